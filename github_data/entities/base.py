@@ -64,6 +64,14 @@ class BaseSaveStrategy(Protocol):
         """Read entities from source."""
         ...
 
+    def get_incremental_model(self) -> Any:
+        """Get the model of saved items if saves can be incremental."""
+        ...
+
+    def read_updated_since(self, *args: Any, **kwargs: Any) -> Any:
+        """Read only the entities updated since a time."""
+        ...
+
     def transform(self, *args: Any, **kwargs: Any) -> Any:
         """Transform entities for storage."""
         ...
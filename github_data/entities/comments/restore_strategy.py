@@ -1,15 +1,19 @@
 """Comments restore strategy implementation."""
 
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Tuple, Union, TYPE_CHECKING
 from pathlib import Path
 from urllib.parse import urlparse
 
-from github_data.operations.restore.strategy import RestoreEntityStrategy
+from github_data.operations.restore.strategy import (
+    RestoreEntityStrategy,
+    forward_results,
+)
 from github_data.entities.comments.models import Comment
+from github_data.entities.issues.restore_strategy import IMPORTED_COMMENTS_CONTEXT_KEY
 
 if TYPE_CHECKING:
     from github_data.storage.protocols import StorageService
-    from github_data.github.protocols import RepositoryService
+    from github_data.github.protocols import BatchResultCallback, RepositoryService
 
 
 class CommentsRestoreStrategy(RestoreEntityStrategy):
@@ -24,6 +28,15 @@ class CommentsRestoreStrategy(RestoreEntityStrategy):
     def get_dependencies(self) -> List[str]:
         return ["issues"]  # Comments depend on issues
 
+    def get_parent_keys(self, comment: Comment) -> List[Tuple[str, Any]]:
+        """Return the context entry a comment waits for: its issue's number."""
+        return [
+            (
+                "issue_number_mapping",
+                self._extract_issue_number_from_url(comment.issue_url),
+            )
+        ]
+
     def read(self, input_path: str, storage_service: "StorageService") -> List[Comment]:
         comments_file = Path(input_path) / "comments.json"
         comments = storage_service.read(comments_file, Comment)
@@ -36,6 +49,9 @@ class CommentsRestoreStrategy(RestoreEntityStrategy):
         # Get issue number mapping from context
         issue_mapping = context.get("issue_number_mapping", {})
         original_issue_number = self._extract_issue_number_from_url(comment.issue_url)
+        if original_issue_number in context.get(IMPORTED_COMMENTS_CONTEXT_KEY, ()):
+            return None  # Already imported together with its issue
+
         new_issue_number = issue_mapping.get(original_issue_number)
 
         if new_issue_number is None:
@@ -69,6 +85,28 @@ class CommentsRestoreStrategy(RestoreEntityStrategy):
         )
         return {"issue_number": entity_data["issue_number"]}
 
+    def write_batch(
+        self,
+        github_service: "RepositoryService",
+        repo_name: str,
+        entities_data: List[Dict[str, Any]],
+        on_result: Optional["BatchResultCallback"] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        def created(
+            index: int, result: Union[Dict[str, Any], Exception]
+        ) -> Union[Dict[str, Any], Exception]:
+            if isinstance(result, Exception):
+                return result
+            return {"issue_number": entities_data[index]["issue_number"]}
+
+        # Batched requests keep the comments in chronological order
+        results = github_service.create_issue_comments_batch(
+            repo_name,
+            [(data["issue_number"], data["body"]) for data in entities_data],
+            on_result=forward_results(on_result, created),
+        )
+        return [created(index, result) for index, result in enumerate(results)]
+
     def post_create_actions(
         self,
         github_service: "RepositoryService",
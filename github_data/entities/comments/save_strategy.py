@@ -1,7 +1,10 @@
 """Comments save strategy implementation."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Type
 
+from pydantic import BaseModel
+
+from github_data.entities.comments.models import Comment
 from github_data.operations.save.strategy import SaveEntityStrategy
 from github_data.operations.save.mixins.entity_coupling import EntityCouplingMixin
 
@@ -26,6 +29,10 @@ class CommentsSaveStrategy(EntityCouplingMixin, SaveEntityStrategy):
         """Return list of entity types this entity depends on."""
         return ["issues"]  # Comments depend on issues being saved first
 
+    def get_incremental_model(self) -> Optional[Type[BaseModel]]:
+        """Return the model merged into saved comments by incremental saves."""
+        return Comment
+
     def get_converter_name(self) -> str:
         """Return the converter function name for this entity type."""
         return "convert_to_comment"
@@ -76,10 +76,19 @@ class IssuesEntityConfig:
             context: Typed strategy context with validated services
 
         Returns:
-            IssuesRestoreStrategy instance
+            IssuesRestoreStrategy instance, importing issues through the
+            issue import API if the context provides an issue importer
         """
-        from github_data.entities.issues.restore_strategy import IssuesRestoreStrategy
+        from github_data.entities.issues.restore_strategy import (
+            IssueImportRestoreStrategy,
+            IssuesRestoreStrategy,
+        )
 
+        if context.issue_importer is not None:
+            return IssueImportRestoreStrategy(
+                context.issue_importer,
+                include_original_metadata=context.include_original_metadata,
+            )
         return IssuesRestoreStrategy(
             include_original_metadata=context.include_original_metadata
         )
@@ -0,0 +1,243 @@
+"""
+Issue import engine.
+
+Creates issues through GitHub's issue import API, which takes an issue
+together with its comments, closed state, labels and milestone in a single
+request instead of one request per issue, comment and state change. Imports
+are processed asynchronously by GitHub: every import is queued first, then
+the status of all of them is polled in batches until each is imported or
+has failed. Each result is reported as soon as it is known, so callers can
+record finished imports while others are still being processed.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    TYPE_CHECKING,
+    cast,
+)
+
+if TYPE_CHECKING:
+    from github_data.github.protocols import RepositoryService
+
+logger = logging.getLogger(__name__)
+
+# Seconds between the first status polls; doubled while nothing finishes
+DEFAULT_POLL_INTERVAL = 1.0
+MAX_POLL_INTERVAL = 30.0
+
+# Seconds without any import finishing before the rest are given up
+DEFAULT_IMPORT_TIMEOUT = 600.0
+
+# Allowance for clock skew when listing imports queued since submission
+SINCE_MARGIN = timedelta(minutes=5)
+
+# GitHub's import statuses
+IMPORTED_STATUS = "imported"
+FAILED_STATUS = "failed"
+
+
+@dataclass(frozen=True)
+class IssueImport:
+    """Issue to import.
+
+    Attributes:
+        issue: Issue fields (title, body, closed, labels, milestone, ...)
+        comments: Comments created with the issue, each with body and
+            created_at
+    """
+
+    issue: Dict[str, Any]
+    comments: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class IssueImportError(Exception):
+    """Raised for, or returned in place of, an issue that was not imported."""
+
+    def __init__(self, message: str, status: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.status = status
+
+
+# Result of one import: the created issue's number and import id, or why
+# no issue was created
+ImportResult = Union[Dict[str, Any], IssueImportError]
+
+# Records the result of the import at a position
+ResultCallback = Callable[[int, ImportResult], None]
+
+
+class IssueImporter:
+    """Bulk issue creation through the issue import API."""
+
+    def __init__(
+        self,
+        include_comments: bool = True,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: float = DEFAULT_IMPORT_TIMEOUT,
+    ):
+        """
+        Initialize importer.
+
+        Args:
+            include_comments: Whether issue comments are imported with their
+                issues
+            poll_interval: Seconds between the first status polls
+            timeout: Seconds without any import finishing before the
+                remaining imports are given up
+
+        Raises:
+            ValueError: If poll_interval or timeout is not positive
+        """
+        if poll_interval <= 0:
+            raise ValueError(f"poll_interval must be positive, got {poll_interval}")
+        if timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {timeout}")
+        self._include_comments = include_comments
+        self._poll_interval = poll_interval
+        self._timeout = timeout
+
+    @property
+    def include_comments(self) -> bool:
+        """Whether issue comments are imported with their issues."""
+        return self._include_comments
+
+    def import_issues(
+        self,
+        github_service: "RepositoryService",
+        repo_name: str,
+        imports: Sequence[IssueImport],
+        on_result: Optional[ResultCallback] = None,
+    ) -> List[ImportResult]:
+        """Import issues and wait until GitHub has processed all of them.
+
+        Args:
+            github_service: Service the imports are sent through
+            repo_name: Target repository in "owner/repo" format
+            imports: Issues to import, in the order they should be created
+            on_result: Called with the position and result of each import as
+                soon as it finished, in the order they finish
+
+        Returns:
+            For each import in order, a dictionary with the created issue's
+            number and the import id, or an IssueImportError
+        """
+        results: List[Optional[ImportResult]] = [None] * len(imports)
+        since = (datetime.now(timezone.utc) - SINCE_MARGIN).isoformat()
+
+        def finish(index: int, result: ImportResult) -> None:
+            results[index] = result
+            if on_result is not None:
+                on_result(index, result)
+
+        pending: Dict[int, int] = {}
+        for index, item in enumerate(imports):
+            try:
+                status = github_service.start_issue_import(
+                    repo_name, item.issue, item.comments
+                )
+            except Exception as e:
+                finish(
+                    index,
+                    IssueImportError(
+                        "Failed to queue import of issue "
+                        f"'{item.issue.get('title')}': {e}"
+                    ),
+                )
+                continue
+            pending[status["id"]] = index
+
+        if pending:
+            self._wait(github_service, repo_name, since, pending, finish)
+
+        # Every import has its result now
+        return cast(List[ImportResult], results)
+
+    def _wait(
+        self,
+        github_service: "RepositoryService",
+        repo_name: str,
+        since: str,
+        pending: Dict[int, int],
+        finish: ResultCallback,
+    ) -> None:
+        """Poll import status in batches until every pending import finished."""
+        interval = self._poll_interval
+        last_progress = time.monotonic()
+        while pending:
+            time.sleep(interval)
+            statuses = github_service.get_issue_imports(repo_name, since)
+            if self._collect(statuses, pending, finish):
+                last_progress = time.monotonic()
+                interval = self._poll_interval
+                continue
+            if time.monotonic() - last_progress >= self._timeout:
+                break
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+        # Imports may be missing from the listing; ask for each one once
+        for import_id in list(pending):
+            try:
+                status = github_service.get_issue_import(repo_name, import_id)
+            except Exception as e:
+                logger.warning(f"Failed to get status of issue import {import_id}: {e}")
+                continue
+            self._collect([status], pending, finish)
+
+        for import_id, index in pending.items():
+            finish(
+                index,
+                IssueImportError(
+                    f"Issue import {import_id} did not finish within "
+                    f"{self._timeout:g} seconds"
+                ),
+            )
+
+    def _collect(
+        self,
+        statuses: Sequence[Dict[str, Any]],
+        pending: Dict[int, int],
+        finish: ResultCallback,
+    ) -> int:
+        """Record the result of finished pending imports.
+
+        Returns:
+            Number of imports that finished
+        """
+        finished = 0
+        for status in statuses:
+            import_id = status.get("id")
+            if import_id not in pending:
+                continue
+            if status.get("status") not in (IMPORTED_STATUS, FAILED_STATUS):
+                continue
+            finish(pending.pop(import_id), self._result(status))
+            finished += 1
+        return finished
+
+    @staticmethod
+    def _result(status: Dict[str, Any]) -> ImportResult:
+        """Turn a finished import's status into its result."""
+        issue_url = status.get("issue_url")
+        if status.get("status") == FAILED_STATUS or not issue_url:
+            errors = "; ".join(
+                f"{error.get('field')}: {error.get('code')}"
+                for error in status.get("errors") or []
+            )
+            return IssueImportError(
+                f"Issue import {status['id']} failed: {errors or 'no issue created'}",
+                status,
+            )
+        return {
+            "number": int(issue_url.rstrip("/").rsplit("/", 1)[1]),
+            "import_id": status["id"],
+        }
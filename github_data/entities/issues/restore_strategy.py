@@ -3,12 +3,21 @@
 from typing import List, Dict, Any, Optional, TYPE_CHECKING, Union, Set
 from pathlib import Path
 
-from github_data.operations.restore.strategy import RestoreEntityStrategy
+from github_data.operations.restore.strategy import (
+    RestoreEntityStrategy,
+    forward_results,
+)
+from github_data.entities.comments.models import Comment
+from github_data.entities.issues.issue_importer import IssueImport, IssueImporter
 from github_data.entities.issues.models import Issue
 
 if TYPE_CHECKING:
     from github_data.storage.protocols import StorageService
-    from github_data.github.protocols import RepositoryService
+    from github_data.github.protocols import BatchResultCallback, RepositoryService
+
+# Context key mapping original numbers of issues imported with their comments
+# to their new numbers
+IMPORTED_COMMENTS_CONTEXT_KEY = "issues_with_imported_comments"
 
 
 class IssuesRestoreStrategy(RestoreEntityStrategy):
@@ -140,22 +149,34 @@ class IssuesRestoreStrategy(RestoreEntityStrategy):
     ) -> None:
         # Close issue if it was originally closed
         if created_data["original_state"] == "closed":
-            try:
-                github_service.close_issue(
-                    repo_name, created_data["number"], created_data.get("state_reason")
-                )
-                reason_text = (
-                    f"with reason: {created_data['state_reason']}"
-                    if created_data.get("state_reason")
-                    else ""
-                )
-                print(f"Closed issue #{created_data['number']} {reason_text}")
-            except Exception as e:
-                print(
-                    f"Warning: Failed to close issue " f"#{created_data['number']}: {e}"
-                )
+            self._close_issue(github_service, repo_name, created_data)
+
+        self._record_created_issue(entity, created_data, context)
+
+    def _close_issue(
+        self,
+        github_service: "RepositoryService",
+        repo_name: str,
+        created_data: Dict[str, Any],
+    ) -> None:
+        """Close a created issue with its original state reason."""
+        try:
+            github_service.close_issue(
+                repo_name, created_data["number"], created_data.get("state_reason")
+            )
+            reason_text = (
+                f"with reason: {created_data['state_reason']}"
+                if created_data.get("state_reason")
+                else ""
+            )
+            print(f"Closed issue #{created_data['number']} {reason_text}")
+        except Exception as e:
+            print(f"Warning: Failed to close issue " f"#{created_data['number']}: {e}")
 
-        # Store number mapping for dependent entities
+    def _record_created_issue(
+        self, entity: Issue, created_data: Dict[str, Any], context: Dict[str, Any]
+    ) -> None:
+        """Store the issue's number mapping for dependent entities."""
         if "issue_number_mapping" not in context:
             context["issue_number_mapping"] = {}
         context["issue_number_mapping"][created_data["original_number"]] = created_data[
@@ -166,3 +187,142 @@ class IssuesRestoreStrategy(RestoreEntityStrategy):
             f"Created issue #{created_data['number']}: "
             f"{entity.title} (was #{created_data['original_number']})"
         )
+
+
+class IssueImportRestoreStrategy(IssuesRestoreStrategy):
+    """Strategy restoring issues through the issue import API.
+
+    Each issue is created with its closed state, labels, milestone and, when
+    comments are restored, its comments in a single import. Issues whose
+    comments were imported are listed in the context so the comments
+    strategy skips them.
+    """
+
+    def __init__(
+        self,
+        importer: IssueImporter,
+        include_original_metadata: bool = True,
+        include_issues: Union[bool, Set[int]] = True,
+    ):
+        """Initialize issue import restore strategy.
+
+        Args:
+            importer: Engine sending the imports and waiting for them
+            include_original_metadata: Whether to include original metadata in
+                restored issues and comments
+            include_issues: Boolean for all/none or set of issue numbers for
+                selective filtering
+        """
+        super().__init__(include_original_metadata, include_issues)
+        self._importer = importer
+        self._comments_by_issue: Dict[int, List[Comment]] = {}
+
+    def read(self, input_path: str, storage_service: "StorageService") -> List[Issue]:
+        """Load issues and, if they are imported together, their comments."""
+        issues = super().read(input_path, storage_service)
+
+        self._comments_by_issue = {}
+        if self._importer.include_comments and issues:
+            comments_file = Path(input_path) / "comments.json"
+            comments = storage_service.read(comments_file, Comment)
+            for comment in sorted(comments, key=lambda c: c.created_at):
+                self._comments_by_issue.setdefault(comment.issue_number, []).append(
+                    comment
+                )
+
+        return issues
+
+    def transform(
+        self, issue: Issue, context: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        issue_data = super().transform(issue, context)
+        if issue_data is None:
+            return None
+
+        from github_data.github.metadata import prepare_comment_body_for_restore
+
+        issue_data["created_at"] = issue.created_at.isoformat()
+        issue_data["updated_at"] = issue.updated_at.isoformat()
+        if issue.closed_at:
+            issue_data["closed_at"] = issue.closed_at.isoformat()
+        issue_data["comments"] = [
+            {
+                "body": prepare_comment_body_for_restore(
+                    comment, include_metadata=self._include_original_metadata
+                ),
+                "created_at": comment.created_at.isoformat(),
+            }
+            for comment in self._comments_by_issue.get(issue.number, [])
+        ]
+        return issue_data
+
+    def write_batch(
+        self,
+        github_service: "RepositoryService",
+        repo_name: str,
+        entities_data: List[Dict[str, Any]],
+        on_result: Optional["BatchResultCallback"] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        def created(
+            index: int, result: Union[Dict[str, Any], Exception]
+        ) -> Union[Dict[str, Any], Exception]:
+            if isinstance(result, Exception):
+                return result
+            data = entities_data[index]
+            return {
+                "number": result["number"],
+                "original_number": data["original_number"],
+                "original_state": data["original_state"],
+                "state_reason": data.get("state_reason"),
+            }
+
+        imports = [
+            IssueImport(issue=self._import_fields(data), comments=data["comments"])
+            for data in entities_data
+        ]
+        # Imports finish out of order; each is reported as soon as it finished
+        results = self._importer.import_issues(
+            github_service,
+            repo_name,
+            imports,
+            on_result=forward_results(on_result, created),
+        )
+        return [created(index, result) for index, result in enumerate(results)]
+
+    def post_create_actions(
+        self,
+        github_service: "RepositoryService",
+        repo_name: str,
+        entity: Issue,
+        created_data: Dict[str, Any],
+        context: Dict[str, Any],
+    ) -> None:
+        # Imports close issues as completed; other reasons are set afterwards
+        if created_data["original_state"] == "closed" and created_data.get(
+            "state_reason"
+        ) not in (None, "completed"):
+            self._close_issue(github_service, repo_name, created_data)
+
+        # Listed before the mapping lands, which may release the comments
+        if self._importer.include_comments:
+            context.setdefault(IMPORTED_COMMENTS_CONTEXT_KEY, {})[
+                created_data["original_number"]
+            ] = created_data["number"]
+
+        self._record_created_issue(entity, created_data, context)
+
+    @staticmethod
+    def _import_fields(issue_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Issue fields in the form the import API takes them."""
+        fields = {
+            "title": issue_data["title"],
+            "body": issue_data["body"],
+            "labels": issue_data["labels"],
+            "closed": issue_data["original_state"] == "closed",
+            "created_at": issue_data["created_at"],
+            "updated_at": issue_data["updated_at"],
+        }
+        for optional in ("closed_at", "milestone"):
+            if issue_data.get(optional) is not None:
+                fields[optional] = issue_data[optional]
+        return fields
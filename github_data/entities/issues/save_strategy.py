@@ -1,7 +1,10 @@
 """Issues save strategy implementation."""
 
-from typing import List, Dict, Any, Union, Set
+from typing import List, Dict, Any, Union, Set, Optional, Type
 
+from pydantic import BaseModel
+
+from github_data.entities.issues.models import Issue
 from github_data.operations.save.strategy import SaveEntityStrategy
 from github_data.operations.save.mixins.selective_filtering import (
     SelectiveFilteringMixin,
@@ -31,6 +34,10 @@ class IssuesSaveStrategy(SelectiveFilteringMixin, SaveEntityStrategy):
             "milestones",
         ]  # Issues depend on labels and milestones being saved first
 
+    def get_incremental_model(self) -> Optional[Type[BaseModel]]:
+        """Return the model merged into saved issues by incremental saves."""
+        return Issue
+
     def get_converter_name(self) -> str:
         """Return the converter function name for this entity type."""
         return "convert_to_issue"
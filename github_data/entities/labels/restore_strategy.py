@@ -1,11 +1,12 @@
 """Labels restore strategy implementation."""
 
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Union, TYPE_CHECKING
 from pathlib import Path
 
 from github_data.operations.restore.strategy import (
     RestoreEntityStrategy,
     RestoreConflictStrategy,
+    forward_results,
 )
 from github_data.entities.labels.models import Label
 from github_data.entities.labels.conflict_strategies import (
@@ -16,7 +17,7 @@ from github_data.entities.labels.conflict_strategies import (
 
 if TYPE_CHECKING:
     from github_data.storage.protocols import StorageService
-    from github_data.github.protocols import RepositoryService
+    from github_data.github.protocols import BatchResultCallback, RepositoryService
 
 
 class LabelsRestoreStrategy(RestoreEntityStrategy):
@@ -63,6 +64,27 @@ class LabelsRestoreStrategy(RestoreEntityStrategy):
                 f"Failed to create label '{entity_data['name']}': {e}"
             ) from e
 
+    def write_batch(
+        self,
+        github_service: "RepositoryService",
+        repo_name: str,
+        entities_data: List[Dict[str, Any]],
+        on_result: Optional["BatchResultCallback"] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        def created(
+            index: int, result: Union[Dict[str, Any], Exception]
+        ) -> Union[Dict[str, Any], Exception]:
+            name = entities_data[index]["name"]
+            if isinstance(result, Exception):
+                return RuntimeError(f"Failed to create label '{name}': {result}")
+            return {"name": name}
+
+        # Create labels in batched requests; failed labels do not stop the others
+        results = github_service.create_labels_batch(
+            repo_name, entities_data, on_result=forward_results(on_result, created)
+        )
+        return [created(index, result) for index, result in enumerate(results)]
+
     def post_create_actions(
         self,
         github_service: "RepositoryService",
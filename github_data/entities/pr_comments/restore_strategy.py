@@ -1,12 +1,13 @@
 """Pull request comments restore strategy implementation."""
 
 import logging
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Tuple, Union, TYPE_CHECKING
 from pathlib import Path
 
 from github_data.operations.restore.strategy import (
     RestoreEntityStrategy,
     RestoreConflictStrategy,
+    forward_results,
 )
 from github_data.entities.pr_comments.models import PullRequestComment
 
@@ -14,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from github_data.storage.protocols import StorageService
-    from github_data.github.protocols import RepositoryService
+    from github_data.github.protocols import BatchResultCallback, RepositoryService
 
 
 class PullRequestCommentsRestoreStrategy(RestoreEntityStrategy):
@@ -34,6 +35,10 @@ class PullRequestCommentsRestoreStrategy(RestoreEntityStrategy):
     def get_dependencies(self) -> List[str]:
         return ["pull_requests"]  # Comments depend on pull requests existing
 
+    def get_parent_keys(self, comment: PullRequestComment) -> List[Tuple[str, Any]]:
+        """Return the context entry a comment waits for: its PR's number."""
+        return [("pr_number_mapping", comment.pull_request_number)]
+
     def read(
         self, input_path: str, storage_service: "StorageService"
     ) -> List[PullRequestComment]:
@@ -81,6 +86,29 @@ class PullRequestCommentsRestoreStrategy(RestoreEntityStrategy):
         )
         return {"id": created_comment.get("id", "unknown")}
 
+    def write_batch(
+        self,
+        github_service: "RepositoryService",
+        repo_name: str,
+        entities_data: List[Dict[str, Any]],
+        on_result: Optional["BatchResultCallback"] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Create all comments in batched requests, in order."""
+
+        def created(
+            index: int, result: Union[Dict[str, Any], Exception]
+        ) -> Union[Dict[str, Any], Exception]:
+            if isinstance(result, Exception):
+                return result
+            return {"id": result.get("id", "unknown")}
+
+        results = github_service.create_issue_comments_batch(
+            repo_name,
+            [(data["pr_number"], data["body"]) for data in entities_data],
+            on_result=forward_results(on_result, created),
+        )
+        return [created(index, result) for index, result in enumerate(results)]
+
     def post_create_actions(
         self,
         github_service: "RepositoryService",
@@ -1,7 +1,10 @@
 """PR Comments save strategy implementation."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Type
 
+from pydantic import BaseModel
+
+from github_data.entities.pr_comments.models import PullRequestComment
 from github_data.operations.save.strategy import SaveEntityStrategy
 from github_data.operations.save.mixins.entity_coupling import EntityCouplingMixin
 
@@ -27,6 +30,10 @@ class PullRequestCommentsSaveStrategy(EntityCouplingMixin, SaveEntityStrategy):
             "pull_requests"
         ]  # PR comments depend on pull requests being saved first
 
+    def get_incremental_model(self) -> Optional[Type[BaseModel]]:
+        """Return the model merged into saved pr comments by incremental saves."""
+        return PullRequestComment
+
     def get_converter_name(self) -> str:
         """Return the converter function name for this entity type."""
         return "convert_to_pr_comment"
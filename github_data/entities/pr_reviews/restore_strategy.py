@@ -1,6 +1,6 @@
 """PR reviews restore strategy implementation."""
 
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -24,6 +24,15 @@ class PullRequestReviewsRestoreStrategy(RestoreEntityStrategy):
     def get_dependencies(self) -> List[str]:
         return ["pull_requests"]  # PR reviews depend on pull requests
 
+    def get_parent_keys(self, review: PullRequestReview) -> List[Tuple[str, Any]]:
+        """Return the context entry a review waits for: its PR's number."""
+        return [
+            (
+                "pr_number_mapping",
+                self._extract_pr_number_from_url(review.pull_request_url),
+            )
+        ]
+
     def read(
         self, input_path: str, storage_service: "StorageService"
     ) -> List[PullRequestReview]:
@@ -38,7 +47,7 @@ class PullRequestReviewsRestoreStrategy(RestoreEntityStrategy):
         self, review: PullRequestReview, context: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         # Get pull request number mapping from context
-        pr_mapping = context.get("pull_request_number_mapping", {})
+        pr_mapping = context.get("pr_number_mapping", {})
         original_pr_number = self._extract_pr_number_from_url(review.pull_request_url)
         new_pr_number = pr_mapping.get(original_pr_number)
 
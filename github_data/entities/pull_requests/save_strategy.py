@@ -1,7 +1,10 @@
 """Pull Requests save strategy implementation."""
 
-from typing import List, Dict, Any, Union, Set
+from typing import List, Dict, Any, Union, Set, Optional, Type
 
+from pydantic import BaseModel
+
+from github_data.entities.pull_requests.models import PullRequest
 from github_data.operations.save.strategy import SaveEntityStrategy
 from github_data.operations.save.mixins.selective_filtering import (
     SelectiveFilteringMixin,
@@ -31,6 +34,10 @@ class PullRequestsSaveStrategy(SelectiveFilteringMixin, SaveEntityStrategy):
             "milestones",
         ]  # Pull requests depend on labels and milestones being saved first
 
+    def get_incremental_model(self) -> Optional[Type[BaseModel]]:
+        """Return the model merged into saved pull requests by incremental saves."""
+        return PullRequest
+
     def get_converter_name(self) -> str:
         """Return the converter function name for this entity type."""
         return "convert_to_pull_request"
@@ -94,6 +94,18 @@ class EntityRegistry:
         sorter = TopologicalSorter(entities)
         return sorter.sort()
 
+    def get_enabled_entity_levels(self) -> List[List[RegisteredEntity]]:
+        """Get all enabled entities grouped into dependency levels.
+
+        Entities within a level do not depend on each other and can be
+        processed concurrently once all previous levels have completed.
+
+        Returns:
+            List of levels, each a list of entities sorted by name
+        """
+        enabled = [e for e in self._entities.values() if e.is_enabled()]
+        return TopologicalSorter(enabled).sort_into_levels()
+
     def get_all_entity_names(self) -> List[str]:
         """Get names of all registered entities.
 
@@ -136,6 +148,24 @@ class TopologicalSorter:
         self._check_for_cycles(sorted_names)
         return self._map_names_to_entities(sorted_names)
 
+    def sort_into_levels(self) -> List[List[RegisteredEntity]]:
+        """Group entities into dependency levels.
+
+        Level 0 holds entities without dependencies; each following level
+        holds entities whose dependencies all appear in earlier levels.
+
+        Returns:
+            Entities grouped by level, each level sorted by name.
+
+        Raises:
+            ValueError: If circular dependency detected.
+        """
+        self._build_entity_map()
+        self._build_dependency_graph()
+        levels = self._execute_levelled_kahns_algorithm()
+        self._check_for_cycles([name for level in levels for name in level])
+        return [self._map_names_to_entities(level) for level in levels]
+
     def _build_entity_map(self) -> None:
         self._entity_map = {e.config.name: e for e in self._entities}
 
@@ -165,6 +195,22 @@ class TopologicalSorter:
 
         return sorted_names
 
+    def _execute_levelled_kahns_algorithm(self) -> List[List[str]]:
+        level = sorted(n for n, degree in self._in_degree.items() if degree == 0)
+        levels: List[List[str]] = []
+
+        while level:
+            levels.append(level)
+            next_level: List[str] = []
+            for current in level:
+                for neighbor in self._graph[current]:
+                    self._in_degree[neighbor] -= 1
+                    if self._in_degree[neighbor] == 0:
+                        next_level.append(neighbor)
+            level = sorted(next_level)
+
+        return levels
+
     def _check_for_cycles(self, sorted_names: List[str]) -> None:
         if len(sorted_names) != len(self._entity_map):
             remaining = set(self._entity_map.keys()) - set(sorted_names)
@@ -0,0 +1,308 @@
+"""
+Release asset download engine.
+
+Streams release asset binaries straight to disk in fixed-size chunks, many
+assets at a time, under an optional byte-rate cap shared by all downloads.
+Interrupted downloads resume from their partial file with an HTTP Range
+request, and each finished file is checked against the asset's size and
+SHA-256 digest. Files already on disk that pass the same check are not
+downloaded again.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import requests
+
+from github_data.github.cache import uncached_session
+
+logger = logging.getLogger(__name__)
+
+# Assets downloaded at the same time
+DEFAULT_DOWNLOAD_WORKERS = 4
+
+# Bytes read from the network and written to disk at a time
+CHUNK_SIZE = 1024 * 1024
+
+# Attempts per asset; each retry resumes from the bytes already on disk
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Seconds to wait for the server to connect or send the next chunk
+REQUEST_TIMEOUT_SECONDS = 60
+
+# Suffix of files still being downloaded
+PARTIAL_SUFFIX = ".part"
+
+# Suffix of the files recording a finished download's SHA-256 digest
+DIGEST_SUFFIX = ".sha256"
+
+
+@dataclass(frozen=True)
+class AssetDownload:
+    """Release asset to download.
+
+    Attributes:
+        url: URL the asset binary is served from
+        path: File the asset is saved to
+        size: Size of the asset in bytes, as reported by GitHub
+        sha256: Hex SHA-256 digest reported by GitHub, if any
+    """
+
+    url: str
+    path: Path
+    size: int
+    sha256: Optional[str] = None
+
+
+class AssetDownloadError(Exception):
+    """Raised when an asset cannot be downloaded or fails verification."""
+
+    def __init__(self, message: str, download: Optional[AssetDownload] = None):
+        super().__init__(message)
+        self.download = download
+
+
+class ByteRateLimiter:
+    """Thread-safe cap on the combined bytes per second of all downloads."""
+
+    def __init__(self, bytes_per_second: int):
+        """
+        Initialize limiter.
+
+        Args:
+            bytes_per_second: Maximum combined download rate
+
+        Raises:
+            ValueError: If bytes_per_second is below 1
+        """
+        if bytes_per_second < 1:
+            raise ValueError(
+                f"Byte rate must be at least 1 per second, got {bytes_per_second}"
+            )
+        self._bytes_per_second = float(bytes_per_second)
+        self._next_free = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, byte_count: int) -> None:
+        """Account for received bytes, sleeping until the rate allows them."""
+        with self._lock:
+            now = time.monotonic()
+            self._next_free = (
+                max(self._next_free, now) + byte_count / self._bytes_per_second
+            )
+            delay = self._next_free - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def file_sha256(path: Path, chunk_size: int = CHUNK_SIZE) -> str:
+    """Return the hex SHA-256 digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _sibling(path: Path, suffix: str) -> Path:
+    """Return the file next to path with suffix appended to its name."""
+    return path.with_name(path.name + suffix)
+
+
+class ReleaseAssetDownloader:
+    """Parallel, resumable and verified release asset downloads."""
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        max_bytes_per_second: Optional[int] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        """
+        Initialize downloader.
+
+        Args:
+            token: GitHub token sent with downloads, needed for private
+                repositories; requests drops it on redirects to other hosts
+            max_workers: Maximum number of assets downloaded at once
+            max_bytes_per_second: Combined download rate cap; unlimited if
+                not given
+            max_attempts: Attempts per asset before giving up on it
+            chunk_size: Bytes read and written at a time
+
+        Raises:
+            ValueError: If max_workers or max_attempts is below 1
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+        self._token = token
+        self._max_workers = max_workers
+        self._rate_limiter = (
+            ByteRateLimiter(max_bytes_per_second)
+            if max_bytes_per_second is not None
+            else None
+        )
+        self._max_attempts = max_attempts
+        self._chunk_size = chunk_size
+        self._thread_local = threading.local()
+
+    @property
+    def _session(self) -> requests.Session:
+        """Return this thread's HTTP session, creating it on first use.
+
+        Asset binaries are streamed to disk, so the session bypasses the
+        global HTTP cache, which would buffer whole responses.
+        """
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = uncached_session()
+            session.headers["Accept"] = "application/octet-stream"
+            if self._token:
+                session.headers["Authorization"] = f"Bearer {self._token}"
+            self._thread_local.session = session
+        return session
+
+    def download_all(
+        self, downloads: Sequence[AssetDownload]
+    ) -> List[AssetDownloadError]:
+        """Download assets in parallel, skipping verified files on disk.
+
+        Every asset is attempted even if others fail.
+
+        Returns:
+            Errors of the assets that could not be downloaded
+        """
+        if not downloads:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(downloads)),
+            thread_name_prefix="asset-download",
+        ) as executor:
+            futures = [executor.submit(self.download, d) for d in downloads]
+
+        errors = []
+        for future in futures:
+            error = future.exception()
+            if isinstance(error, AssetDownloadError):
+                errors.append(error)
+            elif error is not None:
+                raise error
+        return errors
+
+    def download(self, download: AssetDownload) -> bool:
+        """Download one asset unless a verified copy is already on disk.
+
+        Returns:
+            True if the asset was downloaded, False if it was skipped
+
+        Raises:
+            AssetDownloadError: If all attempts fail
+        """
+        if self.is_complete(download):
+            logger.debug(f"Skipping verified asset {download.path}")
+            return False
+
+        download.path.parent.mkdir(parents=True, exist_ok=True)
+        last_error: Optional[Exception] = None
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                self._fetch(download)
+                return True
+            except (requests.RequestException, AssetDownloadError) as e:
+                last_error = e
+                logger.warning(
+                    f"Download of {download.url} failed "
+                    f"(attempt {attempt}/{self._max_attempts}): {e}"
+                )
+
+        raise AssetDownloadError(
+            f"Failed to download {download.url} to {download.path}: {last_error}",
+            download,
+        )
+
+    def is_complete(self, download: AssetDownload) -> bool:
+        """Check whether the asset's file is on disk with the right size and hash.
+
+        The file is compared with GitHub's digest if known, otherwise with the
+        digest recorded when it was downloaded.
+        """
+        path = download.path
+        if not path.is_file() or path.stat().st_size != download.size:
+            return False
+
+        expected = download.sha256
+        if expected is None:
+            digest_file = _sibling(path, DIGEST_SUFFIX)
+            if not digest_file.is_file():
+                return False
+            expected = digest_file.read_text().strip()
+        return file_sha256(path, self._chunk_size) == expected
+
+    def _fetch(self, download: AssetDownload) -> None:
+        """Stream the asset into its partial file, then verify and finish it."""
+        partial = _sibling(download.path, PARTIAL_SUFFIX)
+        offset = partial.stat().st_size if partial.is_file() else 0
+        if offset > download.size:
+            partial.unlink()
+            offset = 0
+
+        digest = hashlib.sha256()
+        if offset:
+            # Resume: the bytes on disk are hashed instead of downloaded again
+            with open(partial, "rb") as file:
+                while chunk := file.read(self._chunk_size):
+                    digest.update(chunk)
+
+        if offset < download.size:
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            with self._session.get(
+                download.url,
+                headers=headers,
+                stream=True,
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            ) as response:
+                response.raise_for_status()
+                if offset and response.status_code != 206:
+                    # Server ignored the range and sent the whole file
+                    offset = 0
+                    digest = hashlib.sha256()
+
+                with open(partial, "ab" if offset else "wb") as file:
+                    for chunk in response.iter_content(self._chunk_size):
+                        file.write(chunk)
+                        digest.update(chunk)
+                        if self._rate_limiter is not None:
+                            self._rate_limiter.consume(len(chunk))
+
+        self._verify(download, partial, digest.hexdigest())
+        partial.replace(download.path)
+        _sibling(download.path, DIGEST_SUFFIX).write_text(digest.hexdigest() + "\n")
+
+    @staticmethod
+    def _verify(download: AssetDownload, partial: Path, sha256: str) -> None:
+        """Check a finished partial file, deleting it if it is corrupt."""
+        size = partial.stat().st_size
+        if size == download.size and download.sha256 in (None, sha256):
+            return
+
+        partial.unlink()
+        if size != download.size:
+            raise AssetDownloadError(
+                f"Size mismatch for {download.path.name}: "
+                f"expected {download.size} bytes, got {size}"
+            )
+        raise AssetDownloadError(
+            f"SHA-256 mismatch for {download.path.name}: "
+            f"expected {download.sha256}, got {sha256}"
+        )
@@ -0,0 +1,213 @@
+"""
+Release asset upload engine.
+
+Uploads saved release asset files to restored releases, several at a time,
+in the background while the restore continues. Each file is streamed from
+disk as the request body rather than read into memory. Assets the target
+release already has in full are skipped, so an interrupted restore can be
+repeated; unfinished uploads left behind by a failed attempt are deleted
+before the asset is sent again.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from github_data.github.protocols import RepositoryService
+
+logger = logging.getLogger(__name__)
+
+# Assets uploaded at the same time
+DEFAULT_UPLOAD_WORKERS = 4
+
+# Attempts per asset before giving up on it
+DEFAULT_MAX_ATTEMPTS = 3
+
+# GitHub's state of an asset whose upload has finished
+UPLOADED_STATE = "uploaded"
+
+
+@dataclass(frozen=True)
+class AssetUpload:
+    """Saved release asset to upload.
+
+    Attributes:
+        release_id: ID of the release on the target repository
+        path: Saved asset file
+        name: Asset name on the release
+        content_type: Media type the asset is served with
+    """
+
+    release_id: int
+    path: Path
+    name: str
+    content_type: str
+
+
+class AssetUploadError(Exception):
+    """Raised when an asset cannot be uploaded."""
+
+    def __init__(self, message: str, upload: Optional[AssetUpload] = None):
+        super().__init__(message)
+        self.upload = upload
+
+
+class ReleaseAssetUploader:
+    """Concurrent, resumable release asset uploads through a GitHub service."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_UPLOAD_WORKERS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        """
+        Initialize uploader.
+
+        Args:
+            max_workers: Maximum number of assets uploaded at once
+            max_attempts: Attempts per asset before giving up on it
+
+        Raises:
+            ValueError: If max_workers or max_attempts is below 1
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+        self._max_workers = max_workers
+        self._max_attempts = max_attempts
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future[Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        github_service: "RepositoryService",
+        repo_name: str,
+        release_id: int,
+        uploads: Sequence[AssetUpload],
+    ) -> int:
+        """Start uploading a release's missing assets in the background.
+
+        Returns:
+            Number of uploads started; assets the release already has in
+            full are skipped
+        """
+        if not uploads:
+            return 0
+
+        existing = {
+            asset["name"]: asset
+            for asset in github_service.get_release_assets(repo_name, release_id)
+        }
+
+        started = 0
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="asset-upload"
+                )
+            for upload in uploads:
+                asset = existing.get(upload.name)
+                if asset is not None and self._is_uploaded(asset, upload):
+                    logger.debug(f"Skipping asset {upload.name} already uploaded")
+                    continue
+                self._pending.append(
+                    self._executor.submit(
+                        self.upload, github_service, repo_name, upload, asset
+                    )
+                )
+                started += 1
+        return started
+
+    def wait(self) -> List[AssetUploadError]:
+        """Wait for every submitted upload to finish.
+
+        Returns:
+            Errors of the assets that could not be uploaded
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+            executor, self._executor = self._executor, None
+
+        errors = []
+        for future in pending:
+            error = future.exception()
+            if isinstance(error, AssetUploadError):
+                errors.append(error)
+            elif error is not None:
+                errors.append(AssetUploadError(str(error)))
+        if executor is not None:
+            executor.shutdown()
+        return errors
+
+    def upload(
+        self,
+        github_service: "RepositoryService",
+        repo_name: str,
+        upload: AssetUpload,
+        existing: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Upload one asset, replacing an unfinished copy on the release.
+
+        Args:
+            github_service: Service the upload is sent through
+            repo_name: Target repository in "owner/repo" format
+            upload: Asset to upload
+            existing: Asset of the same name already on the release, if any
+
+        Returns:
+            Raw JSON data of the uploaded asset
+
+        Raises:
+            AssetUploadError: If all attempts fail
+        """
+        stale = existing
+        last_error: Optional[Exception] = None
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                if attempt > 1:
+                    # A failed attempt may have left an unfinished asset behind
+                    stale = self._find_asset(github_service, repo_name, upload)
+                if stale is not None:
+                    github_service.delete_release_asset(repo_name, stale["id"])
+                    stale = None
+                return github_service.upload_release_asset(
+                    repo_name,
+                    upload.release_id,
+                    str(upload.path),
+                    upload.name,
+                    upload.content_type,
+                )
+            except Exception as e:
+                last_error = e
+                logger.warning(
+                    f"Upload of {upload.name} failed "
+                    f"(attempt {attempt}/{self._max_attempts}): {e}"
+                )
+
+        raise AssetUploadError(
+            f"Failed to upload {upload.path} as {upload.name}: {last_error}", upload
+        )
+
+    @staticmethod
+    def _is_uploaded(asset: Dict[str, Any], upload: AssetUpload) -> bool:
+        """Check whether a release asset is a finished copy of the file."""
+        return (
+            asset.get("state") == UPLOADED_STATE
+            and asset.get("size") == upload.path.stat().st_size
+        )
+
+    @staticmethod
+    def _find_asset(
+        github_service: "RepositoryService", repo_name: str, upload: AssetUpload
+    ) -> Optional[Dict[str, Any]]:
+        """Return the release's asset named like the upload, if any."""
+        for asset in github_service.get_release_assets(repo_name, upload.release_id):
+            if asset["name"] == upload.name:
+                return dict(asset)
+        return None
@@ -29,6 +29,7 @@ def convert_to_release_asset(raw_data: Dict[str, Any]) -> ReleaseAsset:
         created_at=_parse_datetime(raw_data["created_at"]),
         updated_at=_parse_datetime(raw_data["updated_at"]),
         uploader=uploader,
+        digest=raw_data.get("digest"),
         local_path=raw_data.get("local_path"),  # May be set during save
     )
 
@@ -61,6 +62,7 @@ def convert_to_release(raw_data: Dict[str, Any]) -> Release:
         id=raw_data["id"],
         tag_name=raw_data["tag_name"],
         target_commitish=raw_data["target_commitish"],
+        tag_commit_sha=raw_data.get("tag_commit_sha"),
         name=raw_data.get("name"),
         body=raw_data.get("body"),
         draft=raw_data.get("draft", False),
@@ -64,11 +64,12 @@ class ReleasesEntityConfig:
             context: Typed strategy context with validated services
 
         Returns:
-            ReleasesSaveStrategy instance
+            ReleasesSaveStrategy instance, downloading assets if the context
+            provides a release asset downloader
         """
         from github_data.entities.releases.save_strategy import ReleasesSaveStrategy
 
-        return ReleasesSaveStrategy()
+        return ReleasesSaveStrategy(asset_downloader=context.release_asset_downloader)
 
     @staticmethod
     def create_restore_strategy(
@@ -80,10 +81,11 @@ class ReleasesEntityConfig:
             context: Typed strategy context with validated services
 
         Returns:
-            ReleasesRestoreStrategy instance
+            ReleasesRestoreStrategy instance, uploading assets if the context
+            provides a release asset uploader
         """
         from github_data.entities.releases.restore_strategy import (
             ReleasesRestoreStrategy,
         )
 
-        return ReleasesRestoreStrategy()
+        return ReleasesRestoreStrategy(asset_uploader=context.release_asset_uploader)
@@ -18,6 +18,7 @@ class ReleaseAsset(BaseModel):
     created_at: datetime
     updated_at: datetime
     uploader: GitHubUser
+    digest: Optional[str] = None  # "sha256:<hex>", when GitHub reports one
     local_path: Optional[str] = None  # Path when downloaded
 
     model_config = ConfigDict(populate_by_name=True)
@@ -29,6 +30,7 @@ class Release(BaseModel):
     id: Union[int, str]
     tag_name: str
     target_commitish: str  # Branch or commit SHA
+    tag_commit_sha: Optional[str] = None  # Commit the tag points at, if tagged
     name: Optional[str] = None
     body: Optional[str] = None  # Release notes (markdown)
     draft: bool = False
@@ -1,12 +1,72 @@
 """Release save strategy implementation."""
 
-from typing import Any, Dict, List
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 from github_data.operations.save.strategy import SaveEntityStrategy
+from github_data.entities.releases.asset_downloader import (
+    AssetDownload,
+    AssetDownloadError,
+    ReleaseAssetDownloader,
+)
+from github_data.entities.releases.models import Release, ReleaseAsset
+
+if TYPE_CHECKING:
+    from github_data.github.protocols import RepositoryService
+    from github_data.storage.protocols import StorageService
+
+# Directory under the output path holding one subdirectory of assets per release
+ASSETS_DIRECTORY = "release_assets"
+
+# REST endpoint serving an asset's binary when asked for application/octet-stream;
+# unlike browser_download_url it honours tokens, so private assets download too
+ASSET_API_URL = "https://api.github.com/repos/{repo_name}/releases/assets/{asset_id}"
+
+
+def _path_component(name: str) -> str:
+    """Make a tag or asset name safe to use as a single path component."""
+    component = name.replace("/", "_").replace("\\", "_")
+    return f"_{component}" if component in ("", ".", "..") else component
+
+
+def asset_local_path(release: Release, asset: ReleaseAsset) -> str:
+    """Return where an asset is saved, relative to the output path."""
+    return str(
+        PurePosixPath(
+            ASSETS_DIRECTORY,
+            _path_component(release.tag_name),
+            _path_component(asset.name),
+        )
+    )
+
+
+def asset_download_url(repo_name: Optional[str], asset: ReleaseAsset) -> str:
+    """Return the URL an asset's binary is downloaded from.
+
+    Assets are downloaded through the REST API by their numeric id. Assets
+    saved before their numeric id was recorded, or of an unknown repository,
+    fall back to browser_download_url, which only works for public
+    repositories.
+    """
+    if repo_name is None or not isinstance(asset.id, int):
+        return asset.browser_download_url
+    return ASSET_API_URL.format(repo_name=repo_name, asset_id=asset.id)
 
 
 class ReleasesSaveStrategy(SaveEntityStrategy):
     """Strategy for saving repository releases."""
 
+    def __init__(self, asset_downloader: Optional[ReleaseAssetDownloader] = None):
+        """
+        Initialize strategy.
+
+        Args:
+            asset_downloader: Downloader saving asset binaries next to the
+                release data; assets are not downloaded if not given
+        """
+        self._asset_downloader = asset_downloader
+        self._repo_name: Optional[str] = None
+
     def get_entity_name(self) -> str:
         """Return the entity name for file naming and logging."""
         return "releases"
@@ -23,10 +83,73 @@ class ReleasesSaveStrategy(SaveEntityStrategy):
         """Return the service method name for data collection."""
         return "get_repository_releases"
 
+    def read(self, github_service: "RepositoryService", repo_name: str) -> List[Any]:
+        """Read releases, remembering the repository their assets come from."""
+        self._repo_name = repo_name
+        return super().read(github_service, repo_name)
+
+    def read_updated_since(
+        self, github_service: "RepositoryService", repo_name: str, since: datetime
+    ) -> List[Any]:
+        """Read changed releases, remembering the repository of their assets."""
+        self._repo_name = repo_name
+        return super().read_updated_since(github_service, repo_name, since)
+
     def transform(self, entities: List[Any], context: Dict[str, Any]) -> List[Any]:
         """Process release data - no special processing needed yet."""
         return entities
 
+    def _perform_save(
+        self, entities: List[Any], output_path: str, storage_service: "StorageService"
+    ) -> None:
+        """Download release assets, then save releases with their local paths.
+
+        Releases are saved even if some assets fail; the save then reports
+        the failed assets, whose local_path stays unset.
+        """
+        errors: List[AssetDownloadError] = []
+        if self._asset_downloader is not None:
+            errors = self._download_assets(entities, Path(output_path))
+
+        super()._perform_save(entities, output_path, storage_service)
+
+        if errors:
+            raise AssetDownloadError(
+                f"{len(errors)} release asset(s) failed to download: "
+                + "; ".join(str(error) for error in errors)
+            )
+
+    def _download_assets(
+        self, releases: List[Release], output_dir: Path
+    ) -> List[AssetDownloadError]:
+        """Download every release's assets and record their local paths."""
+        assert self._asset_downloader is not None
+
+        assets_by_path: Dict[Path, ReleaseAsset] = {}
+        downloads = []
+        for release in releases:
+            for asset in release.assets:
+                local_path = asset_local_path(release, asset)
+                download = AssetDownload(
+                    url=asset_download_url(self._repo_name, asset),
+                    path=output_dir / local_path,
+                    size=asset.size,
+                    sha256=(
+                        asset.digest.removeprefix("sha256:")
+                        if asset.digest and asset.digest.startswith("sha256:")
+                        else None
+                    ),
+                )
+                asset.local_path = local_path
+                assets_by_path[download.path] = asset
+                downloads.append(download)
+
+        errors = self._asset_downloader.download_all(downloads)
+        for error in errors:
+            if error.download is not None:
+                assets_by_path[error.download.path].local_path = None
+        return errors
+
     def should_skip(self, config: Any) -> bool:
         """Skip release operations if disabled in config."""
         return not getattr(config, "include_releases", True)
@@ -4,6 +4,11 @@ from typing import Optional, Any, TYPE_CHECKING, Callable
 from dataclasses import dataclass
 
 if TYPE_CHECKING:
+    from github_data.entities.releases.asset_downloader import (
+        ReleaseAssetDownloader,
+    )
+    from github_data.entities.releases.asset_uploader import ReleaseAssetUploader
+    from github_data.entities.issues.issue_importer import IssueImporter
     from github_data.git.service import GitRepositoryService
     from github_data.github.service import GitHubService
 
@@ -78,6 +83,9 @@ class StrategyContext:
 
     # Non-service configuration (has default, no validation needed)
     _include_original_metadata: bool = True
+    _release_asset_downloader: Optional["ReleaseAssetDownloader"] = None
+    _release_asset_uploader: Optional["ReleaseAssetUploader"] = None
+    _issue_importer: Optional["IssueImporter"] = None
 
     # Public typed properties with validation
 
@@ -100,3 +108,18 @@ class StrategyContext:
     def include_original_metadata(self) -> bool:
         """Whether to preserve original GitHub metadata during restore."""
         return self._include_original_metadata
+
+    @property
+    def release_asset_downloader(self) -> Optional["ReleaseAssetDownloader"]:
+        """Downloader for release asset binaries; None skips asset downloads."""
+        return self._release_asset_downloader
+
+    @property
+    def release_asset_uploader(self) -> Optional["ReleaseAssetUploader"]:
+        """Uploader for saved release asset files; None skips asset uploads."""
+        return self._release_asset_uploader
+
+    @property
+    def issue_importer(self) -> Optional["IssueImporter"]:
+        """Importer creating issues via the import API; None creates them singly."""
+        return self._issue_importer
@@ -1,14 +1,17 @@
 """Sub-issues restore strategy implementation."""
 
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Tuple, Union, TYPE_CHECKING
 from pathlib import Path
 
-from github_data.operations.restore.strategy import RestoreEntityStrategy
+from github_data.operations.restore.strategy import (
+    RestoreEntityStrategy,
+    forward_results,
+)
 from github_data.entities.sub_issues.models import SubIssue
 
 if TYPE_CHECKING:
     from github_data.storage.protocols import StorageService
-    from github_data.github.protocols import RepositoryService
+    from github_data.github.protocols import BatchResultCallback, RepositoryService
 
 
 class SubIssuesRestoreStrategy(RestoreEntityStrategy):
@@ -23,6 +26,13 @@ class SubIssuesRestoreStrategy(RestoreEntityStrategy):
     def get_dependencies(self) -> List[str]:
         return ["issues"]  # Sub-issues depend on issues
 
+    def get_parent_keys(self, sub_issue: SubIssue) -> List[Tuple[str, Any]]:
+        """Return the context entries a link waits for: both issues' numbers."""
+        return [
+            ("issue_number_mapping", sub_issue.parent_issue_number),
+            ("issue_number_mapping", sub_issue.sub_issue_number),
+        ]
+
     def read(
         self, input_path: str, storage_service: "StorageService"
     ) -> List[SubIssue]:
@@ -77,6 +87,28 @@ class SubIssuesRestoreStrategy(RestoreEntityStrategy):
             "original_child_number": entity_data["original_child_number"],
         }
 
+    def write_batch(
+        self,
+        github_service: "RepositoryService",
+        repo_name: str,
+        entities_data: List[Dict[str, Any]],
+        on_result: Optional["BatchResultCallback"] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        def created(
+            index: int, result: Union[Dict[str, Any], Exception]
+        ) -> Union[Dict[str, Any], Exception]:
+            if isinstance(result, Exception):
+                return result
+            return dict(entities_data[index])
+
+        # Link sub-issues in batched requests, keeping their order
+        results = github_service.add_sub_issues_batch(
+            repo_name,
+            [(data["parent_number"], data["child_number"]) for data in entities_data],
+            on_result=forward_results(on_result, created),
+        )
+        return [created(index, result) for index, result in enumerate(results)]
+
     def post_create_actions(
         self,
         github_service: "RepositoryService",
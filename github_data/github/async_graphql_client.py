@@ -0,0 +1,200 @@
+"""
+Asyncio GitHub GraphQL client.
+
+Runs queries on gql's aiohttp transport so that several of them can be in
+flight at once. The per-item lookups packed into aliased batches and the
+follow-up queries completing truncated nested connections are independent,
+so they are sent concurrently, bounded by a configurable limit.
+
+The client keeps the public methods of GitHubGraphQLClient. An event loop
+runs on a background thread, and the synchronous methods submit their
+queries to it and wait, so GitHubApiBoundary callers work unchanged.
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from gql import Client
+
+from .graphql_client import GitHubGraphQLClient, REQUEST_TIMEOUT_SECONDS
+from .utils.graphql_budget import operation_name
+from .utils.query_cache import validate_query
+
+# Queries in flight at once; GitHub's secondary limits allow up to 100
+DEFAULT_CONCURRENCY = 12
+
+T = TypeVar("T")
+
+
+class AsyncGitHubGraphQLClient(GitHubGraphQLClient):
+    """
+    GitHub GraphQL client sending independent queries concurrently.
+
+    Requires the ``async`` extra (``pip install github-data[async]``).
+    """
+
+    def __init__(
+        self, token: str, concurrency: int = DEFAULT_CONCURRENCY, **kwargs: Any
+    ):
+        """
+        Initialize asyncio GraphQL client.
+
+        Args:
+            token: GitHub authentication token
+            concurrency: Maximum number of queries in flight at once
+            **kwargs: Arguments for GitHubGraphQLClient
+
+        Raises:
+            ValueError: If concurrency is below 1
+            ImportError: If the async transport's dependencies are missing
+        """
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be at least 1, got {concurrency}")
+        self._concurrency = concurrency
+        self._clients: Dict[str, Client] = {}
+        self._sessions: Dict[str, Any] = {}
+        # Created on the loop's thread, see _in_flight_limit
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        super().__init__(token, **kwargs)
+
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="graphql-async", daemon=True
+        )
+        self._loop_thread.start()
+
+    @property
+    def concurrency(self) -> int:
+        """Maximum number of queries in flight at once."""
+        return self._concurrency
+
+    def _client_for(self, token: str) -> Client:
+        """GraphQL client for a token, shared by every coroutine on the loop."""
+        gql_client = self._clients.get(token)
+        if gql_client is None:
+            gql_client = self._clients[token] = self._create_graphql_client(token)
+        return gql_client
+
+    def _create_graphql_client(self, token: str) -> Client:
+        """Create a GraphQL client on the aiohttp transport."""
+        try:
+            from gql.transport.aiohttp import AIOHTTPTransport
+        except ImportError as e:
+            raise ImportError(
+                "The async GraphQL client requires aiohttp; "
+                "install it with 'pip install github-data[async]'"
+            ) from e
+
+        transport = AIOHTTPTransport(
+            url="https://api.github.com/graphql",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=REQUEST_TIMEOUT_SECONDS,
+        )
+        return Client(transport=transport)
+
+    def _run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the client's loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def _in_flight_limit(self) -> asyncio.Semaphore:
+        """Semaphore bounding queries in flight; call on the loop's thread."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        return self._semaphore
+
+    async def _session_for(self, token: str) -> Any:
+        """Connected session for a token, opened on first use."""
+        session = self._sessions.get(token)
+        if session is not None:
+            return session
+
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            session = self._sessions.get(token)
+            if session is None:
+                session = await self._client_for(token).connect_async()
+                self._sessions[token] = session
+            return session
+
+    async def execute_async(
+        self, query: Any, variable_values: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Execute a GraphQL query on the client's loop.
+
+        Checks the query against the bundled schema, then sends it with the
+        pooled token that has the most points left, or the primary token for
+        a mutation, once a slot below the concurrency limit and point budget
+        are free, and records the rateLimit data the query selected, if any.
+        Results of repeated read-only queries come from the response cache,
+        if any.
+        """
+        if self._validate_queries:
+            validate_query(query)
+        cache_key = self._response_cache_key(query, variable_values)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        token = self._token_for(query)
+        async with self._in_flight_limit():
+            # Budget waits sleep, so keep them off the loop
+            await self._loop.run_in_executor(None, self._budget.wait_for_budget, token)
+            session = await self._session_for(token)
+            result: Dict[str, Any] = await session.execute(
+                query, variable_values=variable_values
+            )
+        self._budget.record(result.get("rateLimit"), operation_name(query), token)
+        self._store_response(cache_key, result)
+        return result
+
+    async def execute_many_async(
+        self,
+        requests: Sequence[Tuple[Any, Optional[Dict[str, Any]]]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Execute independent queries concurrently, returning results in order.
+
+        With return_exceptions, a failed query's exception is returned in its
+        place instead of being raised.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.execute_async(query, variable_values=variables)
+                    for query, variables in requests
+                ),
+                return_exceptions=return_exceptions,
+            )
+        )
+
+    def execute(
+        self, query: Any, variable_values: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Execute a GraphQL query and wait for its result."""
+        return self._run(self.execute_async(query, variable_values=variable_values))
+
+    def execute_many(
+        self,
+        requests: Sequence[Tuple[Any, Optional[Dict[str, Any]]]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Execute independent queries concurrently and wait for all results."""
+        return self._run(self.execute_many_async(requests, return_exceptions))
+
+    def close(self) -> None:
+        """Close every open session and stop the client's loop."""
+
+        async def close_sessions() -> None:
+            for token in list(self._sessions):
+                await self._clients[token].close_async()
+            self._sessions.clear()
+
+        if self._loop.is_closed():
+            return
+        self._run(close_sessions())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
@@ -7,9 +7,18 @@ Focused solely on API access - no rate limiting, caching, or retry logic.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, cast
+from datetime import datetime
+from typing import Dict, Iterator, List, Any, Optional, Sequence, Tuple, cast
 from .protocols import GitHubApiBoundary as GitHubApiBoundaryProtocol
+from .async_graphql_client import AsyncGitHubGraphQLClient
+from .graphql_cache import GraphQLResponseCache
 from .graphql_client import GitHubGraphQLClient
+from .rate_limit_tracker import RateLimitTracker
+from .http_pool import SharedHTTPPool
+from .token_pool import PooledTokenAuth, TokenPool
+from .utils.alias_batcher import DEFAULT_BATCH_SIZE
+from .utils.graphql_budget import GraphQLBudgetTracker
+from .utils.mutation_batcher import MutationResult
 from .restapi_client import GitHubRestApiClient
 from github import Github, Auth
 from github.Repository import Repository
@@ -24,16 +33,56 @@ class GitHubApiBoundary(GitHubApiBoundaryProtocol):
     rate limiting, caching, or retry logic. Pure API access layer.
     """
 
-    def __init__(self, token: str):
+    def __init__(
+        self,
+        token: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        rate_limits: Optional[RateLimitTracker] = None,
+        token_pool: Optional[TokenPool] = None,
+        http_pool: Optional[SharedHTTPPool] = None,
+        graphql_concurrency: Optional[int] = None,
+        validate_graphql_queries: bool = True,
+        graphql_response_cache: Optional[GraphQLResponseCache] = None,
+    ):
         """
         Initialize GitHub API client with authentication.
 
         Args:
             token: GitHub authentication token
+            batch_size: Maximum number of per-item lookups per batched query
+            rate_limits: Shared store receiving the GraphQL rate-limit state
+            token_pool: Tokens REST and GraphQL requests are spread over;
+                token alone is used if not given
+            http_pool: Keep-alive connections for GraphQL; also sizes
+                PyGithub's own connection pool
+            graphql_concurrency: Maximum number of GraphQL queries in flight
+                at once; queries are sent one at a time per thread if not given
+            validate_graphql_queries: Whether to check GraphQL queries against
+                the bundled schema before sending them
+            graphql_response_cache: Cache answering repeated read-only
+                GraphQL queries; every query is sent if not given
         """
-        self._github = Github(auth=Auth.Token(token))
+        http_pool = http_pool or SharedHTTPPool()
+        auth = PooledTokenAuth(token_pool) if token_pool else Auth.Token(token)
+        self._github = Github(auth=auth, pool_size=http_pool.size)
         self._token = token
-        self._graphql_client = GitHubGraphQLClient(token)
+        graphql_options: Dict[str, Any] = {
+            "batch_size": batch_size,
+            "budget": GraphQLBudgetTracker(
+                rate_limits=rate_limits, token_pool=token_pool
+            ),
+            "token_pool": token_pool,
+            "http_pool": http_pool,
+            "validate_queries": validate_graphql_queries,
+            "response_cache": graphql_response_cache,
+        }
+        self._graphql_client: GitHubGraphQLClient = (
+            AsyncGitHubGraphQLClient(
+                token, concurrency=graphql_concurrency, **graphql_options
+            )
+            if graphql_concurrency is not None
+            else GitHubGraphQLClient(token, **graphql_options)
+        )
         self._rest_client = GitHubRestApiClient(token, github_instance=self._github)
 
     # Public API - Repository Data Operations (GraphQL-enhanced)
@@ -97,10 +146,20 @@ class GitHubApiBoundary(GitHubApiBoundaryProtocol):
         """Get all labels from repository using GraphQL for better performance."""
         return self._graphql_client.get_repository_labels(repo_name)
 
+    def iter_repository_labels(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream labels page by page using GraphQL."""
+        return self._graphql_client.iter_repository_labels(repo_name)
+
     def get_repository_issues(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all issues from repository using GraphQL for better performance."""
         return self._graphql_client.get_repository_issues(repo_name)
 
+    def iter_repository_issues(
+        self, repo_name: str, since: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream issues from repository page by page using GraphQL."""
+        return self._graphql_client.iter_repository_issues(repo_name, since=since)
+
     def get_issue_comments(
         self, repo_name: str, issue_number: int
     ) -> List[Dict[str, Any]]:
@@ -111,6 +170,12 @@ class GitHubApiBoundary(GitHubApiBoundaryProtocol):
         """Get all comments from all issues using GraphQL for better performance."""
         return self._graphql_client.get_all_issue_comments(repo_name)
 
+    def iter_all_issue_comments(
+        self, repo_name: str, since: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream comments from all issues page by page using GraphQL."""
+        return self._graphql_client.iter_all_issue_comments(repo_name, since=since)
+
     # Public API - Repository Modification Operations
 
     def create_label(
@@ -166,18 +231,63 @@ class GitHubApiBoundary(GitHubApiBoundaryProtocol):
             logging.error(f"Failed to get milestones for {repo_name}: {e}")
             raise
 
+    def iter_repository_milestones(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream milestones page by page using GraphQL."""
+        return self._graphql_client.iter_repository_milestones(repo_name)
+
     def get_repository_releases(self, repo_name: str) -> List[Dict[str, Any]]:
-        """Get all releases from repository via REST API.
+        """Get all releases with their assets using GraphQL pagination."""
+        return self._graphql_client.get_repository_releases(repo_name)
 
-        Note: Uses REST API as releases are not fully supported in GraphQL.
-        PyGithub's get_releases() returns a PaginatedList that handles
-        pagination automatically.
-        """
-        repo = self._github.get_repo(repo_name)
-        releases = repo.get_releases()
+    def iter_repository_releases(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream releases with their assets page by page using GraphQL."""
+        return self._graphql_client.iter_repository_releases(repo_name)
+
+    def get_release_by_tag(
+        self, repo_name: str, tag_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get a published release by its tag via REST API."""
+        return self._rest_client.get_release_by_tag(repo_name, tag_name)
+
+    def start_issue_import(
+        self,
+        repo_name: str,
+        issue: Dict[str, Any],
+        comments: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Queue an issue with its comments for import via REST API."""
+        return self._rest_client.start_issue_import(repo_name, issue, comments)
+
+    def get_issue_import(self, repo_name: str, import_id: int) -> Dict[str, Any]:
+        """Get the status of one issue import via REST API."""
+        return self._rest_client.get_issue_import(repo_name, import_id)
+
+    def get_issue_imports(self, repo_name: str, since: str) -> List[Dict[str, Any]]:
+        """Get the status of issue imports queued since a time via REST API."""
+        return self._rest_client.get_issue_imports(repo_name, since)
+
+    def get_release_assets(
+        self, repo_name: str, release_id: int
+    ) -> List[Dict[str, Any]]:
+        """Get all assets of a release via REST API."""
+        return self._rest_client.get_release_assets(repo_name, release_id)
+
+    def upload_release_asset(
+        self,
+        repo_name: str,
+        release_id: int,
+        file_path: str,
+        name: str,
+        content_type: str,
+    ) -> Dict[str, Any]:
+        """Upload a file as release asset via REST API."""
+        return self._rest_client.upload_release_asset(
+            repo_name, release_id, file_path, name, content_type
+        )
 
-        # Convert PaginatedList to list of raw_data dicts
-        return [release.raw_data for release in releases]
+    def delete_release_asset(self, repo_name: str, asset_id: int) -> None:
+        """Delete a release asset via REST API."""
+        self._rest_client.delete_release_asset(repo_name, asset_id)
 
     def create_milestone(
         self,
@@ -226,6 +336,14 @@ class GitHubApiBoundary(GitHubApiBoundaryProtocol):
         """Get current rate limit status using GraphQL."""
         return self._graphql_client.get_rate_limit_status()
 
+    def get_graphql_costs(self) -> Dict[str, int]:
+        """Get GraphQL points spent so far, per query."""
+        return self._graphql_client.get_graphql_costs()
+
+    def get_http_pool_stats(self) -> Dict[str, int]:
+        """Get reuse statistics of the GraphQL connection pool."""
+        return self._graphql_client.get_http_pool_stats()
+
     # Low-level Repository Operations
 
     def _get_repository(self, repo_name: str) -> Repository:
@@ -238,16 +356,40 @@ class GitHubApiBoundary(GitHubApiBoundaryProtocol):
         """Get all pull requests from repository using GraphQL for performance."""
         return self._graphql_client.get_repository_pull_requests(repo_name)
 
+    def iter_repository_pull_requests(
+        self, repo_name: str, since: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream pull requests from repository page by page using GraphQL."""
+        return self._graphql_client.iter_repository_pull_requests(
+            repo_name, since=since
+        )
+
     def get_pull_request_comments(
         self, repo_name: str, pr_number: int
     ) -> List[Dict[str, Any]]:
         """Get comments for specific pull request using GraphQL."""
         return self._graphql_client.get_pull_request_comments(repo_name, pr_number)
 
+    def get_pull_request_comments_batch(
+        self, repo_name: str, pr_numbers: Sequence[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Get comments for many pull requests in aliased batch queries."""
+        return self._graphql_client.get_pull_request_comments_batch(
+            repo_name, pr_numbers
+        )
+
     def get_all_pull_request_comments(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all comments from all pull requests using GraphQL for performance."""
         return self._graphql_client.get_all_pull_request_comments(repo_name)
 
+    def iter_all_pull_request_comments(
+        self, repo_name: str, since: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream comments from all pull requests page by page using GraphQL."""
+        return self._graphql_client.iter_all_pull_request_comments(
+            repo_name, since=since
+        )
+
     def create_pull_request(
         self,
         repo_name: str,
@@ -274,10 +416,22 @@ class GitHubApiBoundary(GitHubApiBoundaryProtocol):
         """Get reviews for specific pull request using GraphQL."""
         return self._graphql_client.get_pull_request_reviews(repo_name, pr_number)
 
+    def get_pull_request_reviews_batch(
+        self, repo_name: str, pr_numbers: Sequence[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Get reviews for many pull requests in aliased batch queries."""
+        return self._graphql_client.get_pull_request_reviews_batch(
+            repo_name, pr_numbers
+        )
+
     def get_all_pull_request_reviews(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all pull request reviews using GraphQL for performance."""
         return self._graphql_client.get_all_pull_request_reviews(repo_name)
 
+    def iter_all_pull_request_reviews(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream pull request reviews page by page using GraphQL."""
+        return self._graphql_client.iter_all_pull_request_reviews(repo_name)
+
     def get_pull_request_review_comments(
         self, repo_name: str, review_id: str
     ) -> List[Dict[str, Any]]:
@@ -286,12 +440,26 @@ class GitHubApiBoundary(GitHubApiBoundaryProtocol):
             repo_name, review_id
         )
 
+    def get_pull_request_review_comments_batch(
+        self, repo_name: str, review_ids: Sequence[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get comments for many pull request reviews in batched queries."""
+        return self._graphql_client.get_pull_request_review_comments_batch(
+            repo_name, review_ids
+        )
+
     def get_all_pull_request_review_comments(
         self, repo_name: str
     ) -> List[Dict[str, Any]]:
         """Get all pull request review comments using GraphQL for performance."""
         return self._graphql_client.get_all_pull_request_review_comments(repo_name)
 
+    def iter_all_pull_request_review_comments(
+        self, repo_name: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream pull request review comments page by page using GraphQL."""
+        return self._graphql_client.iter_all_pull_request_review_comments(repo_name)
+
     def create_pull_request_review(
         self, repo_name: str, pr_number: int, body: str, state: str
     ) -> Dict[str, Any]:
@@ -314,6 +482,10 @@ class GitHubApiBoundary(GitHubApiBoundaryProtocol):
         """Get all sub-issue relationships from repository using GraphQL."""
         return self._graphql_client.get_repository_sub_issues(repo_name)
 
+    def iter_repository_sub_issues(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream sub-issue relationships page by page using GraphQL."""
+        return self._graphql_client.iter_repository_sub_issues(repo_name)
+
     def get_issue_sub_issues_graphql(
         self, repo_name: str, issue_number: int
     ) -> List[Dict[str, Any]]:
@@ -322,6 +494,26 @@ class GitHubApiBoundary(GitHubApiBoundaryProtocol):
             repo_name, issue_number
         )
 
+    def get_issue_sub_issues_graphql_batch(
+        self, repo_name: str, issue_numbers: Sequence[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Get sub-issues for many issues in aliased batch queries."""
+        return self._graphql_client.get_issue_sub_issues_graphql_batch(
+            repo_name, issue_numbers
+        )
+
+    def get_issue_parent_graphql(
+        self, repo_name: str, issue_number: int
+    ) -> Optional[Dict[str, Any]]:
+        """Get parent issue if this issue is a sub-issue using GraphQL."""
+        return self._graphql_client.get_issue_parent(repo_name, issue_number)
+
+    def get_issue_parents_graphql_batch(
+        self, repo_name: str, issue_numbers: Sequence[int]
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """Get parent issues of many issues in aliased batch queries."""
+        return self._graphql_client.get_issue_parents_batch(repo_name, issue_numbers)
+
     # Public API - Sub-Issues Operations (REST)
 
     def get_issue_sub_issues(
@@ -363,3 +555,23 @@ class GitHubApiBoundary(GitHubApiBoundaryProtocol):
         return self._rest_client.reprioritize_sub_issue(
             repo_name, parent_issue_number, sub_issue_number, position
         )
+
+    # Public API - Batched Modification Operations (GraphQL)
+
+    def create_labels_batch(
+        self, repo_name: str, labels: Sequence[Dict[str, Any]]
+    ) -> List[MutationResult]:
+        """Create many labels in aliased batch mutations."""
+        return self._graphql_client.create_labels_batch(repo_name, labels)
+
+    def add_sub_issues_batch(
+        self, repo_name: str, links: Sequence[Tuple[int, int]]
+    ) -> List[MutationResult]:
+        """Link many sub-issues to their parents in aliased batch mutations."""
+        return self._graphql_client.add_sub_issues_batch(repo_name, links)
+
+    def create_issue_comments_batch(
+        self, repo_name: str, comments: Sequence[Tuple[int, str]]
+    ) -> List[MutationResult]:
+        """Add many issue or pull request comments in aliased batch mutations."""
+        return self._graphql_client.create_issue_comments_batch(repo_name, comments)
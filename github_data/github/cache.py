@@ -3,12 +3,20 @@ Global caching setup for GitHub API responses.
 
 Provides ETag-based conditional requests and response caching
 to reduce redundant API calls and improve performance.
+
+Cached responses are tagged with the repository and data type of the read
+that fetched them, so a write evicts only the responses it made stale
+instead of the whole cache.
 """
 
 import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set
 
+import requests
 import requests_cache
 
 logger = logging.getLogger(__name__)
@@ -23,6 +31,110 @@ class CacheConfig:
     backend: str = "sqlite"  # sqlite, redis, memory, etc.
     allowable_codes: List[int] = field(default_factory=lambda: [200, 404])
     stale_if_error: bool = True
+    # GraphQL response lifetimes by data type (e.g. "labels"), overriding
+    # expire_after; 0 disables caching of that data type
+    expire_after_by_type: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class CacheTag:
+    """Repository and data type a cached response belongs to."""
+
+    repo_name: str
+    data_type: str
+
+    @classmethod
+    def from_cache_key(cls, cache_key: Optional[str]) -> Optional["CacheTag"]:
+        """
+        Derive a tag from a service cache key.
+
+        Args:
+            cache_key: Key in "data_type:owner/repo[:item]" form
+
+        Returns:
+            Tag, or None if the key does not name a repository
+        """
+        if not cache_key:
+            return None
+        parts = cache_key.split(":", 2)
+        if len(parts) < 2 or "/" not in parts[1]:
+            return None
+        return cls(repo_name=parts[1], data_type=parts[0])
+
+
+class CacheIndex:
+    """Thread-safe record of which cached responses belong to which tag.
+
+    Reads run inside scope(tag); every response received meanwhile, fresh
+    or served from the cache, is recorded under the tag. The scope is a
+    context variable, so it follows the read into executor threads and
+    coroutines that copy the caller's context. Responses neither stored
+    nor read by this process are not indexed and expire normally.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._lock = threading.Lock()
+        self._keys: Dict[CacheTag, Set[str]] = {}
+        self._tag: ContextVar[Optional[CacheTag]] = ContextVar(
+            "cache_tag", default=None
+        )
+
+    @contextmanager
+    def scope(self, tag: Optional[CacheTag]) -> Iterator[None]:
+        """Record responses received in this context under tag while open."""
+        token = self._tag.set(tag)
+        try:
+            yield
+        finally:
+            self._tag.reset(token)
+
+    def current_tag(self) -> Optional[CacheTag]:
+        """Return the tag of the innermost open scope, if any."""
+        return self._tag.get()
+
+    def record(self, response_key: str) -> None:
+        """Record a cached response under the open scope's tag."""
+        tag = self._tag.get()
+        if tag is None:
+            return
+        with self._lock:
+            self._keys.setdefault(tag, set()).add(response_key)
+
+    def clear(self) -> None:
+        """Forget every recorded response."""
+        with self._lock:
+            self._keys.clear()
+
+    def pop(self, tags: Iterable[CacheTag]) -> Set[str]:
+        """Forget tags and return the response keys recorded under them."""
+        keys: Set[str] = set()
+        with self._lock:
+            for tag in tags:
+                keys |= self._keys.pop(tag, set())
+        return keys
+
+
+_cache_index = CacheIndex()
+
+
+def get_cache_index() -> CacheIndex:
+    """Return the index shared by every cached session."""
+    return _cache_index
+
+
+class TaggingCachedSession(requests_cache.CachedSession):
+    """Cached session recording each response in the cache index."""
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        """Send a request and index the cache key of its response."""
+        response = super().send(request, **kwargs)
+        response_key = getattr(response, "cache_key", None)
+        if response_key:
+            _cache_index.record(response_key)
+        return response
 
 
 def setup_global_cache(config: Optional[CacheConfig] = None) -> None:
@@ -35,8 +147,10 @@ def setup_global_cache(config: Optional[CacheConfig] = None) -> None:
     if config is None:
         config = CacheConfig()
 
+    _cache_index.clear()
     requests_cache.install_cache(
         cache_name=config.cache_name,
+        session_factory=TaggingCachedSession,
         expire_after=config.expire_after,
         backend=config.backend,
         allowable_codes=config.allowable_codes,
@@ -45,9 +159,39 @@ def setup_global_cache(config: Optional[CacheConfig] = None) -> None:
     logger.info(f"Global cache installed: {config.cache_name}")
 
 
+def uncached_session() -> requests.Session:
+    """
+    Create an HTTP session that never uses the global cache.
+
+    install_cache() replaces requests.Session with a cached session class,
+    so sessions created afterwards would store every response body in the
+    cache backend, large downloads included.
+    """
+    return requests_cache.OriginalSession()
+
+
 def clear_cache() -> None:
     """Clear all cached data."""
     requests_cache.clear()
+    _cache_index.clear()
+
+
+def invalidate_cache(repo_name: str, data_types: Iterable[str]) -> int:
+    """
+    Evict cached responses of a repository's data types.
+
+    Args:
+        repo_name: Repository name in format "owner/repo"
+        data_types: Data types whose cached reads are stale
+
+    Returns:
+        Number of cached responses evicted
+    """
+    keys = _cache_index.pop(CacheTag(repo_name, data_type) for data_type in data_types)
+    cache = requests_cache.get_cache() if requests_cache.is_installed() else None
+    if keys and cache is not None:
+        cache.delete(*keys)
+    return len(keys)
 
 
 def get_cache_info() -> Dict[str, Any]:
@@ -0,0 +1,127 @@
+"""
+Persistent cache for GraphQL responses.
+
+requests_cache only caches GET requests, so GraphQL POSTs always reach
+GitHub. This cache stores query results in the same requests_cache backend
+(sqlite by default), keyed by a hash of the query document and its
+variables. Repeated saves of a repository within the lifetime, and
+pagination resumed after a crash, are then answered from the cache.
+
+Entries are tagged like other cached reads (see cache.CacheIndex), so a
+write evicts the stale ones, and the tag's data type selects the lifetime.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Mapping, Optional
+
+import requests_cache
+from requests_cache import CachedResponse
+from requests_cache.models import CachedRequest
+
+from .cache import get_cache_index
+from .utils.query_cache import query_digest
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Prefix keeping GraphQL entries apart from requests_cache's own keys
+KEY_PREFIX = "graphql:"
+
+
+class GraphQLResponseCache:
+    """Thread-safe GraphQL response cache on the installed requests_cache."""
+
+    def __init__(
+        self,
+        expire_after: int = 3600,
+        expire_after_by_type: Optional[Mapping[str, int]] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            expire_after: Seconds a response stays fresh
+            expire_after_by_type: Lifetimes overriding expire_after for the
+                data type being read (e.g. "labels"); 0 disables caching
+        """
+        self._expire_after = expire_after
+        self._expire_after_by_type = dict(expire_after_by_type or {})
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def key(self, query: Any, variables: Optional[Dict[str, Any]]) -> Optional[str]:
+        """
+        Return the cache key of a query with its variables.
+
+        Returns:
+            Key, or None if the query must not be cached (e.g. a mutation)
+        """
+        digest = query_digest(query)
+        if digest is None:
+            return None
+        payload = json.dumps(variables or {}, sort_keys=True, default=str)
+        return (
+            KEY_PREFIX
+            + hashlib.sha256(f"{digest}:{payload}".encode("utf-8")).hexdigest()
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the fresh cached result for a key, if any."""
+        backend = self._backend()
+        response = backend.get_response(key) if backend is not None else None
+        hit = response is not None and not response.is_expired
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+        if response is None or not hit:
+            return None
+
+        get_cache_index().record(key)
+        result: Dict[str, Any] = json.loads(response.content)
+        return result
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a query result for the lifetime of the current data type."""
+        backend = self._backend()
+        ttl = self._lifetime()
+        if backend is None or ttl <= 0:
+            return
+
+        response = CachedResponse(
+            status_code=200,
+            url=GRAPHQL_URL,
+            content=json.dumps(result).encode("utf-8"),
+            request=CachedRequest(method="POST", url=GRAPHQL_URL),
+        )
+        backend.save_response(
+            response,
+            cache_key=key,
+            expires=datetime.now(timezone.utc) + timedelta(seconds=ttl),
+        )
+        get_cache_index().record(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of cache hits and misses so far."""
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses}
+
+    def _lifetime(self) -> int:
+        tag = get_cache_index().current_tag()
+        if tag is None:
+            return self._expire_after
+        return self._expire_after_by_type.get(tag.data_type, self._expire_after)
+
+    @staticmethod
+    def _backend() -> Optional[Any]:
+        """Backend of the installed global cache, if caching is on."""
+        if not requests_cache.is_installed():
+            return None
+        return requests_cache.get_cache()
@@ -6,8 +6,24 @@ Provides methods for querying labels, issues, comments, pull requests,
 sub-issues, and rate limits using GraphQL for better performance.
 """
 
-from typing import Dict, List, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Any, Optional, Sequence, Tuple
+from .utils.alias_batcher import AliasBatchFetcher, DEFAULT_BATCH_SIZE
+from .utils.mutation_batcher import (
+    AliasedMutation,
+    MutationBatcher,
+    MutationError,
+    MutationResult,
+)
+from .rate_limit_tracker import GRAPHQL_RESOURCE
+from .token_pool import TokenPool
+from .utils.graphql_budget import GraphQLBudgetTracker, operation_name
 from .utils.graphql_paginator import GraphQLPaginator
+from .utils.nested_connections import NestedConnection, NestedConnectionResolver
+from .utils.query_cache import compile_query, is_mutation, validate_query
+from .utils.updated_since import NEWEST_FIRST, UpdatedSinceFilter
 from .utils.data_enrichment import (
     CommentEnricher,
     SubIssueRelationshipBuilder,
@@ -17,27 +33,54 @@ from .utils.data_enrichment import (
 
 # Required GraphQL imports
 from gql import Client
-from gql.transport.requests import RequestsHTTPTransport
+from .graphql_cache import GraphQLResponseCache
+from .http_pool import PooledRequestsHTTPTransport, SharedHTTPPool
 from .queries import (
     REPOSITORY_LABELS_QUERY,
     REPOSITORY_ISSUES_QUERY,
     REPOSITORY_COMMENTS_QUERY,
     REPOSITORY_PULL_REQUESTS_QUERY,
-    PULL_REQUEST_COMMENTS_QUERY,
     REPOSITORY_PR_COMMENTS_QUERY,
+    REPOSITORY_RELEASES_QUERY,
     REPOSITORY_SUB_ISSUES_QUERY,
-    ISSUE_SUB_ISSUES_QUERY,
     RATE_LIMIT_QUERY,
 )
+from .queries.comments import ISSUE_COMMENTS_CONNECTION
+from .queries.issues import ISSUE_LABELS_CONNECTION
+from .queries.pull_requests import (
+    PULL_REQUEST_ASSIGNEES_CONNECTION,
+    PULL_REQUEST_COMMENTS_CONNECTION,
+    PULL_REQUEST_COMMENTS_LOOKUP,
+    PULL_REQUEST_LABELS_CONNECTION,
+)
+from .queries.mutations import (
+    ADD_COMMENT_MUTATION,
+    ADD_SUB_ISSUE_MUTATION,
+    CREATE_LABEL_MUTATION,
+    ISSUE_OR_PULL_REQUEST_ID_LOOKUP,
+    REPOSITORY_ID_QUERY,
+)
+from .queries.releases import (
+    RELEASE_ASSETS_CONNECTION,
+    REPOSITORY_DEFAULT_BRANCH_QUERY,
+)
+from .queries.sub_issues import (
+    ISSUE_PARENT_LOOKUP,
+    ISSUE_SUB_ISSUE_DETAILS_CONNECTION,
+    ISSUE_SUB_ISSUES_LOOKUP,
+    SUB_ISSUES_CONNECTION,
+)
 from .queries.milestones import (
     REPOSITORY_MILESTONES_QUERY,
     build_milestones_query_variables,
 )
 from .queries.pr_reviews import (
-    PULL_REQUEST_REVIEWS_QUERY,
     REPOSITORY_PR_REVIEWS_QUERY,
-    REVIEW_COMMENTS_QUERY,
     REPOSITORY_REVIEW_COMMENTS_QUERY,
+    REVIEW_COMMENTS_CONNECTION,
+    PULL_REQUEST_REVIEWS_CONNECTION,
+    PULL_REQUEST_REVIEW_IDS_CONNECTION,
+    PULL_REQUEST_REVIEWS_LOOKUP,
 )
 from .graphql_converters import (
     convert_graphql_labels_to_rest_format,
@@ -47,9 +90,18 @@ from .graphql_converters import (
     convert_graphql_pr_comments_to_rest_format,
     convert_graphql_pr_reviews_to_rest_format,
     convert_graphql_review_comments_to_rest_format,
+    convert_graphql_releases_to_rest_format,
     convert_graphql_rate_limit_to_rest_format,
+    convert_graphql_issue_parent_to_rest_format,
+    convert_graphql_added_comment_to_rest_format,
 )
 
+# Threads shared by all paginations for fetching the next page ahead
+PREFETCH_WORKERS = 4
+
+# Requests slower than this fail so the paginator can retry a smaller page
+REQUEST_TIMEOUT_SECONDS = 60
+
 
 class GitHubGraphQLClient:
     """
@@ -59,22 +111,210 @@ class GitHubGraphQLClient:
     with better performance than REST API for bulk operations.
     """
 
-    def __init__(self, token: str):
+    def __init__(
+        self,
+        token: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        budget: Optional[GraphQLBudgetTracker] = None,
+        token_pool: Optional[TokenPool] = None,
+        http_pool: Optional[SharedHTTPPool] = None,
+        validate_queries: bool = True,
+        response_cache: Optional[GraphQLResponseCache] = None,
+    ):
         """
         Initialize GraphQL client with authentication.
 
         Args:
             token: GitHub authentication token
+            batch_size: Maximum number of per-item lookups packed into one
+                aliased query by the *_batch methods
+            budget: Point-budget tracker shared with other clients of the
+                same token; a private one is created if not given
+            token_pool: Tokens to spread queries over by remaining budget;
+                token alone is used if not given
+            http_pool: Keep-alive connections shared by every thread's
+                transport; a private pool is created if not given
+            validate_queries: Whether to check each query against the bundled
+                schema (once per query) before sending it
+            response_cache: Cache answering repeated read-only queries
+                without sending them; every query is sent if not given
+        """
+        self._token = token
+        self._token_pool = token_pool
+        self._http_pool = http_pool or SharedHTTPPool()
+        self._budget = budget or GraphQLBudgetTracker()
+        self._validate_queries = validate_queries
+        self._response_cache = response_cache
+        self._thread_local = threading.local()
+        self._client_for(token)
+        self._prefetch_executor = ThreadPoolExecutor(
+            max_workers=PREFETCH_WORKERS, thread_name_prefix="graphql-prefetch"
+        )
+        self._nested_resolver = NestedConnectionResolver(self)
+        self._alias_fetcher = AliasBatchFetcher(self, batch_size=batch_size)
+        self._mutation_batcher = MutationBatcher(self)
+
+    @property
+    def _gql_client(self) -> Client:
+        """GraphQL client owned by the calling thread, for the primary token."""
+        return self._client_for(self._token)
+
+    def _client_for(self, token: str) -> Client:
+        """GraphQL client owned by the calling thread for a token.
+
+        A gql Client holds a single transport session and cannot execute
+        queries from several threads at once, so each thread gets its own.
+        """
+        gql_clients: Optional[Dict[str, Client]] = getattr(
+            self._thread_local, "gql_clients", None
+        )
+        if gql_clients is None:
+            gql_clients = self._thread_local.gql_clients = {}
+
+        gql_client = gql_clients.get(token)
+        if gql_client is None:
+            gql_client = gql_clients[token] = self._create_graphql_client(token)
+        return gql_client
+
+    def execute(
+        self, query: Any, variable_values: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Execute a GraphQL query on the calling thread's client.
+
+        Checks the query against the bundled schema, sends it with the
+        pooled token that has the most points left, or the primary token
+        for a mutation, waits for point budget
+        first and records the rateLimit data the
+        query selected, if any. Results of repeated read-only queries come
+        from the response cache, if any, without using budget.
+        """
+        if self._validate_queries:
+            validate_query(query)
+        cache_key = self._response_cache_key(query, variable_values)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        token = self._token_for(query)
+        self._budget.wait_for_budget(token)
+        result: Dict[str, Any] = self._client_for(token).execute(
+            query, variable_values=variable_values
+        )
+        self._budget.record(result.get("rateLimit"), operation_name(query), token)
+        self._store_response(cache_key, result)
+        return result
+
+    def _token_for(self, query: Any) -> str:
+        """Token to send a query with; mutations always use the primary one."""
+        if self._token_pool is None:
+            return self._token
+        if is_mutation(query):
+            return self._token_pool.primary
+        return self._token_pool.acquire(GRAPHQL_RESOURCE)
+
+    def _response_cache_key(
+        self, query: Any, variable_values: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        """Response cache key of a query, or None if it is not cached."""
+        if self._response_cache is None:
+            return None
+        return self._response_cache.key(query, variable_values)
+
+    def _cached_response(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Fresh cached result for a response cache key, if any."""
+        if self._response_cache is None or cache_key is None:
+            return None
+        return self._response_cache.get(cache_key)
+
+    def _store_response(self, cache_key: Optional[str], result: Dict[str, Any]) -> None:
+        """Store a query result in the response cache, if it is cached."""
+        if self._response_cache is not None and cache_key is not None:
+            self._response_cache.set(cache_key, result)
+
+    def get_response_cache_stats(self) -> Optional[Dict[str, int]]:
+        """Return response cache hits and misses, or None if not caching."""
+        if self._response_cache is None:
+            return None
+        return self._response_cache.stats()
+
+    def execute_many(
+        self,
+        requests: Sequence[Tuple[Any, Optional[Dict[str, Any]]]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Execute independent queries and return their results in order.
+
+        With return_exceptions, a failed query's exception is returned in its
+        place instead of being raised.
+        """
+        results: List[Any] = []
+        for query, variables in requests:
+            try:
+                results.append(self.execute(query, variable_values=variables))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    def get_graphql_costs(self) -> Dict[str, int]:
+        """Return the GraphQL points spent so far, per query."""
+        return self._budget.cost_by_query()
+
+    def get_http_pool_stats(self) -> Dict[str, int]:
+        """Return reuse statistics of the GraphQL connection pool."""
+        return self._http_pool.stats()
+
+    def _create_paginator(self) -> GraphQLPaginator:
+        """Create a paginator that fetches the next page ahead of the caller."""
+        return GraphQLPaginator(self, prefetch_executor=self._prefetch_executor)
+
+    def _complete_nested(
+        self,
+        connections: Sequence[NestedConnection],
+        post_processor: Optional[
+            Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]
+        ] = None,
+        node_filter: Optional[
+            Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]
+        ] = None,
+    ) -> Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """Build a page post-processor that first completes nested connections.
+
+        node_filter drops nodes before their connections are completed.
         """
-        self._gql_client = self._create_graphql_client(token)
+
+        def process(nodes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            if node_filter is not None:
+                nodes = node_filter(nodes)
+            self._nested_resolver.resolve(nodes, connections)
+            return post_processor(nodes) if post_processor else nodes
+
+        return process
 
     def _create_graphql_client(self, token: str) -> Client:
-        """Create and configure GraphQL client for GitHub API."""
-        transport = RequestsHTTPTransport(
+        """Create and configure GraphQL client for GitHub API.
+
+        Queries are validated against the bundled schema by execute, so the
+        client neither downloads GitHub's schema nor validates again.
+        """
+        transport = PooledRequestsHTTPTransport(
+            self._http_pool,
             url="https://api.github.com/graphql",
             headers={"Authorization": f"Bearer {token}"},
+            timeout=REQUEST_TIMEOUT_SECONDS,
         )
-        return Client(transport=transport, fetch_schema_from_transport=True)
+        return Client(transport=transport)
+
+    @staticmethod
+    def _updated_since(
+        variables: Dict[str, Any], since: Optional[datetime]
+    ) -> Optional[UpdatedSinceFilter]:
+        """Order a pull request read newest first and filter it by since."""
+        if since is None:
+            return None
+        variables["orderBy"] = NEWEST_FIRST
+        return UpdatedSinceFilter(since)
 
     def _parse_repo_name(self, repo_name: str) -> tuple[str, str]:
         """Parse owner/repo format into separate components."""
@@ -90,30 +330,57 @@ class GitHubGraphQLClient:
 
     def get_repository_labels(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all labels from repository using GraphQL for better performance."""
-        owner, name = self._parse_repo_name(repo_name)
+        return list(self.iter_repository_labels(repo_name))
 
-        result = self._gql_client.execute(
-            REPOSITORY_LABELS_QUERY, variable_values={"owner": owner, "name": name}
-        )
+    def iter_repository_labels(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream labels from repository page by page."""
+        owner, name = self._parse_repo_name(repo_name)
 
-        graphql_labels = result["repository"]["labels"]["nodes"]
-        return convert_graphql_labels_to_rest_format(graphql_labels)
+        paginator = self._create_paginator()
+        for page in paginator.paginate_iter(
+            query=REPOSITORY_LABELS_QUERY,
+            variable_values={"owner": owner, "name": name},
+            data_path="repository.labels",
+        ):
+            yield from convert_graphql_labels_to_rest_format(page)
 
     def get_repository_issues(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all issues from repository using GraphQL for better performance."""
+        return list(self.iter_repository_issues(repo_name))
+
+    def iter_repository_issues(
+        self, repo_name: str, since: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream issues from repository page by page.
+
+        With since, only issues updated at or after it are read.
+        """
         owner, name = self._parse_repo_name(repo_name)
 
-        paginator = GraphQLPaginator(self._gql_client)
-        all_issues = paginator.paginate_all(
+        paginator = self._create_paginator()
+        for page in paginator.paginate_iter(
             query=REPOSITORY_ISSUES_QUERY,
-            variable_values={"owner": owner, "name": name},
+            variable_values={
+                "owner": owner,
+                "name": name,
+                "since": since.isoformat() if since else None,
+            },
             data_path="repository.issues",
-        )
-
-        return convert_graphql_issues_to_rest_format(all_issues, repo_name)
+            post_processor=self._complete_nested([ISSUE_LABELS_CONNECTION]),
+        ):
+            yield from convert_graphql_issues_to_rest_format(page, repo_name)
 
     def get_all_issue_comments(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all comments from all issues using GraphQL for better performance."""
+        return list(self.iter_all_issue_comments(repo_name))
+
+    def iter_all_issue_comments(
+        self, repo_name: str, since: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream comments from all issues page by page.
+
+        With since, only comments of issues updated at or after it are read.
+        """
         owner, name = self._parse_repo_name(repo_name)
 
         def comment_post_processor(
@@ -128,73 +395,100 @@ class GitHubGraphQLClient:
                 all_comments.extend(comments)
             return all_comments
 
-        paginator = GraphQLPaginator(self._gql_client)
-        all_comments = paginator.paginate_all(
+        paginator = self._create_paginator()
+        for page in paginator.paginate_iter(
             query=REPOSITORY_COMMENTS_QUERY,
-            variable_values={"owner": owner, "name": name},
+            variable_values={
+                "owner": owner,
+                "name": name,
+                "since": since.isoformat() if since else None,
+            },
             data_path="repository.issues",
-            post_processor=comment_post_processor,
-        )
-
-        return convert_graphql_comments_to_rest_format(all_comments)
+            post_processor=self._complete_nested(
+                [ISSUE_COMMENTS_CONNECTION], comment_post_processor
+            ),
+        ):
+            yield from convert_graphql_comments_to_rest_format(page)
 
     # Pull Request Operations
 
     def get_repository_pull_requests(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all pull requests from repository using GraphQL for performance."""
+        return list(self.iter_repository_pull_requests(repo_name))
+
+    def iter_repository_pull_requests(
+        self, repo_name: str, since: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream pull requests from repository page by page.
+
+        With since, only pull requests updated at or after it are read,
+        newest first.
+        """
         owner, name = self._parse_repo_name(repo_name)
+        variables: Dict[str, Any] = {"owner": owner, "name": name}
+        recent = self._updated_since(variables, since)
 
-        paginator = GraphQLPaginator(self._gql_client)
-        all_prs = paginator.paginate_all(
+        paginator = self._create_paginator()
+        for page in paginator.paginate_iter(
             query=REPOSITORY_PULL_REQUESTS_QUERY,
-            variable_values={"owner": owner, "name": name},
+            variable_values=variables,
             data_path="repository.pullRequests",
-        )
-
-        return convert_graphql_pull_requests_to_rest_format(all_prs, repo_name)
+            post_processor=self._complete_nested(
+                [PULL_REQUEST_ASSIGNEES_CONNECTION, PULL_REQUEST_LABELS_CONNECTION],
+                node_filter=recent,
+            ),
+        ):
+            yield from convert_graphql_pull_requests_to_rest_format(page, repo_name)
+            if recent is not None and recent.exhausted:
+                return
 
     def get_pull_request_comments(
         self, repo_name: str, pr_number: int
     ) -> List[Dict[str, Any]]:
         """Get comments for specific pull request using GraphQL."""
-        owner, name = self._parse_repo_name(repo_name)
-
-        def comment_post_processor(nodes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-            """Post-process comments to add pull request URL."""
-            pr_data = self._gql_client.execute(
-                PULL_REQUEST_COMMENTS_QUERY,
-                variable_values={
-                    "owner": owner,
-                    "name": name,
-                    "prNumber": pr_number,
-                    "first": 1,  # Only needed to get the PR URL
-                    "after": None,
-                },
-            )["repository"]["pullRequest"]
-
-            if not pr_data:
-                return []
+        return self.get_pull_request_comments_batch(repo_name, [pr_number])[pr_number]
 
-            pull_request_url = pr_data["url"]
-            return CommentEnricher.enrich_pr_comments(nodes, pull_request_url)
+    def get_pull_request_comments_batch(
+        self, repo_name: str, pr_numbers: Sequence[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Get comments for many pull requests with aliased batch queries."""
+        owner, name = self._parse_repo_name(repo_name)
 
-        paginator = GraphQLPaginator(self._gql_client)
-        all_comments = paginator.paginate_all(
-            query=PULL_REQUEST_COMMENTS_QUERY,
-            variable_values={
-                "owner": owner,
-                "name": name,
-                "prNumber": pr_number,
-            },
-            data_path="repository.pullRequest.comments",
-            post_processor=comment_post_processor,
+        prs = self._alias_fetcher.fetch(
+            owner, name, PULL_REQUEST_COMMENTS_LOOKUP, pr_numbers
+        )
+        self._nested_resolver.resolve(
+            [pr for pr in prs.values() if pr], [PULL_REQUEST_COMMENTS_CONNECTION]
         )
 
-        return convert_graphql_pr_comments_to_rest_format(all_comments)
+        comments_by_pr: Dict[int, List[Dict[str, Any]]] = {}
+        for pr_number, pr in prs.items():
+            if not pr:
+                comments_by_pr[pr_number] = []
+                continue
+            comments = CommentEnricher.enrich_pr_comments(
+                pr["comments"]["nodes"], pr["url"]
+            )
+            comments_by_pr[pr_number] = convert_graphql_pr_comments_to_rest_format(
+                comments
+            )
+        return comments_by_pr
 
     def get_all_pull_request_comments(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all comments from all pull requests using GraphQL for performance."""
+        return list(self.iter_all_pull_request_comments(repo_name))
+
+    def iter_all_pull_request_comments(
+        self, repo_name: str, since: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream comments from all pull requests page by page.
+
+        With since, only comments of pull requests updated at or after it
+        are read.
+        """
         owner, name = self._parse_repo_name(repo_name)
+        variables: Dict[str, Any] = {"owner": owner, "name": name}
+        recent = self._updated_since(variables, since)
 
         def comment_post_processor(
             prs_nodes: List[Dict[str, Any]],
@@ -208,20 +502,29 @@ class GitHubGraphQLClient:
                 all_comments.extend(comments)
             return all_comments
 
-        paginator = GraphQLPaginator(self._gql_client)
-        all_comments = paginator.paginate_all(
+        paginator = self._create_paginator()
+        for page in paginator.paginate_iter(
             query=REPOSITORY_PR_COMMENTS_QUERY,
-            variable_values={"owner": owner, "name": name},
+            variable_values=variables,
             data_path="repository.pullRequests",
-            post_processor=comment_post_processor,
-        )
-
-        return convert_graphql_pr_comments_to_rest_format(all_comments)
+            post_processor=self._complete_nested(
+                [PULL_REQUEST_COMMENTS_CONNECTION],
+                comment_post_processor,
+                node_filter=recent,
+            ),
+        ):
+            yield from convert_graphql_pr_comments_to_rest_format(page)
+            if recent is not None and recent.exhausted:
+                return
 
     # Sub-Issues Operations
 
     def get_repository_sub_issues(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all sub-issue relationships from repository using GraphQL."""
+        return list(self.iter_repository_sub_issues(repo_name))
+
+    def iter_repository_sub_issues(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream sub-issue relationships from repository page by page."""
         owner, name = self._parse_repo_name(repo_name)
 
         def sub_issues_post_processor(
@@ -232,59 +535,74 @@ class GitHubGraphQLClient:
                 issues_nodes
             )
 
-        paginator = GraphQLPaginator(self._gql_client)
-        all_sub_issues = paginator.paginate_all(
+        paginator = self._create_paginator()
+        for page in paginator.paginate_iter(
             query=REPOSITORY_SUB_ISSUES_QUERY,
             variable_values={"owner": owner, "name": name},
             data_path="repository.issues",
-            post_processor=sub_issues_post_processor,
-        )
-
-        return all_sub_issues
+            post_processor=self._complete_nested(
+                [SUB_ISSUES_CONNECTION], sub_issues_post_processor
+            ),
+        ):
+            yield from page
 
     def get_issue_sub_issues_graphql(
         self, repo_name: str, issue_number: int
     ) -> List[Dict[str, Any]]:
         """Get sub-issues for a specific issue using GraphQL."""
+        return self.get_issue_sub_issues_graphql_batch(repo_name, [issue_number])[
+            issue_number
+        ]
+
+    def get_issue_sub_issues_graphql_batch(
+        self, repo_name: str, issue_numbers: Sequence[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Get sub-issues for many issues with aliased batch queries."""
         owner, name = self._parse_repo_name(repo_name)
 
-        def sub_issues_post_processor(
-            sub_issues_nodes: List[Dict[str, Any]],
-        ) -> List[Dict[str, Any]]:
-            """Post-process sub-issues with additional metadata."""
-            # First, get the parent issue details to enrich sub-issues
-            result = self._gql_client.execute(
-                ISSUE_SUB_ISSUES_QUERY,
-                variable_values={
-                    "owner": owner,
-                    "name": name,
-                    "issueNumber": issue_number,
-                    "first": 1,  # We just need the parent issue details
-                },
+        issues = self._alias_fetcher.fetch(
+            owner, name, ISSUE_SUB_ISSUES_LOOKUP, issue_numbers
+        )
+        self._nested_resolver.resolve(
+            [issue for issue in issues.values() if issue],
+            [ISSUE_SUB_ISSUE_DETAILS_CONNECTION],
+        )
+
+        return {
+            issue_number: (
+                SubIssueRelationshipBuilder.build_issue_relationships(
+                    issue["subIssues"]["nodes"], issue
+                )
+                if issue
+                else []
             )
+            for issue_number, issue in issues.items()
+        }
 
-            issue_data = result["repository"]["issue"]
-            if not issue_data:
-                return []
+    def get_issue_parent(
+        self, repo_name: str, issue_number: int
+    ) -> Optional[Dict[str, Any]]:
+        """Get parent issue if this issue is a sub-issue using GraphQL."""
+        return self.get_issue_parents_batch(repo_name, [issue_number])[issue_number]
 
-            # Enrich each sub-issue with parent issue details
-            return SubIssueRelationshipBuilder.build_issue_relationships(
-                sub_issues_nodes, issue_data
-            )
+    def get_issue_parents_batch(
+        self, repo_name: str, issue_numbers: Sequence[int]
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """Get parent issues of many issues with aliased batch queries.
 
-        paginator = GraphQLPaginator(self._gql_client)
-        all_sub_issues = paginator.paginate_all(
-            query=ISSUE_SUB_ISSUES_QUERY,
-            variable_values={
-                "owner": owner,
-                "name": name,
-                "issueNumber": issue_number,
-            },
-            data_path="repository.issue.subIssues",
-            post_processor=sub_issues_post_processor,
-        )
+        Issues without a parent, and issues that do not exist, map to None.
+        """
+        owner, name = self._parse_repo_name(repo_name)
 
-        return all_sub_issues
+        issues = self._alias_fetcher.fetch(
+            owner, name, ISSUE_PARENT_LOOKUP, issue_numbers
+        )
+        return {
+            issue_number: convert_graphql_issue_parent_to_rest_format(
+                issue.get("parent") if issue else None
+            )
+            for issue_number, issue in issues.items()
+        }
 
     # Pull Request Reviews
 
@@ -292,30 +610,40 @@ class GitHubGraphQLClient:
         self, repo_name: str, pr_number: int
     ) -> List[Dict[str, Any]]:
         """Get reviews for specific pull request using GraphQL."""
-        owner, name = self._parse_repo_name(repo_name)
+        return self.get_pull_request_reviews_batch(repo_name, [pr_number])[pr_number]
 
-        def review_post_processor(
-            reviews_nodes: List[Dict[str, Any]],
-        ) -> List[Dict[str, Any]]:
-            """Post-process reviews with additional metadata."""
-            return ReviewEnricher.enrich_pr_reviews(reviews_nodes, pr_number)
+    def get_pull_request_reviews_batch(
+        self, repo_name: str, pr_numbers: Sequence[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Get reviews for many pull requests with aliased batch queries."""
+        owner, name = self._parse_repo_name(repo_name)
 
-        paginator = GraphQLPaginator(self._gql_client)
-        all_reviews = paginator.paginate_all(
-            query=PULL_REQUEST_REVIEWS_QUERY,
-            variable_values={
-                "owner": owner,
-                "name": name,
-                "prNumber": pr_number,
-            },
-            data_path="repository.pullRequest.reviews",
-            post_processor=review_post_processor,
+        prs = self._alias_fetcher.fetch(
+            owner, name, PULL_REQUEST_REVIEWS_LOOKUP, pr_numbers
+        )
+        self._nested_resolver.resolve(
+            [pr for pr in prs.values() if pr], [PULL_REQUEST_REVIEWS_CONNECTION]
         )
 
-        return convert_graphql_pr_reviews_to_rest_format(all_reviews)
+        reviews_by_pr: Dict[int, List[Dict[str, Any]]] = {}
+        for pr_number, pr in prs.items():
+            if not pr:
+                reviews_by_pr[pr_number] = []
+                continue
+            reviews = ReviewEnricher.enrich_pr_reviews(
+                pr["reviews"]["nodes"], pr_number
+            )
+            reviews_by_pr[pr_number] = convert_graphql_pr_reviews_to_rest_format(
+                reviews
+            )
+        return reviews_by_pr
 
     def get_all_pull_request_reviews(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all reviews from all pull requests using GraphQL for performance."""
+        return list(self.iter_all_pull_request_reviews(repo_name))
+
+    def iter_all_pull_request_reviews(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream reviews from all pull requests page by page."""
         owner, name = self._parse_repo_name(repo_name)
 
         def review_post_processor(
@@ -332,48 +660,66 @@ class GitHubGraphQLClient:
                 all_reviews.extend(reviews)
             return all_reviews
 
-        paginator = GraphQLPaginator(self._gql_client)
-        all_reviews = paginator.paginate_all(
+        paginator = self._create_paginator()
+        for page in paginator.paginate_iter(
             query=REPOSITORY_PR_REVIEWS_QUERY,
             variable_values={"owner": owner, "name": name},
             data_path="repository.pullRequests",
-            post_processor=review_post_processor,
-        )
-
-        return convert_graphql_pr_reviews_to_rest_format(all_reviews)
+            post_processor=self._complete_nested(
+                [PULL_REQUEST_REVIEWS_CONNECTION], review_post_processor
+            ),
+        ):
+            yield from convert_graphql_pr_reviews_to_rest_format(page)
 
     def get_pull_request_review_comments(
         self, repo_name: str, review_id: str
     ) -> List[Dict[str, Any]]:
         """Get comments for specific pull request review using GraphQL."""
-        owner, name = self._parse_repo_name(repo_name)
-
-        def comment_post_processor(
-            comments_nodes: List[Dict[str, Any]],
-        ) -> List[Dict[str, Any]]:
-            """Post-process review comments with additional metadata."""
-            return ReviewCommentEnricher.enrich_review_comments(
-                comments_nodes, review_id
-            )
+        return self.get_pull_request_review_comments_batch(repo_name, [review_id])[
+            review_id
+        ]
 
-        paginator = GraphQLPaginator(self._gql_client)
-        all_comments = paginator.paginate_all(
-            query=REVIEW_COMMENTS_QUERY,
-            variable_values={
-                "owner": owner,
-                "name": name,
-                "reviewId": review_id,
-            },
-            data_path="repository.pullRequest.review.comments",
-            post_processor=comment_post_processor,
-        )
+    def get_pull_request_review_comments_batch(
+        self, repo_name: str, review_ids: Sequence[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get comments for many reviews with batched node queries.
 
-        return convert_graphql_review_comments_to_rest_format(all_comments)
+        Review IDs are global node IDs, so the reviews are fetched as
+        connections that still have every page to load.
+        """
+        self._parse_repo_name(repo_name)
+
+        reviews: List[Dict[str, Any]] = [
+            {
+                "id": review_id,
+                "comments": {
+                    "nodes": [],
+                    "pageInfo": {"hasNextPage": True, "endCursor": None},
+                },
+            }
+            for review_id in dict.fromkeys(review_ids)
+        ]
+        self._nested_resolver.resolve(reviews, [REVIEW_COMMENTS_CONNECTION])
+
+        return {
+            review["id"]: convert_graphql_review_comments_to_rest_format(
+                ReviewCommentEnricher.enrich_review_comments(
+                    review["comments"]["nodes"], review["id"]
+                )
+            )
+            for review in reviews
+        }
 
     def get_all_pull_request_review_comments(
         self, repo_name: str
     ) -> List[Dict[str, Any]]:
         """Get all review comments from all reviews using GraphQL for performance."""
+        return list(self.iter_all_pull_request_review_comments(repo_name))
+
+    def iter_all_pull_request_review_comments(
+        self, repo_name: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream review comments from all reviews page by page."""
         owner, name = self._parse_repo_name(repo_name)
 
         def comment_post_processor(
@@ -392,21 +738,22 @@ class GitHubGraphQLClient:
                     all_comments.extend(comments)
             return all_comments
 
-        paginator = GraphQLPaginator(self._gql_client)
-        all_comments = paginator.paginate_all(
+        paginator = self._create_paginator()
+        for page in paginator.paginate_iter(
             query=REPOSITORY_REVIEW_COMMENTS_QUERY,
             variable_values={"owner": owner, "name": name},
             data_path="repository.pullRequests",
-            post_processor=comment_post_processor,
-        )
-
-        return convert_graphql_review_comments_to_rest_format(all_comments)
+            post_processor=self._complete_nested(
+                [PULL_REQUEST_REVIEW_IDS_CONNECTION], comment_post_processor
+            ),
+        ):
+            yield from convert_graphql_review_comments_to_rest_format(page)
 
     # Rate Limit Monitoring
 
     def get_rate_limit_status(self) -> Dict[str, Any]:
         """Get current rate limit status using GraphQL."""
-        result = self._gql_client.execute(RATE_LIMIT_QUERY)
+        result = self.execute(RATE_LIMIT_QUERY)
         rate_limit_data = result["rateLimit"]
 
         rate_limit_response = {
@@ -422,25 +769,215 @@ class GitHubGraphQLClient:
 
     def get_repository_milestones(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all repository milestones with pagination."""
+        return list(self.iter_repository_milestones(repo_name))
 
+    def iter_repository_milestones(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream repository milestones page by page."""
         owner, name = repo_name.split("/", 1)
-        milestones = []
         after = None
-
-        from gql import gql
+        query = compile_query(REPOSITORY_MILESTONES_QUERY)
 
         while True:
             variables = build_milestones_query_variables(owner, name, after)
-            response = self._gql_client.execute(
-                gql(REPOSITORY_MILESTONES_QUERY), variable_values=variables
-            )
+            response = self.execute(query, variable_values=variables)
 
             milestone_data = response["repository"]["milestones"]
-            milestones.extend(milestone_data["nodes"])
+            yield from milestone_data["nodes"]
 
             if not milestone_data["pageInfo"]["hasNextPage"]:
                 break
 
             after = milestone_data["pageInfo"]["endCursor"]
 
-        return milestones
+    # Release Operations
+
+    def get_repository_releases(self, repo_name: str) -> List[Dict[str, Any]]:
+        """Get all releases with their assets using GraphQL pagination."""
+        return list(self.iter_repository_releases(repo_name))
+
+    def iter_repository_releases(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream releases with their assets page by page, newest first."""
+        owner, name = self._parse_repo_name(repo_name)
+        default_branch: Optional[str] = None
+
+        paginator = self._create_paginator()
+        for page in paginator.paginate_iter(
+            query=REPOSITORY_RELEASES_QUERY,
+            variable_values={"owner": owner, "name": name},
+            data_path="repository.releases",
+            post_processor=self._complete_nested([RELEASE_ASSETS_CONNECTION]),
+        ):
+            # Looked up once, and only if there are releases to target it
+            if default_branch is None and page:
+                default_branch = self._get_default_branch(owner, name)
+            yield from convert_graphql_releases_to_rest_format(
+                page, default_branch or ""
+            )
+
+    def _get_default_branch(self, owner: str, name: str) -> str:
+        """Get the name of the repository's default branch, if it has one."""
+        result = self.execute(
+            REPOSITORY_DEFAULT_BRANCH_QUERY,
+            variable_values={"owner": owner, "name": name},
+        )
+        branch_ref = result["repository"]["defaultBranchRef"]
+        return branch_ref["name"] if branch_ref else ""
+
+    # Batched Mutations
+
+    def create_labels_batch(
+        self, repo_name: str, labels: Sequence[Dict[str, Any]]
+    ) -> List[MutationResult]:
+        """Create many labels with aliased batch mutations.
+
+        Args:
+            repo_name: Repository in "owner/repo" format
+            labels: Labels to create, each with name, color and description
+
+        Returns:
+            Created label, or the error it failed with, for each label in order
+        """
+        owner, name = self._parse_repo_name(repo_name)
+        repository_id = self._get_repository_id(owner, name)
+
+        results = self._mutation_batcher.execute(
+            CREATE_LABEL_MUTATION,
+            [
+                {
+                    "repositoryId": repository_id,
+                    "name": label["name"],
+                    "color": label["color"],
+                    "description": label.get("description") or "",
+                }
+                for label in labels
+            ],
+        )
+        return [
+            (
+                result
+                if isinstance(result, MutationError)
+                else convert_graphql_labels_to_rest_format([result["label"]])[0]
+            )
+            for result in results
+        ]
+
+    def add_sub_issues_batch(
+        self, repo_name: str, links: Sequence[Tuple[int, int]]
+    ) -> List[MutationResult]:
+        """Link many sub-issues to their parents with aliased batch mutations.
+
+        Args:
+            repo_name: Repository in "owner/repo" format
+            links: (parent issue number, sub-issue number) pairs, applied in
+                order so sub-issues keep their position under the parent
+
+        Returns:
+            Linked issue numbers, or the error the link failed with, for each
+            link in order
+        """
+        owner, name = self._parse_repo_name(repo_name)
+        node_ids = self._alias_fetcher.fetch(
+            owner,
+            name,
+            ISSUE_OR_PULL_REQUEST_ID_LOOKUP,
+            [number for link in links for number in link],
+        )
+
+        def mutation_input(link: Tuple[int, int]) -> Dict[str, Any]:
+            parent, sub_issue = (node_ids.get(number) for number in link)
+            return {
+                "issueId": parent["id"] if parent else None,
+                "subIssueId": sub_issue["id"] if sub_issue else None,
+            }
+
+        results = self._execute_resolved_mutations(
+            ADD_SUB_ISSUE_MUTATION,
+            [mutation_input(link) for link in links],
+            ("issueId", "subIssueId"),
+        )
+        return [
+            (
+                result
+                if isinstance(result, MutationError)
+                else {
+                    "parent_issue_number": result["issue"]["number"],
+                    "sub_issue_number": result["subIssue"]["number"],
+                }
+            )
+            for result in results
+        ]
+
+    def create_issue_comments_batch(
+        self, repo_name: str, comments: Sequence[Tuple[int, str]]
+    ) -> List[MutationResult]:
+        """Add many issue or pull request comments with aliased batch mutations.
+
+        Args:
+            repo_name: Repository in "owner/repo" format
+            comments: (issue or pull request number, body) pairs, created in
+                order
+
+        Returns:
+            Created comment, or the error it failed with, for each comment in
+            order
+        """
+        owner, name = self._parse_repo_name(repo_name)
+        node_ids = self._alias_fetcher.fetch(
+            owner,
+            name,
+            ISSUE_OR_PULL_REQUEST_ID_LOOKUP,
+            [number for number, _ in comments],
+        )
+
+        def mutation_input(comment: Tuple[int, str]) -> Dict[str, Any]:
+            subject = node_ids.get(comment[0])
+            return {"subjectId": subject["id"] if subject else None, "body": comment[1]}
+
+        results = self._execute_resolved_mutations(
+            ADD_COMMENT_MUTATION,
+            [mutation_input(comment) for comment in comments],
+            ("subjectId",),
+        )
+        return [
+            (
+                result
+                if isinstance(result, MutationError)
+                else convert_graphql_added_comment_to_rest_format(
+                    result["commentEdge"]["node"]
+                )
+            )
+            for result in results
+        ]
+
+    def _execute_resolved_mutations(
+        self,
+        mutation: AliasedMutation,
+        inputs: List[Dict[str, Any]],
+        id_fields: Tuple[str, ...],
+    ) -> List[MutationResult]:
+        """Send the mutations whose node IDs resolved; fail the others."""
+        results: List[Optional[MutationResult]] = [None] * len(inputs)
+        resolved = []
+        for index, mutation_input in enumerate(inputs):
+            if all(mutation_input[field] for field in id_fields):
+                resolved.append(index)
+            else:
+                results[index] = MutationError(
+                    f"{mutation.field}: issue or pull request not found",
+                    mutation_input,
+                )
+
+        sent = self._mutation_batcher.execute(
+            mutation, [inputs[index] for index in resolved]
+        )
+        for index, result in zip(resolved, sent):
+            results[index] = result
+        return [result for result in results if result is not None]
+
+    def _get_repository_id(self, owner: str, name: str) -> str:
+        """Get the node ID of a repository."""
+        result = self.execute(
+            REPOSITORY_ID_QUERY, variable_values={"owner": owner, "name": name}
+        )
+        repository_id: str = result["repository"]["id"]
+        return repository_id
@@ -5,7 +5,10 @@ Transforms GraphQL response structures to be compatible with
 the existing REST-based data processing pipeline.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+# REST user ID of GitHub's "ghost" account, which stands in for deleted users
+GHOST_USER_ID = 10137
 
 
 def convert_graphql_labels_to_rest_format(
@@ -317,3 +320,110 @@ def convert_graphql_review_comments_to_rest_format(
         rest_comments.append(rest_comment)
 
     return rest_comments
+
+
+def convert_graphql_release_assets_to_rest_format(
+    graphql_assets: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Convert GraphQL release asset nodes to REST API format.
+
+    Assets keep their REST (database) IDs, which the asset download and
+    upload endpoints are addressed by.
+    """
+    return [
+        {
+            "id": asset.get("databaseId") or asset["id"],
+            "name": asset["name"],
+            "content_type": asset["contentType"],
+            "size": asset["size"],
+            "download_count": asset["downloadCount"],
+            "browser_download_url": asset["downloadUrl"],
+            "created_at": asset["createdAt"],
+            "updated_at": asset["updatedAt"],
+            "digest": asset.get("digest"),
+            "uploader": {
+                "login": asset["uploadedBy"]["login"],
+                "id": asset["uploadedBy"].get("id"),
+                "avatar_url": asset["uploadedBy"].get("avatarUrl"),
+                "html_url": asset["uploadedBy"].get("url"),
+            },
+        }
+        for asset in graphql_assets
+    ]
+
+
+def convert_graphql_releases_to_rest_format(
+    graphql_releases: List[Dict[str, Any]], default_branch: str = ""
+) -> List[Dict[str, Any]]:
+    """Convert GraphQL release nodes to REST API format.
+
+    Releases keep their REST (database) IDs. GraphQL does not expose the
+    branch a release was created from, so every release targets
+    default_branch, as REST reports for releases made on it. The commit
+    its tag points at, if the tag exists, is kept as tag_commit_sha;
+    restores create a missing tag there and only fall back to the branch
+    when the repository lacks that commit.
+    """
+    rest_releases = []
+
+    for release in graphql_releases:
+        # Deleted accounts are reported as the ghost user, as in REST
+        author: Dict[str, Any] = {"login": "ghost", "id": GHOST_USER_ID}
+        if release.get("author"):
+            author = {
+                "login": release["author"]["login"],
+                "id": release["author"].get("id"),
+                "avatar_url": release["author"].get("avatarUrl"),
+                "html_url": release["author"].get("url"),
+            }
+
+        tag_commit = release.get("tagCommit")
+        rest_release = {
+            "id": release.get("databaseId") or release["id"],
+            "tag_name": release["tagName"],
+            "target_commitish": default_branch,
+            "tag_commit_sha": tag_commit["oid"] if tag_commit else None,
+            "name": release.get("name"),
+            "body": release.get("description"),
+            "draft": release.get("isDraft", False),
+            "prerelease": release.get("isPrerelease", False),
+            "immutable": release.get("immutable", False),
+            "created_at": release["createdAt"],
+            "published_at": release.get("publishedAt"),
+            "html_url": release["url"],
+            "author": author,
+            "assets": convert_graphql_release_assets_to_rest_format(
+                release.get("releaseAssets", {}).get("nodes", [])
+            ),
+        }
+        rest_releases.append(rest_release)
+
+    return rest_releases
+
+
+def convert_graphql_issue_parent_to_rest_format(
+    graphql_parent: Optional[Dict[str, Any]],
+) -> Optional[Dict[str, Any]]:
+    """Convert a GraphQL parent issue node to the REST parent issue subset."""
+    if not graphql_parent:
+        return None
+    return {
+        "id": graphql_parent.get("databaseId") or graphql_parent["id"],
+        "node_id": graphql_parent["id"],
+        "number": graphql_parent["number"],
+        "title": graphql_parent["title"],
+        "state": graphql_parent["state"].lower(),
+        "html_url": graphql_parent["url"],
+    }
+
+
+def convert_graphql_added_comment_to_rest_format(
+    graphql_comment: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Convert a comment node returned by addComment to REST API format."""
+    return {
+        "id": graphql_comment.get("databaseId") or graphql_comment["id"],
+        "node_id": graphql_comment["id"],
+        "body": graphql_comment["body"],
+        "html_url": graphql_comment["url"],
+    }
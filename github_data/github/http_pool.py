@@ -0,0 +1,104 @@
+"""
+Shared HTTP connection pool for GitHub API transports.
+
+gql's RequestsHTTPTransport opens a new requests session for every query and
+closes it afterwards, so each query pays a fresh TLS handshake. The pool
+keeps one keep-alive connection pool that every GraphQL transport, on every
+thread, sends through, and reports how well connections are being reused.
+"""
+
+import threading
+from typing import Any, Dict
+
+import requests
+from gql.transport.requests import RequestsHTTPTransport
+from requests.adapters import HTTPAdapter
+
+# Connections kept alive per host; matches requests' own default
+DEFAULT_POOL_SIZE = 10
+
+
+class SharedHTTPPool:
+    """Keep-alive connection pool shared by transports on any thread.
+
+    The pool blocks callers when all connections are busy instead of opening
+    throwaway connections, so size it to the number of concurrent callers.
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE):
+        """
+        Initialize pool.
+
+        Args:
+            size: Maximum number of connections kept open per host
+
+        Raises:
+            ValueError: If size is below 1
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        self._size = size
+        self._adapter = HTTPAdapter(
+            pool_connections=size, pool_maxsize=size, pool_block=True
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Maximum number of connections kept open per host."""
+        return self._size
+
+    def mount(self, session: requests.Session) -> None:
+        """Route a session's HTTP(S) requests through the shared connections."""
+        for prefix in "http://", "https://":
+            session.mount(prefix, self._adapter)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return connection reuse statistics.
+
+        Returns:
+            Number of hosts with a pool, connections opened and requests sent
+        """
+        pools = self._adapter.poolmanager.pools
+        with self._lock:
+            host_pools = [pools[key] for key in pools.keys()]
+        return {
+            "hosts": len(host_pools),
+            "connections_opened": sum(pool.num_connections for pool in host_pools),
+            "requests": sum(pool.num_requests for pool in host_pools),
+        }
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self._adapter.close()
+
+
+class PooledRequestsHTTPTransport(RequestsHTTPTransport):
+    """gql requests transport whose sessions share a SharedHTTPPool.
+
+    gql connects and closes the transport around every query; closing only
+    drops the session object so pooled connections stay open for the next
+    query.
+    """
+
+    def __init__(self, http_pool: SharedHTTPPool, **kwargs: Any):
+        """
+        Initialize transport.
+
+        Args:
+            http_pool: Connection pool to send requests through
+            **kwargs: Arguments for RequestsHTTPTransport
+        """
+        super().__init__(**kwargs)
+        self._http_pool = http_pool
+
+    def connect(self) -> None:
+        """Open a session sending through the shared connections."""
+        super().connect()
+        if self.session is not None:
+            self._http_pool.mount(self.session)
+
+    def close(self) -> None:
+        """Drop the session, keeping the shared connections alive."""
+        self.session = None
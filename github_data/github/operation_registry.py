@@ -3,6 +3,8 @@
 import logging
 from typing import Dict, Any, Optional, List
 
+from .cache import CacheTag
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,6 +101,25 @@ class Operation:
         param_values = ":".join(str(kwargs[k]) for k in sorted(kwargs.keys()))
         return f"{self.method_name}:{param_values}"
 
+    def get_cache_tag(self, **kwargs: Any) -> Optional[CacheTag]:
+        """
+        Get the repository and data type the operation reads or modifies.
+
+        A cache_key_template in "data_type:{repo_name}..." form names the
+        data type; otherwise it is the entity name.
+
+        Args:
+            **kwargs: Method parameters
+
+        Returns:
+            Cache tag, or None if the operation is not scoped to a repository
+        """
+        if self.cache_key_template:
+            return CacheTag.from_cache_key(self.get_cache_key(**kwargs))
+        if "repo_name" in kwargs:
+            return CacheTag(repo_name=kwargs["repo_name"], data_type=self.entity_name)
+        return None
+
 
 class GitHubOperationRegistry:
     """Registry for dynamically discovered GitHub API operations."""
@@ -6,7 +6,11 @@ and architectural clarity through abstract interfaces.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Sequence, Tuple, Union
+
+# Receives the position of an item of a batched write and its result, or the
+# error it failed with, as soon as the result is known
+BatchResultCallback = Callable[[int, Union[Dict[str, Any], Exception]], None]
 
 
 class RepositoryService(ABC):
@@ -254,6 +258,104 @@ class RepositoryService(ABC):
         """Change sub-issue order/position."""
         pass
 
+    @abstractmethod
+    def create_labels_batch(
+        self,
+        repo_name: str,
+        labels: Sequence[Dict[str, Any]],
+        on_result: Optional[BatchResultCallback] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Create many labels, continuing past labels that fail.
+
+        Args:
+            repo_name: Repository in "owner/repo" format
+            labels: Labels to create, each with name, color and description
+            on_result: Called with each label's result once its request
+                returned
+
+        Returns:
+            Created label, or the error it failed with, for each label in order
+        """
+        pass
+
+    @abstractmethod
+    def add_sub_issues_batch(
+        self,
+        repo_name: str,
+        links: Sequence[Tuple[int, int]],
+        on_result: Optional[BatchResultCallback] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Link many sub-issues to their parents, continuing past failures.
+
+        Args:
+            repo_name: Repository in "owner/repo" format
+            links: (parent issue number, sub-issue number) pairs, in order
+            on_result: Called with each link's result once its request
+                returned
+
+        Returns:
+            Link data, or the error the link failed with, for each link in order
+        """
+        pass
+
+    @abstractmethod
+    def create_issue_comments_batch(
+        self,
+        repo_name: str,
+        comments: Sequence[Tuple[int, str]],
+        on_result: Optional[BatchResultCallback] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Add many issue or pull request comments, in order.
+
+        Args:
+            repo_name: Repository in "owner/repo" format
+            comments: (issue or pull request number, body) pairs
+            on_result: Called with each comment's result once its request
+                returned
+
+        Returns:
+            Created comment, or the error it failed with, for each comment
+            in order
+        """
+        pass
+
+    @abstractmethod
+    def start_issue_import(
+        self,
+        repo_name: str,
+        issue: Dict[str, Any],
+        comments: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Queue an issue with its comments for import.
+
+        Args:
+            repo_name: Repository in "owner/repo" format
+            issue: Issue fields (title, body, closed, labels, ...)
+            comments: Comments, each with body and created_at
+
+        Returns:
+            Import status, including the import's id
+        """
+        pass
+
+    @abstractmethod
+    def get_issue_import(self, repo_name: str, import_id: int) -> Dict[str, Any]:
+        """Get the status of one issue import."""
+        pass
+
+    @abstractmethod
+    def get_issue_imports(self, repo_name: str, since: str) -> List[Dict[str, Any]]:
+        """Get the status of every issue import queued at or after since.
+
+        Args:
+            repo_name: Repository in "owner/repo" format
+            since: ISO 8601 timestamp
+
+        Returns:
+            Import statuses
+        """
+        pass
+
     @abstractmethod
     def create_milestone(
         self,
@@ -291,6 +393,37 @@ class RepositoryService(ABC):
         """Create a release."""
         pass
 
+    @abstractmethod
+    def get_release_by_tag(
+        self, repo_name: str, tag_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get a published release by its tag, or None if there is none."""
+        pass
+
+    @abstractmethod
+    def get_release_assets(
+        self, repo_name: str, release_id: int
+    ) -> List[Dict[str, Any]]:
+        """Get all assets of a release."""
+        pass
+
+    @abstractmethod
+    def upload_release_asset(
+        self,
+        repo_name: str,
+        release_id: int,
+        file_path: str,
+        name: str,
+        content_type: str,
+    ) -> Dict[str, Any]:
+        """Upload a file as release asset."""
+        pass
+
+    @abstractmethod
+    def delete_release_asset(self, repo_name: str, asset_id: int) -> None:
+        """Delete a release asset."""
+        pass
+
 
 class RateLimitHandler(ABC):
     """Abstract interface for rate limiting operations."""
@@ -383,6 +516,13 @@ class GitHubApiBoundary(ABC):
         """Get issue sub-issues from GitHub GraphQL API."""
         pass
 
+    @abstractmethod
+    def get_issue_parent_graphql(
+        self, repo_name: str, issue_number: int
+    ) -> Optional[Dict[str, Any]]:
+        """Get issue parent from GitHub GraphQL API."""
+        pass
+
     @abstractmethod
     def get_issue_parent(
         self, repo_name: str, issue_number: int
@@ -16,6 +16,7 @@ from .pull_requests import (
     PULL_REQUEST_COMMENTS_QUERY,
     REPOSITORY_PR_COMMENTS_QUERY,
 )
+from .releases import REPOSITORY_RELEASES_QUERY
 from .sub_issues import REPOSITORY_SUB_ISSUES_QUERY, ISSUE_SUB_ISSUES_QUERY
 from .utility import REPOSITORY_BACKUP_QUERY, RATE_LIMIT_QUERY
 
@@ -31,6 +32,8 @@ __all__ = [
     "REPOSITORY_PULL_REQUESTS_QUERY",
     "PULL_REQUEST_COMMENTS_QUERY",
     "REPOSITORY_PR_COMMENTS_QUERY",
+    # Releases
+    "REPOSITORY_RELEASES_QUERY",
     # Sub-Issues
     "REPOSITORY_SUB_ISSUES_QUERY",
     "ISSUE_SUB_ISSUES_QUERY",
@@ -6,6 +6,27 @@ Provides optimized queries for fetching all comments across a repository.
 
 from gql import gql
 
+from ..utils.nested_connections import NestedConnection
+
+# Comment fields shared by issue and pull request comment queries
+ISSUE_COMMENT_FIELDS_FRAGMENT = """
+    fragment IssueCommentFields on IssueComment {
+        id
+        body
+        createdAt
+        updatedAt
+        url
+        author {
+            login
+            ... on User {
+                id
+                avatarUrl
+                url
+            }
+        }
+    }
+"""
+
 # All issue comments across repository
 REPOSITORY_COMMENTS_QUERY = gql(
     """
@@ -13,15 +34,23 @@ REPOSITORY_COMMENTS_QUERY = gql(
         $owner: String!,
         $name: String!,
         $first: Int!,
-        $after: String
+        $after: String,
+        $since: DateTime
     ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
             issues(
                 first: $first,
                 after: $after,
-                orderBy: {field: CREATED_AT, direction: ASC}
+                orderBy: {field: CREATED_AT, direction: ASC},
+                filterBy: {since: $since}
             ) {
                 nodes {
+                    id
                     number
                     url
                     comments(
@@ -29,19 +58,7 @@ REPOSITORY_COMMENTS_QUERY = gql(
                         orderBy: {field: UPDATED_AT, direction: ASC}
                     ) {
                         nodes {
-                            id
-                            body
-                            createdAt
-                            updatedAt
-                            url
-                            author {
-                                login
-                                ... on User {
-                                    id
-                                    avatarUrl
-                                    url
-                                }
-                            }
+                            ...IssueCommentFields
                         }
                         pageInfo {
                             hasNextPage
@@ -57,4 +74,14 @@ REPOSITORY_COMMENTS_QUERY = gql(
         }
     }
 """
+    + ISSUE_COMMENT_FIELDS_FRAGMENT
+)
+
+# Comments beyond the first page of each issue in REPOSITORY_COMMENTS_QUERY
+ISSUE_COMMENTS_CONNECTION = NestedConnection(
+    field="comments",
+    parent_type="Issue",
+    node_fields="...IssueCommentFields",
+    fragments=ISSUE_COMMENT_FIELDS_FRAGMENT,
+    arguments="orderBy: {field: UPDATED_AT, direction: ASC}",
 )
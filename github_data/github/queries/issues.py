@@ -6,6 +6,9 @@ Provides optimized queries for fetching repository issues and their comments.
 
 from gql import gql
 
+from ..utils.nested_connections import NestedConnection
+from .labels import LABEL_FIELDS_FRAGMENT
+
 # Repository issues with labels (for issue-only backup operations)
 REPOSITORY_ISSUES_QUERY = gql(
     """
@@ -13,13 +16,20 @@ REPOSITORY_ISSUES_QUERY = gql(
         $owner: String!,
         $name: String!,
         $first: Int!,
-        $after: String
+        $after: String,
+        $since: DateTime
     ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
             issues(
                 first: $first,
                 after: $after,
-                orderBy: {field: CREATED_AT, direction: ASC}
+                orderBy: {field: CREATED_AT, direction: ASC},
+                filterBy: {since: $since}
             ) {
                 nodes {
                     id
@@ -41,10 +51,11 @@ REPOSITORY_ISSUES_QUERY = gql(
                     }
                     labels(first: 20) {
                         nodes {
-                            id
-                            name
-                            color
-                            description
+                            ...LabelFields
+                        }
+                        pageInfo {
+                            hasNextPage
+                            endCursor
                         }
                     }
                     milestone {
@@ -76,6 +87,15 @@ REPOSITORY_ISSUES_QUERY = gql(
         }
     }
 """
+    + LABEL_FIELDS_FRAGMENT
+)
+
+# Labels beyond the first page of each issue in REPOSITORY_ISSUES_QUERY
+ISSUE_LABELS_CONNECTION = NestedConnection(
+    field="labels",
+    parent_type="Issue",
+    node_fields="...LabelFields",
+    fragments=LABEL_FIELDS_FRAGMENT,
 )
 
 # Issue comments for a specific issue
@@ -88,6 +108,11 @@ ISSUE_COMMENTS_QUERY = gql(
         $first: Int!,
         $after: String
     ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
             issue(number: $issueNumber) {
                 comments(
@@ -6,17 +6,34 @@ Provides optimized queries for fetching repository labels.
 
 from gql import gql
 
+# Label fields shared by every query that selects labels
+LABEL_FIELDS_FRAGMENT = """
+    fragment LabelFields on Label {
+        id
+        name
+        color
+        description
+    }
+"""
+
 # Repository labels only (for label-only backup operations)
 REPOSITORY_LABELS_QUERY = gql(
     """
-    query getRepositoryLabels($owner: String!, $name: String!) {
+    query getRepositoryLabels(
+        $owner: String!,
+        $name: String!,
+        $first: Int!,
+        $after: String
+    ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
-            labels(first: 100) {
+            labels(first: $first, after: $after) {
                 nodes {
-                    id
-                    name
-                    color
-                    description
+                    ...LabelFields
                 }
                 pageInfo {
                     hasNextPage
@@ -26,4 +43,5 @@ REPOSITORY_LABELS_QUERY = gql(
         }
     }
 """
+    + LABEL_FIELDS_FRAGMENT
 )
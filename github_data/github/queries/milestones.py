@@ -4,6 +4,11 @@ from typing import Optional
 
 REPOSITORY_MILESTONES_QUERY = """
 query getRepositoryMilestones($owner: String!, $name: String!, $after: String) {
+  rateLimit {
+    cost
+    remaining
+    resetAt
+  }
   repository(owner: $owner, name: $name) {
     milestones(first: 100, after: $after) {
       pageInfo {
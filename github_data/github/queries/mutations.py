@@ -0,0 +1,60 @@
+"""
+GraphQL mutations for batched restore writes.
+
+Each mutation is sent for many items per request by the mutation batcher.
+Mutations address objects by node ID, so the lookups resolving repository
+and issue node IDs live here too.
+"""
+
+from gql import gql
+
+from ..utils.alias_batcher import AliasedLookup
+from ..utils.mutation_batcher import AliasedMutation
+from ..utils.query_cache import exclude_from_response_cache
+
+# Node IDs are looked up right before writing with them, so they are always
+# fetched from GitHub rather than the response cache
+
+# Node ID of a repository, the target of createLabel
+REPOSITORY_ID_QUERY = gql(
+    """
+    query getRepositoryId($owner: String!, $name: String!) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
+        repository(owner: $owner, name: $name) {
+            id
+        }
+    }
+"""
+)
+exclude_from_response_cache(REPOSITORY_ID_QUERY)
+
+# Node ID of an issue or pull request, looked up for many numbers per request
+ISSUE_OR_PULL_REQUEST_ID_LOOKUP = AliasedLookup(
+    field="issueOrPullRequest",
+    key_argument="number",
+    key_type="Int!",
+    selection="... on Issue { id } ... on PullRequest { id }",
+    cached=False,
+)
+
+CREATE_LABEL_MUTATION = AliasedMutation(
+    field="createLabel",
+    input_type="CreateLabelInput!",
+    selection="label { id name color description }",
+)
+
+ADD_SUB_ISSUE_MUTATION = AliasedMutation(
+    field="addSubIssue",
+    input_type="AddSubIssueInput!",
+    selection="issue { number } subIssue { number }",
+)
+
+ADD_COMMENT_MUTATION = AliasedMutation(
+    field="addComment",
+    input_type="AddCommentInput!",
+    selection="commentEdge { node { id databaseId body url } }",
+)
@@ -6,6 +6,63 @@ Provides optimized queries for fetching PR reviews and their comments.
 
 from gql import gql
 
+from ..utils.alias_batcher import AliasedLookup
+from ..utils.nested_connections import NestedConnection
+
+# Review comment fields shared by every review comment query
+REVIEW_COMMENT_FIELDS_FRAGMENT = """
+    fragment ReviewCommentFields on PullRequestReviewComment {
+        id
+        body
+        author {
+            login
+            ... on User {
+                id
+                avatarUrl
+                url
+            }
+        }
+        createdAt
+        updatedAt
+        diffHunk
+        path
+        line
+        url
+    }
+"""
+
+# Review fields, including the first page of the review's comments
+REVIEW_FIELDS_FRAGMENT = (
+    """
+    fragment ReviewFields on PullRequestReview {
+        id
+        author {
+            login
+            ... on User {
+                id
+                avatarUrl
+                url
+            }
+        }
+        body
+        state
+        submittedAt
+        authorAssociation
+        url
+        comments(first: 10) {
+            nodes {
+                ...ReviewCommentFields
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    }
+"""
+    + REVIEW_COMMENT_FIELDS_FRAGMENT
+)
+
 # Pull request reviews for a specific PR
 PULL_REQUEST_REVIEWS_QUERY = gql(
     """
@@ -16,6 +73,11 @@ PULL_REQUEST_REVIEWS_QUERY = gql(
         $first: Int!,
         $after: String
     ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
             pullRequest(number: $prNumber) {
                 reviews(
@@ -23,40 +85,7 @@ PULL_REQUEST_REVIEWS_QUERY = gql(
                     after: $after
                 ) {
                     nodes {
-                        id
-                        author {
-                            login
-                            ... on User {
-                                id
-                                avatarUrl
-                                url
-                            }
-                        }
-                        body
-                        state
-                        submittedAt
-                        authorAssociation
-                        url
-                        comments(first: 10) {
-                            nodes {
-                                id
-                                body
-                                author {
-                                    login
-                                    ... on User {
-                                        id
-                                        avatarUrl
-                                        url
-                                    }
-                                }
-                                createdAt
-                                updatedAt
-                                diffHunk
-                                path
-                                line
-                                url
-                            }
-                        }
+                        ...ReviewFields
                     }
                     pageInfo {
                         hasNextPage
@@ -68,6 +97,7 @@ PULL_REQUEST_REVIEWS_QUERY = gql(
         }
     }
 """
+    + REVIEW_FIELDS_FRAGMENT
 )
 
 # All pull request reviews across repository
@@ -79,6 +109,11 @@ REPOSITORY_PR_REVIEWS_QUERY = gql(
         $first: Int!,
         $after: String
     ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
             pullRequests(
                 first: $first,
@@ -86,46 +121,14 @@ REPOSITORY_PR_REVIEWS_QUERY = gql(
                 orderBy: {field: CREATED_AT, direction: ASC}
             ) {
                 nodes {
+                    id
                     number
                     url
                     reviews(
                         first: 10
                     ) {
                         nodes {
-                            id
-                            author {
-                                login
-                                ... on User {
-                                    id
-                                    avatarUrl
-                                    url
-                                }
-                            }
-                            body
-                            state
-                            submittedAt
-                            authorAssociation
-                            url
-                            comments(first: 10) {
-                                nodes {
-                                    id
-                                    body
-                                    author {
-                                        login
-                                        ... on User {
-                                            id
-                                            avatarUrl
-                                            url
-                                        }
-                                    }
-                                    createdAt
-                                    updatedAt
-                                    diffHunk
-                                    path
-                                    line
-                                    url
-                                }
-                            }
+                            ...ReviewFields
                         }
                         pageInfo {
                             hasNextPage
@@ -141,6 +144,7 @@ REPOSITORY_PR_REVIEWS_QUERY = gql(
         }
     }
 """
+    + REVIEW_FIELDS_FRAGMENT
 )
 
 # Review comments for a specific review
@@ -154,6 +158,11 @@ REVIEW_COMMENTS_QUERY = gql(
         $first: Int!,
         $after: String
     ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
             pullRequest(number: $prNumber) {
                 review(id: $reviewId) {
@@ -162,22 +171,7 @@ REVIEW_COMMENTS_QUERY = gql(
                         after: $after
                     ) {
                         nodes {
-                            id
-                            body
-                            author {
-                                login
-                                ... on User {
-                                    id
-                                    avatarUrl
-                                    url
-                                }
-                            }
-                            createdAt
-                            updatedAt
-                            diffHunk
-                            path
-                            line
-                            url
+                            ...ReviewCommentFields
                         }
                         pageInfo {
                             hasNextPage
@@ -190,6 +184,7 @@ REVIEW_COMMENTS_QUERY = gql(
         }
     }
 """
+    + REVIEW_COMMENT_FIELDS_FRAGMENT
 )
 
 # All review comments across repository
@@ -201,6 +196,11 @@ REPOSITORY_REVIEW_COMMENTS_QUERY = gql(
         $first: Int!,
         $after: String
     ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
             pullRequests(
                 first: $first,
@@ -208,6 +208,7 @@ REPOSITORY_REVIEW_COMMENTS_QUERY = gql(
                 orderBy: {field: CREATED_AT, direction: ASC}
             ) {
                 nodes {
+                    id
                     number
                     url
                     reviews(first: 10) {
@@ -215,25 +216,18 @@ REPOSITORY_REVIEW_COMMENTS_QUERY = gql(
                             id
                             comments(first: 10) {
                                 nodes {
-                                    id
-                                    body
-                                    author {
-                                        login
-                                        ... on User {
-                                            id
-                                            avatarUrl
-                                            url
-                                        }
-                                    }
-                                    createdAt
-                                    updatedAt
-                                    diffHunk
-                                    path
-                                    line
-                                    url
+                                    ...ReviewCommentFields
+                                }
+                                pageInfo {
+                                    hasNextPage
+                                    endCursor
                                 }
                             }
                         }
+                        pageInfo {
+                            hasNextPage
+                            endCursor
+                        }
                     }
                 }
                 pageInfo {
@@ -244,4 +238,46 @@ REPOSITORY_REVIEW_COMMENTS_QUERY = gql(
         }
     }
 """
+    + REVIEW_COMMENT_FIELDS_FRAGMENT
+)
+
+# Comments beyond the first page of each review
+REVIEW_COMMENTS_CONNECTION = NestedConnection(
+    field="comments",
+    parent_type="PullRequestReview",
+    node_fields="...ReviewCommentFields",
+    fragments=REVIEW_COMMENT_FIELDS_FRAGMENT,
+)
+
+# Reviews beyond the first page of each PR in REPOSITORY_PR_REVIEWS_QUERY
+PULL_REQUEST_REVIEWS_CONNECTION = NestedConnection(
+    field="reviews",
+    parent_type="PullRequest",
+    node_fields="...ReviewFields",
+    fragments=REVIEW_FIELDS_FRAGMENT,
+    children=(REVIEW_COMMENTS_CONNECTION,),
+)
+
+# Review ids beyond the first page of each PR in REPOSITORY_REVIEW_COMMENTS_QUERY
+PULL_REQUEST_REVIEW_IDS_CONNECTION = NestedConnection(
+    field="reviews",
+    parent_type="PullRequest",
+    node_fields=(
+        "id comments(first: 10) { nodes { ...ReviewCommentFields } "
+        "pageInfo { hasNextPage endCursor } }"
+    ),
+    fragments=REVIEW_COMMENT_FIELDS_FRAGMENT,
+    children=(REVIEW_COMMENTS_CONNECTION,),
+)
+
+# Reviews of a single PR, looked up for many PRs per request
+PULL_REQUEST_REVIEWS_LOOKUP = AliasedLookup(
+    field="pullRequest",
+    key_argument="number",
+    key_type="Int!",
+    selection=(
+        "id url reviews(first: 50) { "
+        "nodes { ...ReviewFields } pageInfo { hasNextPage endCursor } }"
+    ),
+    fragments=REVIEW_FIELDS_FRAGMENT,
 )
@@ -6,6 +6,11 @@ Provides optimized queries for fetching pull requests and their comments.
 
 from gql import gql
 
+from ..utils.alias_batcher import AliasedLookup
+from ..utils.nested_connections import NestedConnection
+from .comments import ISSUE_COMMENT_FIELDS_FRAGMENT
+from .labels import LABEL_FIELDS_FRAGMENT
+
 # Repository pull requests (for PR-only backup operations)
 REPOSITORY_PULL_REQUESTS_QUERY = gql(
     """
@@ -13,13 +18,19 @@ REPOSITORY_PULL_REQUESTS_QUERY = gql(
         $owner: String!,
         $name: String!,
         $first: Int!,
-        $after: String
+        $after: String,
+        $orderBy: IssueOrder = {field: CREATED_AT, direction: ASC}
     ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
             pullRequests(
                 first: $first,
                 after: $after,
-                orderBy: {field: CREATED_AT, direction: ASC}
+                orderBy: $orderBy
             ) {
                 nodes {
                     id
@@ -56,13 +67,18 @@ REPOSITORY_PULL_REQUESTS_QUERY = gql(
                             avatarUrl
                             url
                         }
+                        pageInfo {
+                            hasNextPage
+                            endCursor
+                        }
                     }
                     labels(first: 20) {
                         nodes {
-                            id
-                            name
-                            color
-                            description
+                            ...LabelFields
+                        }
+                        pageInfo {
+                            hasNextPage
+                            endCursor
                         }
                     }
                     milestone {
@@ -88,44 +104,6 @@ REPOSITORY_PULL_REQUESTS_QUERY = gql(
                     comments {
                         totalCount
                     }
-                    reviews(first: 10) {
-                        nodes {
-                            id
-                            author {
-                                login
-                                ... on User {
-                                    id
-                                    avatarUrl
-                                    url
-                                }
-                            }
-                            body
-                            state
-                            submittedAt
-                            authorAssociation
-                            url
-                            comments(first: 10) {
-                                nodes {
-                                    id
-                                    body
-                                    author {
-                                        login
-                                        ... on User {
-                                            id
-                                            avatarUrl
-                                            url
-                                        }
-                                    }
-                                    createdAt
-                                    updatedAt
-                                    diffHunk
-                                    path
-                                    line
-                                    url
-                                }
-                            }
-                        }
-                    }
                 }
                 pageInfo {
                     hasNextPage
@@ -135,6 +113,22 @@ REPOSITORY_PULL_REQUESTS_QUERY = gql(
         }
     }
 """
+    + LABEL_FIELDS_FRAGMENT
+)
+
+# Assignees beyond the first page of each PR in REPOSITORY_PULL_REQUESTS_QUERY
+PULL_REQUEST_ASSIGNEES_CONNECTION = NestedConnection(
+    field="assignees",
+    parent_type="PullRequest",
+    node_fields="login id avatarUrl url",
+)
+
+# Labels beyond the first page of each PR in REPOSITORY_PULL_REQUESTS_QUERY
+PULL_REQUEST_LABELS_CONNECTION = NestedConnection(
+    field="labels",
+    parent_type="PullRequest",
+    node_fields="...LabelFields",
+    fragments=LABEL_FIELDS_FRAGMENT,
 )
 
 # Pull request comments for a specific PR
@@ -147,6 +141,11 @@ PULL_REQUEST_COMMENTS_QUERY = gql(
         $first: Int!,
         $after: String
     ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
             pullRequest(number: $prNumber) {
                 comments(
@@ -188,35 +187,31 @@ REPOSITORY_PR_COMMENTS_QUERY = gql(
         $owner: String!,
         $name: String!,
         $first: Int!,
-        $after: String
+        $after: String,
+        $orderBy: IssueOrder = {field: CREATED_AT, direction: ASC}
     ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
             pullRequests(
                 first: $first,
                 after: $after,
-                orderBy: {field: CREATED_AT, direction: ASC}
+                orderBy: $orderBy
             ) {
                 nodes {
+                    id
                     number
                     url
+                    updatedAt
                     comments(
                         first: 10,
                         orderBy: {field: UPDATED_AT, direction: ASC}
                     ) {
                         nodes {
-                            id
-                            body
-                            createdAt
-                            updatedAt
-                            url
-                            author {
-                                login
-                                ... on User {
-                                    id
-                                    avatarUrl
-                                    url
-                                }
-                            }
+                            ...IssueCommentFields
                         }
                         pageInfo {
                             hasNextPage
@@ -232,4 +227,27 @@ REPOSITORY_PR_COMMENTS_QUERY = gql(
         }
     }
 """
+    + ISSUE_COMMENT_FIELDS_FRAGMENT
+)
+
+# Comments beyond the first page of each PR in REPOSITORY_PR_COMMENTS_QUERY
+PULL_REQUEST_COMMENTS_CONNECTION = NestedConnection(
+    field="comments",
+    parent_type="PullRequest",
+    node_fields="...IssueCommentFields",
+    fragments=ISSUE_COMMENT_FIELDS_FRAGMENT,
+    arguments="orderBy: {field: UPDATED_AT, direction: ASC}",
+)
+
+# Comments of a single PR, looked up for many PRs per request
+PULL_REQUEST_COMMENTS_LOOKUP = AliasedLookup(
+    field="pullRequest",
+    key_argument="number",
+    key_type="Int!",
+    selection=(
+        "id url comments(first: 100, "
+        "orderBy: {field: UPDATED_AT, direction: ASC}) { "
+        "nodes { ...IssueCommentFields } pageInfo { hasNextPage endCursor } }"
+    ),
+    fragments=ISSUE_COMMENT_FIELDS_FRAGMENT,
 )
@@ -0,0 +1,119 @@
+"""
+GraphQL queries for repository release operations.
+
+Provides paginated queries for fetching releases with their assets inline.
+"""
+
+from gql import gql
+
+from ..utils.nested_connections import NestedConnection
+
+# Asset fields shared by every release asset query
+RELEASE_ASSET_FIELDS_FRAGMENT = """
+    fragment ReleaseAssetFields on ReleaseAsset {
+        id
+        databaseId
+        name
+        contentType
+        size
+        digest
+        downloadCount
+        downloadUrl
+        createdAt
+        updatedAt
+        uploadedBy {
+            login
+            id
+            avatarUrl
+            url
+        }
+    }
+"""
+
+# Repository releases with the first page of each release's assets
+REPOSITORY_RELEASES_QUERY = gql(
+    """
+    query getRepositoryReleases(
+        $owner: String!,
+        $name: String!,
+        $first: Int!,
+        $after: String
+    ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
+        repository(owner: $owner, name: $name) {
+            releases(
+                first: $first,
+                after: $after,
+                orderBy: {field: CREATED_AT, direction: DESC}
+            ) {
+                nodes {
+                    id
+                    databaseId
+                    name
+                    tagName
+                    tagCommit {
+                        oid
+                    }
+                    description
+                    isDraft
+                    immutable
+                    isPrerelease
+                    createdAt
+                    publishedAt
+                    url
+                    author {
+                        login
+                        id
+                        avatarUrl
+                        url
+                    }
+                    releaseAssets(first: 100) {
+                        nodes {
+                            ...ReleaseAssetFields
+                        }
+                        pageInfo {
+                            hasNextPage
+                            endCursor
+                        }
+                    }
+                }
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+            }
+        }
+    }
+"""
+    + RELEASE_ASSET_FIELDS_FRAGMENT
+)
+
+# Assets beyond the first page of each release in REPOSITORY_RELEASES_QUERY
+RELEASE_ASSETS_CONNECTION = NestedConnection(
+    field="releaseAssets",
+    parent_type="Release",
+    node_fields="...ReleaseAssetFields",
+    fragments=RELEASE_ASSET_FIELDS_FRAGMENT,
+)
+
+# Default branch, the target_commitish REST reports for releases made on it
+REPOSITORY_DEFAULT_BRANCH_QUERY = gql(
+    """
+    query getRepositoryDefaultBranch($owner: String!, $name: String!) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
+        repository(owner: $owner, name: $name) {
+            defaultBranchRef {
+                name
+            }
+        }
+    }
+"""
+)
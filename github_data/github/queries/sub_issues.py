@@ -6,6 +6,9 @@ Provides optimized queries for fetching sub-issue relationships and hierarchies.
 
 from gql import gql
 
+from ..utils.alias_batcher import AliasedLookup
+from ..utils.nested_connections import NestedConnection
+
 # Repository sub-issues query
 REPOSITORY_SUB_ISSUES_QUERY = gql(
     """
@@ -15,6 +18,11 @@ REPOSITORY_SUB_ISSUES_QUERY = gql(
         $first: Int!,
         $after: String
     ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
             issues(
                 first: $first,
@@ -49,6 +57,13 @@ REPOSITORY_SUB_ISSUES_QUERY = gql(
 """
 )
 
+# Sub-issues beyond the first page of each issue in REPOSITORY_SUB_ISSUES_QUERY
+SUB_ISSUES_CONNECTION = NestedConnection(
+    field="subIssues",
+    parent_type="Issue",
+    node_fields="id number",
+)
+
 # Issue sub-issues query for specific issue
 ISSUE_SUB_ISSUES_QUERY = gql(
     """
@@ -59,6 +74,11 @@ ISSUE_SUB_ISSUES_QUERY = gql(
         $first: Int!,
         $after: String
     ) {
+        rateLimit {
+            cost
+            remaining
+            resetAt
+        }
         repository(owner: $owner, name: $name) {
             issue(number: $issueNumber) {
                 id
@@ -85,3 +105,31 @@ ISSUE_SUB_ISSUES_QUERY = gql(
     }
 """
 )
+
+# Sub-issues of a single issue, looked up for many issues per request
+ISSUE_SUB_ISSUES_LOOKUP = AliasedLookup(
+    field="issue",
+    key_argument="number",
+    key_type="Int!",
+    selection=(
+        "id number subIssues(first: 100) { "
+        "nodes { id number title state url } "
+        "pageInfo { hasNextPage endCursor } } "
+        "parent { id number }"
+    ),
+)
+
+# Sub-issues beyond the first page of each issue in ISSUE_SUB_ISSUES_LOOKUP
+ISSUE_SUB_ISSUE_DETAILS_CONNECTION = NestedConnection(
+    field="subIssues",
+    parent_type="Issue",
+    node_fields="id number title state url",
+)
+
+# Parent of a single issue, looked up for many issues per request
+ISSUE_PARENT_LOOKUP = AliasedLookup(
+    field="issue",
+    key_argument="number",
+    key_type="Int!",
+    selection="parent { id databaseId number title state url }",
+)
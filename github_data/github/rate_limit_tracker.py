@@ -0,0 +1,103 @@
+"""
+Passive rate-limit tracking.
+
+Records rate-limit state carried by responses the client already receives:
+the ``X-RateLimit-*`` headers of REST responses (as kept by PyGithub's
+requester) and the ``rateLimit`` field selected by GraphQL queries. Any
+component can read the latest state without making a request.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+# Rate-limit resources tracked separately by GitHub
+CORE_RESOURCE = "core"
+GRAPHQL_RESOURCE = "graphql"
+
+
+@dataclass(frozen=True)
+class RateLimitState:
+    """Latest known state of one rate-limit resource.
+
+    Attributes:
+        remaining: Requests (REST) or points (GraphQL) left in the window
+        limit: Size of the window's budget, if the response reported it
+        reset_at: Seconds since the epoch at which the window resets
+    """
+
+    remaining: int
+    limit: Optional[int]
+    reset_at: Optional[float]
+
+
+class RateLimitTracker:
+    """Thread-safe store of the latest rate-limit state per resource."""
+
+    def __init__(self) -> None:
+        """Initialize tracker with no known state."""
+        self._lock = threading.Lock()
+        self._states: Dict[str, RateLimitState] = {}
+
+    def update(
+        self,
+        resource: str,
+        remaining: int,
+        limit: Optional[int] = None,
+        reset_at: Optional[float] = None,
+    ) -> None:
+        """
+        Record the rate-limit state reported by a response.
+
+        Args:
+            resource: Rate-limit resource the response counted against
+            remaining: Budget left in the current window
+            limit: Size of the window's budget, if known
+            reset_at: Seconds since the epoch at which the window resets
+        """
+        with self._lock:
+            previous = self._states.get(resource)
+            if limit is None and previous is not None:
+                limit = previous.limit
+            self._states[resource] = RateLimitState(remaining, limit, reset_at)
+
+    def get(self, resource: str) -> Optional[RateLimitState]:
+        """Return the latest state of a resource, if any response reported it."""
+        with self._lock:
+            return self._states.get(resource)
+
+    def snapshot(self) -> Dict[str, RateLimitState]:
+        """Return the latest state of every tracked resource."""
+        with self._lock:
+            return dict(self._states)
+
+    def record_rest_headers(self, github_client: Any) -> None:
+        """
+        Record the rate-limit headers of the last REST response.
+
+        Reads the values PyGithub's requester keeps from the most recent
+        response, which never triggers a request of its own.
+
+        Args:
+            github_client: PyGithub client whose last response to read
+        """
+        self.record_requester(getattr(github_client, "requester", None))
+
+    def record_requester(self, requester: Any) -> None:
+        """Record the rate-limit headers kept by a PyGithub requester."""
+        rate_limiting = getattr(requester, "rate_limiting", None)
+        reset_at = getattr(requester, "rate_limiting_resettime", None)
+        if not isinstance(rate_limiting, tuple) or len(rate_limiting) != 2:
+            return
+
+        remaining, limit = rate_limiting
+        if not isinstance(remaining, int) or limit < 0:
+            # No response carrying rate-limit headers has been seen yet
+            return
+
+        self.update(
+            CORE_RESOURCE,
+            remaining,
+            limit,
+            float(reset_at) if isinstance(reset_at, int) and reset_at else None,
+        )
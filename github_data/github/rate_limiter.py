@@ -8,8 +8,10 @@ Separated from boundary layer to maintain clean separation of concerns.
 import time
 import random
 import logging
-from typing import Callable, TypeVar, Any
+from datetime import datetime, timezone
+from typing import Callable, TypeVar, Any, Optional
 from .protocols import RateLimitHandler as RateLimitHandlerProtocol
+from .rate_limit_tracker import CORE_RESOURCE, RateLimitState, RateLimitTracker
 from github.GithubException import RateLimitExceededException, GithubException
 
 logger = logging.getLogger(__name__)
@@ -30,6 +32,7 @@ class RateLimitHandler(RateLimitHandlerProtocol):
         base_delay: float = 1.0,
         max_delay: float = 60.0,
         jitter: bool = True,
+        tracker: Optional[RateLimitTracker] = None,
     ):
         """
         Initialize rate limit handler.
@@ -39,11 +42,18 @@ class RateLimitHandler(RateLimitHandlerProtocol):
             base_delay: Base delay for exponential backoff
             max_delay: Maximum delay between retries
             jitter: Whether to add random jitter to delays
+            tracker: Shared store of rate-limit state seen on responses
         """
         self._max_retries = max_retries
         self._base_delay = base_delay
         self._max_delay = max_delay
         self._jitter = jitter
+        self._tracker = tracker or RateLimitTracker()
+
+    @property
+    def tracker(self) -> RateLimitTracker:
+        """Rate-limit state recorded from responses, readable without requests."""
+        return self._tracker
 
     def execute_with_retry(self, operation: Callable[[], T], github_client: Any) -> T:
         """
@@ -85,6 +95,10 @@ class RateLimitHandler(RateLimitHandlerProtocol):
             raise last_exception
         raise RuntimeError("Unexpected end of retry loop")
 
+    def monitor_rate_limit_status(self, github_client: Any) -> None:
+        """Log a warning if the remaining rate limit is low."""
+        self._monitor_rate_limit_status(github_client)
+
     def _should_retry(self, attempt: int) -> bool:
         """Check if we should retry the operation."""
         return attempt < self._max_retries
@@ -119,36 +133,26 @@ class RateLimitHandler(RateLimitHandlerProtocol):
         logger.error(f"GitHub API error: {error.status} - {error.data}")
 
     def _monitor_rate_limit_status(self, github_client: Any) -> None:
-        """Monitor rate limit status and log warnings if low."""
-        try:
-            rate_limit = github_client.get_rate_limit()
-            core_limit = getattr(rate_limit, "core", None)
-
-            if self._is_rate_limit_low(core_limit):
-                self._log_low_rate_limit_warning(core_limit)
+        """Record rate limit headers of the last response; warn if low."""
+        self._tracker.record_rest_headers(github_client)
+        core_limit = self._tracker.get(CORE_RESOURCE)
 
-        except (AttributeError, GithubException, TypeError):
-            # Skip rate limit monitoring if it fails (e.g., in tests)
-            pass
+        if core_limit is not None and self._is_rate_limit_low(core_limit):
+            self._log_low_rate_limit_warning(core_limit)
 
-    def _is_rate_limit_low(self, core_limit: Any) -> bool:
+    def _is_rate_limit_low(self, core_limit: RateLimitState) -> bool:
         """Check if rate limit is low (below threshold)."""
-        if not core_limit or not hasattr(core_limit, "remaining"):
-            return False
-
-        remaining_count = getattr(core_limit, "remaining", None)
-        return (
-            remaining_count is not None
-            and isinstance(remaining_count, int)
-            and remaining_count < 100
-        )
+        return core_limit.remaining < 100
 
-    def _log_low_rate_limit_warning(self, core_limit: Any) -> None:
+    def _log_low_rate_limit_warning(self, core_limit: RateLimitState) -> None:
         """Log warning about low rate limit."""
-        remaining_count = getattr(core_limit, "remaining", 0)
-        reset_time = getattr(core_limit, "reset", None)
+        reset_time = (
+            datetime.fromtimestamp(core_limit.reset_at, tz=timezone.utc)
+            if core_limit.reset_at is not None
+            else None
+        )
         logger.warning(
-            f"GitHub API rate limit low: {remaining_count} "
+            f"GitHub API rate limit low: {core_limit.remaining} "
             f"requests remaining, resets at {reset_time}"
         )
 
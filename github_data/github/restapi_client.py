@@ -7,10 +7,25 @@ interface for REST-specific operations.
 """
 
 from typing import Dict, List, Any, Optional, Union, cast
-from github import Github, Auth
+from urllib.parse import quote
+from github import Github, Auth, UnknownObjectException
+from github.GitReleaseAsset import GitReleaseAsset
 from github.Repository import Repository
 from github.PaginatedList import PaginatedList
 
+# Host that release asset uploads are sent to
+UPLOADS_URL = "https://uploads.github.com"
+
+# Media type enabling the issue import API
+ISSUE_IMPORT_MEDIA_TYPE = "application/vnd.github.golden-comet-preview+json"
+
+# Headers of import status polls; no-store keeps the global HTTP cache from
+# answering a poll with an earlier status, per request and on any thread
+ISSUE_IMPORT_STATUS_HEADERS = {
+    "Accept": ISSUE_IMPORT_MEDIA_TYPE,
+    "Cache-Control": "no-store",
+}
+
 
 class GitHubRestApiClient:
     """
@@ -99,10 +114,12 @@ class GitHubRestApiClient:
         self, repo_name: str, issue_number: int, body: str
     ) -> Dict[str, Any]:
         """Create a new comment on an issue and return raw JSON data."""
-        repo = self._get_repository(repo_name)
-        issue = repo.get_issue(issue_number)
-        created_comment = issue.create_comment(body)
-        return self._extract_raw_data(created_comment)
+        # POST /repos/{owner}/{repo}/issues/{issue_number}/comments
+        return self._write(
+            "POST",
+            f"/repos/{repo_name}/issues/{issue_number}/comments",
+            {"body": body},
+        )
 
     # Label Operations
 
@@ -118,18 +135,19 @@ class GitHubRestApiClient:
 
     def delete_label(self, repo_name: str, label_name: str) -> None:
         """Delete a label from the repository."""
-        repo = self._get_repository(repo_name)
-        label = repo.get_label(label_name)
-        label.delete()
+        # DELETE /repos/{owner}/{repo}/labels/{name}
+        self._write("DELETE", self._label_url(repo_name, label_name))
 
     def update_label(
         self, repo_name: str, old_name: str, name: str, color: str, description: str
     ) -> Dict[str, Any]:
         """Update an existing label and return raw JSON data."""
-        repo = self._get_repository(repo_name)
-        label = repo.get_label(old_name)
-        label.edit(name=name, color=color, description=description)
-        return self._extract_raw_data(label)
+        # PATCH /repos/{owner}/{repo}/labels/{name}
+        return self._write(
+            "PATCH",
+            self._label_url(repo_name, old_name),
+            {"new_name": name, "color": color, "description": description},
+        )
 
     # Issue Operations
 
@@ -142,31 +160,63 @@ class GitHubRestApiClient:
         milestone: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Create a new issue and return raw JSON data."""
-        repo = self._get_repository(repo_name)
-
-        # Create issue with or without milestone
+        # POST /repos/{owner}/{repo}/issues; the milestone is given by number,
+        # so it need not be fetched first
+        parameters: Dict[str, Any] = {"title": title, "body": body, "labels": labels}
         if milestone is not None:
-            milestone_obj = repo.get_milestone(milestone)
-            created_issue = repo.create_issue(
-                title=title, body=body, labels=labels, milestone=milestone_obj
-            )
-        else:
-            created_issue = repo.create_issue(title=title, body=body, labels=labels)
-        return self._extract_raw_data(created_issue)
+            parameters["milestone"] = milestone
+        return self._write("POST", f"/repos/{repo_name}/issues", parameters)
 
     def close_issue(
         self, repo_name: str, issue_number: int, state_reason: Optional[str] = None
     ) -> Dict[str, Any]:
         """Close an issue with optional state reason and return raw JSON data."""
-        repo = self._get_repository(repo_name)
-        issue = repo.get_issue(issue_number)
-
+        # PATCH /repos/{owner}/{repo}/issues/{issue_number}
+        parameters = {"state": "closed"}
         if state_reason:
-            issue.edit(state="closed", state_reason=state_reason)
-        else:
-            issue.edit(state="closed")
+            parameters["state_reason"] = state_reason
+        return self._write(
+            "PATCH", f"/repos/{repo_name}/issues/{issue_number}", parameters
+        )
+
+    # Issue Import Operations (Direct REST API)
 
-        return self._extract_raw_data(issue)
+    def start_issue_import(
+        self,
+        repo_name: str,
+        issue: Dict[str, Any],
+        comments: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Queue an issue with its comments for import and return its status."""
+        # POST /repos/{owner}/{repo}/import/issues
+        _, data = self._github.requester.requestJsonAndCheck(
+            "POST",
+            f"/repos/{repo_name}/import/issues",
+            headers={"Accept": ISSUE_IMPORT_MEDIA_TYPE},
+            input={"issue": issue, "comments": comments},
+        )
+        return cast(Dict[str, Any], data)
+
+    def get_issue_import(self, repo_name: str, import_id: int) -> Dict[str, Any]:
+        """Get the status of one issue import."""
+        # GET /repos/{owner}/{repo}/import/issues/{import_id}
+        _, data = self._github.requester.requestJsonAndCheck(
+            "GET",
+            f"/repos/{repo_name}/import/issues/{import_id}",
+            headers=dict(ISSUE_IMPORT_STATUS_HEADERS),
+        )
+        return cast(Dict[str, Any], data)
+
+    def get_issue_imports(self, repo_name: str, since: str) -> List[Dict[str, Any]]:
+        """Get the status of every issue import queued at or after since."""
+        # GET /repos/{owner}/{repo}/import/issues?since={timestamp}
+        _, data = self._github.requester.requestJsonAndCheck(
+            "GET",
+            f"/repos/{repo_name}/import/issues",
+            parameters={"since": since},
+            headers=dict(ISSUE_IMPORT_STATUS_HEADERS),
+        )
+        return cast(List[Dict[str, Any]], data or [])
 
     # Pull Request Operations
 
@@ -203,20 +253,25 @@ class GitHubRestApiClient:
         self, repo_name: str, pr_number: int, body: str
     ) -> Dict[str, Any]:
         """Create a new comment on a pull request and return raw JSON data."""
-        repo = self._get_repository(repo_name)
-        pr = repo.get_pull(pr_number)
-        created_comment = pr.create_issue_comment(body)
-        return self._extract_raw_data(created_comment)
+        # Pull request conversation comments are issue comments:
+        # POST /repos/{owner}/{repo}/issues/{pr_number}/comments
+        return self._write(
+            "POST",
+            f"/repos/{repo_name}/issues/{pr_number}/comments",
+            {"body": body},
+        )
 
     def create_pull_request_review(
         self, repo_name: str, pr_number: int, body: str, state: str
     ) -> Dict[str, Any]:
         """Create a new pull request review and return raw JSON data."""
-        repo = self._get_repository(repo_name)
-        pr = repo.get_pull(pr_number)
+        # POST /repos/{owner}/{repo}/pulls/{pr_number}/reviews
         # GitHub API review states: APPROVE, REQUEST_CHANGES, COMMENT
-        created_review = pr.create_review(body=body, event=state)
-        return self._extract_raw_data(created_review)
+        return self._write(
+            "POST",
+            f"/repos/{repo_name}/pulls/{pr_number}/reviews",
+            {"body": body, "event": state},
+        )
 
     def create_pull_request_review_comment(
         self, repo_name: str, review_id: str, body: str
@@ -273,6 +328,60 @@ class GitHubRestApiClient:
             )
         return self._extract_raw_data(created_milestone)
 
+    # Release Asset Operations (Direct REST API)
+
+    def get_release_by_tag(
+        self, repo_name: str, tag_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get a published release by its tag, or None if there is none."""
+        # GET /repos/{owner}/{repo}/releases/tags/{tag}
+        url = f"/repos/{repo_name}/releases/tags/{quote(tag_name, safe='')}"
+        try:
+            _, data = self._github.requester.requestJsonAndCheck("GET", url)
+        except UnknownObjectException:
+            return None
+        return cast(Dict[str, Any], data)
+
+    def get_release_assets(
+        self, repo_name: str, release_id: int
+    ) -> List[Dict[str, Any]]:
+        """Get all assets of a release, including unfinished uploads."""
+        # GET /repos/{owner}/{repo}/releases/{release_id}/assets
+        assets = PaginatedList(
+            GitReleaseAsset,
+            self._github.requester,
+            f"/repos/{repo_name}/releases/{release_id}/assets",
+            {"per_page": 100},
+        )
+        return self._extract_raw_data_list(assets)
+
+    def upload_release_asset(
+        self,
+        repo_name: str,
+        release_id: int,
+        file_path: str,
+        name: str,
+        content_type: str,
+    ) -> Dict[str, Any]:
+        """Upload a file as release asset, streaming it from disk."""
+        # POST https://uploads.github.com/repos/{owner}/{repo}/releases/
+        # {release_id}/assets; PyGithub sends the open file as request body
+        url = f"{UPLOADS_URL}/repos/{repo_name}/releases/{release_id}/assets"
+        _, data = self._github.requester.requestBlobAndCheck(
+            "POST",
+            url,
+            parameters={"name": name},
+            headers={"Content-Type": content_type},
+            input=file_path,
+        )
+        return data
+
+    def delete_release_asset(self, repo_name: str, asset_id: int) -> None:
+        """Delete a release asset."""
+        # DELETE /repos/{owner}/{repo}/releases/assets/{asset_id}
+        url = f"/repos/{repo_name}/releases/assets/{asset_id}"
+        self._github.requester.requestJsonAndCheck("DELETE", url)
+
     # Sub-Issues Operations (Direct REST API)
 
     def get_issue_sub_issues(
@@ -371,6 +480,26 @@ class GitHubRestApiClient:
         else:
             return {}
 
+    # Direct Write Utilities
+
+    def _write(
+        self, verb: str, url: str, parameters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Send a write request to a known URL and return raw JSON data.
+
+        Writes go straight to the endpoint instead of through PyGithub
+        objects, which would first fetch the object being written.
+        """
+        _, data = self._github.requester.requestJsonAndCheck(
+            verb, url, input=parameters
+        )
+        return cast(Dict[str, Any], data or {})
+
+    @staticmethod
+    def _label_url(repo_name: str, label_name: str) -> str:
+        """API URL of a repository label."""
+        return f"/repos/{repo_name}/labels/{quote(label_name, safe='')}"
+
     # Raw Data Extraction Utilities
 
     def _extract_raw_data_list(
@@ -6,15 +6,75 @@ Maintains clean separation from the ultra-thin boundary layer.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Callable, cast
-from .protocols import RepositoryService
+import threading
+from contextlib import nullcontext
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+from .protocols import BatchResultCallback, RepositoryService
 from .boundary import GitHubApiBoundary
+from .graphql_cache import GraphQLResponseCache
 from .rate_limiter import RateLimitHandler
-from .cache import setup_global_cache, clear_cache, CacheConfig
+from .rate_limit_tracker import RateLimitTracker
+from .http_pool import DEFAULT_POOL_SIZE, SharedHTTPPool
+from .token_pool import TokenPool
+from .write_scheduler import (
+    DEFAULT_WRITES_PER_HOUR,
+    DEFAULT_WRITES_PER_MINUTE,
+    WriteScheduler,
+)
+from .cache import (
+    CacheConfig,
+    CacheTag,
+    get_cache_index,
+    invalidate_cache,
+    setup_global_cache,
+)
 from .operation_registry import GitHubOperationRegistry, Operation
+from .utils.alias_batcher import DEFAULT_BATCH_SIZE, is_item_error
+from .utils.mutation_batcher import DEFAULT_MUTATION_BATCH_SIZE
+from .utils.request_coalescer import RequestCoalescer
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Most single-item calls answered by one coalesced batch call
+COALESCED_BATCH_SIZE = 100
+
+# Cached data types made stale by modifying each data type
+STALE_DATA_TYPES: Dict[str, Tuple[str, ...]] = {
+    "labels": ("labels",),
+    # Milestones embed the number of their issues and pull requests
+    "issues": ("issues", "milestones"),
+    "comments": ("comments", "all_comments"),
+    "pull_requests": ("pull_requests", "milestones"),
+    # Pull requests embed their comment count
+    "pr_comments": ("pr_comments", "all_pr_comments", "pull_requests"),
+    "pr_reviews": ("pr_reviews", "all_pr_reviews"),
+    # Reviews embed their first page of comments
+    "pr_review_comments": (
+        "pr_review_comments",
+        "all_pr_review_comments",
+        "pr_reviews",
+        "all_pr_reviews",
+    ),
+    "sub_issues": ("sub_issues", "issue_sub_issues", "issue_parent"),
+    # Issues and pull requests embed their milestone
+    "milestones": ("milestones", "issues", "pull_requests"),
+}
+
 
 class GitHubService(RepositoryService):
     """
@@ -29,6 +89,8 @@ class GitHubService(RepositoryService):
         boundary: GitHubApiBoundary,
         rate_limiter: Optional[RateLimitHandler] = None,
         caching_enabled: bool = True,
+        write_scheduler: Optional[WriteScheduler] = None,
+        token_pool: Optional[TokenPool] = None,
     ):
         """
         Initialize GitHub service with dependencies.
@@ -37,19 +99,34 @@ class GitHubService(RepositoryService):
             boundary: Ultra-thin API boundary layer
             rate_limiter: Optional rate limiting handler
             caching_enabled: Whether caching is enabled globally
+            write_scheduler: Optional pacing of mutating calls
+            token_pool: Tokens the boundary spreads reads over; writes are
+                sent with its primary token
         """
         self._boundary = boundary
         self._rate_limiter = rate_limiter or RateLimitHandler()
         self._caching_enabled = caching_enabled
+        self._write_scheduler = write_scheduler
+        self._token_pool = token_pool
 
         # Initialize operation registry
         self._operation_registry = GitHubOperationRegistry()
 
+        # Batches serving concurrent single-item lookups, per operation and
+        # repository
+        self._coalescers: Dict[Tuple[str, str], RequestCoalescer[Any, Any]] = {}
+        self._coalescers_lock = threading.Lock()
+
         logger.info(
             f"GitHubService initialized with "
             f"{len(self._operation_registry.list_operations())} registered operations"
         )
 
+    @property
+    def rate_limits(self) -> RateLimitTracker:
+        """Rate-limit state seen on recent responses, read without a request."""
+        return self._rate_limiter.tracker
+
     # Public API - Repository Data Operations
 
     def get_repository_metadata(self, repo_name: str) -> Optional[Dict[str, Any]]:
@@ -109,6 +186,13 @@ class GitHubService(RepositoryService):
             ),
         )
 
+    def iter_repository_labels(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream labels from repository with rate limit monitoring."""
+        return self._stream_with_cross_cutting_concerns(
+            lambda: self._boundary.iter_repository_labels(repo_name),
+            cache_key=f"labels:{repo_name}",
+        )
+
     def get_repository_issues(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all issues from repository with rate limiting and caching."""
         return cast(
@@ -119,6 +203,15 @@ class GitHubService(RepositoryService):
             ),
         )
 
+    def iter_repository_issues(
+        self, repo_name: str, since: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream issues from repository with rate limit monitoring."""
+        return self._stream_with_cross_cutting_concerns(
+            lambda: self._boundary.iter_repository_issues(repo_name, since=since),
+            cache_key=f"issues:{repo_name}",
+        )
+
     def get_issue_comments(
         self, repo_name: str, issue_number: int
     ) -> List[Dict[str, Any]]:
@@ -143,6 +236,15 @@ class GitHubService(RepositoryService):
             ),
         )
 
+    def iter_all_issue_comments(
+        self, repo_name: str, since: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream all issue comments with rate limit monitoring."""
+        return self._stream_with_cross_cutting_concerns(
+            lambda: self._boundary.iter_all_issue_comments(repo_name, since=since),
+            cache_key=f"all_comments:{repo_name}",
+        )
+
     def get_repository_pull_requests(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all pull requests from repository with rate limiting and caching."""
         return cast(
@@ -155,6 +257,17 @@ class GitHubService(RepositoryService):
             ),
         )
 
+    def iter_repository_pull_requests(
+        self, repo_name: str, since: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream pull requests from repository with rate limit monitoring."""
+        return self._stream_with_cross_cutting_concerns(
+            lambda: self._boundary.iter_repository_pull_requests(
+                repo_name, since=since
+            ),
+            cache_key=f"pull_requests:{repo_name}",
+        )
+
     def get_pull_request_comments(
         self, repo_name: str, pr_number: int
     ) -> List[Dict[str, Any]]:
@@ -169,6 +282,20 @@ class GitHubService(RepositoryService):
             ),
         )
 
+    def get_pull_request_comments_batch(
+        self, repo_name: str, pr_numbers: Sequence[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Get comments for many pull requests with rate limiting."""
+        return cast(
+            Dict[int, List[Dict[str, Any]]],
+            self._execute_with_cross_cutting_concerns(
+                cache_key=None,  # Batches are keyed by their members
+                operation=lambda: self._boundary.get_pull_request_comments_batch(
+                    repo_name, pr_numbers
+                ),
+            ),
+        )
+
     def get_all_pull_request_comments(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all pull request comments with rate limiting and caching."""
         return cast(
@@ -181,6 +308,17 @@ class GitHubService(RepositoryService):
             ),
         )
 
+    def iter_all_pull_request_comments(
+        self, repo_name: str, since: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream all pull request comments with rate limit monitoring."""
+        return self._stream_with_cross_cutting_concerns(
+            lambda: self._boundary.iter_all_pull_request_comments(
+                repo_name, since=since
+            ),
+            cache_key=f"all_pr_comments:{repo_name}",
+        )
+
     def get_pull_request_reviews(
         self, repo_name: str, pr_number: int
     ) -> List[Dict[str, Any]]:
@@ -195,6 +333,20 @@ class GitHubService(RepositoryService):
             ),
         )
 
+    def get_pull_request_reviews_batch(
+        self, repo_name: str, pr_numbers: Sequence[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Get reviews for many pull requests with rate limiting."""
+        return cast(
+            Dict[int, List[Dict[str, Any]]],
+            self._execute_with_cross_cutting_concerns(
+                cache_key=None,  # Batches are keyed by their members
+                operation=lambda: self._boundary.get_pull_request_reviews_batch(
+                    repo_name, pr_numbers
+                ),
+            ),
+        )
+
     def get_all_pull_request_reviews(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get all pull request reviews with rate limiting and caching."""
         return cast(
@@ -207,6 +359,13 @@ class GitHubService(RepositoryService):
             ),
         )
 
+    def iter_all_pull_request_reviews(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream all pull request reviews with rate limit monitoring."""
+        return self._stream_with_cross_cutting_concerns(
+            lambda: self._boundary.iter_all_pull_request_reviews(repo_name),
+            cache_key=f"all_pr_reviews:{repo_name}",
+        )
+
     def get_pull_request_review_comments(
         self, repo_name: str, review_id: str
     ) -> List[Dict[str, Any]]:
@@ -221,6 +380,20 @@ class GitHubService(RepositoryService):
             ),
         )
 
+    def get_pull_request_review_comments_batch(
+        self, repo_name: str, review_ids: Sequence[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get comments for many pull request reviews with rate limiting."""
+        return cast(
+            Dict[str, List[Dict[str, Any]]],
+            self._execute_with_cross_cutting_concerns(
+                cache_key=None,  # Batches are keyed by their members
+                operation=lambda: self._boundary.get_pull_request_review_comments_batch(
+                    repo_name, review_ids
+                ),
+            ),
+        )
+
     def get_all_pull_request_review_comments(
         self, repo_name: str
     ) -> List[Dict[str, Any]]:
@@ -235,6 +408,15 @@ class GitHubService(RepositoryService):
             ),
         )
 
+    def iter_all_pull_request_review_comments(
+        self, repo_name: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream all review comments with rate limit monitoring."""
+        return self._stream_with_cross_cutting_concerns(
+            lambda: self._boundary.iter_all_pull_request_review_comments(repo_name),
+            cache_key=f"all_pr_review_comments:{repo_name}",
+        )
+
     def get_repository_sub_issues(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get sub-issue relationships from repository with caching."""
         return cast(
@@ -245,6 +427,12 @@ class GitHubService(RepositoryService):
             ),
         )
 
+    def iter_repository_sub_issues(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream sub-issue relationships with rate limit monitoring."""
+        return self._stream_with_cross_cutting_concerns(
+            lambda: self._boundary.iter_repository_sub_issues(repo_name)
+        )
+
     def get_repository_milestones(self, repo_name: str) -> List[Dict[str, Any]]:
         """Get milestones via GraphQL with caching and rate limiting."""
         return cast(
@@ -255,8 +443,14 @@ class GitHubService(RepositoryService):
             ),
         )
 
+    def iter_repository_milestones(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream milestones with rate limit monitoring."""
+        return self._stream_with_cross_cutting_concerns(
+            lambda: self._boundary.iter_repository_milestones(repo_name)
+        )
+
     def get_repository_releases(self, repo_name: str) -> List[Dict[str, Any]]:
-        """Get releases via REST API with caching and rate limiting."""
+        """Get releases via GraphQL with caching and rate limiting."""
         return cast(
             List[Dict[str, Any]],
             self._execute_with_cross_cutting_concerns(
@@ -265,16 +459,38 @@ class GitHubService(RepositoryService):
             ),
         )
 
+    def iter_repository_releases(self, repo_name: str) -> Iterator[Dict[str, Any]]:
+        """Stream releases with rate limit monitoring."""
+        return self._stream_with_cross_cutting_concerns(
+            lambda: self._boundary.iter_repository_releases(repo_name)
+        )
+
     def get_issue_sub_issues(
         self, repo_name: str, issue_number: int
     ) -> List[Dict[str, Any]]:
-        """Get sub-issues for specific issue with rate limiting and caching."""
+        """Get sub-issues for specific issue with rate limiting and caching.
+
+        Concurrent calls for the same repository share batched queries.
+        """
+        coalescer = self._coalescer(
+            "issue_sub_issues",
+            repo_name,
+            lambda issue_numbers: self.get_issue_sub_issues_batch(
+                repo_name, issue_numbers
+            ),
+        )
+        return cast(List[Dict[str, Any]], coalescer.load(issue_number))
+
+    def get_issue_sub_issues_batch(
+        self, repo_name: str, issue_numbers: Sequence[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Get sub-issues for many issues with rate limiting."""
         return cast(
-            List[Dict[str, Any]],
+            Dict[int, List[Dict[str, Any]]],
             self._execute_with_cross_cutting_concerns(
-                cache_key=f"issue_sub_issues:{repo_name}:{issue_number}",
-                operation=lambda: self._boundary.get_issue_sub_issues_graphql(
-                    repo_name, issue_number
+                cache_key=f"issue_sub_issues:{repo_name}",
+                operation=lambda: self._boundary.get_issue_sub_issues_graphql_batch(
+                    repo_name, issue_numbers
                 ),
             ),
         )
@@ -282,11 +498,32 @@ class GitHubService(RepositoryService):
     def get_issue_parent(
         self, repo_name: str, issue_number: int
     ) -> Optional[Dict[str, Any]]:
-        """Get parent issue if this issue is a sub-issue with caching."""
+        """Get parent issue if this issue is a sub-issue with caching.
+
+        Concurrent calls for the same repository share batched queries.
+        """
         # Note: This method returns a single item, not a list like other methods
-        return self._rate_limiter.execute_with_retry(
-            lambda: self._boundary.get_issue_parent(repo_name, issue_number),
-            self._boundary._github,
+        coalescer = self._coalescer(
+            "issue_parent",
+            repo_name,
+            lambda issue_numbers: self.get_issue_parents_batch(
+                repo_name, issue_numbers
+            ),
+        )
+        return cast(Optional[Dict[str, Any]], coalescer.load(issue_number))
+
+    def get_issue_parents_batch(
+        self, repo_name: str, issue_numbers: Sequence[int]
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """Get parent issues of many issues with rate limiting and caching."""
+        return cast(
+            Dict[int, Optional[Dict[str, Any]]],
+            self._execute_with_cross_cutting_concerns(
+                cache_key=f"issue_parent:{repo_name}",
+                operation=lambda: self._boundary.get_issue_parents_graphql_batch(
+                    repo_name, issue_numbers
+                ),
+            ),
         )
 
     def get_rate_limit_status(self) -> Dict[str, Any]:
@@ -296,6 +533,15 @@ class GitHubService(RepositoryService):
             lambda: self._boundary.get_rate_limit_status(), self._boundary._github
         )
 
+    def get_graphql_costs(self) -> Dict[str, int]:
+        """Get GraphQL points spent so far, per query."""
+        # Local bookkeeping, no API call involved
+        return self._boundary.get_graphql_costs()
+
+    def get_http_pool_stats(self) -> Dict[str, int]:
+        """Get connection reuse statistics for tuning the pool size."""
+        return self._boundary.get_http_pool_stats()
+
     # Public API - Repository Modification Operations
 
     def create_label(
@@ -303,30 +549,25 @@ class GitHubService(RepositoryService):
     ) -> Dict[str, Any]:
         """Create a new label with rate limiting."""
         # Modifications should not be cached and should clear related caches
-        result = self._rate_limiter.execute_with_retry(
-            lambda: self._boundary.create_label(repo_name, name, color, description),
-            self._boundary._github,
+        result = self._execute_write(
+            lambda: self._boundary.create_label(repo_name, name, color, description)
         )
         self._invalidate_cache_for_repository(repo_name, "labels")
         return result
 
     def delete_label(self, repo_name: str, label_name: str) -> None:
         """Delete a label with rate limiting."""
-        self._rate_limiter.execute_with_retry(
-            lambda: self._boundary.delete_label(repo_name, label_name),
-            self._boundary._github,
-        )
+        self._execute_write(lambda: self._boundary.delete_label(repo_name, label_name))
         self._invalidate_cache_for_repository(repo_name, "labels")
 
     def update_label(
         self, repo_name: str, old_name: str, name: str, color: str, description: str
     ) -> Dict[str, Any]:
         """Update an existing label with rate limiting."""
-        result = self._rate_limiter.execute_with_retry(
+        result = self._execute_write(
             lambda: self._boundary.update_label(
                 repo_name, old_name, name, color, description
-            ),
-            self._boundary._github,
+            )
         )
         self._invalidate_cache_for_repository(repo_name, "labels")
         return result
@@ -340,11 +581,10 @@ class GitHubService(RepositoryService):
         milestone: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Create a new issue with rate limiting."""
-        result = self._rate_limiter.execute_with_retry(
+        result = self._execute_write(
             lambda: self._boundary.create_issue(
                 repo_name, title, body, labels, milestone=milestone
-            ),
-            self._boundary._github,
+            )
         )
         self._invalidate_cache_for_repository(repo_name, "issues")
         return result
@@ -353,9 +593,8 @@ class GitHubService(RepositoryService):
         self, repo_name: str, issue_number: int, body: str
     ) -> Dict[str, Any]:
         """Create a new comment with rate limiting."""
-        result = self._rate_limiter.execute_with_retry(
-            lambda: self._boundary.create_issue_comment(repo_name, issue_number, body),
-            self._boundary._github,
+        result = self._execute_write(
+            lambda: self._boundary.create_issue_comment(repo_name, issue_number, body)
         )
         self._invalidate_cache_for_repository(repo_name, "comments")
         return result
@@ -364,13 +603,50 @@ class GitHubService(RepositoryService):
         self, repo_name: str, issue_number: int, state_reason: Optional[str] = None
     ) -> Dict[str, Any]:
         """Close an issue with rate limiting."""
-        result = self._rate_limiter.execute_with_retry(
-            lambda: self._boundary.close_issue(repo_name, issue_number, state_reason),
-            self._boundary._github,
+        result = self._execute_write(
+            lambda: self._boundary.close_issue(repo_name, issue_number, state_reason)
+        )
+        self._invalidate_cache_for_repository(repo_name, "issues")
+        return result
+
+    def start_issue_import(
+        self,
+        repo_name: str,
+        issue: Dict[str, Any],
+        comments: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Queue an issue import with write pacing and rate limiting."""
+        result = self._execute_write(
+            lambda: self._boundary.start_issue_import(repo_name, issue, comments)
         )
         self._invalidate_cache_for_repository(repo_name, "issues")
+        self._invalidate_cache_for_repository(repo_name, "comments")
         return result
 
+    def get_issue_import(self, repo_name: str, import_id: int) -> Dict[str, Any]:
+        """Get the status of an issue import with rate limiting."""
+        return cast(
+            Dict[str, Any],
+            self._execute_with_cross_cutting_concerns(
+                # Import status changes while it is polled; the request
+                # bypasses the HTTP cache, see ISSUE_IMPORT_STATUS_HEADERS
+                cache_key=None,
+                operation=lambda: self._boundary.get_issue_import(repo_name, import_id),
+            ),
+        )
+
+    def get_issue_imports(self, repo_name: str, since: str) -> List[Dict[str, Any]]:
+        """Get the status of recent issue imports with rate limiting."""
+        return cast(
+            List[Dict[str, Any]],
+            self._execute_with_cross_cutting_concerns(
+                # Import status changes while it is polled; the request
+                # bypasses the HTTP cache, see ISSUE_IMPORT_STATUS_HEADERS
+                cache_key=None,
+                operation=lambda: self._boundary.get_issue_imports(repo_name, since),
+            ),
+        )
+
     def create_pull_request(
         self,
         repo_name: str,
@@ -381,11 +657,10 @@ class GitHubService(RepositoryService):
         milestone: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Create a new pull request with rate limiting."""
-        result = self._rate_limiter.execute_with_retry(
+        result = self._execute_write(
             lambda: self._boundary.create_pull_request(
                 repo_name, title, body, head, base, milestone=milestone
-            ),
-            self._boundary._github,
+            )
         )
         self._invalidate_cache_for_repository(repo_name, "pull_requests")
         return result
@@ -394,11 +669,10 @@ class GitHubService(RepositoryService):
         self, repo_name: str, pr_number: int, body: str
     ) -> Dict[str, Any]:
         """Create a new PR comment with rate limiting."""
-        result = self._rate_limiter.execute_with_retry(
+        result = self._execute_write(
             lambda: self._boundary.create_pull_request_comment(
                 repo_name, pr_number, body
-            ),
-            self._boundary._github,
+            )
         )
         self._invalidate_cache_for_repository(repo_name, "pr_comments")
         return result
@@ -407,11 +681,10 @@ class GitHubService(RepositoryService):
         self, repo_name: str, parent_issue_number: int, sub_issue_number: int
     ) -> Dict[str, Any]:
         """Add existing issue as sub-issue with rate limiting."""
-        result = self._rate_limiter.execute_with_retry(
+        result = self._execute_write(
             lambda: self._boundary.add_sub_issue(
                 repo_name, parent_issue_number, sub_issue_number
-            ),
-            self._boundary._github,
+            )
         )
         self._invalidate_cache_for_repository(repo_name, "sub_issues")
         return result
@@ -420,11 +693,10 @@ class GitHubService(RepositoryService):
         self, repo_name: str, parent_issue_number: int, sub_issue_number: int
     ) -> None:
         """Remove sub-issue relationship with rate limiting."""
-        self._rate_limiter.execute_with_retry(
+        self._execute_write(
             lambda: self._boundary.remove_sub_issue(
                 repo_name, parent_issue_number, sub_issue_number
-            ),
-            self._boundary._github,
+            )
         )
         self._invalidate_cache_for_repository(repo_name, "sub_issues")
 
@@ -436,11 +708,10 @@ class GitHubService(RepositoryService):
         position: int,
     ) -> Dict[str, Any]:
         """Change sub-issue order/position with rate limiting."""
-        result = self._rate_limiter.execute_with_retry(
+        result = self._execute_write(
             lambda: self._boundary.reprioritize_sub_issue(
                 repo_name, parent_issue_number, sub_issue_number, position
-            ),
-            self._boundary._github,
+            )
         )
         self._invalidate_cache_for_repository(repo_name, "sub_issues")
         return result
@@ -504,13 +775,22 @@ class GitHubService(RepositoryService):
                 return self._execute_with_cross_cutting_concerns(
                     cache_key=cache_key,
                     operation=lambda: self._call_boundary(operation, **kwargs),
+                    cache_tag=operation.get_cache_tag(**kwargs),
                 )
-            else:
-                # No caching for write operations
+            elif operation.should_cache():
                 return self._execute_with_cross_cutting_concerns(
                     cache_key=None,
                     operation=lambda: self._call_boundary(operation, **kwargs),
                 )
+            else:
+                # No caching for write operations, which are paced instead
+                result = self._execute_write(
+                    lambda: self._call_boundary(operation, **kwargs)
+                )
+                tag = operation.get_cache_tag(**kwargs)
+                if tag is not None:
+                    self._invalidate_cache_for_repository(tag.repo_name, tag.data_type)
+                return result
         except Exception as e:
             # Enhanced error context for debugging
             raise type(e)(
@@ -571,30 +851,113 @@ class GitHubService(RepositoryService):
         return get_converter(converter_name)
 
     def _execute_with_cross_cutting_concerns(
-        self, cache_key: Optional[str], operation: Callable[[], Any]
+        self,
+        cache_key: Optional[str],
+        operation: Callable[[], Any],
+        cache_tag: Optional[CacheTag] = None,
     ) -> Any:
-        """Execute operation with rate limiting and caching."""
-        # With global caching, requests are automatically cached
-        # We just need to execute with rate limiting
-        return self._rate_limiter.execute_with_retry(operation, self._boundary._github)
+        """Execute operation with rate limiting and caching.
+
+        With global caching, requests are cached automatically; the responses
+        are tagged with cache_tag, or the repository and data type named by
+        cache_key, so writes can evict just them.
+        """
+        tag = cache_tag or CacheTag.from_cache_key(cache_key)
+
+        def tagged_operation() -> Any:
+            with get_cache_index().scope(tag):
+                return operation()
+
+        return self._rate_limiter.execute_with_retry(
+            tagged_operation, self._boundary._github
+        )
+
+    def _execute_write(self, operation: Callable[[], T], writes: int = 1) -> T:
+        """Execute mutating operation with write pacing and rate limiting.
+
+        writes is the number of mutations the operation makes; each one is
+        charged against the write budgets. With a token pool, the operation's
+        requests are sent with the primary token, so restored content has a
+        single author and one account's secondary limits apply.
+        """
+        token_pool = self._token_pool
+
+        def pinned_operation() -> T:
+            with token_pool.writing() if token_pool else nullcontext():
+                return operation()
+
+        write_scheduler = self._write_scheduler
+        if write_scheduler is None:
+            return self._rate_limiter.execute_with_retry(
+                pinned_operation, self._boundary._github
+            )
+        return self._rate_limiter.execute_with_retry(
+            lambda: write_scheduler.execute(pinned_operation, writes),
+            self._boundary._github,
+        )
+
+    def _stream_with_cross_cutting_concerns(
+        self,
+        operation: Callable[[], Iterator[Dict[str, Any]]],
+        cache_key: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream operation results with rate limit monitoring.
+
+        Items already handed to the caller cannot be replayed, so streams are
+        not retried as a whole; the paginator retries each page that fails
+        transiently before yielding any of its items. Rate limit status is
+        checked once the stream completes.
+        Responses are tagged for cache invalidation like other reads; the
+        tag is only in scope while the stream fetches, not while the caller
+        consumes an item.
+        """
+        index = get_cache_index()
+        tag = CacheTag.from_cache_key(cache_key)
+        items = operation()
+        while True:
+            with index.scope(tag):
+                item = next(items, None)
+            if item is None:
+                break
+            yield item
+        self._rate_limiter.monitor_rate_limit_status(self._boundary._github)
+
+    def _coalescer(
+        self,
+        operation: str,
+        repo_name: str,
+        fetch_batch: Callable[[List[Any]], Dict[Any, Any]],
+    ) -> RequestCoalescer[Any, Any]:
+        """Coalescer batching an operation's single-item calls for a repository."""
+        key = (operation, repo_name)
+        with self._coalescers_lock:
+            coalescer = self._coalescers.get(key)
+            if coalescer is None:
+                coalescer = RequestCoalescer(
+                    fetch_batch, COALESCED_BATCH_SIZE, is_item_error
+                )
+                self._coalescers[key] = coalescer
+            return coalescer
 
     def _invalidate_cache_for_repository(self, repo_name: str, data_type: str) -> None:
-        """Invalidate cached data for repository after modifications."""
+        """Evict cached reads of repository data made stale by a modification."""
         if self._caching_enabled:
-            # For now, we'll clear all cache
-            # In the future, we can implement more granular invalidation
-            logger.info(f"Clearing cache after {data_type} modification in {repo_name}")
-            clear_cache()
+            evicted = invalidate_cache(
+                repo_name, STALE_DATA_TYPES.get(data_type, (data_type,))
+            )
+            logger.debug(
+                f"Evicted {evicted} cached responses after {data_type} "
+                f"modification in {repo_name}"
+            )
 
     def create_pull_request_review(
         self, repo_name: str, pr_number: int, body: str, state: str
     ) -> Dict[str, Any]:
         """Create a new pull request review with rate limiting."""
-        result = self._rate_limiter.execute_with_retry(
+        result = self._execute_write(
             lambda: self._boundary.create_pull_request_review(
                 repo_name, pr_number, body, state
-            ),
-            self._boundary._github,
+            )
         )
         self._invalidate_cache_for_repository(repo_name, "pr_reviews")
         return result
@@ -603,11 +966,10 @@ class GitHubService(RepositoryService):
         self, repo_name: str, review_id: str, body: str
     ) -> Dict[str, Any]:
         """Create a new pull request review comment with rate limiting."""
-        result = self._rate_limiter.execute_with_retry(
+        result = self._execute_write(
             lambda: self._boundary.create_pull_request_review_comment(
                 repo_name, review_id, body
-            ),
-            self._boundary._github,
+            )
         )
         self._invalidate_cache_for_repository(repo_name, "pr_review_comments")
         return result
@@ -621,11 +983,10 @@ class GitHubService(RepositoryService):
         state: str = "open",
     ) -> Dict[str, Any]:
         """Create milestone via REST API with cache invalidation."""
-        result = self._rate_limiter.execute_with_retry(
+        result = self._execute_write(
             lambda: self._boundary.create_milestone(
                 repo_name, title, description, due_on, state
-            ),
-            self._boundary._github,
+            )
         )
 
         # Invalidate relevant caches
@@ -644,7 +1005,7 @@ class GitHubService(RepositoryService):
         prerelease: bool = False,
     ) -> Dict[str, Any]:
         """Create release via REST API with rate limiting."""
-        return self._rate_limiter.execute_with_retry(
+        result: Dict[str, Any] = self._execute_write(
             lambda: self._boundary.create_release(
                 repo_name=repo_name,
                 tag_name=tag_name,
@@ -653,16 +1014,176 @@ class GitHubService(RepositoryService):
                 body=body,
                 draft=draft,
                 prerelease=prerelease,
+            )
+        )
+        self._invalidate_cache_for_repository(repo_name, "releases")
+        return result
+
+    def get_release_by_tag(
+        self, repo_name: str, tag_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get a published release by its tag with rate limiting."""
+        return cast(
+            Optional[Dict[str, Any]],
+            self._execute_with_cross_cutting_concerns(
+                cache_key=f"releases:{repo_name}:{tag_name}",
+                operation=lambda: self._boundary.get_release_by_tag(
+                    repo_name, tag_name
+                ),
             ),
-            self._boundary._github,
         )
 
+    def get_release_assets(
+        self, repo_name: str, release_id: int
+    ) -> List[Dict[str, Any]]:
+        """Get all assets of a release with rate limiting."""
+        return cast(
+            List[Dict[str, Any]],
+            self._execute_with_cross_cutting_concerns(
+                cache_key=f"releases:{repo_name}:{release_id}",
+                operation=lambda: self._boundary.get_release_assets(
+                    repo_name, release_id
+                ),
+            ),
+        )
+
+    def upload_release_asset(
+        self,
+        repo_name: str,
+        release_id: int,
+        file_path: str,
+        name: str,
+        content_type: str,
+    ) -> Dict[str, Any]:
+        """Upload a release asset with write pacing and rate limiting."""
+        try:
+            return self._execute_write(
+                lambda: self._boundary.upload_release_asset(
+                    repo_name, release_id, file_path, name, content_type
+                )
+            )
+        finally:
+            # Failed uploads can leave an unfinished asset on the release
+            self._invalidate_cache_for_repository(repo_name, "releases")
+
+    def delete_release_asset(self, repo_name: str, asset_id: int) -> None:
+        """Delete a release asset with write pacing and rate limiting."""
+        self._execute_write(
+            lambda: self._boundary.delete_release_asset(repo_name, asset_id)
+        )
+        self._invalidate_cache_for_repository(repo_name, "releases")
+
+    # Public API - Batched Modification Operations
+
+    def create_labels_batch(
+        self,
+        repo_name: str,
+        labels: Sequence[Dict[str, Any]],
+        on_result: Optional[BatchResultCallback] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Create many labels in batched mutations with write pacing."""
+        return self._execute_write_batches(
+            repo_name,
+            ("labels",),
+            labels,
+            lambda batch: self._boundary.create_labels_batch(repo_name, batch),
+            on_result,
+        )
+
+    def add_sub_issues_batch(
+        self,
+        repo_name: str,
+        links: Sequence[Tuple[int, int]],
+        on_result: Optional[BatchResultCallback] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Link many sub-issues in batched mutations with write pacing."""
+        return self._execute_write_batches(
+            repo_name,
+            ("sub_issues",),
+            links,
+            lambda batch: self._boundary.add_sub_issues_batch(repo_name, batch),
+            on_result,
+        )
+
+    def create_issue_comments_batch(
+        self,
+        repo_name: str,
+        comments: Sequence[Tuple[int, str]],
+        on_result: Optional[BatchResultCallback] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Add many comments in batched mutations with write pacing."""
+        return self._execute_write_batches(
+            repo_name,
+            # Pull requests take comments like issues
+            ("comments", "pr_comments"),
+            comments,
+            lambda batch: self._boundary.create_issue_comments_batch(repo_name, batch),
+            on_result,
+        )
+
+    def _execute_write_batches(
+        self,
+        repo_name: str,
+        data_types: Tuple[str, ...],
+        items: Sequence[T],
+        write_batch: Callable[[Sequence[T]], Sequence[Any]],
+        on_result: Optional[BatchResultCallback] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Send items in batched mutations, paced per mutation.
+
+        Each batch is its own write, so a retried batch never repeats the
+        mutations of batches that already succeeded. GitHub counts every
+        mutation of a batch against its content-creation limits, so each
+        request is charged one write per item.
+
+        A request that fails after its retries does not discard the results
+        of the batches before it: its items, and the ones not yet sent, are
+        returned with its error. on_result receives each batch's results as
+        soon as its request returned, so callers can record them before the
+        next request is sent.
+        """
+        results: List[Union[Dict[str, Any], Exception]] = []
+        try:
+            for start in range(0, len(items), DEFAULT_MUTATION_BATCH_SIZE):
+                batch = items[start : start + DEFAULT_MUTATION_BATCH_SIZE]
+                failed = False
+                try:
+                    batch_results = list(
+                        self._execute_write(lambda: write_batch(batch), len(batch))
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Batched write to {repo_name} failed after {start} of "
+                        f"{len(items)} items: {e}"
+                    )
+                    batch_results = [e for _ in items[start:]]
+                    failed = True
+
+                if on_result is not None:
+                    for offset, result in enumerate(batch_results):
+                        on_result(start + offset, result)
+                results.extend(batch_results)
+                if failed:
+                    break
+        finally:
+            if items:
+                for data_type in data_types:
+                    self._invalidate_cache_for_repository(repo_name, data_type)
+        return results
+
 
 def create_github_service(
     token: str,
     enable_rate_limiting: bool = True,
     enable_caching: bool = True,
     cache_config: Optional[CacheConfig] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    writes_per_minute: int = DEFAULT_WRITES_PER_MINUTE,
+    writes_per_hour: int = DEFAULT_WRITES_PER_HOUR,
+    token_pool: Optional[TokenPool] = None,
+    http_pool_size: int = DEFAULT_POOL_SIZE,
+    graphql_concurrency: Optional[int] = None,
+    validate_graphql_queries: bool = True,
 ) -> GitHubService:
     """
     Factory function to create a configured GitHub service.
@@ -672,16 +1193,50 @@ def create_github_service(
         enable_rate_limiting: Whether to enable rate limiting
         enable_caching: Whether to enable caching
         cache_config: Optional cache configuration
+        batch_size: Maximum number of per-item lookups per batched GraphQL query
+        writes_per_minute: Budget for mutating calls in any minute
+        writes_per_hour: Budget for mutating calls in any hour
+        token_pool: Tokens to spread requests over by remaining budget
+        http_pool_size: Keep-alive connections per host; match the number of
+            threads issuing requests concurrently
+        graphql_concurrency: Maximum number of GraphQL queries in flight at
+            once on the asyncio client; the threaded client is used if None
+        validate_graphql_queries: Whether to check GraphQL queries against the
+            bundled schema before sending them
 
     Returns:
         Configured GitHubService instance
     """
-    boundary = GitHubApiBoundary(token)
-
-    rate_limiter = RateLimitHandler() if enable_rate_limiting else None
+    config = cache_config or CacheConfig()
+    rate_limits = RateLimitTracker()
+    boundary = GitHubApiBoundary(
+        token,
+        batch_size=batch_size,
+        rate_limits=rate_limits,
+        token_pool=token_pool,
+        http_pool=SharedHTTPPool(http_pool_size),
+        graphql_concurrency=graphql_concurrency,
+        validate_graphql_queries=validate_graphql_queries,
+        graphql_response_cache=(
+            GraphQLResponseCache(config.expire_after, config.expire_after_by_type)
+            if enable_caching
+            else None
+        ),
+    )
+
+    rate_limiter = (
+        RateLimitHandler(tracker=rate_limits) if enable_rate_limiting else None
+    )
 
     if enable_caching:
-        config = cache_config or CacheConfig()
         setup_global_cache(config)
 
-    return GitHubService(boundary, rate_limiter, enable_caching)
+    write_scheduler = (
+        WriteScheduler(per_minute=writes_per_minute, per_hour=writes_per_hour)
+        if enable_rate_limiting
+        else None
+    )
+
+    return GitHubService(
+        boundary, rate_limiter, enable_caching, write_scheduler, token_pool
+    )
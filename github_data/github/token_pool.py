@@ -0,0 +1,202 @@
+"""
+Pool of GitHub tokens with budget-aware rotation.
+
+One token is capped at one rate-limit bucket. The pool spreads requests over
+several tokens, sending each request to the token with the most headroom
+left in the resource it counts against. Budgets are tracked per token from
+the rate-limit data responses already carry (see rate_limit_tracker).
+
+Only reads are spread. Writes are authored by the account owning the token,
+and GitHub's secondary limits on them are per account, so every write is
+sent with the primary token.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from github import Auth
+from github.Requester import WithRequester
+
+from .rate_limit_tracker import CORE_RESOURCE, RateLimitTracker
+
+
+class TokenPool:
+    """Thread-safe set of tokens handed out by remaining budget."""
+
+    def __init__(self, tokens: Sequence[str]):
+        """
+        Initialize pool.
+
+        Args:
+            tokens: GitHub tokens to rotate between; duplicates are dropped
+
+        Raises:
+            ValueError: If no token is given
+        """
+        unique_tokens = list(dict.fromkeys(token for token in tokens if token))
+        if not unique_tokens:
+            raise ValueError("Token pool requires at least one token")
+
+        self._tokens = unique_tokens
+        self._trackers = {token: RateLimitTracker() for token in unique_tokens}
+        self._lock = threading.Lock()
+        self._handed_out = 0
+        self._last_used: Dict[str, int] = {token: 0 for token in unique_tokens}
+        self._writing = threading.local()
+
+    @classmethod
+    def from_environment(cls) -> Optional["TokenPool"]:
+        """
+        Build a pool from GITHUB_TOKENS or GITHUB_TOKENS_FILE, if either is set.
+
+        GITHUB_TOKENS holds comma- or whitespace-separated tokens;
+        GITHUB_TOKENS_FILE names a file with one token per line. GITHUB_TOKEN,
+        if set, joins the pool as its first token.
+
+        Returns:
+            Token pool, or None if neither variable is set
+
+        Raises:
+            ValueError: If the variables are set but yield no token
+            OSError: If GITHUB_TOKENS_FILE cannot be read
+        """
+        listed = os.getenv("GITHUB_TOKENS")
+        path = os.getenv("GITHUB_TOKENS_FILE")
+        if not listed and not path:
+            return None
+
+        tokens: List[str] = []
+        if os.getenv("GITHUB_TOKEN"):
+            tokens.append(os.environ["GITHUB_TOKEN"])
+        if listed:
+            tokens.extend(listed.replace(",", " ").split())
+        if path:
+            with open(path) as token_file:
+                tokens.extend(
+                    line.strip()
+                    for line in token_file
+                    if line.strip() and not line.lstrip().startswith("#")
+                )
+        return cls(tokens)
+
+    @property
+    def tokens(self) -> List[str]:
+        """Tokens in the pool, in configuration order."""
+        return list(self._tokens)
+
+    @property
+    def primary(self) -> str:
+        """Token writes are sent with; the first one configured."""
+        return self._tokens[0]
+
+    @contextmanager
+    def writing(self) -> Iterator[None]:
+        """Hand out the primary token on this thread while the block runs."""
+        self._writing.depth = getattr(self._writing, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            self._writing.depth -= 1
+
+    def tracker_for(self, token: str) -> RateLimitTracker:
+        """Return the rate-limit state recorded for one token."""
+        return self._trackers[token]
+
+    def acquire(self, resource: str = CORE_RESOURCE) -> str:
+        """
+        Pick the token with the most headroom for a resource.
+
+        Tokens without a known state, or whose window has reset, count as
+        having a full budget. Ties go to the least recently used token.
+        Inside writing(), the primary token is returned instead.
+
+        Args:
+            resource: Rate-limit resource the request counts against
+
+        Returns:
+            Token to send the request with
+        """
+        if getattr(self._writing, "depth", 0):
+            return self.primary
+
+        now = time.time()
+        with self._lock:
+            token = max(
+                self._tokens,
+                key=lambda t: (self._headroom(t, resource, now), -self._last_used[t]),
+            )
+            self._handed_out += 1
+            self._last_used[token] = self._handed_out
+            return token
+
+    def _headroom(self, token: str, resource: str, now: float) -> float:
+        """Return the budget a token has left, or infinity if unknown."""
+        state = self._trackers[token].get(resource)
+        if state is None or (state.reset_at is not None and state.reset_at <= now):
+            return float("inf")
+        return float(state.remaining)
+
+
+class PooledTokenAuth(Auth.Auth, WithRequester["PooledTokenAuth"]):
+    """PyGithub authentication drawing a token from a pool per request.
+
+    PyGithub keeps the rate-limit headers of the latest response on its
+    requester, whichever thread sent the request. Before a thread's next
+    request, those headers are recorded for the token its previous request
+    used, but only if no other request overlapped it; otherwise they may
+    belong to another token and are dropped, and the pool rotates by use.
+    """
+
+    def __init__(self, pool: TokenPool):
+        """
+        Initialize authentication.
+
+        Args:
+            pool: Token pool to draw from
+        """
+        super().__init__()
+        self._pool = pool
+        self._lock = threading.Lock()
+        self._sent = 0
+        # Per thread: token, send number and whether nothing else was in flight
+        self._in_flight: Dict[int, Tuple[str, int, bool]] = {}
+
+    @property
+    def token_type(self) -> str:
+        """Authorization scheme for GitHub tokens."""
+        return "token"
+
+    @property
+    def token(self) -> str:
+        """Token the next request will be sent with."""
+        return self._pool.acquire(CORE_RESOURCE)
+
+    def authentication(self, headers: dict) -> None:
+        """Add the token with the most core headroom to the headers."""
+        thread_id = threading.get_ident()
+        with self._lock:
+            # A thread's previous request has finished once it sends another
+            previous = self._in_flight.pop(thread_id, None)
+            if previous is not None:
+                last_token, sent, alone = previous
+                if alone and sent == self._sent:
+                    self._pool.tracker_for(last_token).record_requester(self.requester)
+            self._forget_finished_threads()
+
+            token = self.token
+            self._sent += 1
+            self._in_flight[thread_id] = (token, self._sent, not self._in_flight)
+        headers["Authorization"] = f"{self.token_type} {token}"
+
+    def _forget_finished_threads(self) -> None:
+        """Drop requests of threads that have exited, so they are complete."""
+        alive = {thread.ident for thread in threading.enumerate()}
+        for thread_id in [t for t in self._in_flight if t not in alive]:
+            del self._in_flight[thread_id]
+
+    @property
+    def _masked_token(self) -> str:
+        return "token (pooled token removed)"
@@ -0,0 +1,204 @@
+"""
+Alias batching for per-item GraphQL lookups.
+
+Packs many lookups of the same repository field (one pull request, one issue)
+into a single GraphQL document using field aliases, then splits the response
+back out per key.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from gql import gql
+from gql.transport.exceptions import TransportQueryError
+
+from .query_cache import exclude_from_response_cache
+
+K = TypeVar("K")
+
+DEFAULT_BATCH_SIZE = 50
+
+
+def execute_all(
+    gql_client: Any,
+    requests: Sequence[Tuple[Any, Dict[str, Any]]],
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Execute independent queries, concurrently if the client supports it.
+
+    Clients providing execute_many (such as the async client) may keep
+    several of the requests in flight at once; others run them in order.
+    With return_exceptions, a failed request's exception is returned in its
+    place instead of being raised, so the other results are kept.
+    """
+    if getattr(type(gql_client), "execute_many", None) is not None:
+        results: List[Any] = gql_client.execute_many(
+            requests, return_exceptions=return_exceptions
+        )
+        return results
+
+    results = []
+    for query, variables in requests:
+        try:
+            results.append(gql_client.execute(query, variable_values=variables))
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
+
+
+def _error_item(error: Any) -> Optional[str]:
+    """Return the itemN alias a GraphQL error was reported for, if any.
+
+    Lookups are nested in the repository field, so the alias is the first
+    itemN element of the error's path.
+    """
+    path = error.get("path") if isinstance(error, dict) else None
+    for element in (path or [])[:2]:
+        if isinstance(element, str) and element.startswith("item"):
+            return element
+    return None
+
+
+def is_item_error(error: Exception) -> bool:
+    """Check whether a failed lookup's GraphQL errors all name item aliases.
+
+    Such errors are caused by the keys looked up, while any other error,
+    such as a transport failure, would fail every batch alike.
+    """
+    if not isinstance(error, TransportQueryError) or not error.errors:
+        return False
+    return all(_error_item(item_error) is not None for item_error in error.errors)
+
+
+def _repository_data(result: Any) -> Dict[str, Any]:
+    """Return a batch's repository data with items that failed set to None.
+
+    GitHub answers a lookup of an item that does not exist with null data
+    and a NOT_FOUND error for its alias, which gql raises as a
+    TransportQueryError carrying the partial data.
+
+    Raises:
+        Exception: The request's error if it is not tied to an item alias
+    """
+    if isinstance(result, TransportQueryError):
+        failed = [_error_item(error) for error in result.errors or []]
+        if not result.data or not failed or None in failed:
+            raise result
+        repository: Dict[str, Any] = dict(result.data.get("repository") or {})
+        for alias in failed:
+            repository[str(alias)] = None
+        return repository
+    if isinstance(result, BaseException):
+        raise result
+    return result.get("repository") or {}
+
+
+@dataclass(frozen=True)
+class AliasedLookup:
+    """Repository field looked up for many keys in one aliased query.
+
+    Attributes:
+        field: Repository field to look up (e.g. "pullRequest")
+        key_argument: Argument selecting the item (e.g. "number")
+        key_type: GraphQL type of the key argument (e.g. "Int!")
+        selection: Selection set for each looked-up item
+        fragments: Fragment definitions referenced by selection
+        cached: Whether results may come from the response cache; off for
+            lookups made right before a write
+    """
+
+    field: str
+    key_argument: str
+    key_type: str
+    selection: str
+    fragments: str = ""
+    cached: bool = True
+
+
+@lru_cache(maxsize=128)
+def _build_aliased_query(lookup: AliasedLookup, key_count: int) -> Any:
+    """Build a repository query looking up key_count items under aliases."""
+    variables = ["$owner: String!", "$name: String!"]
+    selections = []
+    for index in range(key_count):
+        variables.append(f"$key{index}: {lookup.key_type}")
+        selections.append(
+            f"item{index}: {lookup.field}({lookup.key_argument}: $key{index}) "
+            f"{{ {lookup.selection} }}"
+        )
+
+    query = (
+        f"query getBatched{lookup.field[0].upper()}{lookup.field[1:]}("
+        + ", ".join(variables)
+        + ") {\nrateLimit { cost remaining resetAt }\n"
+        + "repository(owner: $owner, name: $name) {\n"
+        + "\n".join(selections)
+        + "\n}\n}\n"
+        + lookup.fragments
+    )
+    document = gql(query)
+    return document if lookup.cached else exclude_from_response_cache(document)
+
+
+class AliasBatchFetcher:
+    """Fetch per-item lookups batch_size keys per GraphQL request."""
+
+    def __init__(self, gql_client: Any, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Initialize fetcher with GraphQL client.
+
+        Args:
+            gql_client: GraphQL client for executing batched queries
+            batch_size: Maximum number of aliased lookups per request
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        self._gql_client = gql_client
+        self._batch_size = batch_size
+
+    def fetch(
+        self, owner: str, name: str, lookup: AliasedLookup, keys: Sequence[K]
+    ) -> Dict[K, Optional[Dict[str, Any]]]:
+        """
+        Look up every key and return the raw item for each one.
+
+        Args:
+            owner: Repository owner
+            name: Repository name
+            lookup: Field and selection to look up
+            keys: Keys to look up; duplicates are fetched once
+
+        Returns:
+            Mapping of key to item data, or None if the item was not returned
+            or does not exist
+
+        Raises:
+            Exception: Request failures not tied to an item, such as
+                transport errors
+        """
+        unique_keys: List[K] = list(dict.fromkeys(keys))
+        batches = [
+            unique_keys[start : start + self._batch_size]
+            for start in range(0, len(unique_keys), self._batch_size)
+        ]
+
+        requests = []
+        for batch in batches:
+            variables: Dict[str, Any] = {"owner": owner, "name": name}
+            for index, key in enumerate(batch):
+                variables[f"key{index}"] = key
+            requests.append((_build_aliased_query(lookup, len(batch)), variables))
+
+        results: Dict[K, Optional[Dict[str, Any]]] = {}
+        for batch, result in zip(
+            batches,
+            execute_all(self._gql_client, requests, return_exceptions=True),
+        ):
+            repository = _repository_data(result)
+            for index, key in enumerate(batch):
+                results[key] = repository.get(f"item{index}")
+
+        return results
@@ -0,0 +1,182 @@
+"""
+GraphQL point-budget accounting.
+
+Paginated queries select ``rateLimit { cost remaining resetAt }`` alongside
+their data. The tracker records those values, spreads requests over the time
+left in the rate-limit window once the budget runs low, and keeps the points
+spent by each query so a save can report what every entity cost.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..rate_limit_tracker import GRAPHQL_RESOURCE, RateLimitTracker
+from ..token_pool import TokenPool
+
+logger = logging.getLogger(__name__)
+
+# Points held back for restores and ad-hoc calls sharing the same token
+DEFAULT_RESERVE = 100
+
+# Requests are only paced once fewer points than this remain
+DEFAULT_PACE_BELOW = 1000
+
+
+def _parse_reset_at(reset_at: str) -> float:
+    """Convert a GraphQL resetAt timestamp to seconds since the epoch."""
+    return datetime.fromisoformat(reset_at.replace("Z", "+00:00")).timestamp()
+
+
+def operation_name(query: Any) -> str:
+    """Return the name of the operation in a gql() request or document."""
+    document = getattr(query, "document", query)
+    for definition in getattr(document, "definitions", ()):
+        name = getattr(definition, "name", None)
+        if getattr(definition, "operation", None) is not None:
+            return name.value if name is not None else "anonymous"
+    return "anonymous"
+
+
+@dataclass
+class _TokenBudget:
+    """Budget last reported for one token, and its pacing schedule."""
+
+    remaining: int
+    reset_at: Optional[float]
+    next_request_at: float = 0.0
+
+
+class GraphQLBudgetTracker:
+    """Thread-safe tracker of the GraphQL point budget shared by all requests."""
+
+    def __init__(
+        self,
+        reserve: int = DEFAULT_RESERVE,
+        pace_below: int = DEFAULT_PACE_BELOW,
+        rate_limits: Optional[RateLimitTracker] = None,
+        token_pool: Optional[TokenPool] = None,
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            reserve: Points never spent before the window resets
+            pace_below: Remaining points below which requests are spread out
+            rate_limits: Shared store the observed GraphQL budget is copied to
+            token_pool: Pool whose per-token state receives each token's budget
+        """
+        self._reserve = reserve
+        self._pace_below = pace_below
+        self._rate_limits = rate_limits
+        self._token_pool = token_pool
+        self._lock = threading.Lock()
+        self._budgets: Dict[Optional[str], _TokenBudget] = {}
+        self._last_cost = 1
+        self._costs: Dict[str, int] = defaultdict(int)
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Most points left to any token, if a response reported them."""
+        with self._lock:
+            if not self._budgets:
+                return None
+            return max(budget.remaining for budget in self._budgets.values())
+
+    def record(
+        self,
+        rate_limit: Optional[Dict[str, Any]],
+        query_name: str,
+        token: Optional[str] = None,
+    ) -> None:
+        """
+        Record the rateLimit data returned with a query.
+
+        Args:
+            rate_limit: The response's rateLimit object, if it selected one
+            query_name: Operation name the cost is charged to
+            token: Token the query was sent with, when tokens are pooled
+        """
+        if not rate_limit:
+            return
+
+        cost = int(rate_limit.get("cost") or 0)
+        reset_at = (
+            _parse_reset_at(rate_limit["resetAt"])
+            if rate_limit.get("resetAt")
+            else None
+        )
+        remaining = rate_limit.get("remaining")
+
+        with self._lock:
+            self._costs[query_name] += cost
+            if cost:
+                self._last_cost = cost
+            if remaining is None:
+                return
+
+            budget = self._budgets.get(token)
+            if budget is not None and budget.reset_at == reset_at:
+                # Concurrent responses may arrive out of order
+                budget.remaining = min(budget.remaining, int(remaining))
+            else:
+                budget = _TokenBudget(int(remaining), reset_at)
+                self._budgets[token] = budget
+
+            if self._rate_limits is not None:
+                self._rate_limits.update(
+                    GRAPHQL_RESOURCE, budget.remaining, reset_at=budget.reset_at
+                )
+            if self._token_pool is not None and token is not None:
+                self._token_pool.tracker_for(token).update(
+                    GRAPHQL_RESOURCE, budget.remaining, reset_at=budget.reset_at
+                )
+
+    def wait_for_budget(self, token: Optional[str] = None) -> None:
+        """Sleep as long as needed to keep the next request within budget.
+
+        Args:
+            token: Token the next request will be sent with
+        """
+        with self._lock:
+            budget = self._budgets.get(token)
+            delay = self._reserve_slot(budget, time.time()) if budget else 0.0
+
+        if budget is not None and delay > 0:
+            logger.info(
+                f"GraphQL budget low ({budget.remaining} points left), "
+                f"pausing {delay:.1f}s"
+            )
+            time.sleep(delay)
+
+    def cost_by_query(self) -> Dict[str, int]:
+        """Return the points spent so far, per query operation name."""
+        with self._lock:
+            return dict(self._costs)
+
+    def _reserve_slot(self, budget: _TokenBudget, now: float) -> float:
+        """Claim the next request slot and return how long to wait for it."""
+        if budget.reset_at is None:
+            return 0.0
+
+        window_left = budget.reset_at - now
+        if window_left <= 0:
+            # The window has reset; the next response reports the new budget
+            return 0.0
+
+        if budget.remaining <= self._reserve:
+            budget.next_request_at = budget.reset_at
+            return window_left
+
+        if budget.remaining >= self._pace_below:
+            return 0.0
+
+        requests_left = (budget.remaining - self._reserve) / self._last_cost
+        interval = window_left / requests_left
+        slot = max(now, budget.next_request_at)
+        budget.next_request_at = slot + interval
+        return slot - now
@@ -1,20 +1,75 @@
-from typing import Dict, List, Any, Callable, Optional
-from gql import Client
+import contextvars
+import logging
+import time
+from concurrent.futures import Executor, Future
+from typing import Dict, Iterator, List, Any, Callable, Optional
+
+import requests
+from github.GithubException import RateLimitExceededException
+from gql.transport.exceptions import (
+    TransportConnectionFailed,
+    TransportQueryError,
+    TransportServerError,
+)
+
+logger = logging.getLogger(__name__)
+
+# Gateway errors GitHub returns when a page takes too long to build
+PAGE_TOO_LARGE_STATUS_CODES = {502, 503, 504}
+
+# Pages slower than this, or costing more points, shrink the next page
+SLOW_PAGE_SECONDS = 10.0
+HIGH_PAGE_COST = 50
+
+# Pages faster than this grow the next page, up to the configured size
+FAST_PAGE_SECONDS = 2.0
+
+# Status codes of rate-limited requests, retried after a backoff
+RATE_LIMITED_STATUS_CODES = {403, 429}
 
 
 class GraphQLPaginator:
     """Generic GraphQL cursor-based pagination utility."""
 
-    def __init__(self, gql_client: Client, page_size: int = 100):
+    def __init__(
+        self,
+        gql_client: Any,
+        page_size: int = 100,
+        prefetch_executor: Optional[Executor] = None,
+        min_page_size: int = 10,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ):
         """
         Initialize paginator with GraphQL client.
 
+        Page size adapts to the responses: a page that times out is retried
+        from the same cursor at half the size, slow or expensive pages shrink
+        the next one, and fast cheap pages grow it back up to page_size. A
+        page failing with a transient error (server error, connection
+        failure, rate limit) is retried from the same cursor with exponential
+        backoff; none of its items were yielded yet, so none are repeated.
+
         Args:
-            gql_client: GraphQL client for executing queries
+            gql_client: GraphQL client for executing queries. When a prefetch
+                executor is given it must be safe to call from that
+                executor's threads.
             page_size: Number of items to fetch per page, defaults to 100
+            prefetch_executor: Optional executor used to fetch the next page
+                while the current one is being processed
+            min_page_size: Smallest page size to shrink to before giving up
+            max_retries: Attempts to repeat a page failing with a transient
+                error
+            retry_delay: Seconds before the first retry, doubled for each
+                further one
         """
         self._gql_client = gql_client
+        self._max_page_size = page_size
+        self._min_page_size = min(min_page_size, page_size)
         self._page_size = page_size
+        self._prefetch_executor = prefetch_executor
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
 
     def _resolve_data_path(
         self, result: Dict[str, Any], data_path: str
@@ -36,7 +91,89 @@ class GraphQLPaginator:
                 return None
         return current
 
-    def paginate_all(
+    def _fetch_page(
+        self, query: Any, variable_values: Dict[str, Any], cursor: Optional[str]
+    ) -> Dict[str, Any]:
+        """Execute the query for the page starting after cursor."""
+        attempt = 0
+        while True:
+            page_size = self._page_size
+
+            # Create a copy of variable values to avoid modifying the original
+            pagination_variables = variable_values.copy()
+            pagination_variables.update({"first": page_size, "after": cursor})
+
+            started = time.monotonic()
+            try:
+                result: Dict[str, Any] = self._gql_client.execute(
+                    query, variable_values=pagination_variables
+                )
+            except Exception as error:
+                if page_size > self._min_page_size and self._is_page_too_large(error):
+                    self._page_size = max(self._min_page_size, page_size // 2)
+                    logger.warning(
+                        f"GraphQL page of {page_size} items failed ({error}); "
+                        f"retrying with {self._page_size}"
+                    )
+                    continue
+                if attempt >= self._max_retries or not self._is_transient(error):
+                    raise
+                delay = self._retry_delay * (2**attempt)
+                attempt += 1
+                logger.warning(
+                    f"GraphQL page request failed ({error}); retrying in "
+                    f"{delay:.1f}s (attempt {attempt}/{self._max_retries})"
+                )
+                time.sleep(delay)
+                continue
+
+            self._adapt_page_size(time.monotonic() - started, result)
+            return result
+
+    def _is_page_too_large(self, error: Exception) -> bool:
+        """Check whether a failed request is likely to succeed with fewer items."""
+        if isinstance(error, TransportServerError):
+            return error.code in PAGE_TOO_LARGE_STATUS_CODES
+        if isinstance(error, TransportConnectionFailed):
+            return isinstance(error.__cause__, requests.Timeout)
+        if isinstance(error, TransportQueryError):
+            return "timeout" in str(error).lower()
+        return isinstance(error, requests.Timeout)
+
+    def _is_transient(self, error: Exception) -> bool:
+        """Check whether a failed request may succeed when repeated later."""
+        if isinstance(error, TransportServerError):
+            return error.code is None or (
+                error.code >= 500 or error.code in RATE_LIMITED_STATUS_CODES
+            )
+        if isinstance(error, TransportQueryError):
+            return any(
+                isinstance(e, dict) and e.get("type") == "RATE_LIMITED"
+                for e in error.errors or []
+            )
+        return isinstance(
+            error,
+            (
+                TransportConnectionFailed,
+                requests.ConnectionError,
+                requests.Timeout,
+                RateLimitExceededException,
+            ),
+        )
+
+    def _adapt_page_size(self, elapsed: float, result: Dict[str, Any]) -> None:
+        """Shrink or grow the next page based on how the last one went."""
+        rate_limit = result.get("rateLimit") or {}
+        cost = rate_limit.get("cost")
+
+        if elapsed > SLOW_PAGE_SECONDS or (cost is not None and cost > HIGH_PAGE_COST):
+            self._page_size = max(self._min_page_size, self._page_size // 2)
+        elif elapsed < FAST_PAGE_SECONDS and (
+            cost is None or cost * 2 <= HIGH_PAGE_COST
+        ):
+            self._page_size = min(self._max_page_size, self._page_size * 2)
+
+    def paginate_iter(
         self,
         query: Any,
         variable_values: Dict[str, Any],
@@ -44,9 +181,13 @@ class GraphQLPaginator:
         post_processor: Optional[
             Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]
         ] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[List[Dict[str, Any]]]:
         """
-        Execute paginated GraphQL query and return all results.
+        Execute paginated GraphQL query and yield results page by page.
+
+        Only the current page is held in memory. With a prefetch executor the
+        request for the next page is in flight while the caller processes
+        the current one.
 
         Args:
             query: GraphQL query object (from gql)
@@ -54,42 +195,78 @@ class GraphQLPaginator:
             data_path: Dot-notation path to paginated data (e.g., "repository.issues")
             post_processor: Optional function to process each page of results
 
-        Returns:
-            List of all items from all pages
+        Yields:
+            List of items for each page, after post-processing
         """
-        all_items: List[Dict[str, Any]] = []
         cursor = None
+        next_page: Optional[Future[Dict[str, Any]]] = None
 
-        while True:
-            # Create a copy of variable values to avoid modifying the original
-            pagination_variables = variable_values.copy()
-            pagination_variables.update({"first": self._page_size, "after": cursor})
+        try:
+            while True:
+                if next_page is not None:
+                    result = next_page.result()
+                    next_page = None
+                else:
+                    result = self._fetch_page(query, variable_values, cursor)
 
-            # Execute the query with pagination
-            result = self._gql_client.execute(
-                query, variable_values=pagination_variables
-            )
+                # Resolve the data path
+                data = self._resolve_data_path(result, data_path)
 
-            # Resolve the data path
-            data = self._resolve_data_path(result, data_path)
+                # Handle null data gracefully
+                if data is None:
+                    return
 
-            # Handle null data gracefully
-            if data is None:
-                break
+                has_next_page = data["pageInfo"]["hasNextPage"]
+                cursor = data["pageInfo"]["endCursor"]
 
-            # Optional post-processing
-            page_items = data["nodes"]
-            if post_processor:
-                page_items = post_processor(page_items)
+                if has_next_page and self._prefetch_executor is not None:
+                    # Carry the caller's context (e.g. its cache scope) along
+                    next_page = self._prefetch_executor.submit(
+                        contextvars.copy_context().run,
+                        self._fetch_page,
+                        query,
+                        variable_values,
+                        cursor,
+                    )
 
-            # Extend all items list
-            all_items.extend(page_items)
+                # Optional post-processing
+                page_items = data["nodes"]
+                if post_processor:
+                    page_items = post_processor(page_items)
+
+                yield page_items
+
+                if not has_next_page:
+                    return
+        finally:
+            # Abandoned iteration must not leave a request behind
+            if next_page is not None:
+                next_page.cancel()
 
-            # Check for more pages
-            if not data["pageInfo"]["hasNextPage"]:
-                break
+    def paginate_all(
+        self,
+        query: Any,
+        variable_values: Dict[str, Any],
+        data_path: str,
+        post_processor: Optional[
+            Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]
+        ] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute paginated GraphQL query and return all results.
 
-            # Update cursor for next iteration
-            cursor = data["pageInfo"]["endCursor"]
+        Args:
+            query: GraphQL query object (from gql)
+            variable_values: Base variables for the query (without pagination params)
+            data_path: Dot-notation path to paginated data (e.g., "repository.issues")
+            post_processor: Optional function to process each page of results
 
+        Returns:
+            List of all items from all pages
+        """
+        all_items: List[Dict[str, Any]] = []
+        for page_items in self.paginate_iter(
+            query, variable_values, data_path, post_processor
+        ):
+            all_items.extend(page_items)
         return all_items
@@ -0,0 +1,153 @@
+"""
+Alias batching for independent GraphQL mutations.
+
+Packs many mutations of the same kind (one label, one comment) into a single
+GraphQL document using field aliases. GitHub runs a document's mutations one
+after another in document order and reports errors per alias, so an item
+that fails leaves the rest of its batch applied.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from gql import gql
+from gql.transport.exceptions import TransportQueryError
+
+DEFAULT_MUTATION_BATCH_SIZE = 50
+
+
+@dataclass(frozen=True)
+class AliasedMutation:
+    """Mutation sent for many inputs in one aliased document.
+
+    Attributes:
+        field: Mutation field to call (e.g. "createLabel")
+        input_type: GraphQL type of the mutation's input (e.g.
+            "CreateLabelInput!")
+        selection: Selection set on each mutation payload
+    """
+
+    field: str
+    input_type: str
+    selection: str
+
+
+class MutationError(Exception):
+    """Raised for, or returned in place of, a mutation GitHub rejected."""
+
+    def __init__(self, message: str, input_data: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.input_data = input_data
+
+
+# Result of one mutation in a batch: its payload, or why it failed
+MutationResult = Union[Dict[str, Any], MutationError]
+
+
+@lru_cache(maxsize=128)
+def _build_aliased_mutation(mutation: AliasedMutation, input_count: int) -> Any:
+    """Build a document calling mutation input_count times under aliases."""
+    variables = []
+    selections = []
+    for index in range(input_count):
+        variables.append(f"$input{index}: {mutation.input_type}")
+        selections.append(
+            f"item{index}: {mutation.field}(input: $input{index}) "
+            f"{{ {mutation.selection} }}"
+        )
+
+    document = (
+        f"mutation batched{mutation.field[0].upper()}{mutation.field[1:]}("
+        + ", ".join(variables)
+        + ") {\n"
+        + "\n".join(selections)
+        + "\n}\n"
+    )
+    return gql(document)
+
+
+def _error_alias(error: Any) -> Optional[str]:
+    """Return the alias a GraphQL error was reported for, if any."""
+    path = error.get("path") if isinstance(error, dict) else None
+    return str(path[0]) if path else None
+
+
+def _error_message(error: Any) -> str:
+    """Return the message of a GraphQL error."""
+    return str(error.get("message", error)) if isinstance(error, dict) else str(error)
+
+
+class MutationBatcher:
+    """Send mutations batch_size inputs per GraphQL request."""
+
+    def __init__(self, gql_client: Any, batch_size: int = DEFAULT_MUTATION_BATCH_SIZE):
+        """
+        Initialize batcher with GraphQL client.
+
+        Args:
+            gql_client: GraphQL client for executing batched mutations
+            batch_size: Maximum number of aliased mutations per request
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        self._gql_client = gql_client
+        self._batch_size = batch_size
+
+    def execute(
+        self, mutation: AliasedMutation, inputs: Sequence[Dict[str, Any]]
+    ) -> List[MutationResult]:
+        """
+        Run the mutation once per input, in order.
+
+        Args:
+            mutation: Mutation and payload selection to send
+            inputs: Input object of each mutation
+
+        Returns:
+            Payload of each mutation in input order, or a MutationError for
+            each one GitHub rejected
+
+        Raises:
+            Exception: Request failures affecting a whole batch, such as
+                transport errors or errors not tied to an alias
+        """
+        results: List[MutationResult] = []
+        for start in range(0, len(inputs), self._batch_size):
+            results.extend(
+                self._execute_batch(mutation, inputs[start : start + self._batch_size])
+            )
+        return results
+
+    def _execute_batch(
+        self, mutation: AliasedMutation, inputs: Sequence[Dict[str, Any]]
+    ) -> List[MutationResult]:
+        """Send one aliased document and split its payloads per input."""
+        variables = {f"input{index}": item for index, item in enumerate(inputs)}
+        errors_by_alias: Dict[str, List[str]] = {}
+        try:
+            data = self._gql_client.execute(
+                _build_aliased_mutation(mutation, len(inputs)),
+                variable_values=variables,
+            )
+        except TransportQueryError as e:
+            # Partial success: failed aliases are null and have errors
+            if not e.data:
+                raise
+            data = e.data
+            for error in e.errors or []:
+                alias = _error_alias(error)
+                if alias is None:
+                    raise
+                errors_by_alias.setdefault(alias, []).append(_error_message(error))
+
+        results: List[MutationResult] = []
+        for index, item in enumerate(inputs):
+            alias = f"item{index}"
+            payload = data.get(alias)
+            if alias in errors_by_alias or payload is None:
+                message = "; ".join(errors_by_alias.get(alias, [])) or "no payload"
+                results.append(MutationError(f"{mutation.field}: {message}", item))
+            else:
+                results.append(payload)
+        return results
@@ -0,0 +1,173 @@
+"""
+Follow-up pagination for nested GraphQL connections.
+
+Repository queries fetch inner connections (comments on issues, reviews on
+pull requests, ...) with a fixed page size. This module completes the inner
+connections that report more pages by querying their parents by node ID,
+many parents per request.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+from gql import gql
+
+from .alias_batcher import execute_all
+
+
+@dataclass(frozen=True)
+class NestedConnection:
+    """Inner connection that may need follow-up pages.
+
+    Attributes:
+        field: Connection field name on the parent node (e.g. "comments")
+        parent_type: GraphQL type of the parent node (e.g. "Issue")
+        node_fields: Selection set for each node of the connection
+        fragments: Fragment definitions referenced by node_fields
+        arguments: Extra connection arguments (e.g. an orderBy clause)
+        children: Connections nested inside this connection's nodes
+    """
+
+    field: str
+    parent_type: str
+    node_fields: str
+    fragments: str = ""
+    arguments: str = ""
+    children: Tuple["NestedConnection", ...] = ()
+
+
+@lru_cache(maxsize=128)
+def _build_follow_up_query(connection: NestedConnection, parent_count: int) -> Any:
+    """Build a query fetching the next page of connection for parent_count nodes."""
+    # Extra arguments may contain braces, so they are not format() input
+    extra_arguments = f", {connection.arguments}" if connection.arguments else ""
+
+    variables = ["$first: Int!"]
+    selections = []
+    for index in range(parent_count):
+        variables.append(f"$id{index}: ID!")
+        variables.append(f"$after{index}: String")
+        selections.append(
+            f"node{index}: node(id: $id{index}) {{ "
+            f"... on {connection.parent_type} {{ "
+            f"{connection.field}(first: $first, after: $after{index}"
+            f"{extra_arguments}) {{ "
+            f"nodes {{ {connection.node_fields} }} "
+            f"pageInfo {{ hasNextPage endCursor }} "
+            f"}} }} }}"
+        )
+
+    query = (
+        f"query get{connection.parent_type}"
+        f"{connection.field[0].upper()}{connection.field[1:]}Pages("
+        + ", ".join(variables)
+        + ") {\nrateLimit { cost remaining resetAt }\n"
+        + "\n".join(selections)
+        + "\n}\n"
+        + connection.fragments
+    )
+    return gql(query)
+
+
+class NestedConnectionResolver:
+    """Complete truncated nested connections with batched node queries."""
+
+    def __init__(self, gql_client: Any, batch_size: int = 50, page_size: int = 100):
+        """
+        Initialize resolver with GraphQL client.
+
+        Args:
+            gql_client: GraphQL client for executing follow-up queries
+            batch_size: Number of parent nodes queried per request
+            page_size: Number of connection items fetched per parent and request
+        """
+        self._gql_client = gql_client
+        self._batch_size = batch_size
+        self._page_size = page_size
+
+    def resolve(
+        self,
+        nodes: List[Dict[str, Any]],
+        connections: Sequence[NestedConnection],
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the remaining pages of each connection on nodes, in place.
+
+        Args:
+            nodes: Parent nodes as returned by the GraphQL query
+            connections: Connections of the parent nodes to complete
+
+        Returns:
+            The same nodes, with every connection holding all of its items
+        """
+        for connection in connections:
+            self._complete_connection(nodes, connection)
+            if connection.children:
+                items = [
+                    item
+                    for node in nodes
+                    for item in self._connection_items(node, connection.field)
+                ]
+                self.resolve(items, connection.children)
+        return nodes
+
+    def _connection_items(
+        self, node: Dict[str, Any], field: str
+    ) -> List[Dict[str, Any]]:
+        """Return the items of a node's connection, or none if it is absent."""
+        connection_data = node.get(field)
+        if not connection_data:
+            return []
+        items: List[Dict[str, Any]] = connection_data.get("nodes") or []
+        return items
+
+    def _has_next_page(self, node: Dict[str, Any], field: str) -> bool:
+        """Check whether a node's connection was truncated."""
+        connection_data = node.get(field)
+        if not connection_data or "pageInfo" not in connection_data:
+            return False
+        return bool(connection_data["pageInfo"]["hasNextPage"])
+
+    def _complete_connection(
+        self, nodes: List[Dict[str, Any]], connection: NestedConnection
+    ) -> None:
+        """Append follow-up pages to every truncated connection of nodes."""
+        pending = [
+            node for node in nodes if self._has_next_page(node, connection.field)
+        ]
+
+        while pending:
+            # Every truncated parent is one page further along per round
+            batches = [
+                pending[start : start + self._batch_size]
+                for start in range(0, len(pending), self._batch_size)
+            ]
+            pending = []
+
+            requests = []
+            for batch in batches:
+                variables: Dict[str, Any] = {"first": self._page_size}
+                for index, node in enumerate(batch):
+                    variables[f"id{index}"] = node["id"]
+                    variables[f"after{index}"] = node[connection.field]["pageInfo"][
+                        "endCursor"
+                    ]
+                requests.append(
+                    (_build_follow_up_query(connection, len(batch)), variables)
+                )
+
+            results = execute_all(self._gql_client, requests)
+            for batch, result in zip(batches, results):
+                for index, node in enumerate(batch):
+                    parent = result.get(f"node{index}") or {}
+                    page = parent.get(connection.field)
+                    if page is None:
+                        # Parent vanished between requests; keep what we have
+                        node[connection.field]["pageInfo"]["hasNextPage"] = False
+                        continue
+
+                    node[connection.field]["nodes"].extend(page["nodes"])
+                    node[connection.field]["pageInfo"] = page["pageInfo"]
+                    if page["pageInfo"]["hasNextPage"]:
+                        pending.append(node)
@@ -0,0 +1,175 @@
+"""
+Parsed and validated GraphQL query cache.
+
+Queries are checked against the GitHub schema snapshot bundled with the
+package (schema/github.graphql) instead of GitHub's introspection schema,
+which gql would otherwise download on every run before the first query.
+Each query document is parsed, validated and hashed once per process; later
+executions of the same document skip this work.
+"""
+
+import hashlib
+import re
+import threading
+import weakref
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from gql import gql
+from graphql import (
+    DocumentNode,
+    GraphQLSchema,
+    OperationType,
+    build_ast_schema,
+    parse,
+    print_ast,
+    validate,
+)
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent / "schema" / "github.graphql"
+
+
+@lru_cache(maxsize=None)
+def bundled_schema() -> GraphQLSchema:
+    """Return the bundled GitHub schema, built on first use."""
+    return build_ast_schema(parse(SCHEMA_PATH.read_text(encoding="utf-8")))
+
+
+@lru_cache(maxsize=None)
+def schema_version() -> str:
+    """Return the version recorded in the bundled schema's header."""
+    match = re.search(
+        r"^# Version: (\S+)$", SCHEMA_PATH.read_text(encoding="utf-8"), re.MULTILINE
+    )
+    return match.group(1) if match else "unknown"
+
+
+@lru_cache(maxsize=256)
+def compile_query(source: str) -> Any:
+    """Parse a query string once and return the cached gql request."""
+    return gql(source)
+
+
+class _DocumentMemo:
+    """Values computed once per live query document.
+
+    Documents are keyed by identity; an entry is dropped when its document
+    is garbage collected, so a new document reusing the id starts afresh.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[int, Tuple["weakref.ref[DocumentNode]", Any]] = {}
+
+    def get(self, document: DocumentNode) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(id(document))
+        if entry is None or entry[0]() is not document:
+            return None
+        return entry[1]
+
+    def put(self, document: DocumentNode, value: Any) -> None:
+        key = id(document)
+        with self._lock:
+            self._entries[key] = (
+                weakref.ref(document, partial(self._forget, key)),
+                value,
+            )
+
+    def _forget(self, key: int, _document: Any) -> None:
+        self._entries.pop(key, None)
+
+
+_validated = _DocumentMemo()
+_digests = _DocumentMemo()
+
+
+def validate_query(query: Any) -> None:
+    """
+    Validate a query against the bundled schema, once per document.
+
+    Args:
+        query: gql() request or parsed document; anything else is skipped
+
+    Raises:
+        GraphQLError: If the query does not match the schema
+    """
+    document = getattr(query, "document", query)
+    if not isinstance(document, DocumentNode) or _validated.get(document):
+        return
+
+    errors = validate(bundled_schema(), document)
+    if errors:
+        raise errors[0]
+    _validated.put(document, True)
+
+
+def exclude_from_response_cache(query: Any) -> Any:
+    """
+    Mark a query whose results must always come from GitHub.
+
+    Used for lookups made right before a write, such as node IDs, which the
+    persistent response cache could otherwise answer with IDs of a deleted
+    and recreated repository of the same name.
+
+    Args:
+        query: gql() request or parsed document
+
+    Returns:
+        The query, for use in assignments
+    """
+    document = getattr(query, "document", query)
+    if isinstance(document, DocumentNode):
+        _digests.put(document, "")
+    return query
+
+
+def is_mutation(query: Any) -> bool:
+    """
+    Check whether a query document contains a mutation.
+
+    Args:
+        query: gql() request or parsed document
+
+    Returns:
+        True if any operation of the parsed document is a mutation
+    """
+    document = getattr(query, "document", query)
+    if not isinstance(document, DocumentNode):
+        return False
+    return any(
+        getattr(definition, "operation", None) == OperationType.MUTATION
+        for definition in document.definitions
+    )
+
+
+def query_digest(query: Any) -> Optional[str]:
+    """
+    Return a digest identifying a read-only query document.
+
+    Args:
+        query: gql() request or parsed document
+
+    Returns:
+        Hex digest of the printed document, or None if it is not a parsed
+        document, contains a mutation or subscription or is excluded from
+        the response cache
+    """
+    document = getattr(query, "document", query)
+    if not isinstance(document, DocumentNode):
+        return None
+
+    digest = _digests.get(document)
+    if digest is None:
+        read_only = all(
+            getattr(definition, "operation", OperationType.QUERY) == OperationType.QUERY
+            for definition in document.definitions
+        )
+        digest = (
+            hashlib.sha256(print_ast(document).encode("utf-8")).hexdigest()
+            if read_only
+            else ""
+        )
+        _digests.put(document, digest)
+    return digest or None
@@ -0,0 +1,131 @@
+"""
+Coalescing of single-item lookups into batch lookups.
+
+Callers ask for one key at a time; keys requested while a batch is in
+flight are collected and fetched together by the next batch. A lone caller
+is served at once, so sequential use costs no extra latency, while
+concurrent callers (e.g. restore worker threads) share round trips. A
+batch failing because of one of its keys is split and fetched again in
+halves, so one bad key fails only its own caller; any other failure is
+handed to every caller of the batch at once.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class RequestCoalescer(Generic[K, V]):
+    """Thread-safe coalescing of load(key) calls into fetch_batch(keys) calls."""
+
+    def __init__(
+        self,
+        fetch_batch: Callable[[List[K]], Mapping[K, V]],
+        max_batch_size: int,
+        is_item_error: Optional[Callable[[Exception], bool]] = None,
+    ):
+        """
+        Initialize coalescer.
+
+        Args:
+            fetch_batch: Looks up many keys at once, returning a value for
+                each of them
+            max_batch_size: Maximum number of keys passed to one fetch_batch
+                call
+            is_item_error: Tells whether a fetch_batch error was caused by
+                some of the keys, so splitting the batch can isolate them;
+                if not given, every error fails the whole batch
+
+        Raises:
+            ValueError: If max_batch_size is below 1
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        self._fetch_batch = fetch_batch
+        self._max_batch_size = max_batch_size
+        self._is_item_error = is_item_error
+        self._condition = threading.Condition()
+        self._pending: Dict[K, "Future[V]"] = {}
+        self._dispatching = False
+
+    def load(self, key: K) -> V:
+        """
+        Look up one key, batched with keys other threads are waiting for.
+
+        The calling thread either fetches a batch of waiting keys itself or
+        waits while another thread's batch is in flight.
+
+        Raises:
+            Exception: Whatever fetch_batch raised for the batch holding
+                key, or for the smallest one if the error was split down
+        """
+        with self._condition:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = Future()
+
+        while not future.done():
+            with self._condition:
+                self._condition.wait_for(lambda: future.done() or not self._dispatching)
+                if future.done():
+                    break
+                self._dispatching = True
+                batch = self._take_batch()
+            self._dispatch(batch)
+
+        return future.result()
+
+    def _take_batch(self) -> Dict[K, "Future[V]"]:
+        """Remove up to max_batch_size waiting keys; caller holds the lock."""
+        keys = list(self._pending)[: self._max_batch_size]
+        return {key: self._pending.pop(key) for key in keys}
+
+    def _dispatch(self, batch: Dict[K, "Future[V]"]) -> None:
+        """Fetch a batch and hand every waiting caller its value or error."""
+        try:
+            self._resolve(batch)
+        except BaseException as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            raise
+        finally:
+            with self._condition:
+                self._dispatching = False
+                self._condition.notify_all()
+
+    def _resolve(self, batch: Dict[K, "Future[V]"]) -> None:
+        """Fetch a batch, bisecting it on item errors to isolate the keys."""
+        try:
+            values = self._fetch_batch(list(batch))
+        except Exception as e:
+            if len(batch) == 1 or not (
+                self._is_item_error is not None and self._is_item_error(e)
+            ):
+                # Request-level failures would fail every half just the same
+                for future in batch.values():
+                    future.set_exception(e)
+                return
+            keys = list(batch)
+            middle = len(keys) // 2
+            self._resolve({key: batch[key] for key in keys[:middle]})
+            self._resolve({key: batch[key] for key in keys[middle:]})
+            return
+
+        for key, future in batch.items():
+            if key in values:
+                future.set_result(values[key])
+            else:
+                future.set_exception(KeyError(key))
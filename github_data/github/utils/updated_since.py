@@ -0,0 +1,45 @@
+"""
+Incremental reads of pull request connections.
+
+Unlike issues, pull requests cannot be filtered by update time. Reading them
+newest first and stopping at the first one older than the watermark fetches
+only the pages holding changed pull requests.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+# Order under which every changed node precedes the unchanged ones
+NEWEST_FIRST = {"field": "UPDATED_AT", "direction": "DESC"}
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Convert a GraphQL DateTime to a timezone-aware datetime."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class UpdatedSinceFilter:
+    """Page filter keeping nodes updated at or after a watermark.
+
+    Pages must be ordered by NEWEST_FIRST. Once a page holds an older node,
+    exhausted is set: every later page holds only older nodes.
+    """
+
+    def __init__(self, since: datetime):
+        """
+        Initialize filter.
+
+        Args:
+            since: Timezone-aware watermark; nodes updated before it are dropped
+        """
+        self._since = since
+        self.exhausted = False
+
+    def __call__(self, nodes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the nodes of a page updated at or after the watermark."""
+        recent = [
+            node for node in nodes if parse_timestamp(node["updatedAt"]) >= self._since
+        ]
+        if len(recent) < len(nodes):
+            self.exhausted = True
+        return recent
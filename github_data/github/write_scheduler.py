@@ -0,0 +1,199 @@
+"""
+Write scheduler for mutating GitHub API calls.
+
+GitHub applies secondary rate limits to content creation on top of the
+hourly request budget. The scheduler spaces writes to stay within
+configurable per-minute and per-hour budgets, waits out ``Retry-After`` when
+a secondary limit triggers anyway, and slows down after each such response
+before gradually returning to the configured pace.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, TypeVar
+
+from github.GithubException import GithubException
+from gql.transport.exceptions import TransportQueryError, TransportServerError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# GitHub's documented content-creation limits
+DEFAULT_WRITES_PER_MINUTE = 80
+DEFAULT_WRITES_PER_HOUR = 500
+
+# Wait used when a secondary limit response carries no Retry-After header
+DEFAULT_PENALTY_SECONDS = 60.0
+
+# Successful writes after which a reduced pace is raised again
+RECOVERY_WRITES = 20
+
+# Errors REST and GraphQL writes fail with, rate limit rejections included
+WRITE_ERRORS = (GithubException, TransportServerError, TransportQueryError)
+
+
+def _lowercase_headers(error: Exception) -> Dict[str, Any]:
+    """Return the error response's headers with lowercase names."""
+    headers = getattr(error, "headers", None) or {}
+    return {str(name).lower(): value for name, value in headers.items()}
+
+
+def is_secondary_rate_limit(error: Exception) -> bool:
+    """Check whether an error is a secondary (abuse) rate limit response.
+
+    Primary limits (no requests left in the hour) are left to
+    RateLimitHandler, which knows how to back off until the reset. GraphQL
+    requests are rejected with a 403 or 429 status, or with a RATE_LIMITED
+    error in the response; the gql transport keeps no headers to tell the
+    two kinds of limit apart, so both are treated as secondary.
+    """
+    if isinstance(error, TransportServerError):
+        return error.code in (403, 429)
+    if isinstance(error, TransportQueryError):
+        return any(
+            isinstance(e, dict) and e.get("type") == "RATE_LIMITED"
+            for e in error.errors or []
+        )
+    if not isinstance(error, GithubException):
+        return False
+
+    if error.status == 429:
+        return True
+    if error.status != 403:
+        return False
+
+    headers = _lowercase_headers(error)
+    if str(headers.get("x-ratelimit-remaining")) == "0":
+        return False
+    return "retry-after" in headers or "secondary rate limit" in str(error).lower()
+
+
+class WriteScheduler:
+    """Thread-safe pacing of mutating calls within write budgets."""
+
+    def __init__(
+        self,
+        per_minute: int = DEFAULT_WRITES_PER_MINUTE,
+        per_hour: int = DEFAULT_WRITES_PER_HOUR,
+        max_retries: int = 3,
+    ):
+        """
+        Initialize write scheduler.
+
+        Args:
+            per_minute: Maximum writes started in any minute
+            per_hour: Maximum writes started in any hour
+            max_retries: Attempts to repeat a write rejected by a secondary limit
+        """
+        if per_minute < 1 or per_hour < 1:
+            raise ValueError(
+                f"Write budgets must be at least 1, got {per_minute}/min "
+                f"and {per_hour}/hour"
+            )
+        self._max_per_minute = float(per_minute)
+        self._per_minute = float(per_minute)
+        self._per_hour = per_hour
+        self._max_retries = max_retries
+        self._lock = threading.Lock()
+        self._hour_window: Deque[float] = deque()
+        self._next_write_at = 0.0
+        self._penalty_until = 0.0
+        self._successes = 0
+
+    @property
+    def per_minute(self) -> float:
+        """Current pace in writes per minute, lowered after penalties."""
+        with self._lock:
+            return self._per_minute
+
+    def execute(self, operation: Callable[[], T], writes: int = 1) -> T:
+        """
+        Run a write once the budgets allow it.
+
+        Args:
+            operation: Mutating call to run
+            writes: Number of writes the call makes, such as the mutations of
+                a batched request; each one is charged against the budgets
+
+        Returns:
+            Result of the operation
+
+        Raises:
+            GithubException: If the write fails for another reason, or keeps
+                hitting secondary limits after max_retries attempts; the
+                gql transport errors of GraphQL writes likewise
+        """
+        for attempt in range(self._max_retries + 1):
+            self._wait_for_slot(writes)
+            try:
+                result = operation()
+            except WRITE_ERRORS as e:
+                if attempt == self._max_retries or not is_secondary_rate_limit(e):
+                    raise
+                self._back_off(e)
+                continue
+
+            self._record_success()
+            return result
+
+        # Safety fallback - the loop either returns or raises
+        raise RuntimeError("Unexpected end of write retry loop")
+
+    def _wait_for_slot(self, writes: int) -> None:
+        """Claim the next slots for writes and sleep until they come up."""
+        # A request larger than the hourly budget waits for a whole hour
+        writes = max(1, min(writes, self._per_hour))
+        with self._lock:
+            now = time.monotonic()
+            while self._hour_window and self._hour_window[0] <= now - 3600:
+                self._hour_window.popleft()
+
+            slot = max(now, self._next_write_at, self._penalty_until)
+            excess = len(self._hour_window) + writes - self._per_hour
+            if excess > 0:
+                oldest = self._hour_window[excess - 1]
+                slot = max(slot, oldest + 3600)
+
+            self._next_write_at = slot + writes * 60.0 / self._per_minute
+            self._hour_window.extend([slot] * writes)
+            delay = slot - now
+
+        if delay > 0:
+            logger.debug(f"Pacing write for {delay:.1f}s")
+            time.sleep(delay)
+
+    def _back_off(self, error: Exception) -> None:
+        """Halve the pace and hold all writes for the requested time."""
+        retry_after = _lowercase_headers(error).get("retry-after")
+        try:
+            wait = float(retry_after) if retry_after is not None else None
+        except ValueError:
+            wait = None
+        if wait is None:
+            wait = DEFAULT_PENALTY_SECONDS
+
+        with self._lock:
+            self._penalty_until = max(self._penalty_until, time.monotonic() + wait)
+            self._per_minute = max(1.0, self._per_minute / 2)
+            self._successes = 0
+            per_minute = self._per_minute
+
+        status = getattr(error, "status", None) or getattr(error, "code", None)
+        logger.warning(
+            f"GitHub secondary rate limit hit ({status or 'RATE_LIMITED'}). "
+            f"Pausing writes for {wait:.0f}s, then continuing at "
+            f"{per_minute:.0f}/min"
+        )
+
+    def _record_success(self) -> None:
+        """Raise a reduced pace again after a run of successful writes."""
+        with self._lock:
+            if self._per_minute >= self._max_per_minute:
+                return
+            self._successes += 1
+            if self._successes >= RECOVERY_WRITES:
+                self._successes = 0
+                self._per_minute = min(self._max_per_minute, self._per_minute * 1.25)
@@ -5,11 +5,28 @@ import sys
 import time
 from typing import Optional, List, Dict, Any
 
+from github_data.entities.issues.issue_importer import IssueImporter
 from github_data.entities.registry import EntityRegistry
+from github_data.entities.releases.asset_downloader import (
+    DEFAULT_DOWNLOAD_WORKERS,
+    ReleaseAssetDownloader,
+)
+from github_data.entities.releases.asset_uploader import (
+    DEFAULT_UPLOAD_WORKERS,
+    ReleaseAssetUploader,
+)
 from github_data.operations import StrategyBasedOrchestrator
 from github_data.operations.save.orchestrator import StrategyBasedSaveOrchestrator
 from github_data.operations.restore.orchestrator import StrategyBasedRestoreOrchestrator
 from github_data.github import create_github_service
+from github_data.github.async_graphql_client import DEFAULT_CONCURRENCY
+from github_data.github.graphql_client import PREFETCH_WORKERS
+from github_data.github.http_pool import DEFAULT_POOL_SIZE
+from github_data.github.token_pool import TokenPool
+from github_data.github.write_scheduler import (
+    DEFAULT_WRITES_PER_HOUR,
+    DEFAULT_WRITES_PER_MINUTE,
+)
 from github_data.storage import create_storage_service
 from github_data.git.service import GitRepositoryServiceImpl
 
@@ -23,12 +40,27 @@ class Main:
         self._operation: str = "save"
         self._registry: EntityRegistry
         self._github_token: Optional[str]
+        self._token_pool: Optional[TokenPool] = None
         self._github_repo: str
         self._data_path: str
         self._orchestrator: StrategyBasedOrchestrator
         self._git_service: Optional[GitRepositoryServiceImpl] = None
         self._create_repository_if_missing: bool = True
         self._repository_visibility: str = "public"
+        self._max_workers: int = 1
+        self._writes_per_minute: int = DEFAULT_WRITES_PER_MINUTE
+        self._writes_per_hour: int = DEFAULT_WRITES_PER_HOUR
+        self._graphql_concurrency: Optional[int] = None
+        self._validate_graphql_queries: bool = True
+        self._incremental_save: bool = False
+        self._include_release_assets: bool = True
+        self._asset_download_workers: int = DEFAULT_DOWNLOAD_WORKERS
+        self._asset_download_bytes_per_second: Optional[int] = None
+        self._asset_upload_workers: int = DEFAULT_UPLOAD_WORKERS
+        self._issue_import: bool = False
+        self._pipelined_restore: bool = False
+        self._restore_journal: bool = True
+        self._resume_restore: bool = False
 
     def main(self) -> None:
         """Execute save or restore operation based on environment variables."""
@@ -39,6 +71,16 @@ class Main:
         self._load_data_path_from_environment()
         self._load_create_repository_if_missing_from_environment()
         self._load_repository_visibility_from_environment()
+        self._load_max_workers_from_environment()
+        self._load_write_budgets_from_environment()
+        self._load_graphql_concurrency_from_environment()
+        self._load_graphql_validation_from_environment()
+        self._load_incremental_save_from_environment()
+        self._load_release_assets_from_environment()
+        self._load_issue_import_from_environment()
+        self._load_pipelined_restore_from_environment()
+        self._load_restore_journal_from_environment()
+        self._load_resume_restore_from_environment()
         self._build_github_service()
         self._build_storage_service()
         self._ensure_repository_exists()
@@ -62,8 +104,15 @@ class Main:
             exit(f"Error initializing registry: {e}")
 
     def _load_github_token_from_environment(self) -> None:
+        try:
+            self._token_pool = TokenPool.from_environment()
+        except (ValueError, OSError) as e:
+            exit(f"Error: Invalid GITHUB_TOKENS configuration. {e}")
+
         token = os.getenv("GITHUB_TOKEN")
-        if token is None or not token:
+        if self._token_pool is not None:
+            self._github_token = self._token_pool.primary
+        elif token is None or not token:
             exit("Error: GITHUB_TOKEN environment variable required")
         else:
             self._github_token = token
@@ -106,6 +155,158 @@ class Main:
             )
         self._repository_visibility = value
 
+    def _load_max_workers_from_environment(self) -> None:
+        """Load MAX_WORKERS setting (number of entities processed concurrently)."""
+        value = os.getenv("MAX_WORKERS", "1")
+        try:
+            max_workers = int(value)
+        except ValueError:
+            exit(f"Error: Invalid MAX_WORKERS '{value}'. Must be a positive integer.")
+        if max_workers < 1:
+            exit(f"Error: Invalid MAX_WORKERS '{value}'. Must be a positive integer.")
+        self._max_workers = max_workers
+
+    def _load_write_budgets_from_environment(self) -> None:
+        """Load WRITES_PER_MINUTE and WRITES_PER_HOUR (restore only)."""
+        if self._operation != "restore":
+            return
+
+        self._writes_per_minute = self._load_positive_int(
+            "WRITES_PER_MINUTE", DEFAULT_WRITES_PER_MINUTE
+        )
+        self._writes_per_hour = self._load_positive_int(
+            "WRITES_PER_HOUR", DEFAULT_WRITES_PER_HOUR
+        )
+
+    def _load_graphql_concurrency_from_environment(self) -> None:
+        """Load GRAPHQL_CONCURRENCY (queries in flight on the asyncio client)."""
+        if os.getenv("GRAPHQL_CONCURRENCY") is None:
+            return
+
+        self._graphql_concurrency = self._load_positive_int(
+            "GRAPHQL_CONCURRENCY", DEFAULT_CONCURRENCY
+        )
+
+    def _load_graphql_validation_from_environment(self) -> None:
+        """Load GRAPHQL_VALIDATE_QUERIES (check queries against bundled schema)."""
+        value = os.getenv("GRAPHQL_VALIDATE_QUERIES", "true")
+        try:
+            from github_data.config.number_parser import NumberSpecificationParser
+
+            self._validate_graphql_queries = (
+                NumberSpecificationParser.parse_boolean_value(value)
+            )
+        except ValueError as e:
+            exit(f"Error: Invalid GRAPHQL_VALIDATE_QUERIES value. {e}")
+
+    def _load_incremental_save_from_environment(self) -> None:
+        """Load INCREMENTAL_SAVE setting (save only)."""
+        if self._operation != "save":
+            return
+
+        value = os.getenv("INCREMENTAL_SAVE", "false")
+        try:
+            from github_data.config.number_parser import NumberSpecificationParser
+
+            self._incremental_save = NumberSpecificationParser.parse_boolean_value(
+                value
+            )
+        except ValueError as e:
+            exit(f"Error: Invalid INCREMENTAL_SAVE value. {e}")
+
+    def _load_release_assets_from_environment(self) -> None:
+        """Load INCLUDE_RELEASE_ASSETS and the asset transfer settings."""
+        value = os.getenv("INCLUDE_RELEASE_ASSETS", "true")
+        try:
+            from github_data.config.number_parser import NumberSpecificationParser
+
+            self._include_release_assets = (
+                NumberSpecificationParser.parse_boolean_value(value)
+            )
+        except ValueError as e:
+            exit(f"Error: Invalid INCLUDE_RELEASE_ASSETS value. {e}")
+
+        if self._operation == "restore":
+            self._asset_upload_workers = self._load_positive_int(
+                "ASSET_UPLOAD_WORKERS", DEFAULT_UPLOAD_WORKERS
+            )
+            return
+
+        self._asset_download_workers = self._load_positive_int(
+            "ASSET_DOWNLOAD_WORKERS", DEFAULT_DOWNLOAD_WORKERS
+        )
+        if os.getenv("ASSET_DOWNLOAD_BYTES_PER_SECOND") is not None:
+            self._asset_download_bytes_per_second = self._load_positive_int(
+                "ASSET_DOWNLOAD_BYTES_PER_SECOND", 1
+            )
+
+    def _load_issue_import_from_environment(self) -> None:
+        """Load ISSUE_IMPORT setting (restore only)."""
+        if self._operation != "restore":
+            return
+
+        value = os.getenv("ISSUE_IMPORT", "false")
+        try:
+            from github_data.config.number_parser import NumberSpecificationParser
+
+            self._issue_import = NumberSpecificationParser.parse_boolean_value(value)
+        except ValueError as e:
+            exit(f"Error: Invalid ISSUE_IMPORT value. {e}")
+
+    def _load_pipelined_restore_from_environment(self) -> None:
+        """Load PIPELINED_RESTORE setting (restore only)."""
+        if self._operation != "restore":
+            return
+
+        value = os.getenv("PIPELINED_RESTORE", "false")
+        try:
+            from github_data.config.number_parser import NumberSpecificationParser
+
+            self._pipelined_restore = NumberSpecificationParser.parse_boolean_value(
+                value
+            )
+        except ValueError as e:
+            exit(f"Error: Invalid PIPELINED_RESTORE value. {e}")
+
+    def _load_restore_journal_from_environment(self) -> None:
+        """Load RESTORE_JOURNAL setting (restore only)."""
+        if self._operation != "restore":
+            return
+
+        value = os.getenv("RESTORE_JOURNAL", "true")
+        try:
+            from github_data.config.number_parser import NumberSpecificationParser
+
+            self._restore_journal = NumberSpecificationParser.parse_boolean_value(value)
+        except ValueError as e:
+            exit(f"Error: Invalid RESTORE_JOURNAL value. {e}")
+
+    def _load_resume_restore_from_environment(self) -> None:
+        """Load RESUME_RESTORE setting (restore only)."""
+        if self._operation != "restore":
+            return
+
+        value = os.getenv("RESUME_RESTORE", "false")
+        try:
+            from github_data.config.number_parser import NumberSpecificationParser
+
+            self._resume_restore = NumberSpecificationParser.parse_boolean_value(value)
+        except ValueError as e:
+            exit(f"Error: Invalid RESUME_RESTORE value. {e}")
+
+        if self._resume_restore and not self._restore_journal:
+            exit("Error: RESUME_RESTORE requires RESTORE_JOURNAL to be enabled.")
+
+    def _load_positive_int(self, name: str, default: int) -> int:
+        value = os.getenv(name, str(default))
+        try:
+            number = int(value)
+        except ValueError:
+            exit(f"Error: Invalid {name} '{value}'. Must be a positive integer.")
+        if number < 1:
+            exit(f"Error: Invalid {name} '{value}'. Must be a positive integer.")
+        return number
+
     def _ensure_repository_exists(self) -> None:
         """Ensure target repository exists, creating if necessary.
 
@@ -210,7 +411,16 @@ class Main:
         print("Continuing with restore operation...")
 
     def _build_github_service(self) -> None:
-        self._github_service = create_github_service(self._github_token)
+        self._github_service = create_github_service(
+            self._github_token,
+            writes_per_minute=self._writes_per_minute,
+            writes_per_hour=self._writes_per_hour,
+            token_pool=self._token_pool,
+            # Every save worker and prefetch thread may hold a connection
+            http_pool_size=max(DEFAULT_POOL_SIZE, self._max_workers + PREFETCH_WORKERS),
+            graphql_concurrency=self._graphql_concurrency,
+            validate_graphql_queries=self._validate_graphql_queries,
+        )
 
     def _build_storage_service(self) -> None:
         self._storage_service = create_storage_service("json")
@@ -218,20 +428,66 @@ class Main:
     def _build_git_service(self) -> None:
         self._git_service = None
         if self._registry.get_entity("git_repository").is_enabled():
+            # Restores push with it, so it must be the token writes use
             self._git_service = GitRepositoryServiceImpl(auth_token=self._github_token)
 
+    def _build_release_asset_downloader(self) -> Optional[ReleaseAssetDownloader]:
+        if not (
+            self._include_release_assets
+            and self._registry.get_entity("releases").is_enabled()
+        ):
+            return None
+        return ReleaseAssetDownloader(
+            token=(
+                self._token_pool.acquire()
+                if self._token_pool is not None
+                else self._github_token
+            ),
+            max_workers=self._asset_download_workers,
+            max_bytes_per_second=self._asset_download_bytes_per_second,
+        )
+
+    def _build_release_asset_uploader(self) -> Optional[ReleaseAssetUploader]:
+        if not (
+            self._include_release_assets
+            and self._registry.get_entity("releases").is_enabled()
+        ):
+            return None
+        return ReleaseAssetUploader(max_workers=self._asset_upload_workers)
+
+    def _build_issue_importer(self) -> Optional[IssueImporter]:
+        if not (
+            self._issue_import and self._registry.get_entity("issues").is_enabled()
+        ):
+            return None
+        return IssueImporter(
+            include_comments=self._registry.get_entity("comments").is_enabled()
+        )
+
     def _build_orchestrator(self) -> None:
-        Orchestrator: type[StrategyBasedOrchestrator]
         if self._operation == "save":
-            Orchestrator = StrategyBasedSaveOrchestrator
+            self._orchestrator = StrategyBasedSaveOrchestrator(
+                registry=self._registry,
+                github_service=self._github_service,
+                storage_service=self._storage_service,
+                git_service=self._git_service,
+                max_workers=self._max_workers,
+                incremental=self._incremental_save,
+                release_asset_downloader=self._build_release_asset_downloader(),
+            )
         else:
-            Orchestrator = StrategyBasedRestoreOrchestrator
-        self._orchestrator = Orchestrator(
-            registry=self._registry,
-            github_service=self._github_service,
-            storage_service=self._storage_service,
-            git_service=self._git_service,
-        )
+            self._orchestrator = StrategyBasedRestoreOrchestrator(
+                registry=self._registry,
+                github_service=self._github_service,
+                storage_service=self._storage_service,
+                git_service=self._git_service,
+                release_asset_uploader=self._build_release_asset_uploader(),
+                issue_importer=self._build_issue_importer(),
+                pipeline_dependents=self._pipelined_restore,
+                max_workers=self._max_workers,
+                journal=self._restore_journal,
+                resume=self._resume_restore,
+            )
 
     def _execute_operation(self) -> None:
         self._print_start_message()
@@ -255,6 +511,25 @@ class Main:
 
         print(f"\n{self._operation.title()} operation completed successfully")
         print(f"Total entities saved: {len(results)}")
+        self._print_graphql_costs()
+        self._print_http_pool_stats()
+
+    def _print_graphql_costs(self) -> None:
+        costs = self._github_service.get_graphql_costs()
+        if not costs:
+            return
+        print(f"\nGraphQL points spent ({sum(costs.values())} total):")
+        for query_name, cost in sorted(costs.items()):
+            print(f"  - {query_name}: {cost}")
+
+    def _print_http_pool_stats(self) -> None:
+        stats = self._github_service.get_http_pool_stats()
+        if not stats.get("requests"):
+            return
+        print(
+            f"GraphQL connections: {stats['connections_opened']} opened "
+            f"for {stats['requests']} requests"
+        )
 
     def _print_enabled_entities(self) -> None:
         enabled = self._registry.get_enabled_entities()
@@ -0,0 +1,217 @@
+"""Restore journal recording completed writes so a restore can resume."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Dict, Hashable, List, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from github_data.entities.issues.restore_strategy import IMPORTED_COMMENTS_CONTEXT_KEY
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "restore_journal.jsonl"
+
+JOURNAL_VERSION = 1
+
+# Context mappings from original to restored items that dependents look up;
+# the entries an item adds are journaled with it
+JOURNALED_MAPPINGS = (
+    "milestone_mapping",
+    "issue_number_mapping",
+    "pr_number_mapping",
+    IMPORTED_COMMENTS_CONTEXT_KEY,
+)
+
+
+def item_key(entity: Any) -> str:
+    """Identify an item across restores of the same data.
+
+    Items are identified by their original id; items without one, such as
+    sub-issue links, by a digest of their content.
+    """
+    item_id = getattr(entity, "id", None)
+    if item_id is not None:
+        return str(item_id)
+    data = entity.model_dump(mode="json") if isinstance(entity, BaseModel) else entity
+    content = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class RestoreJournal:
+    """Append-only record of the items written by one restore.
+
+    Every item is journaled once it was written and its post-create actions
+    ran, together with the context mapping entries those actions added. The
+    journal is stored next to the entity files and flushed to disk after
+    each item, so a restore interrupted at any point can be resumed: the
+    mappings are replayed into the context and journaled items are skipped.
+    An item interrupted between its write and its journal entry is written
+    again on resume.
+    """
+
+    def __init__(
+        self,
+        journal_file: IO[str],
+        completed: Optional[Set[Tuple[str, str]]] = None,
+        mappings: Optional[Dict[str, Dict[Hashable, Any]]] = None,
+    ):
+        """Initialize journal.
+
+        Args:
+            journal_file: Open journal file new entries are appended to
+            completed: (entity name, item key) of the items journaled before
+            mappings: Context mapping entries journaled before
+        """
+        self._file = journal_file
+        self._completed = set(completed or ())
+        self._mappings = mappings or {}
+        self._skipped: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(
+        cls, input_path: str, repo_name: str, resume: bool = False
+    ) -> "RestoreJournal":
+        """Open the journal of a data directory for a restore.
+
+        Args:
+            input_path: Directory holding the entity files
+            repo_name: Repository being restored to
+            resume: Whether to continue the journal of an interrupted restore
+                to the same repository; otherwise a new journal is started
+
+        Returns:
+            Journal holding the entries of the interrupted restore, if resumed
+        """
+        journal_path = Path(input_path) / JOURNAL_FILENAME
+        if resume:
+            loaded = cls._load(journal_path, repo_name)
+            if loaded is not None:
+                completed, mappings, valid_size = loaded
+                journal_file = journal_path.open("r+", encoding="utf-8")
+                # Drop an entry cut off by the interruption
+                journal_file.truncate(valid_size)
+                journal_file.seek(0, os.SEEK_END)
+                print(f"Resuming restore: {len(completed)} items restored before")
+                return cls(journal_file, completed, mappings)
+
+        journal = cls(journal_path.open("w", encoding="utf-8"))
+        journal._append({"version": JOURNAL_VERSION, "repository": repo_name})
+        return journal
+
+    @staticmethod
+    def _load(
+        journal_path: Path, repo_name: str
+    ) -> Optional[Tuple[Set[Tuple[str, str]], Dict[str, Dict[Hashable, Any]], int]]:
+        """Read a journal's entries and the size of its intact part.
+
+        Returns:
+            Completed items, mapping entries and the byte size up to the last
+            intact entry, or None if there is no usable journal for the
+            repository
+        """
+        try:
+            content = journal_path.read_bytes()
+        except FileNotFoundError:
+            logger.warning(f"No restore journal {journal_path}; restoring everything")
+            return None
+
+        completed: Set[Tuple[str, str]] = set()
+        mappings: Dict[str, Dict[Hashable, Any]] = {}
+        valid_size = 0
+        for line in content.splitlines(keepends=True):
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("incomplete entry")
+                entry = json.loads(line)
+            except ValueError:
+                break
+            if valid_size == 0:
+                if entry.get("repository") != repo_name:
+                    logger.warning(
+                        f"Ignoring restore journal {journal_path} of repository "
+                        f"{entry.get('repository')}"
+                    )
+                    return None
+            else:
+                completed.add((entry["entity"], entry["key"]))
+                for name, pairs in entry.get("mappings", {}).items():
+                    mappings.setdefault(name, {}).update(
+                        (original, restored) for original, restored in pairs
+                    )
+            valid_size += len(line)
+
+        if valid_size == 0:
+            return None
+        return completed, mappings, valid_size
+
+    def replay(self, context: Dict[str, Any]) -> None:
+        """Restore the journaled mapping entries into a restore context."""
+        for name, entries in self._mappings.items():
+            context.setdefault(name, {}).update(entries)
+
+    def skip(self, entity_name: str, entity: Any) -> bool:
+        """Tell whether an item was journaled before, counting it if so."""
+        if (entity_name, item_key(entity)) not in self._completed:
+            return False
+        with self._lock:
+            self._skipped[entity_name] = self._skipped.get(entity_name, 0) + 1
+        return True
+
+    def skipped(self, entity_name: str) -> int:
+        """Number of an entity's items skipped as journaled before."""
+        with self._lock:
+            return self._skipped.get(entity_name, 0)
+
+    @staticmethod
+    def mapping_sizes(context: Dict[str, Any]) -> Dict[str, int]:
+        """Sizes of the journaled context mappings before an item's actions."""
+        return {name: len(context.get(name, ())) for name in JOURNALED_MAPPINGS}
+
+    def record(
+        self,
+        entity_name: str,
+        entity: Any,
+        context: Dict[str, Any],
+        sizes: Dict[str, int],
+    ) -> None:
+        """Journal a written item with the mapping entries it added.
+
+        Args:
+            entity_name: Entity the item belongs to
+            entity: Original item
+            context: Restore context after the item's post-create actions
+            sizes: mapping_sizes of the context before those actions; the
+                entries appended since are journaled with the item
+        """
+        mappings: Dict[str, List[Tuple[Any, Any]]] = {}
+        for name, size in sizes.items():
+            mapping = context.get(name, {})
+            added = len(mapping) - size
+            if added > 0:
+                # Mappings keep insertion order, so new entries are the last
+                mappings[name] = list(islice(reversed(mapping.items()), added))[::-1]
+
+        entry: Dict[str, Any] = {"entity": entity_name, "key": item_key(entity)}
+        if mappings:
+            entry["mappings"] = mappings
+        self._append(entry)
+
+    def close(self) -> None:
+        """Close the journal file."""
+        with self._lock:
+            self._file.close()
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        """Write an entry and flush it to disk."""
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
@@ -1,10 +1,15 @@
 """Strategy-based restore orchestrator."""
 
 import json
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 from github_data.entities.labels.restore_strategy import OverwriteConflictStrategy
 from github_data.operations.strategy_factory import StrategyFactory
 from github_data.operations.orchestrator_base import StrategyBasedOrchestrator
+from github_data.operations.restore.journal import RestoreJournal
+from github_data.operations.restore.pipeline import ItemPipeline, PipelineStage
 
 
 if TYPE_CHECKING:
@@ -13,6 +18,10 @@ if TYPE_CHECKING:
     from github_data.git.protocols import GitRepositoryService
     from github_data.entities.registry import EntityRegistry
     from github_data.entities.base import BaseRestoreStrategy
+    from github_data.entities.releases.asset_uploader import ReleaseAssetUploader
+    from github_data.entities.issues.issue_importer import IssueImporter
+
+logger = logging.getLogger(__name__)
 
 
 class StrategyBasedRestoreOrchestrator(StrategyBasedOrchestrator):
@@ -25,6 +34,12 @@ class StrategyBasedRestoreOrchestrator(StrategyBasedOrchestrator):
         storage_service: "StorageService",
         include_original_metadata: bool = True,
         git_service: Optional["GitRepositoryService"] = None,
+        release_asset_uploader: Optional["ReleaseAssetUploader"] = None,
+        issue_importer: Optional["IssueImporter"] = None,
+        pipeline_dependents: bool = False,
+        max_workers: int = 1,
+        journal: bool = False,
+        resume: bool = False,
     ) -> None:
         """Initialize restore orchestrator.
 
@@ -34,12 +49,37 @@ class StrategyBasedRestoreOrchestrator(StrategyBasedOrchestrator):
             storage_service: Storage service for reading data
             include_original_metadata: Whether to include original metadata
             git_service: Optional git service for repository cloning
+            release_asset_uploader: Uploader sending saved release asset
+                files; assets are not uploaded if not given
+            issue_importer: Importer creating issues with their comments via
+                the issue import API; issues are created one by one if not
+                given
+            pipeline_dependents: Whether items of dependent entities, such as
+                comments, are written as soon as their parent exists instead
+                of after all parents were restored
+            max_workers: Maximum number of strategies executed concurrently.
+                1 runs strategies sequentially in dependency order; larger
+                values run each dependency level on a bounded worker pool.
+            journal: Whether every written item and the id mappings it
+                produced are recorded in a journal in the input directory
+            resume: Whether to continue the journal of an interrupted restore,
+                skipping the items it records; implies journal
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
         self._registry = registry
         self._github_service = github_service
         self._storage_service = storage_service
         self._git_service = git_service
         self._context: Dict[str, Any] = {}
+        # Guards the context while strategies run concurrently
+        self._context_lock = threading.Lock()
+        self._pipeline_dependents = pipeline_dependents
+        self._max_workers = max_workers
+        self._record_journal = journal or resume
+        self._resume = resume
+        self._journal: Optional[RestoreJournal] = None
 
         # Create strategy factory
         self._factory = StrategyFactory(registry=registry)
@@ -50,6 +90,8 @@ class StrategyBasedRestoreOrchestrator(StrategyBasedOrchestrator):
             git_service=git_service,
             github_service=github_service,
             include_original_metadata=include_original_metadata,
+            release_asset_uploader=release_asset_uploader,
+            issue_importer=issue_importer,
         )
 
     def execute(
@@ -66,24 +108,210 @@ class StrategyBasedRestoreOrchestrator(StrategyBasedOrchestrator):
         Returns:
             List of result dictionaries for each entity
         """
-        results = []
+        self._open_journal(repo_name, input_path)
+        try:
+            if self._pipeline_dependents:
+                return self._execute_pipelined(repo_name, input_path)
+
+            results = self._execute_levels(
+                self._strategies,
+                lambda strategy: self._run_strategy(strategy, repo_name, input_path),
+            )
+            return [
+                results[strategy.get_entity_name()] for strategy in self._strategies
+            ]
+        finally:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    def _open_journal(self, repo_name: str, input_path: str) -> None:
+        """Open the restore journal and replay its id mappings into the context.
+
+        A journal that cannot be created only disables journaling; resuming
+        requires the journal.
+        """
+        if not self._record_journal:
+            return
+        try:
+            self._journal = RestoreJournal.open(
+                input_path, repo_name, resume=self._resume
+            )
+        except OSError as e:
+            if self._resume:
+                raise
+            logger.warning(f"Restoring without journal: {e}")
+            return
+        self._journal.replay(self._context)
+
+    def _execute_pipelined(
+        self, repo_name: str, input_path: str
+    ) -> List[Dict[str, Any]]:
+        """Execute strategies, writing dependent items as their parents exist.
 
-        # Execute strategies in dependency order (already sorted by registry)
+        Strategies providing get_parent_keys run in their own thread from the
+        start; every other strategy runs in dependency order as usual, after
+        waiting for any such strategy it depends on.
+        """
+        names = {strategy.get_entity_name() for strategy in self._strategies}
+        pipeline = ItemPipeline(self._context)
+        stages: Dict[str, PipelineStage] = {}
         for strategy in self._strategies:
-            entity_name = strategy.get_entity_name()
-            result = self._execute_strategy(strategy, repo_name, input_path)
-            results.append(result)
-            print(f"Restored {entity_name}: {result.get('entities_created', 0)} items")
+            if hasattr(strategy, "get_parent_keys"):
+                entities = self._read_entities(strategy, repo_name, input_path)
+                stages[strategy.get_entity_name()] = pipeline.add_stage(
+                    entities,
+                    strategy.get_parent_keys,
+                    set(self._get_dependencies(strategy)) & names,
+                )
+
+        futures: Dict[str, Future[Dict[str, Any]]] = {}
+
+        def run(strategy: "BaseRestoreStrategy") -> Dict[str, Any]:
+            for dependency in self._get_dependencies(strategy):
+                if dependency in futures:
+                    futures[dependency].result()
+            try:
+                return self._run_strategy(strategy, repo_name, input_path)
+            finally:
+                pipeline.finished(strategy.get_entity_name())
+
+        with ThreadPoolExecutor(
+            max_workers=max(len(stages), 1), thread_name_prefix="restore-pipeline"
+        ) as executor:
+            for strategy in self._strategies:
+                name = strategy.get_entity_name()
+                if name in stages:
+                    futures[name] = executor.submit(
+                        self._run_stage,
+                        pipeline,
+                        strategy,
+                        repo_name,
+                        input_path,
+                        stages[name],
+                    )
+
+            try:
+                results = self._execute_levels(
+                    [s for s in self._strategies if s.get_entity_name() not in stages],
+                    run,
+                )
+            except BaseException:
+                # Stages would otherwise wait for parents that never finish
+                pipeline.cancel()
+                raise
+
+            for name, future in futures.items():
+                results[name] = future.result()
+
+        return [results[strategy.get_entity_name()] for strategy in self._strategies]
+
+    def _execute_levels(
+        self,
+        strategies: List["BaseRestoreStrategy"],
+        run: Callable[["BaseRestoreStrategy"], Dict[str, Any]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run strategies in dependency order, returning results by entity.
+
+        With more than one worker, each dependency level runs concurrently on
+        a bounded pool; levels run one after another so dependents always see
+        the context produced by their dependencies.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        if self._max_workers == 1:
+            # Execute strategies in dependency order (already sorted by registry)
+            for strategy in strategies:
+                results[strategy.get_entity_name()] = run(strategy)
+            return results
 
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="restore"
+        ) as executor:
+            for level in self._group_strategies_by_level(strategies):
+                futures = [executor.submit(run, strategy) for strategy in level]
+                for strategy, future in zip(level, futures):
+                    results[strategy.get_entity_name()] = future.result()
         return results
 
+    def _group_strategies_by_level(
+        self, strategies: List["BaseRestoreStrategy"]
+    ) -> List[List["BaseRestoreStrategy"]]:
+        """Group strategies by the registry's dependency levels."""
+        strategies_by_name = {s.get_entity_name(): s for s in strategies}
+        levels = []
+        for entity_level in self._registry.get_enabled_entity_levels():
+            level = [
+                strategies_by_name[entity.config.name]
+                for entity in entity_level
+                if entity.config.name in strategies_by_name
+            ]
+            if level:
+                levels.append(level)
+        return levels
+
+    def _run_stage(
+        self,
+        pipeline: ItemPipeline,
+        strategy: "BaseRestoreStrategy",
+        repo_name: str,
+        input_path: str,
+        stage: PipelineStage,
+    ) -> Dict[str, Any]:
+        """Execute a pipelined strategy, then release the stages after it."""
+        try:
+            return self._run_strategy(strategy, repo_name, input_path, stage)
+        finally:
+            pipeline.finished(strategy.get_entity_name())
+
+    def _get_dependencies(self, strategy: "BaseRestoreStrategy") -> List[str]:
+        """Names of the entities a strategy's entity depends on."""
+        entity = self._registry.get_entity(strategy.get_entity_name())
+        return list(entity.config.dependencies)
+
+    def _run_strategy(
+        self,
+        strategy: "BaseRestoreStrategy",
+        repo_name: str,
+        input_path: str,
+        stage: Optional[PipelineStage] = None,
+    ) -> Dict[str, Any]:
+        """Execute a strategy and report how many items it restored."""
+        entity_name = strategy.get_entity_name()
+        result = self._execute_strategy(strategy, repo_name, input_path, stage)
+        if self._journal is not None and self._journal.skipped(entity_name):
+            print(
+                f"Skipped {self._journal.skipped(entity_name)} {entity_name} "
+                "restored before"
+            )
+        print(
+            f"Restored {entity_name}: "
+            f"{result.get('entities_created', 0)} items"
+        )
+        return result
+
     def _execute_strategy(
-        self, strategy: "BaseRestoreStrategy", repo_name: str, input_path: str
+        self,
+        strategy: "BaseRestoreStrategy",
+        repo_name: str,
+        input_path: str,
+        stage: Optional[PipelineStage] = None,
     ) -> Dict[str, Any]:
-        """Execute a single entity restoration strategy."""
+        """Execute a single entity restoration strategy.
+
+        With a pipeline stage, the stage's entities are written as the stage
+        releases them instead of being read here.
+        """
         entity_name = strategy.get_entity_name()
 
         try:
+            if stage is not None:
+                created_count, errors = stage.run(
+                    lambda ready: self._create_entities(strategy, repo_name, ready)
+                )
+                return self._complete_strategy(
+                    strategy, repo_name, len(stage.entities), created_count, errors
+                )
+
             # Read data
             entities = strategy.read(input_path, self._storage_service)
             print(f"Loaded {len(entities)} {entity_name} to restore")
@@ -128,26 +356,10 @@ class StrategyBasedRestoreOrchestrator(StrategyBasedOrchestrator):
                     )
 
             # Create entities
-            created_count = 0
-            for entity in entities:
-                entity_data = strategy.transform(entity, self._context)
-                if entity_data is None:
-                    continue  # Skip entity (e.g., missing dependency)
-
-                created_data = strategy.write(
-                    self._github_service, repo_name, entity_data
-                )
-                strategy.post_create_actions(
-                    self._github_service, repo_name, entity, created_data, self._context
-                )
-                created_count += 1
-
-            return {
-                "entity_name": entity_name,
-                "success": True,
-                "entities_processed": len(entities),
-                "entities_created": created_count,
-            }
+            created_count, errors = self._create_entities(strategy, repo_name, entities)
+            return self._complete_strategy(
+                strategy, repo_name, len(entities), created_count, errors
+            )
 
         except (FileNotFoundError, json.JSONDecodeError):
             # Re-raise specific exceptions for backwards compatibility
@@ -160,3 +372,140 @@ class StrategyBasedRestoreOrchestrator(StrategyBasedOrchestrator):
                 "entities_processed": 0,
                 "entities_created": 0,
             }
+
+    def _read_entities(
+        self, strategy: "BaseRestoreStrategy", repo_name: str, input_path: str
+    ) -> List[Any]:
+        """Read a strategy's entities and resolve their conflicts."""
+        entities: List[Any] = strategy.read(input_path, self._storage_service)
+        print(f"Loaded {len(entities)} {strategy.get_entity_name()} to restore")
+        if hasattr(strategy, "resolve_conflicts"):
+            entities = strategy.resolve_conflicts(
+                self._github_service, repo_name, entities
+            )
+        return entities
+
+    def _create_entities(
+        self, strategy: "BaseRestoreStrategy", repo_name: str, entities: List[Any]
+    ) -> Tuple[int, List[str]]:
+        """Write entities in order, returning the number created and errors."""
+        if hasattr(strategy, "write_batch"):
+            return self._write_batched(
+                strategy, strategy.write_batch, repo_name, entities
+            )
+
+        created_count = 0
+        for entity in self._pending_entities(strategy, entities):
+            with self._context_lock:
+                entity_data = strategy.transform(entity, self._context)
+            if entity_data is None:
+                continue  # Skip entity (e.g., missing dependency)
+
+            created_data = strategy.write(self._github_service, repo_name, entity_data)
+            self._post_create(strategy, repo_name, entity, created_data)
+            created_count += 1
+        return created_count, []
+
+    def _pending_entities(
+        self, strategy: "BaseRestoreStrategy", entities: List[Any]
+    ) -> List[Any]:
+        """Entities not yet restored according to the resumed journal."""
+        if self._journal is None:
+            return entities
+        entity_name = strategy.get_entity_name()
+        journal = self._journal
+        return [entity for entity in entities if not journal.skip(entity_name, entity)]
+
+    def _post_create(
+        self,
+        strategy: "BaseRestoreStrategy",
+        repo_name: str,
+        entity: Any,
+        created_data: Any,
+    ) -> None:
+        """Run an entity's post-create actions and journal it as restored."""
+        with self._context_lock:
+            sizes = RestoreJournal.mapping_sizes(self._context)
+            strategy.post_create_actions(
+                self._github_service, repo_name, entity, created_data, self._context
+            )
+            if self._journal is not None:
+                self._journal.record(
+                    strategy.get_entity_name(), entity, self._context, sizes
+                )
+
+    def _complete_strategy(
+        self,
+        strategy: "BaseRestoreStrategy",
+        repo_name: str,
+        processed_count: int,
+        created_count: int,
+        errors: List[str],
+    ) -> Dict[str, Any]:
+        """Finish a strategy's background work and build its result."""
+        entity_name = strategy.get_entity_name()
+        if hasattr(strategy, "complete_restore"):
+            strategy.complete_restore(self._github_service, repo_name, self._context)
+
+        if errors:
+            return {
+                "entity_name": entity_name,
+                "success": False,
+                "error": f"{len(errors)} {entity_name} failed: " + "; ".join(errors),
+                "entities_processed": processed_count,
+                "entities_created": created_count,
+            }
+
+        return {
+            "entity_name": entity_name,
+            "success": True,
+            "entities_processed": processed_count,
+            "entities_created": created_count,
+        }
+
+    def _write_batched(
+        self,
+        strategy: "BaseRestoreStrategy",
+        write_batch: Callable[..., List[Any]],
+        repo_name: str,
+        entities: List[Any],
+    ) -> Tuple[int, List[str]]:
+        """Write all entities in one call to the strategy's write_batch.
+
+        Entities that fail do not stop the others; their errors are returned
+        alongside the number of entities created. Each entity's post-create
+        actions run, and it is journaled, as soon as write_batch reports its
+        result, so a restore interrupted mid-call resumes after the last
+        request that returned.
+        """
+        pending = []
+        with self._context_lock:
+            for entity in self._pending_entities(strategy, entities):
+                entity_data = strategy.transform(entity, self._context)
+                if entity_data is not None:
+                    pending.append((entity, entity_data))
+
+        created_count = 0
+        errors = []
+        reported = set()
+
+        def on_result(index: int, result: Any) -> None:
+            nonlocal created_count
+            reported.add(index)
+            if isinstance(result, Exception):
+                errors.append(str(result))
+                return
+            self._post_create(strategy, repo_name, pending[index][0], result)
+            created_count += 1
+
+        results = write_batch(
+            self._github_service,
+            repo_name,
+            [data for _, data in pending],
+            on_result=on_result,
+        )
+        # Results the strategy did not report while writing
+        for index, result in enumerate(results):
+            if index not in reported:
+                on_result(index, result)
+        return created_count, errors
@@ -0,0 +1,228 @@
+"""
+Item-level pipelining of dependent restore strategies.
+
+Strategies whose items each belong to a parent restored by another strategy
+(comments to issues, reviews to pull requests) name, per item, the restore
+context mapping entries the item needs. Such an item is released for writing
+as soon as those entries land in the context instead of after the parent
+strategy has finished, so e.g. the comments of the first issues are posted
+while later issues are still being created. Items of the same parent are
+released in their original order.
+"""
+
+import threading
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+# Context entry an item waits for: (mapping name, original key)
+MappingKey = Tuple[str, Hashable]
+
+T = TypeVar("T")
+
+
+class ObservedMapping(Dict[Any, Any]):
+    """Restore context mapping reporting every key set to the pipeline."""
+
+    def __init__(
+        self,
+        name: str,
+        on_set: Callable[[str, Hashable], None],
+        initial: Iterable[Tuple[Any, Any]] = (),
+    ):
+        super().__init__(initial)
+        self._name = name
+        self._on_set = on_set
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._on_set(self._name, key)
+
+
+class PipelineStage:
+    """Items of one dependent strategy, released as their parents exist."""
+
+    def __init__(
+        self,
+        entities: List[Any],
+        parent_keys: Callable[[Any], List[MappingKey]],
+        parents: Set[str],
+        context: Dict[str, Any],
+    ):
+        """
+        Initialize stage.
+
+        Args:
+            entities: Items to write, in the order they were read
+            parent_keys: Returns the context entries an item needs; the
+                first one names the parent whose items keep their order
+            parents: Names of the strategies restoring the parents; once all
+                of them finished, every remaining item is released
+            context: Restore context the mappings are looked up in
+        """
+        self.entities = entities
+        self._context = context
+        self._parents = set(parents)
+        self._condition = threading.Condition()
+        self._ready: List[Any] = []
+        self._groups: Dict[Hashable, Deque[Tuple[int, Any, List[MappingKey]]]] = {}
+        self._waiting: Dict[MappingKey, List[Hashable]] = {}
+        self._closed = False
+
+        for index, entity in enumerate(entities):
+            keys = parent_keys(entity)
+            if not keys:
+                self._ready.append(entity)
+                continue
+            self._groups.setdefault(keys[0], deque()).append((index, entity, keys))
+
+        self.mapping_names = {
+            key[0]
+            for group in self._groups.values()
+            for _, _, keys in group
+            for key in keys
+        }
+
+    def start(self) -> None:
+        """Release the items whose parents already exist."""
+        with self._condition:
+            for group in list(self._groups):
+                self._advance(group)
+            if not self._parents:
+                self._close()
+            self._condition.notify_all()
+
+    def key_set(self, mapping_name: str, key: Hashable) -> None:
+        """Release the items that were waiting for a context entry."""
+        with self._condition:
+            groups = self._waiting.pop((mapping_name, key), None)
+            if not groups:
+                return
+            for group in groups:
+                self._advance(group)
+            self._condition.notify_all()
+
+    def parent_finished(self, name: str) -> None:
+        """Note a strategy has finished, releasing all items after the last."""
+        with self._condition:
+            self._parents.discard(name)
+            if not self._parents and not self._closed:
+                self._close()
+                self._condition.notify_all()
+
+    def cancel(self) -> None:
+        """Drop every item not yet written, ending run."""
+        with self._condition:
+            self._ready.clear()
+            self._groups.clear()
+            self._waiting.clear()
+            self._closed = True
+            self._condition.notify_all()
+
+    def run(
+        self, write: Callable[[List[Any]], Tuple[int, List[T]]]
+    ) -> Tuple[int, List[T]]:
+        """Write released items until every item has been written.
+
+        Args:
+            write: Writes a list of released items in order, returning the
+                number created and the errors of those that failed
+
+        Returns:
+            Total number of items created and all errors
+        """
+        created_count = 0
+        errors: List[T] = []
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: bool(self._ready) or self._closed)
+                ready, self._ready = self._ready, []
+                closed = self._closed
+            if ready:
+                created, failed = write(ready)
+                created_count += created
+                errors.extend(failed)
+            if closed:
+                with self._condition:
+                    if not self._ready:
+                        return created_count, errors
+
+    def _advance(self, group: Hashable) -> None:
+        """Release a group's leading items whose entries all exist."""
+        items = self._groups[group]
+        while items:
+            _, entity, keys = items[0]
+            missing = next((key for key in keys if not self._has(key)), None)
+            if missing is not None:
+                self._waiting.setdefault(missing, []).append(group)
+                return
+            items.popleft()
+            self._ready.append(entity)
+        del self._groups[group]
+
+    def _has(self, key: MappingKey) -> bool:
+        return key[1] in self._context.get(key[0], ())
+
+    def _close(self) -> None:
+        """Release every remaining item in its original order."""
+        remaining = sorted(
+            (item for items in self._groups.values() for item in items),
+            key=lambda item: item[0],
+        )
+        self._ready.extend(entity for _, entity, _ in remaining)
+        self._groups.clear()
+        self._waiting.clear()
+        self._closed = True
+
+
+class ItemPipeline:
+    """Stages of the dependent strategies of one restore run."""
+
+    def __init__(self, context: Dict[str, Any]):
+        self._context = context
+        self._stages: List[PipelineStage] = []
+
+    def add_stage(
+        self,
+        entities: List[Any],
+        parent_keys: Callable[[Any], List[MappingKey]],
+        parents: Set[str],
+    ) -> PipelineStage:
+        """Create a stage, observing the context mappings its items need.
+
+        Must be called before the parent strategies start writing.
+        """
+        stage = PipelineStage(entities, parent_keys, parents, self._context)
+        for name in stage.mapping_names:
+            mapping = self._context.get(name)
+            if not isinstance(mapping, ObservedMapping):
+                self._context[name] = ObservedMapping(
+                    name, self._key_set, (mapping or {}).items()
+                )
+        self._stages.append(stage)
+        stage.start()
+        return stage
+
+    def finished(self, name: str) -> None:
+        """Note that a strategy has finished."""
+        for stage in self._stages:
+            stage.parent_finished(name)
+
+    def cancel(self) -> None:
+        """Stop every stage, dropping the items not yet written."""
+        for stage in self._stages:
+            stage.cancel()
+
+    def _key_set(self, mapping_name: str, key: Hashable) -> None:
+        for stage in self._stages:
+            stage.key_set(mapping_name, key)
@@ -1,11 +1,30 @@
 """Base strategy interfaces for entity restoration operations."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Callable, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ...storage.protocols import StorageService
-    from ...github.protocols import RepositoryService
+    from ...github.protocols import BatchResultCallback, RepositoryService
+
+# Turns the service result of the item at a position into its write_batch result
+ResultConverter = Callable[
+    [int, Union[Dict[str, Any], Exception]], Union[Dict[str, Any], Exception]
+]
+
+
+def forward_results(
+    on_result: Optional["BatchResultCallback"], convert: ResultConverter
+) -> Optional["BatchResultCallback"]:
+    """Pass a write_batch caller's on_result the converted service results.
+
+    Strategies with a write_batch method report each item's result through
+    the caller's on_result as soon as the service returned it, so it can be
+    recorded before the rest of the batch is written.
+    """
+    if on_result is None:
+        return None
+    return lambda index, result: on_result(index, convert(index, result))
 
 
 class RestoreEntityStrategy(ABC):
@@ -55,6 +74,18 @@ class RestoreEntityStrategy(ABC):
         """Perform any post-creation actions (e.g., close issues)."""
         pass
 
+    def complete_restore(
+        self,
+        github_service: "RepositoryService",
+        repo_name: str,
+        context: Dict[str, Any],
+    ) -> None:
+        """Finish work started in the background by post_create_actions.
+
+        Called once after all entities have been written.
+        """
+        pass
+
 
 class RestoreConflictStrategy(ABC):
     """Strategy for handling conflicts during restoration."""
@@ -0,0 +1,161 @@
+"""Save manifest recording per-entity watermarks for incremental saves."""
+
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from github_data.entities.registry import EntityRegistry
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "save_manifest.json"
+
+MANIFEST_VERSION = 1
+
+# Watermarks stay this far behind the local clock, so items updated while a
+# save was reading them are read again by the next save
+CLOCK_SKEW_MARGIN = timedelta(minutes=5)
+
+
+class SaveManifest:
+    """High-water marks of the entities saved from one repository.
+
+    Each entity maps to the latest updated_at among its saved items. The
+    manifest is stored next to the entity files; an incremental save reads
+    only the items updated at or after an entity's watermark. Watermarks
+    only hold for the entity selection they were saved with, see
+    selection_fingerprint.
+    """
+
+    def __init__(
+        self,
+        repo_name: str,
+        watermarks: Optional[Dict[str, datetime]] = None,
+        selection: Optional[str] = None,
+    ):
+        """Initialize manifest.
+
+        Args:
+            repo_name: Repository the entity files were saved from
+            watermarks: Timezone-aware watermark per entity name
+            selection: Fingerprint of the entity selection saved with
+        """
+        self._repo_name = repo_name
+        self._watermarks = dict(watermarks or {})
+        self._selection = selection
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls, output_path: str, repo_name: str, selection: Optional[str] = None
+    ) -> "SaveManifest":
+        """Load the manifest of an output directory.
+
+        Args:
+            output_path: Directory holding the entity files
+            repo_name: Repository being saved
+            selection: Fingerprint of the entity selection being saved
+
+        Returns:
+            Stored manifest, or an empty one if there is none, it cannot be
+            read, it belongs to another repository or it was saved with
+            another entity selection
+        """
+        manifest_file = Path(output_path) / MANIFEST_FILENAME
+        try:
+            data = json.loads(manifest_file.read_text(encoding="utf-8"))
+            if data.get("repository") != repo_name:
+                return cls(repo_name, selection=selection)
+            if data.get("selection") != selection:
+                # Items newly selected may be older than any watermark
+                logger.info("Entity selection changed since the previous save")
+                return cls(repo_name, selection=selection)
+            watermarks = {
+                name: datetime.fromisoformat(value)
+                for name, value in data.get("watermarks", {}).items()
+            }
+        except FileNotFoundError:
+            return cls(repo_name, selection=selection)
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable save manifest {manifest_file}: {e}")
+            return cls(repo_name, selection=selection)
+        return cls(repo_name, watermarks, selection)
+
+    def watermark(self, entity_name: str) -> Optional[datetime]:
+        """Return the watermark of an entity, if it was saved before."""
+        with self._lock:
+            return self._watermarks.get(entity_name)
+
+    def advance(
+        self, entity_name: str, items: Sequence[Any], read_started: datetime
+    ) -> None:
+        """Raise an entity's watermark to the latest update among saved items.
+
+        Args:
+            entity_name: Entity the items belong to
+            items: Saved items; those without updated_at are ignored
+            read_started: Timezone-aware time the items' read began; the
+                watermark never passes it, less CLOCK_SKEW_MARGIN
+        """
+        updates: List[datetime] = [
+            item.updated_at
+            for item in items
+            if getattr(item, "updated_at", None) is not None
+        ]
+        if not updates:
+            return
+
+        watermark = min(max(updates), read_started - CLOCK_SKEW_MARGIN)
+        with self._lock:
+            previous = self._watermarks.get(entity_name)
+            if previous is None or watermark > previous:
+                self._watermarks[entity_name] = watermark
+
+    def save(self, output_path: str) -> None:
+        """Write the manifest to an output directory."""
+        with self._lock:
+            data = {
+                "version": MANIFEST_VERSION,
+                "repository": self._repo_name,
+                "selection": self._selection,
+                "watermarks": {
+                    name: value.isoformat()
+                    for name, value in sorted(self._watermarks.items())
+                },
+            }
+        output_dir = Path(output_path)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        (output_dir / MANIFEST_FILENAME).write_text(
+            json.dumps(data, indent=2) + "\n", encoding="utf-8"
+        )
+
+
+def selection_fingerprint(registry: "EntityRegistry") -> str:
+    """Fingerprint the entity selection of a registry.
+
+    Covers every entity's INCLUDE_* value, including selected issue and pull
+    request numbers, since each one decides which items are saved.
+    """
+    selection: Dict[str, Any] = {}
+    for name in registry.get_all_entity_names():
+        enabled = registry.get_entity(name).enabled
+        selection[name] = sorted(enabled) if isinstance(enabled, set) else enabled
+    encoded = json.dumps(selection, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def merge_by_id(saved: Sequence[Any], changed: Sequence[Any]) -> List[Any]:
+    """Merge changed items into previously saved ones by id.
+
+    Saved items keep their order, replaced by their changed version if any;
+    items not saved before are appended in creation order.
+    """
+    changed_by_id = {item.id: item for item in changed}
+    merged = [changed_by_id.pop(item.id, item) for item in saved]
+    merged.extend(sorted(changed_by_id.values(), key=lambda item: item.created_at))
+    return merged
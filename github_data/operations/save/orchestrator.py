@@ -1,8 +1,17 @@
 """Strategy-based save orchestrator."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from github_data.operations.strategy_factory import StrategyFactory
 from github_data.operations.orchestrator_base import StrategyBasedOrchestrator
+from github_data.operations.save.manifest import (
+    SaveManifest,
+    merge_by_id,
+    selection_fingerprint,
+)
 
 if TYPE_CHECKING:
     from github_data.storage.protocols import StorageService
@@ -10,6 +19,9 @@ if TYPE_CHECKING:
     from github_data.git.protocols import GitRepositoryService
     from github_data.entities.registry import EntityRegistry
     from github_data.entities.base import BaseSaveStrategy
+    from github_data.entities.releases.asset_downloader import (
+        ReleaseAssetDownloader,
+    )
 
 
 class StrategyBasedSaveOrchestrator(StrategyBasedOrchestrator):
@@ -21,6 +33,9 @@ class StrategyBasedSaveOrchestrator(StrategyBasedOrchestrator):
         github_service: "RepositoryService",
         storage_service: "StorageService",
         git_service: Optional["GitRepositoryService"] = None,
+        max_workers: int = 1,
+        incremental: bool = False,
+        release_asset_downloader: Optional["ReleaseAssetDownloader"] = None,
     ) -> None:
         """Initialize save orchestrator.
 
@@ -29,18 +44,36 @@ class StrategyBasedSaveOrchestrator(StrategyBasedOrchestrator):
             github_service: GitHub API service
             storage_service: Storage service for writing data
             git_service: Optional git service for repository cloning
+            max_workers: Maximum number of strategies executed concurrently.
+                1 runs strategies sequentially in dependency order; larger
+                values run each dependency level on a bounded worker pool.
+            incremental: Whether entities supporting it read only the items
+                updated since the previous save, per the output directory's
+                save manifest, and merge them into the saved files
+            release_asset_downloader: Downloader saving release asset
+                binaries; assets are not downloaded if not given
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
         self._registry = registry
         self._github_service = github_service
         self._storage_service = storage_service
         self._git_service = git_service
+        self._max_workers = max_workers
+        self._incremental = incremental
+        self._manifest: Optional[SaveManifest] = None
         self._context: Dict[str, Any] = {}
+        self._context_lock = threading.Lock()
 
         # Create strategy factory
         self._factory = StrategyFactory(registry=registry)
 
         # Load strategies for enabled entities
-        self._strategies = self._factory.create_save_strategies(git_service=git_service)
+        self._strategies = self._factory.create_save_strategies(
+            git_service=git_service,
+            release_asset_downloader=release_asset_downloader,
+        )
 
     def execute(
         self,
@@ -56,17 +89,71 @@ class StrategyBasedSaveOrchestrator(StrategyBasedOrchestrator):
         Returns:
             List of result dictionaries for each entity
         """
-        results = []
+        if self._incremental:
+            self._manifest = SaveManifest.load(
+                output_path, repo_name, selection_fingerprint(self._registry)
+            )
 
-        # Execute strategies in dependency order (already sorted by registry)
-        for strategy in self._strategies:
-            entity_name = strategy.get_entity_name()
-            result = self._execute_strategy(strategy, repo_name, output_path)
-            results.append(result)
-            print(f"Saved {entity_name}: {result['count']} items")
+        if self._max_workers > 1:
+            results = self._execute_levels_in_parallel(repo_name, output_path)
+        else:
+            results = []
 
+            # Execute strategies in dependency order (already sorted by registry)
+            for strategy in self._strategies:
+                results.append(
+                    self._execute_and_report(strategy, repo_name, output_path)
+                )
+
+        if self._manifest is not None:
+            self._manifest.save(output_path)
         return results
 
+    def _execute_levels_in_parallel(
+        self, repo_name: str, output_path: str
+    ) -> List[Dict[str, Any]]:
+        """Execute each dependency level concurrently on a bounded pool.
+
+        Levels run one after another so dependents always see the context
+        produced by their dependencies. Results keep the sequential order.
+        """
+        results_by_entity: Dict[str, Dict[str, Any]] = {}
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for level in self._group_strategies_by_level():
+                futures = [
+                    executor.submit(
+                        self._execute_and_report, strategy, repo_name, output_path
+                    )
+                    for strategy in level
+                ]
+                for strategy, future in zip(level, futures):
+                    results_by_entity[strategy.get_entity_name()] = future.result()
+
+        return [results_by_entity[s.get_entity_name()] for s in self._strategies]
+
+    def _group_strategies_by_level(self) -> List[List["BaseSaveStrategy"]]:
+        """Group loaded strategies by the registry's dependency levels."""
+        strategies_by_name = {s.get_entity_name(): s for s in self._strategies}
+        levels = []
+        for entity_level in self._registry.get_enabled_entity_levels():
+            level = [
+                strategies_by_name[entity.config.name]
+                for entity in entity_level
+                if entity.config.name in strategies_by_name
+            ]
+            if level:
+                levels.append(level)
+        return levels
+
+    def _execute_and_report(
+        self, strategy: "BaseSaveStrategy", repo_name: str, output_path: str
+    ) -> Dict[str, Any]:
+        """Execute a strategy and print its summary line."""
+        result = self._execute_strategy(strategy, repo_name, output_path)
+        print(f"Saved {strategy.get_entity_name()}: {result['count']} items")
+        return result
+
     def _is_selective_mode(self, entity_name: str) -> bool:
         """Check if entity is in selective mode (Set[int] instead of bool).
 
@@ -82,6 +169,32 @@ class StrategyBasedSaveOrchestrator(StrategyBasedOrchestrator):
         except ValueError:
             return False
 
+    def _read_entities(
+        self, strategy: "BaseSaveStrategy", repo_name: str, output_path: str
+    ) -> List[Any]:
+        """Read a strategy's entities, incrementally if possible.
+
+        Entities with a saved file and a watermark in the save manifest only
+        read the items updated since then and merge them into the file's.
+        """
+        entity_name = strategy.get_entity_name()
+        entity_file = Path(output_path) / f"{entity_name}.json"
+        model = strategy.get_incremental_model() if self._manifest else None
+        since = (
+            self._manifest.watermark(entity_name)
+            if self._manifest is not None and model is not None
+            else None
+        )
+
+        if model is None or since is None or not entity_file.exists():
+            entities: List[Any] = strategy.read(self._github_service, repo_name)
+            print(f"Collected {len(entities)} {entity_name}")
+            return entities
+
+        changed = strategy.read_updated_since(self._github_service, repo_name, since)
+        print(f"Collected {len(changed)} {entity_name} updated since {since}")
+        return merge_by_id(self._storage_service.read(entity_file, model), changed)
+
     def _execute_strategy(
         self, strategy: "BaseSaveStrategy", repo_name: str, output_path: str
     ) -> Dict[str, Any]:
@@ -89,49 +202,54 @@ class StrategyBasedSaveOrchestrator(StrategyBasedOrchestrator):
         entity_name = strategy.get_entity_name()
 
         try:
-            # Read data
-            entities = strategy.read(self._github_service, repo_name)
-            print(f"Collected {len(entities)} {entity_name}")
+            # Read data (network bound, runs without holding the context lock)
+            read_started = datetime.now(timezone.utc)
+            entities = self._read_entities(strategy, repo_name, output_path)
+
+            with self._context_lock:
+                # Store original context to detect changes
+                original_context = self._context.copy()
+
+                # Transform data
+                processed_entities = strategy.transform(entities, self._context)
+
+                # In selective mode, skip saving if no entities remain
+                if self._is_selective_mode(entity_name) and not processed_entities:
+                    return {
+                        "entity_name": entity_name,
+                        "success": True,
+                        "entities_processed": len(entities),
+                        "entities_saved": 0,
+                        "count": 0,
+                        "data_type": entity_name,
+                        "items_processed": 0,
+                        "execution_time_seconds": 0,
+                    }
+
+                # Update context with saved entities for dependent strategies
+                self._context[entity_name] = processed_entities
 
-            # Store original context to detect changes
-            original_context = self._context.copy()
-
-            # Transform data
-            processed_entities = strategy.transform(entities, self._context)
-
-            # In selective mode, skip saving if no entities remain after processing
-            if self._is_selective_mode(entity_name) and not processed_entities:
-                return {
-                    "entity_name": entity_name,
-                    "success": True,
-                    "entities_processed": len(entities),
-                    "entities_saved": 0,
-                    "count": 0,
-                    "data_type": entity_name,
-                    "items_processed": 0,
-                    "execution_time_seconds": 0,
+                # Entities changed during processing (e.g., sub-issues
+                # updating issues) must be re-saved
+                changed_entities = {
+                    key: value
+                    for key, value in self._context.items()
+                    if key != entity_name
+                    and key in original_context
+                    and value != original_context[key]
                 }
 
             # Write data
             result = strategy.write(
                 processed_entities, output_path, self._storage_service
             )
+            if self._manifest is not None and result.get("success"):
+                self._manifest.advance(entity_name, entities, read_started)
 
-            # Update context with saved entities for dependent strategies
-            self._context[entity_name] = processed_entities
-
-            # If context was changed during processing
-            # (e.g., sub-issues updating issues),
-            # re-save the affected entities
-            for key, value in self._context.items():
-                if key != entity_name and key in original_context:
-                    if value != original_context[key]:
-                        # Re-save the updated entity
-                        from pathlib import Path
-
-                        output_dir = Path(output_path)
-                        entity_file = output_dir / f"{key}.json"
-                        self._storage_service.write(value, entity_file)
+            # Re-save the affected entities
+            for key, value in changed_entities.items():
+                entity_file = Path(output_path) / f"{key}.json"
+                self._storage_service.write(value, entity_file)
 
             return {
                 "entity_name": entity_name,
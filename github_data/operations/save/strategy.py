@@ -2,8 +2,11 @@
 
 import time
 from abc import ABC, abstractmethod
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, TYPE_CHECKING, Callable
+from typing import List, Dict, Any, TYPE_CHECKING, Callable, Iterable, Optional, Type
+
+from pydantic import BaseModel
 
 if TYPE_CHECKING:
     from github_data.storage.protocols import StorageService
@@ -25,17 +28,47 @@ class SaveEntityStrategy(ABC):
 
     def read(self, github_service: "RepositoryService", repo_name: str) -> List[Any]:
         """Template method for reading data from external source."""
-        converter_name = self.get_converter_name()
         service_method = self.get_service_method()
 
-        raw_data = getattr(github_service, service_method)(repo_name)
+        # Prefer the streaming variant so items are converted page by page
+        # instead of after the whole raw list has been built
+        stream_method = "iter_" + service_method.removeprefix("get_")
+        if getattr(type(github_service), stream_method, None) is not None:
+            raw_data = getattr(github_service, stream_method)(repo_name)
+        else:
+            raw_data = getattr(github_service, service_method)(repo_name)
+
+        return self._convert(raw_data)
+
+    def read_updated_since(
+        self, github_service: "RepositoryService", repo_name: str, since: datetime
+    ) -> List[Any]:
+        """Read only the items updated at or after since.
+
+        Requires the streaming service method to accept since; see
+        get_incremental_model.
+        """
+        stream_method = "iter_" + self.get_service_method().removeprefix("get_")
+        return self._convert(
+            getattr(github_service, stream_method)(repo_name, since=since)
+        )
 
+    def _convert(self, raw_data: Iterable[Dict[str, Any]]) -> List[Any]:
+        """Convert raw API items with the entity's registered converter."""
         # Get converter from registry
         from github_data.github.converter_registry import get_converter
 
-        converter = get_converter(converter_name)
+        converter = get_converter(self.get_converter_name())
         return [converter(item) for item in raw_data]
 
+    def get_incremental_model(self) -> Optional[Type[BaseModel]]:
+        """Return the model of saved items if saves can be incremental.
+
+        Incremental saves read such entities with read_updated_since and
+        merge the changed items into the saved file by id.
+        """
+        return None
+
     @abstractmethod
     def get_converter_name(self) -> str:
         """Return the converter function name for this entity type."""
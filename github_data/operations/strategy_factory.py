@@ -82,6 +82,9 @@ class StrategyFactory:
             _include_original_metadata=additional_context.get(
                 "include_original_metadata", True
             ),
+            _release_asset_downloader=additional_context.get(
+                "release_asset_downloader"
+            ),
         )
 
         strategies = []
@@ -134,6 +137,8 @@ class StrategyFactory:
             _github_service=github_service,
             _conflict_strategy=conflict_strategy,
             _include_original_metadata=include_original_metadata,
+            _release_asset_uploader=additional_context.get("release_asset_uploader"),
+            _issue_importer=additional_context.get("issue_importer"),
         )
 
         strategies = []
@@ -277,7 +277,8 @@ class TestGraphQLBoundaryIntegration:
                             "color": "d73a4a",
                             "description": "Something isn't working",
                         }
-                    ]
+                    ],
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
                 }
             }
         }
@@ -305,21 +306,25 @@ class TestGraphQLBoundaryIntegration:
         mock_paginator.return_value = mock_paginator_instance
 
         # Mock paginated response
-        mock_paginator_instance.paginate_all.return_value = [
-            {
-                "id": "MDU6SXNzdWUxMjM0NTY3ODk=",
-                "number": 1,
-                "title": "Test Issue",
-                "body": "Test body",
-                "state": "OPEN",
-                "stateReason": None,
-                "url": "https://github.com/owner/repo/issues/1",
-                "createdAt": "2023-01-15T10:30:00Z",
-                "updatedAt": "2023-01-15T14:20:00Z",
-                "author": {"login": "testuser"},
-                "labels": {"nodes": []},
-            }
-        ]
+        mock_paginator_instance.paginate_iter.return_value = iter(
+            [
+                [
+                    {
+                        "id": "MDU6SXNzdWUxMjM0NTY3ODk=",
+                        "number": 1,
+                        "title": "Test Issue",
+                        "body": "Test body",
+                        "state": "OPEN",
+                        "stateReason": None,
+                        "url": "https://github.com/owner/repo/issues/1",
+                        "createdAt": "2023-01-15T10:30:00Z",
+                        "updatedAt": "2023-01-15T14:20:00Z",
+                        "author": {"login": "testuser"},
+                        "labels": {"nodes": []},
+                    }
+                ]
+            ]
+        )
 
         boundary = GitHubApiBoundary("fake-token")
         result = boundary.get_repository_issues("owner/repo")
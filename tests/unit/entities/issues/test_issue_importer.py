@@ -0,0 +1,249 @@
+"""Tests for restoring issues through the issue import API."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from github_data.entities.comments.models import Comment
+from github_data.entities.comments.restore_strategy import CommentsRestoreStrategy
+from github_data.entities.issues.issue_importer import (
+    IssueImport,
+    IssueImportError,
+    IssueImporter,
+)
+from github_data.entities.issues.models import Issue
+from github_data.entities.issues.restore_strategy import (
+    IMPORTED_COMMENTS_CONTEXT_KEY,
+    IssueImportRestoreStrategy,
+)
+from github_data.entities.users.models import GitHubUser
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+USER = GitHubUser(
+    login="testuser",
+    id=100,
+    avatar_url="https://github.com/testuser.png",
+    html_url="https://github.com/testuser",
+)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(
+        "github_data.entities.issues.issue_importer.time.sleep", lambda _: None
+    )
+
+
+def _issue(number, state="open", state_reason=None):
+    return Issue(
+        id=number,
+        number=number,
+        title=f"Issue {number}",
+        body="Body",
+        state=state,
+        state_reason=state_reason,
+        user=USER,
+        created_at="2023-01-01T00:00:00Z",
+        updated_at="2023-01-02T00:00:00Z",
+        closed_at="2023-01-02T00:00:00Z" if state == "closed" else None,
+        html_url=f"https://github.com/test/repo/issues/{number}",
+        comments=0,
+    )
+
+
+def _comment(issue_number, created_at):
+    return Comment(
+        id=created_at,
+        body=f"Comment at {created_at}",
+        user=USER,
+        created_at=created_at,
+        updated_at=created_at,
+        html_url="https://github.com/test/repo/issues/1#issuecomment-1",
+        issue_url=f"https://api.github.com/repos/test/repo/issues/{issue_number}",
+    )
+
+
+def _imported(import_id, number):
+    return {
+        "id": import_id,
+        "status": "imported",
+        "issue_url": f"https://api.github.com/repos/owner/repo/issues/{number}",
+    }
+
+
+class TestIssueImporter:
+    """Imports are queued first, then polled in batches."""
+
+    def test_imports_issues_and_polls_in_batches(self):
+        """Test every import is queued and resolved from one status listing."""
+        service = Mock()
+        service.start_issue_import.side_effect = [
+            {"id": 11, "status": "pending"},
+            {"id": 12, "status": "pending"},
+        ]
+        service.get_issue_imports.side_effect = [
+            [{"id": 11, "status": "pending"}, {"id": 12, "status": "pending"}],
+            [_imported(11, 5), _imported(12, 6), _imported(3, 1)],
+        ]
+        importer = IssueImporter()
+
+        results = importer.import_issues(
+            service,
+            "owner/repo",
+            [
+                IssueImport({"title": "A"}, [{"body": "c", "created_at": "t"}]),
+                IssueImport({"title": "B"}),
+            ],
+        )
+
+        assert results == [
+            {"number": 5, "import_id": 11},
+            {"number": 6, "import_id": 12},
+        ]
+        service.start_issue_import.assert_any_call(
+            "owner/repo", {"title": "A"}, [{"body": "c", "created_at": "t"}]
+        )
+        assert service.get_issue_imports.call_count == 2
+        service.get_issue_import.assert_not_called()
+
+    def test_reports_failed_and_unqueued_imports(self):
+        """Test failures are returned in place without stopping other imports."""
+        service = Mock()
+        service.start_issue_import.side_effect = [
+            ConnectionError("reset"),
+            {"id": 12, "status": "pending"},
+        ]
+        service.get_issue_imports.return_value = [
+            {
+                "id": 12,
+                "status": "failed",
+                "errors": [{"field": "milestone", "code": "invalid"}],
+            }
+        ]
+
+        results = IssueImporter().import_issues(
+            service,
+            "owner/repo",
+            [IssueImport({"title": "A"}), IssueImport({"title": "B"})],
+        )
+
+        assert isinstance(results[0], IssueImportError)
+        assert "reset" in str(results[0])
+        assert isinstance(results[1], IssueImportError)
+        assert "milestone: invalid" in str(results[1])
+
+    def test_reports_each_import_as_it_finishes(self):
+        """Test on_result sees each import when its status says it finished."""
+        service = Mock()
+        service.start_issue_import.side_effect = [
+            {"id": 11, "status": "pending"},
+            {"id": 12, "status": "pending"},
+        ]
+        reported = []
+        service.get_issue_imports.side_effect = [
+            [{"id": 11, "status": "pending"}, _imported(12, 6)],
+            [_imported(11, 5)],
+        ]
+
+        IssueImporter().import_issues(
+            service,
+            "owner/repo",
+            [IssueImport({"title": "A"}), IssueImport({"title": "B"})],
+            on_result=lambda index, result: reported.append(
+                (index, result["number"], service.get_issue_imports.call_count)
+            ),
+        )
+
+        assert reported == [(1, 6, 1), (0, 5, 2)]
+
+    def test_checks_unlisted_imports_before_giving_up(self):
+        """Test imports missing from the listing are looked up one by one."""
+        service = Mock()
+        service.start_issue_import.return_value = {"id": 11, "status": "pending"}
+        service.get_issue_imports.return_value = []
+        service.get_issue_import.return_value = _imported(11, 9)
+
+        results = IssueImporter(timeout=0.001).import_issues(
+            service, "owner/repo", [IssueImport({"title": "A"})]
+        )
+
+        assert results == [{"number": 9, "import_id": 11}]
+        service.get_issue_import.assert_called_once_with("owner/repo", 11)
+
+
+class TestIssueImportRestoreStrategy:
+    """Issues are imported with their comments in one request each."""
+
+    def test_imports_issue_with_comments_and_fills_mapping(self):
+        """Test comments travel with their issue and the mapping is filled."""
+        storage = Mock()
+        storage.read.side_effect = [
+            [_issue(1, state="closed"), _issue(2)],
+            [
+                _comment(1, "2023-01-03T00:00:00Z"),
+                _comment(1, "2023-01-02T00:00:00Z"),
+            ],
+        ]
+        service = Mock()
+        service.start_issue_import.side_effect = [
+            {"id": 11, "status": "pending"},
+            {"id": 12, "status": "pending"},
+        ]
+        service.get_issue_imports.return_value = [_imported(11, 7), _imported(12, 8)]
+        strategy = IssueImportRestoreStrategy(IssueImporter())
+        context = {}
+
+        issues = strategy.read("/data", storage)
+        entities_data = [strategy.transform(issue, context) for issue in issues]
+        results = strategy.write_batch(service, "owner/repo", entities_data)
+        for issue, result in zip(issues, results):
+            strategy.post_create_actions(service, "owner/repo", issue, result, context)
+
+        issue, comments = service.start_issue_import.call_args_list[0].args[1:]
+        assert issue["closed"] is True
+        assert issue["created_at"].startswith("2023-01-01")
+        assert [c["created_at"][:10] for c in comments] == ["2023-01-02", "2023-01-03"]
+        assert service.start_issue_import.call_args_list[1].args[2] == []
+        assert context["issue_number_mapping"] == {1: 7, 2: 8}
+        assert context[IMPORTED_COMMENTS_CONTEXT_KEY] == {1: 7, 2: 8}
+        # Imports close issues as completed already
+        service.close_issue.assert_not_called()
+        service.create_issue.assert_not_called()
+
+    def test_sets_state_reason_other_than_completed(self):
+        """Test issues closed as not planned get their reason afterwards."""
+        strategy = IssueImportRestoreStrategy(IssueImporter())
+        service = Mock()
+        context = {}
+
+        strategy.post_create_actions(
+            service,
+            "owner/repo",
+            _issue(1, state="closed", state_reason="not_planned"),
+            {
+                "number": 7,
+                "original_number": 1,
+                "original_state": "closed",
+                "state_reason": "not_planned",
+            },
+            context,
+        )
+
+        service.close_issue.assert_called_once_with("owner/repo", 7, "not_planned")
+
+    def test_comments_strategy_skips_imported_comments(self):
+        """Test comments imported with their issue are not posted again."""
+        strategy = CommentsRestoreStrategy()
+        context = {
+            "issue_number_mapping": {1: 7, 2: 8},
+            IMPORTED_COMMENTS_CONTEXT_KEY: {1},
+        }
+
+        assert strategy.transform(_comment(1, "2023-01-02T00:00:00Z"), context) is None
+        assert (
+            strategy.transform(_comment(2, "2023-01-02T00:00:00Z"), context)[
+                "issue_number"
+            ]
+            == 8
+        )
@@ -24,7 +24,7 @@ def test_transform_sanitizes_mentions_when_metadata_enabled():
         author_association="CONTRIBUTOR",
         submitted_at="2023-01-01T00:00:00Z",
     )
-    context = {"pull_request_number_mapping": {10: 5}}
+    context = {"pr_number_mapping": {10: 5}}
 
     # Act
     result = strategy.transform(review, context)
@@ -50,7 +50,7 @@ def test_transform_sanitizes_mentions_when_metadata_disabled():
         author_association="CONTRIBUTOR",
         submitted_at="2023-01-01T00:00:00Z",
     )
-    context = {"pull_request_number_mapping": {10: 5}}
+    context = {"pr_number_mapping": {10: 5}}
 
     # Act
     result = strategy.transform(review, context)
@@ -0,0 +1,167 @@
+"""Tests for the release asset download engine."""
+
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+import requests
+import requests_cache
+
+from github_data.entities.releases.asset_downloader import (
+    AssetDownload,
+    ReleaseAssetDownloader,
+)
+from github_data.github.cache import CacheConfig, setup_global_cache
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+CONTENT = b"0123456789" * 10
+
+
+def _response(body, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.iter_content.return_value = [
+        body[start : start + 16] for start in range(0, len(body), 16)
+    ]
+    response.__enter__.return_value = response
+    return response
+
+
+def _downloader_with(session, **kwargs):
+    downloader = ReleaseAssetDownloader(token="token", chunk_size=16, **kwargs)
+    patcher = patch.object(
+        ReleaseAssetDownloader, "_session", new_callable=PropertyMock
+    )
+    patcher.start().return_value = session
+    return downloader, patcher
+
+
+def _download(tmp_path, sha256=hashlib.sha256(CONTENT).hexdigest()):
+    return AssetDownload(
+        url="https://example.com/app.bin",
+        path=tmp_path / "v1.0" / "app.bin",
+        size=len(CONTENT),
+        sha256=sha256,
+    )
+
+
+class TestReleaseAssetDownloader:
+    """Downloads stream to disk, resume, verify and skip finished files."""
+
+    def test_downloads_and_verifies_asset(self, tmp_path):
+        """Test an asset is streamed to its path with a recorded digest."""
+        session = MagicMock()
+        session.get.return_value = _response(CONTENT)
+        downloader, patcher = _downloader_with(session)
+        download = _download(tmp_path)
+
+        try:
+            assert downloader.download(download) is True
+        finally:
+            patcher.stop()
+
+        assert download.path.read_bytes() == CONTENT
+        assert session.get.call_args.kwargs["stream"] is True
+        assert downloader.is_complete(download)
+
+    def test_resumes_partial_download_with_range(self, tmp_path):
+        """Test a partial file is continued from its size."""
+        session = MagicMock()
+        session.get.return_value = _response(CONTENT[40:], status_code=206)
+        downloader, patcher = _downloader_with(session)
+        download = _download(tmp_path)
+        download.path.parent.mkdir(parents=True)
+        download.path.with_name("app.bin.part").write_bytes(CONTENT[:40])
+
+        try:
+            downloader.download(download)
+        finally:
+            patcher.stop()
+
+        assert session.get.call_args.kwargs["headers"] == {"Range": "bytes=40-"}
+        assert download.path.read_bytes() == CONTENT
+
+    def test_skips_verified_asset_on_disk(self, tmp_path):
+        """Test an asset already saved intact is not downloaded again."""
+        session = MagicMock()
+        downloader, patcher = _downloader_with(session)
+        download = _download(tmp_path)
+        download.path.parent.mkdir(parents=True)
+        download.path.write_bytes(CONTENT)
+
+        try:
+            assert downloader.download(download) is False
+        finally:
+            patcher.stop()
+
+        session.get.assert_not_called()
+
+    def test_reports_hash_mismatch_after_retries(self, tmp_path):
+        """Test corrupt downloads are discarded and reported, not saved."""
+        session = MagicMock()
+        session.get.side_effect = lambda *args, **kwargs: _response(CONTENT)
+        downloader, patcher = _downloader_with(session, max_attempts=2)
+        download = _download(tmp_path, sha256="0" * 64)
+
+        try:
+            errors = downloader.download_all([download])
+        finally:
+            patcher.stop()
+
+        assert [error.download for error in errors] == [download]
+        assert session.get.call_count == 2
+        assert not download.path.exists()
+
+    def test_retries_after_connection_error(self, tmp_path):
+        """Test a dropped connection is retried."""
+        session = MagicMock()
+        session.get.side_effect = [
+            requests.ConnectionError("reset"),
+            _response(CONTENT),
+        ]
+        downloader, patcher = _downloader_with(session)
+        download = _download(tmp_path)
+
+        try:
+            assert downloader.download_all([download]) == []
+        finally:
+            patcher.stop()
+
+        assert download.path.read_bytes() == CONTENT
+
+    def test_bypasses_global_http_cache(self, tmp_path):
+        """Test downloads are not stored by the globally installed cache."""
+
+        class AssetHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(CONTENT)))
+                self.end_headers()
+                self.wfile.write(CONTENT)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), AssetHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        setup_global_cache(CacheConfig(backend="memory"))
+        download = AssetDownload(
+            url=f"http://127.0.0.1:{server.server_address[1]}/app.bin",
+            path=tmp_path / "app.bin",
+            size=len(CONTENT),
+            sha256=hashlib.sha256(CONTENT).hexdigest(),
+        )
+
+        try:
+            downloader = ReleaseAssetDownloader(token="token", chunk_size=16)
+            assert downloader.download(download) is True
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert download.path.read_bytes() == CONTENT
+        assert len(requests_cache.get_cache().responses) == 0
@@ -0,0 +1,82 @@
+"""Tests for the release asset upload engine."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from github_data.entities.releases.asset_uploader import (
+    AssetUpload,
+    ReleaseAssetUploader,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+def _upload(tmp_path, name="app.bin"):
+    path = tmp_path / name
+    path.write_bytes(b"0123456789")
+    return AssetUpload(
+        release_id=7, path=path, name=name, content_type="application/octet-stream"
+    )
+
+
+class TestReleaseAssetUploader:
+    """Uploads run in the background, skip finished assets and retry."""
+
+    def test_uploads_missing_assets_in_background(self, tmp_path):
+        """Test every missing asset is uploaded from its file path."""
+        service = Mock()
+        service.get_release_assets.return_value = []
+        uploader = ReleaseAssetUploader(max_workers=2)
+        uploads = [_upload(tmp_path, "a.bin"), _upload(tmp_path, "b.bin")]
+
+        assert uploader.submit(service, "owner/repo", 7, uploads) == 2
+        assert uploader.wait() == []
+
+        uploaded = {
+            call.args[3] for call in service.upload_release_asset.call_args_list
+        }
+        assert uploaded == {"a.bin", "b.bin"}
+        assert service.upload_release_asset.call_args.args[2] in {
+            str(upload.path) for upload in uploads
+        }
+
+    def test_skips_assets_already_uploaded(self, tmp_path):
+        """Test assets the release already has in full are not sent again."""
+        service = Mock()
+        service.get_release_assets.return_value = [
+            {"id": 1, "name": "app.bin", "state": "uploaded", "size": 10}
+        ]
+        uploader = ReleaseAssetUploader()
+
+        assert uploader.submit(service, "owner/repo", 7, [_upload(tmp_path)]) == 0
+        assert uploader.wait() == []
+        service.upload_release_asset.assert_not_called()
+
+    def test_replaces_unfinished_asset(self, tmp_path):
+        """Test an unfinished asset of the same name is deleted first."""
+        service = Mock()
+        service.get_release_assets.return_value = [
+            {"id": 1, "name": "app.bin", "state": "starter", "size": 4}
+        ]
+        uploader = ReleaseAssetUploader()
+
+        uploader.submit(service, "owner/repo", 7, [_upload(tmp_path)])
+        assert uploader.wait() == []
+
+        service.delete_release_asset.assert_called_once_with("owner/repo", 1)
+        service.upload_release_asset.assert_called_once()
+
+    def test_reports_asset_failing_every_attempt(self, tmp_path):
+        """Test an asset is retried, then reported as failed."""
+        service = Mock()
+        service.get_release_assets.return_value = []
+        service.upload_release_asset.side_effect = ConnectionError("reset")
+        uploader = ReleaseAssetUploader(max_attempts=2)
+        upload = _upload(tmp_path)
+
+        uploader.submit(service, "owner/repo", 7, [upload])
+        errors = uploader.wait()
+
+        assert [error.upload for error in errors] == [upload]
+        assert service.upload_release_asset.call_count == 2
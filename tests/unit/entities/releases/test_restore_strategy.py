@@ -166,6 +166,43 @@ class TestReleasesRestoreStrategy:
             prerelease=False,
         )
 
+    def test_write_targets_saved_tag_commit(self):
+        """Test a missing tag is created at the commit it pointed at."""
+        strategy = ReleasesRestoreStrategy()
+        mock_service = Mock()
+        mock_service.create_release.return_value = {"id": 999}
+        entity_data = {
+            "tag_name": "v1.0.1",
+            "target_commitish": "main",
+            "tag_commit_sha": "abc123",
+        }
+
+        assert strategy.write(mock_service, "owner/repo", entity_data)["id"] == 999
+        mock_service.create_release.assert_called_once()
+        assert (
+            mock_service.create_release.call_args.kwargs["target_commitish"] == "abc123"
+        )
+
+    def test_write_falls_back_to_branch_without_tag_commit(self):
+        """Test the saved branch is targeted when the commit is missing."""
+        strategy = ReleasesRestoreStrategy()
+        mock_service = Mock()
+        mock_service.create_release.side_effect = [
+            Exception('422 {"errors": [{"field": "target_commitish"}]}'),
+            {"id": 999},
+        ]
+        entity_data = {
+            "tag_name": "v1.0.1",
+            "target_commitish": "main",
+            "tag_commit_sha": "abc123",
+        }
+
+        assert strategy.write(mock_service, "owner/repo", entity_data)["id"] == 999
+        assert [
+            c.kwargs["target_commitish"]
+            for c in mock_service.create_release.call_args_list
+        ] == ["abc123", "main"]
+
     def test_write_handles_existing_tag(self):
         """Test write method handles tag already exists error."""
         strategy = ReleasesRestoreStrategy()
@@ -187,3 +224,55 @@ class TestReleasesRestoreStrategy:
         # Should return mock response and log warning
         assert result["tag_name"] == "v1.0.0"
         assert result["id"] == -1
+
+    def test_post_create_actions_uploads_saved_assets(self, tmp_path):
+        """Test saved asset files are handed to the uploader."""
+        from github_data.entities.releases.models import ReleaseAsset
+
+        user = GitHubUser(login="alice", id=1, avatar_url="", html_url="")
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        saved = tmp_path / "release_assets" / "v1.0.0" / "app.tar.gz"
+        saved.parent.mkdir(parents=True)
+        saved.write_bytes(b"app")
+
+        def asset(name, local_path):
+            return ReleaseAsset(
+                id=name,
+                name=name,
+                content_type="application/gzip",
+                size=3,
+                download_count=0,
+                browser_download_url=f"https://example.com/{name}",
+                created_at=now,
+                updated_at=now,
+                uploader=user,
+                local_path=local_path,
+            )
+
+        release = Release(
+            id=1,
+            tag_name="v1.0.0",
+            target_commitish="main",
+            created_at=now,
+            author=user,
+            assets=[
+                asset("app.tar.gz", "release_assets/v1.0.0/app.tar.gz"),
+                asset("never-downloaded.zip", None),
+            ],
+            html_url="https://github.com/owner/repo/releases/tag/v1.0.0",
+        )
+        uploader = Mock()
+        uploader.wait.return_value = []
+        strategy = ReleasesRestoreStrategy(asset_uploader=uploader)
+        strategy.read(str(tmp_path), Mock())
+        mock_service = Mock()
+
+        strategy.post_create_actions(
+            mock_service, "owner/repo", release, {"id": 999}, {}
+        )
+        strategy.complete_restore(mock_service, "owner/repo", {})
+
+        service, repo_name, release_id, uploads = uploader.submit.call_args.args
+        assert (repo_name, release_id) == ("owner/repo", 999)
+        assert [(u.path, u.name) for u in uploads] == [(saved, "app.tar.gz")]
+        uploader.wait.assert_called_once()
@@ -4,7 +4,6 @@ import pytest
 from unittest.mock import Mock
 from github_data.entities.releases.save_strategy import ReleasesSaveStrategy
 
-
 pytestmark = [
     pytest.mark.unit,
     pytest.mark.fast,
@@ -55,3 +54,67 @@ class TestReleasesSaveStrategy:
         config = Mock()
         config.include_releases = True
         assert strategy.should_skip(config) is False
+
+    def test_write_downloads_assets_and_records_local_paths(self, tmp_path):
+        """Test assets are downloaded before releases are saved."""
+        release = _release_with_asset("RA_1")
+        asset = release.assets[0]
+        downloader = Mock()
+        downloader.download_all.return_value = []
+        storage_service = Mock()
+        strategy = ReleasesSaveStrategy(asset_downloader=downloader)
+
+        result = strategy.write([release], str(tmp_path), storage_service)
+
+        assert result["success"] is True
+        (download,) = downloader.download_all.call_args.args[0]
+        assert download.path == tmp_path / "release_assets" / "v1.0" / "app.tar.gz"
+        assert download.sha256 == "abc"
+        assert asset.local_path == "release_assets/v1.0/app.tar.gz"
+        storage_service.write.assert_called_once()
+
+    def test_assets_download_through_api_endpoint(self, tmp_path):
+        """Test assets with a numeric id download from the REST asset endpoint."""
+        github_service = Mock()
+        github_service.get_repository_releases.return_value = []
+        downloader = Mock()
+        downloader.download_all.return_value = []
+        strategy = ReleasesSaveStrategy(asset_downloader=downloader)
+
+        strategy.read(github_service, "owner/repo")
+        strategy.write([_release_with_asset(501)], str(tmp_path), Mock())
+
+        (download,) = downloader.download_all.call_args.args[0]
+        assert download.url == (
+            "https://api.github.com/repos/owner/repo/releases/assets/501"
+        )
+
+
+def _release_with_asset(asset_id):
+    from datetime import datetime, timezone
+    from github_data.entities.releases.models import Release, ReleaseAsset
+    from github_data.entities.users.models import GitHubUser
+
+    user = GitHubUser(login="alice", id=1, avatar_url="", html_url="")
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    asset = ReleaseAsset(
+        id=asset_id,
+        name="app.tar.gz",
+        content_type="application/gzip",
+        size=3,
+        download_count=0,
+        browser_download_url="https://example.com/app.tar.gz",
+        created_at=now,
+        updated_at=now,
+        uploader=user,
+        digest="sha256:abc",
+    )
+    return Release(
+        id=1,
+        tag_name="v1.0",
+        target_commitish="main",
+        created_at=now,
+        author=user,
+        assets=[asset],
+        html_url="https://github.com/owner/repo/releases/tag/v1.0",
+    )
@@ -60,3 +60,69 @@ def test_topological_sort_detects_cycles():
 
     with pytest.raises(ValueError, match="circular dependency"):
         registry._topological_sort([a, b])
+
+
+def test_sort_into_levels_groups_independent_entities():
+    """Test entities without mutual dependencies share a level."""
+    from github_data.entities.registry import TopologicalSorter
+
+    class LabelsConfig:
+        name = "labels"
+        dependencies = []
+
+    class MilestonesConfig:
+        name = "milestones"
+        dependencies = []
+
+    class IssuesConfig:
+        name = "issues"
+        dependencies = ["milestones"]
+
+    class CommentsConfig:
+        name = "comments"
+        dependencies = ["issues"]
+
+    class SubIssuesConfig:
+        name = "sub_issues"
+        dependencies = ["issues"]
+
+    entities = [
+        RegisteredEntity(config=config(), enabled=True)
+        for config in (
+            SubIssuesConfig,
+            CommentsConfig,
+            LabelsConfig,
+            IssuesConfig,
+            MilestonesConfig,
+        )
+    ]
+
+    levels = TopologicalSorter(entities).sort_into_levels()
+
+    names = [[e.config.name for e in level] for level in levels]
+    assert names == [
+        ["labels", "milestones"],
+        ["issues"],
+        ["comments", "sub_issues"],
+    ]
+
+
+def test_sort_into_levels_detects_cycles():
+    """Test cycle detection when grouping into levels."""
+    from github_data.entities.registry import TopologicalSorter
+
+    class AConfig:
+        name = "a"
+        dependencies = ["b"]
+
+    class BConfig:
+        name = "b"
+        dependencies = ["a"]
+
+    entities = [
+        RegisteredEntity(config=AConfig(), enabled=True),
+        RegisteredEntity(config=BConfig(), enabled=True),
+    ]
+
+    with pytest.raises(ValueError, match="circular dependency"):
+        TopologicalSorter(entities).sort_into_levels()
@@ -0,0 +1,188 @@
+"""Tests for alias-batched per-item GraphQL lookups."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from gql.transport.exceptions import TransportQueryError
+
+from github_data.github.graphql_client import GitHubGraphQLClient
+from github_data.github.utils.alias_batcher import AliasBatchFetcher, AliasedLookup
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast, pytest.mark.github_api]
+
+PR_URL = AliasedLookup(
+    field="pullRequest", key_argument="number", key_type="Int!", selection="id url"
+)
+
+
+class TestAliasBatchFetcher:
+    """Test packing lookups into aliased queries."""
+
+    def test_rejects_non_positive_batch_size(self):
+        """Test batch_size must be at least 1."""
+        with pytest.raises(ValueError, match="batch_size"):
+            AliasBatchFetcher(Mock(), batch_size=0)
+
+    def test_splits_keys_into_batches_and_maps_results_back(self):
+        """Test each request carries at most batch_size aliased lookups."""
+        client = Mock()
+        client.execute.side_effect = [
+            {"repository": {"item0": {"url": "u1"}, "item1": {"url": "u2"}}},
+            {"repository": {"item0": None}},
+        ]
+
+        results = AliasBatchFetcher(client, batch_size=2).fetch(
+            "owner", "repo", PR_URL, [1, 2, 3, 1]
+        )
+
+        assert client.execute.call_count == 2
+        first_variables = client.execute.call_args_list[0][1]["variable_values"]
+        assert first_variables == {
+            "owner": "owner",
+            "name": "repo",
+            "key0": 1,
+            "key1": 2,
+        }
+        assert results == {1: {"url": "u1"}, 2: {"url": "u2"}, 3: None}
+
+    def test_missing_item_maps_to_none_without_failing_batch(self):
+        """Test a NOT_FOUND item is None while the rest of its batch is kept."""
+        client = Mock()
+        client.execute.side_effect = TransportQueryError(
+            "Could not resolve to a PullRequest with the number of 2.",
+            errors=[
+                {
+                    "type": "NOT_FOUND",
+                    "path": ["repository", "item1"],
+                    "message": "Could not resolve to a PullRequest",
+                }
+            ],
+            data={"repository": {"item0": {"url": "u1"}, "item1": None}},
+        )
+
+        results = AliasBatchFetcher(client).fetch("owner", "repo", PR_URL, [1, 2])
+
+        assert results == {1: {"url": "u1"}, 2: None}
+
+    def test_errors_not_tied_to_an_item_are_raised(self):
+        """Test request-level GraphQL errors still fail the lookup."""
+        client = Mock()
+        client.execute.side_effect = TransportQueryError(
+            "Bad credentials",
+            errors=[{"message": "Bad credentials"}],
+            data={"repository": None},
+        )
+
+        with pytest.raises(TransportQueryError, match="Bad credentials"):
+            AliasBatchFetcher(client).fetch("owner", "repo", PR_URL, [1])
+
+    def test_query_aliases_each_lookup(self):
+        """Test the generated document aliases one field per key."""
+        client = Mock()
+        client.execute.return_value = {"repository": {}}
+
+        AliasBatchFetcher(client).fetch("owner", "repo", PR_URL, [7, 8])
+
+        document = client.execute.call_args[0][0]
+        source = document.document.loc.source.body
+        assert "item0: pullRequest(number: $key0)" in source
+        assert "item1: pullRequest(number: $key1)" in source
+
+
+class TestGraphQLClientBatchedLookups:
+    """Test per-item client methods built on batched lookups."""
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_pull_request_comments_batch_uses_one_request(self, mock_client_class):
+        """Test comments for several PRs come back from a single query."""
+        gql_client = Mock()
+        mock_client_class.return_value = gql_client
+
+        def pr(url, comment_id):
+            return {
+                "id": f"PR_{comment_id}",
+                "url": url,
+                "comments": {
+                    "nodes": [
+                        {
+                            "id": comment_id,
+                            "body": "hi",
+                            "createdAt": "2024-01-01T00:00:00Z",
+                            "updatedAt": "2024-01-01T00:00:00Z",
+                            "url": f"{url}#c",
+                            "author": None,
+                        }
+                    ],
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                },
+            }
+
+        gql_client.execute.return_value = {
+            "repository": {"item0": pr("pr1", "c1"), "item1": pr("pr2", "c2")}
+        }
+        client = GitHubGraphQLClient("token")
+
+        result = client.get_pull_request_comments_batch("owner/repo", [1, 2])
+
+        assert gql_client.execute.call_count == 1
+        assert [c["id"] for c in result[1]] == ["c1"]
+        assert [c["id"] for c in result[2]] == ["c2"]
+        assert result[2][0]["pull_request_url"] == "pr2"
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_review_comments_batch_fetches_by_node_id(self, mock_client_class):
+        """Test review comments for several reviews come from one node query."""
+        gql_client = Mock()
+        mock_client_class.return_value = gql_client
+        empty = {"nodes": [], "pageInfo": {"hasNextPage": False, "endCursor": None}}
+        gql_client.execute.return_value = {
+            "node0": {"comments": empty},
+            "node1": {"comments": empty},
+        }
+        client = GitHubGraphQLClient("token")
+
+        result = client.get_pull_request_review_comments_batch(
+            "owner/repo", ["R1", "R2"]
+        )
+
+        assert gql_client.execute.call_count == 1
+        variables = gql_client.execute.call_args[1]["variable_values"]
+        assert (variables["id0"], variables["id1"]) == ("R1", "R2")
+        assert result == {"R1": [], "R2": []}
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_issue_parents_batch_uses_one_request(self, mock_client_class):
+        """Test parents of several issues come back from a single query."""
+        gql_client = Mock()
+        mock_client_class.return_value = gql_client
+        gql_client.execute.return_value = {
+            "repository": {
+                "item0": {
+                    "parent": {
+                        "id": "I_1",
+                        "databaseId": 101,
+                        "number": 1,
+                        "title": "Epic",
+                        "state": "OPEN",
+                        "url": "https://github.com/owner/repo/issues/1",
+                    }
+                },
+                "item1": {"parent": None},
+                "item2": None,
+            }
+        }
+        client = GitHubGraphQLClient("token")
+
+        result = client.get_issue_parents_batch("owner/repo", [2, 3, 99])
+
+        assert gql_client.execute.call_count == 1
+        assert result[2] == {
+            "id": 101,
+            "node_id": "I_1",
+            "number": 1,
+            "title": "Epic",
+            "state": "open",
+            "html_url": "https://github.com/owner/repo/issues/1",
+        }
+        assert result[3] is None
+        assert result[99] is None
@@ -0,0 +1,128 @@
+"""Tests for the asyncio GraphQL client."""
+
+import asyncio
+import importlib.util
+
+import pytest
+from gql import gql
+from unittest.mock import Mock, patch
+
+from github_data.github.async_graphql_client import AsyncGitHubGraphQLClient
+from github_data.github.utils.alias_batcher import AliasedLookup
+from github_data.github.utils.graphql_budget import GraphQLBudgetTracker
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast, pytest.mark.github_api]
+
+
+class _FakeSession:
+    """Async session answering queries after a short delay."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+
+    async def execute(self, query, variable_values=None):
+        self.calls.append(variable_values)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.respond(variable_values)
+
+
+@pytest.fixture
+def fake_session():
+    return _FakeSession(lambda variables: {"echo": variables})
+
+
+@pytest.fixture
+def make_client(fake_session):
+    """Build async clients whose transport is the fake session."""
+    clients = []
+
+    def create_client(self, token):
+        gql_client = Mock()
+
+        async def connect_async():
+            return fake_session
+
+        async def close_async():
+            pass
+
+        gql_client.connect_async = connect_async
+        gql_client.close_async = close_async
+        return gql_client
+
+    def make(**kwargs):
+        kwargs.setdefault("budget", GraphQLBudgetTracker())
+        client = AsyncGitHubGraphQLClient("token", **kwargs)
+        clients.append(client)
+        return client
+
+    with patch.object(
+        AsyncGitHubGraphQLClient, "_create_graphql_client", create_client
+    ):
+        yield make
+
+    for client in clients:
+        client.close()
+
+
+class TestAsyncGitHubGraphQLClient:
+    """Test concurrent execution behind the synchronous facade."""
+
+    def test_rejects_zero_concurrency(self):
+        """Test at least one query must be allowed in flight."""
+        with pytest.raises(ValueError, match="at least 1"):
+            AsyncGitHubGraphQLClient("token", concurrency=0)
+
+    def test_execute_facade_returns_result(self, make_client):
+        """Test the synchronous execute waits for the query's result."""
+        client = make_client()
+
+        assert client.execute("query", {"n": 1}) == {"echo": {"n": 1}}
+
+    def test_execute_many_respects_concurrency(self, make_client, fake_session):
+        """Test queries run concurrently but never above the limit."""
+        client = make_client(concurrency=3)
+
+        results = client.execute_many([("query", {"n": n}) for n in range(10)])
+
+        assert results == [{"echo": {"n": n}} for n in range(10)]
+        assert fake_session.max_in_flight == 3
+
+    def test_records_budget_of_every_query(self, make_client, fake_session):
+        """Test rateLimit data of concurrent queries reaches the budget."""
+        fake_session.respond = lambda variables: {
+            "rateLimit": {"cost": 2, "remaining": 4000, "resetAt": None}
+        }
+        client = make_client()
+
+        client.execute_many([(gql("query Named { rateLimit { cost } }"), None)] * 4)
+
+        assert client.get_graphql_costs() == {"Named": 8}
+
+    def test_alias_batches_run_concurrently(self, make_client, fake_session):
+        """Test aliased batches of per-item lookups are sent together."""
+        fake_session.respond = lambda variables: {"repository": {}}
+        client = make_client(batch_size=2, concurrency=4)
+        lookup = AliasedLookup(
+            field="issue", key_argument="number", key_type="Int!", selection="id"
+        )
+
+        results = client._alias_fetcher.fetch("owner", "repo", lookup, range(8))
+
+        assert len(fake_session.calls) == 4
+        assert fake_session.max_in_flight == 4
+        assert results == {key: None for key in range(8)}
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("aiohttp") is not None, reason="aiohttp is installed"
+)
+def test_missing_aiohttp_names_the_extra():
+    """Test a helpful error is raised without the async extra."""
+    with pytest.raises(ImportError, match=r"github-data\[async\]"):
+        AsyncGitHubGraphQLClient("token")
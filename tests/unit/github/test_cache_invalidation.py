@@ -0,0 +1,148 @@
+"""Tests for cache invalidation scoped by repository and data type."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from github_data.github.cache import (
+    CacheConfig,
+    CacheTag,
+    get_cache_index,
+    invalidate_cache,
+    setup_global_cache,
+)
+from github_data.github.operation_registry import Operation
+from github_data.github.service import GitHubService
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        body = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    """Serve JSON on localhost, counting requests that reach the server."""
+    _CountingHandler.hits = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _read(url, tag):
+    with get_cache_index().scope(tag):
+        requests.get(url).raise_for_status()
+
+
+class TestCacheTag:
+    """Test tags derived from service cache keys."""
+
+    def test_parses_data_type_and_repository(self):
+        """Test the key's first two segments name type and repository."""
+        assert CacheTag.from_cache_key("comments:owner/repo:7") == CacheTag(
+            repo_name="owner/repo", data_type="comments"
+        )
+
+    def test_ignores_keys_without_repository(self):
+        """Test keys not naming a repository yield no tag."""
+        assert CacheTag.from_cache_key(None) is None
+        assert CacheTag.from_cache_key("rate_limit") is None
+        assert CacheTag.from_cache_key("get_user:octocat") is None
+
+
+class TestInvalidateCache:
+    """Test only the responses of the modified data are evicted."""
+
+    def test_evicts_only_tagged_responses(self, server_url):
+        """Test evicting labels keeps other cached reads warm."""
+        setup_global_cache(CacheConfig(backend="memory"))
+        labels = CacheTag("owner/repo", "labels")
+        releases = CacheTag("owner/repo", "releases")
+
+        _read(f"{server_url}/repos/owner/repo/labels", labels)
+        _read(f"{server_url}/repos/owner/repo/releases", releases)
+        _read(f"{server_url}/repos/owner/repo/labels", labels)
+        assert _CountingHandler.hits == 2
+
+        assert invalidate_cache("owner/repo", ["labels"]) == 1
+
+        _read(f"{server_url}/repos/owner/repo/labels", labels)
+        _read(f"{server_url}/repos/owner/repo/releases", releases)
+        assert _CountingHandler.hits == 3
+
+    def test_other_repositories_stay_cached(self, server_url):
+        """Test invalidation is scoped to the modified repository."""
+        setup_global_cache(CacheConfig(backend="memory"))
+        other = CacheTag("owner/other", "labels")
+        _read(f"{server_url}/repos/owner/other/labels", other)
+
+        assert invalidate_cache("owner/repo", ["labels"]) == 0
+
+        _read(f"{server_url}/repos/owner/other/labels", other)
+        assert _CountingHandler.hits == 1
+
+    def test_untagged_reads_are_not_indexed(self, server_url):
+        """Test responses outside a scope are left to expire normally."""
+        setup_global_cache(CacheConfig(backend="memory"))
+        requests.get(f"{server_url}/rate_limit").raise_for_status()
+
+        assert invalidate_cache("owner/repo", ["labels"]) == 0
+
+
+class TestServiceInvalidation:
+    """Test service writes evict the data types they make stale."""
+
+    @patch("github_data.github.service.invalidate_cache", return_value=0)
+    def test_create_issue_evicts_issues_and_milestones(self, mock_invalidate):
+        """Test milestone issue counts are refreshed after creating an issue."""
+        service = GitHubService(boundary=Mock(), caching_enabled=True)
+        service._rate_limiter = Mock()
+
+        service.create_issue("owner/repo", "title", "body", [])
+
+        mock_invalidate.assert_called_once_with("owner/repo", ("issues", "milestones"))
+
+    @patch("github_data.github.service.invalidate_cache", return_value=0)
+    @patch("github_data.github.service.GitHubOperationRegistry")
+    def test_registry_write_evicts_its_entity(
+        self, mock_registry_class, mock_invalidate
+    ):
+        """Test writes generated from the registry invalidate their entity."""
+        mock_registry_class.return_value.get_operation.return_value = Operation(
+            "create_test_data", "releases", {"boundary_method": "create_test_data"}
+        )
+        service = GitHubService(boundary=Mock(), caching_enabled=True)
+        service._rate_limiter = Mock()
+
+        service.create_test_data(repo_name="owner/repo", tag_name="v1")
+
+        mock_invalidate.assert_called_once_with("owner/repo", ("releases",))
+
+    @patch("github_data.github.service.invalidate_cache")
+    def test_no_invalidation_without_caching(self, mock_invalidate):
+        """Test nothing is evicted when caching is disabled."""
+        service = GitHubService(boundary=Mock(), caching_enabled=False)
+        service._rate_limiter = Mock()
+
+        service.create_label("owner/repo", "bug", "ff0000", "")
+
+        mock_invalidate.assert_not_called()
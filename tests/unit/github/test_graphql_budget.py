@@ -0,0 +1,131 @@
+"""Tests for GraphQL point-budget accounting."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from gql import gql
+
+from github_data.github.graphql_client import GitHubGraphQLClient
+from github_data.github.utils.graphql_budget import (
+    GraphQLBudgetTracker,
+    operation_name,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast, pytest.mark.github_api]
+
+# 2024-01-01T01:00:00Z as seconds since the epoch
+RESET_AT = "2024-01-01T01:00:00Z"
+RESET_EPOCH = 1704070800.0
+
+
+def _rate_limit(remaining, cost=1, reset_at=RESET_AT):
+    return {"cost": cost, "remaining": remaining, "resetAt": reset_at}
+
+
+class TestGraphQLBudgetTracker:
+    """Test recording and pacing against the GraphQL point budget."""
+
+    def test_costs_are_accumulated_per_query(self):
+        """Test every response's cost is charged to its query."""
+        tracker = GraphQLBudgetTracker()
+
+        tracker.record(_rate_limit(4999, cost=1), "getRepositoryIssues")
+        tracker.record(_rate_limit(4997, cost=2), "getRepositoryIssues")
+        tracker.record(_rate_limit(4996, cost=1), "getRepositoryLabels")
+        tracker.record(None, "getRepositoryLabels")
+
+        assert tracker.cost_by_query() == {
+            "getRepositoryIssues": 3,
+            "getRepositoryLabels": 1,
+        }
+        assert tracker.remaining == 4996
+
+    def test_out_of_order_responses_keep_lowest_remaining(self):
+        """Test a late response from the same window cannot raise the budget."""
+        tracker = GraphQLBudgetTracker()
+
+        tracker.record(_rate_limit(900), "q")
+        tracker.record(_rate_limit(950), "q")
+
+        assert tracker.remaining == 900
+
+    @patch("github_data.github.utils.graphql_budget.time")
+    def test_no_pacing_while_budget_is_plentiful(self, mock_time):
+        """Test requests are not delayed above the pacing threshold."""
+        mock_time.time.return_value = RESET_EPOCH - 3600
+        tracker = GraphQLBudgetTracker(pace_below=1000)
+        tracker.record(_rate_limit(4000), "q")
+
+        tracker.wait_for_budget()
+
+        mock_time.sleep.assert_not_called()
+
+    @patch("github_data.github.utils.graphql_budget.time")
+    def test_low_budget_spreads_requests_over_window(self, mock_time):
+        """Test requests are spaced so the budget lasts until the reset."""
+        mock_time.time.return_value = RESET_EPOCH - 1000
+        tracker = GraphQLBudgetTracker(reserve=100, pace_below=1000)
+        tracker.record(_rate_limit(600, cost=5), "q")
+
+        tracker.wait_for_budget()
+        tracker.wait_for_budget()
+
+        # 500 spendable points at 5 per request over 1000s: one every 10s
+        mock_time.sleep.assert_called_once_with(pytest.approx(10.0))
+
+    @patch("github_data.github.utils.graphql_budget.time")
+    def test_exhausted_budget_waits_for_reset(self, mock_time):
+        """Test requests pause until the window resets once the reserve is hit."""
+        mock_time.time.return_value = RESET_EPOCH - 30
+        tracker = GraphQLBudgetTracker(reserve=100)
+        tracker.record(_rate_limit(80), "q")
+
+        tracker.wait_for_budget()
+
+        mock_time.sleep.assert_called_once_with(pytest.approx(30.0))
+
+    @patch("github_data.github.utils.graphql_budget.time")
+    def test_stale_budget_after_reset_is_ignored(self, mock_time):
+        """Test a budget from an expired window does not delay requests."""
+        mock_time.time.return_value = RESET_EPOCH + 5
+        tracker = GraphQLBudgetTracker()
+        tracker.record(_rate_limit(0), "q")
+
+        tracker.wait_for_budget()
+
+        mock_time.sleep.assert_not_called()
+
+
+class TestOperationName:
+    """Test naming queries for cost reporting."""
+
+    def test_named_operation_after_fragments(self):
+        """Test the operation name is found even if fragments come first."""
+        document = gql(
+            "fragment F on Label { name } query getLabels { viewer { login } }"
+        )
+        assert operation_name(document) == "getLabels"
+
+    def test_anonymous_operation(self):
+        """Test unnamed queries are reported as anonymous."""
+        assert operation_name(gql("{ viewer { login } }")) == "anonymous"
+
+
+class TestGraphQLClientBudget:
+    """Test the GraphQL client feeds responses to the budget tracker."""
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_execute_records_rate_limit(self, mock_client_class):
+        """Test a query's rateLimit data is charged to the query by name."""
+        gql_client = Mock()
+        mock_client_class.return_value = gql_client
+        gql_client.execute.return_value = {
+            "rateLimit": _rate_limit(4990, cost=3),
+        }
+        tracker = GraphQLBudgetTracker()
+        client = GitHubGraphQLClient("token", budget=tracker)
+
+        client.execute(gql("query getBudget { rateLimit { cost remaining } }"))
+
+        assert client.get_graphql_costs() == {"getBudget": 3}
+        assert tracker.remaining == 4990
@@ -0,0 +1,234 @@
+"""Tests for the persistent GraphQL response cache."""
+
+import time
+
+import pytest
+from gql import gql
+from unittest.mock import patch
+
+from github_data.github.cache import (
+    CacheConfig,
+    CacheTag,
+    get_cache_index,
+    invalidate_cache,
+    setup_global_cache,
+)
+from github_data.github.graphql_cache import GraphQLResponseCache
+from github_data.github.graphql_client import GitHubGraphQLClient
+from github_data.github.queries import RATE_LIMIT_QUERY
+from github_data.github.queries.mutations import (
+    ISSUE_OR_PULL_REQUEST_ID_LOOKUP,
+    REPOSITORY_ID_QUERY,
+)
+from github_data.github.utils.alias_batcher import _build_aliased_query
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+LABELS_QUERY = gql(
+    """
+    query($owner: String!, $name: String!) {
+      repository(owner: $owner, name: $name) {
+        labels(first: 10) { nodes { name } }
+      }
+    }
+    """
+)
+
+MUTATION = gql(
+    """
+    mutation($id: ID!) {
+      addLabelsToLabelable(input: {labelableId: $id, labelIds: []}) {
+        clientMutationId
+      }
+    }
+    """
+)
+
+REPO = {"owner": "owner", "name": "repo"}
+RESULT = {"repository": {"labels": {"nodes": [{"name": "bug"}]}}}
+
+
+@pytest.fixture
+def memory_cache():
+    """Install an in-memory requests_cache backend."""
+    setup_global_cache(CacheConfig(backend="memory"))
+
+
+@pytest.fixture
+def client(memory_cache):
+    """GraphQL client with a response cache and a mocked transport."""
+    with patch("github_data.github.graphql_client.Client") as mock_client_class:
+        mock_client_class.return_value.execute.return_value = RESULT
+        graphql_client = GitHubGraphQLClient(
+            "token",
+            validate_queries=False,
+            response_cache=GraphQLResponseCache(expire_after=60),
+        )
+        yield graphql_client, mock_client_class.return_value
+
+
+class TestGraphQLResponseCacheKey:
+    """Test which queries get a cache key."""
+
+    def test_key_depends_on_variables(self):
+        """Test the same query with other variables gets another key."""
+        cache = GraphQLResponseCache()
+
+        key = cache.key(LABELS_QUERY, REPO)
+
+        assert key == cache.key(LABELS_QUERY, dict(reversed(list(REPO.items()))))
+        assert key != cache.key(LABELS_QUERY, {**REPO, "name": "other"})
+
+    def test_key_is_stable_across_parses(self):
+        """Test re-parsing the same query text yields the same key."""
+        cache = GraphQLResponseCache()
+
+        assert cache.key(RATE_LIMIT_QUERY, None) == cache.key(
+            gql(RATE_LIMIT_QUERY.document.loc.source.body), None
+        )
+
+    def test_mutations_are_not_cached(self):
+        """Test mutations never get a cache key."""
+        assert GraphQLResponseCache().key(MUTATION, {"id": "1"}) is None
+
+    def test_node_id_lookups_before_writes_are_not_cached(self):
+        """Test repository and issue node ID lookups always reach GitHub."""
+        cache = GraphQLResponseCache()
+
+        assert cache.key(REPOSITORY_ID_QUERY, REPO) is None
+        assert (
+            cache.key(
+                _build_aliased_query(ISSUE_OR_PULL_REQUEST_ID_LOOKUP, 2),
+                {**REPO, "key0": 1, "key1": 2},
+            )
+            is None
+        )
+
+
+class TestGraphQLClientResponseCache:
+    """Test the client answers repeated queries from the cache."""
+
+    def test_repeated_query_skips_transport(self, client):
+        """Test a repeated query is served without sending it."""
+        graphql_client, gql_client = client
+
+        first = graphql_client.execute(LABELS_QUERY, REPO)
+        second = graphql_client.execute(LABELS_QUERY, REPO)
+
+        assert first == second == RESULT
+        assert gql_client.execute.call_count == 1
+        assert graphql_client.get_response_cache_stats() == {"hits": 1, "misses": 1}
+
+    def test_repository_id_lookup_is_sent_every_time(self, client):
+        """Test a recreated repository's node ID is never served stale."""
+        graphql_client, gql_client = client
+        gql_client.execute.return_value = {"repository": {"id": "R_1"}}
+
+        graphql_client.execute(REPOSITORY_ID_QUERY, REPO)
+        graphql_client.execute(REPOSITORY_ID_QUERY, REPO)
+
+        assert gql_client.execute.call_count == 2
+
+    def test_other_variables_are_sent(self, client):
+        """Test a query with different variables misses the cache."""
+        graphql_client, gql_client = client
+
+        graphql_client.execute(LABELS_QUERY, REPO)
+        graphql_client.execute(LABELS_QUERY, {**REPO, "name": "other"})
+
+        assert gql_client.execute.call_count == 2
+
+    def test_cache_hit_records_no_budget(self, client):
+        """Test points are only counted for queries actually sent."""
+        graphql_client, gql_client = client
+        gql_client.execute.return_value = {
+            **RESULT,
+            "rateLimit": {"cost": 1, "remaining": 4999, "resetAt": None},
+        }
+
+        graphql_client.execute(LABELS_QUERY, REPO)
+        graphql_client.execute(LABELS_QUERY, REPO)
+
+        assert sum(graphql_client.get_graphql_costs().values()) == 1
+
+    def test_without_installed_cache_every_query_is_sent(self):
+        """Test nothing is cached while requests_cache is not installed."""
+        with patch("github_data.github.graphql_client.Client") as mock_client_class:
+            mock_client_class.return_value.execute.return_value = RESULT
+            graphql_client = GitHubGraphQLClient(
+                "token", response_cache=GraphQLResponseCache()
+            )
+
+            graphql_client.execute(LABELS_QUERY, REPO)
+            graphql_client.execute(LABELS_QUERY, REPO)
+
+        assert mock_client_class.return_value.execute.call_count == 2
+
+
+class TestGraphQLResponseCacheLifetime:
+    """Test per data type lifetimes and invalidation."""
+
+    def test_entries_expire(self, memory_cache):
+        """Test an entry is not served after its lifetime."""
+        cache = GraphQLResponseCache(expire_after=1)
+        key = cache.key(LABELS_QUERY, REPO)
+
+        cache.set(key, RESULT)
+        assert cache.get(key) == RESULT
+        time.sleep(1.1)
+
+        assert cache.get(key) is None
+
+    def test_zero_lifetime_disables_data_type(self, memory_cache):
+        """Test a data type with lifetime 0 is never stored."""
+        cache = GraphQLResponseCache(expire_after_by_type={"labels": 0})
+        key = cache.key(LABELS_QUERY, REPO)
+
+        with get_cache_index().scope(CacheTag("owner/repo", "labels")):
+            cache.set(key, RESULT)
+        with get_cache_index().scope(CacheTag("owner/repo", "issues")):
+            cache.set(cache.key(LABELS_QUERY, {**REPO, "name": "x"}), RESULT)
+
+        assert cache.get(key) is None
+        assert cache.get(cache.key(LABELS_QUERY, {**REPO, "name": "x"})) == RESULT
+
+    def test_write_evicts_tagged_entries(self, memory_cache):
+        """Test invalidating a repository's data type drops its entries."""
+        cache = GraphQLResponseCache()
+        key = cache.key(LABELS_QUERY, REPO)
+
+        with get_cache_index().scope(CacheTag("owner/repo", "labels")):
+            cache.set(key, RESULT)
+
+        assert invalidate_cache("owner/repo", ["issues"]) == 0
+        assert cache.get(key) == RESULT
+        assert invalidate_cache("owner/repo", ["labels"]) == 1
+        assert cache.get(key) is None
+
+    def test_prefetched_pages_keep_the_tag(self, client):
+        """Test pages fetched ahead on prefetch threads are tagged too."""
+        graphql_client, gql_client = client
+        pages = [
+            {
+                "repository": {
+                    "labels": {
+                        "nodes": [
+                            {
+                                "id": str(page),
+                                "name": str(page),
+                                "color": "fff",
+                                "description": "",
+                            }
+                        ],
+                        "pageInfo": {"hasNextPage": page < 2, "endCursor": str(page)},
+                    }
+                }
+            }
+            for page in range(3)
+        ]
+        gql_client.execute.side_effect = pages
+
+        with get_cache_index().scope(CacheTag("owner/repo", "labels")):
+            graphql_client.get_repository_labels("owner/repo")
+
+        assert invalidate_cache("owner/repo", ["labels"]) == 3
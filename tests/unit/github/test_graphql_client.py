@@ -0,0 +1,249 @@
+"""Tests for GitHubGraphQLClient."""
+
+import threading
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from github_data.github.graphql_client import GitHubGraphQLClient
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+SINCE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class TestGitHubGraphQLClientThreading:
+    """Each thread must execute queries on its own gql Client."""
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_reuses_client_within_a_thread(self, mock_client_class):
+        """Test repeated access on one thread returns the same client."""
+        client = GitHubGraphQLClient("token")
+
+        assert client._gql_client is client._gql_client
+        assert mock_client_class.call_count == 1
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_creates_separate_client_per_thread(self, mock_client_class):
+        """Test a second thread gets its own client."""
+        first, second = MagicMock(), MagicMock()
+        mock_client_class.side_effect = [first, second]
+        client = GitHubGraphQLClient("token")
+
+        assert client._gql_client is first
+
+        seen = []
+        worker = threading.Thread(target=lambda: seen.append(client._gql_client))
+        worker.start()
+        worker.join()
+
+        assert seen == [second]
+
+
+def _pull_requests_page(updated_at, has_next_page):
+    return {
+        "repository": {
+            "pullRequests": {
+                "nodes": [
+                    {"number": number, "updatedAt": timestamp}
+                    for number, timestamp in updated_at
+                ],
+                "pageInfo": {"hasNextPage": has_next_page, "endCursor": "c"},
+            }
+        }
+    }
+
+
+class TestGitHubGraphQLClientUpdatedSince:
+    """Incremental reads fetch only what changed since a watermark."""
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_issues_are_filtered_by_since(self, mock_client_class):
+        """Test issue reads pass since to GitHub's issue filter."""
+        client = GitHubGraphQLClient("token")
+        client.execute = MagicMock(
+            return_value={
+                "repository": {
+                    "issues": {
+                        "nodes": [],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    }
+                }
+            }
+        )
+
+        list(client.iter_repository_issues("owner/repo", since=SINCE))
+
+        variables = client.execute.call_args.kwargs["variable_values"]
+        assert variables["since"] == "2026-01-01T00:00:00+00:00"
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_pull_requests_stop_at_first_older_one(self, mock_client_class):
+        """Test pull requests are read newest first until one predates since."""
+        client = GitHubGraphQLClient("token")
+        client.execute = MagicMock(
+            side_effect=[
+                _pull_requests_page(
+                    [(4, "2026-01-03T00:00:00Z"), (3, "2026-01-02T00:00:00Z")], True
+                ),
+                _pull_requests_page(
+                    [(2, "2026-01-01T00:00:00Z"), (1, "2025-12-31T00:00:00Z")], True
+                ),
+                _pull_requests_page([(0, "2025-12-30T00:00:00Z")], False),
+            ]
+        )
+
+        with patch(
+            "github_data.github.graphql_client."
+            "convert_graphql_pull_requests_to_rest_format",
+            side_effect=lambda nodes, repo_name: nodes,
+        ):
+            pull_requests = list(
+                client.iter_repository_pull_requests("owner/repo", since=SINCE)
+            )
+
+        assert [pr["number"] for pr in pull_requests] == [4, 3, 2]
+        variables = client.execute.call_args_list[0].kwargs["variable_values"]
+        assert variables["orderBy"] == {"field": "UPDATED_AT", "direction": "DESC"}
+
+
+def _release(tag_name, tag_commit, assets):
+    return {
+        "id": f"RE_{tag_name}",
+        "databaseId": len(tag_name),
+        "name": tag_name,
+        "tagName": tag_name,
+        "tagCommit": tag_commit,
+        "description": "notes",
+        "isDraft": tag_commit is None,
+        "immutable": False,
+        "isPrerelease": False,
+        "createdAt": "2026-01-01T00:00:00Z",
+        "publishedAt": None,
+        "url": f"https://github.com/owner/repo/releases/tag/{tag_name}",
+        "author": None,
+        "releaseAssets": {
+            "nodes": assets,
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+        },
+    }
+
+
+class TestGitHubGraphQLClientReleases:
+    """Releases are read by GraphQL pagination with their assets inline."""
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_releases_are_converted_with_assets(self, mock_client_class):
+        """Test releases and their assets arrive in REST shape."""
+        asset = {
+            "id": "RA_1",
+            "databaseId": 501,
+            "name": "app.tar.gz",
+            "contentType": "application/gzip",
+            "size": 42,
+            "downloadCount": 7,
+            "downloadUrl": "https://example.com/app.tar.gz",
+            "createdAt": "2026-01-01T00:00:00Z",
+            "updatedAt": "2026-01-01T00:00:00Z",
+            "uploadedBy": {"login": "alice", "id": "U_1"},
+        }
+        client = GitHubGraphQLClient("token")
+        client.execute = MagicMock(
+            side_effect=[
+                {
+                    "repository": {
+                        "releases": {
+                            "nodes": [_release("v1.0", {"oid": "abc123"}, [asset])],
+                            "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        }
+                    }
+                },
+                {"repository": {"defaultBranchRef": {"name": "main"}}},
+            ]
+        )
+
+        releases = client.get_repository_releases("owner/repo")
+
+        variables = client.execute.call_args_list[0].kwargs["variable_values"]
+        assert variables["first"] == 100
+        assert releases[0]["id"] == 4
+        assert releases[0]["tag_name"] == "v1.0"
+        assert releases[0]["author"]["login"] == "ghost"
+        assert releases[0]["assets"][0]["id"] == 501
+        assert releases[0]["assets"][0]["browser_download_url"] == (
+            "https://example.com/app.tar.gz"
+        )
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_releases_target_default_branch_like_rest(self, mock_client_class):
+        """Test releases target the branch and keep their tag's commit apart.
+
+        Restores create a missing tag at the commit, or on the branch when
+        restored without the Git repository.
+        """
+        client = GitHubGraphQLClient("token")
+        client.execute = MagicMock(
+            side_effect=[
+                {
+                    "repository": {
+                        "releases": {
+                            "nodes": [
+                                _release("v1.0", {"oid": "abc123"}, []),
+                                _release("v1.1", {"oid": "def456"}, []),
+                            ],
+                            "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        }
+                    }
+                },
+                {"repository": {"defaultBranchRef": {"name": "main"}}},
+            ]
+        )
+
+        releases = client.get_repository_releases("owner/repo")
+
+        assert [r["target_commitish"] for r in releases] == ["main", "main"]
+        assert [r["tag_commit_sha"] for r in releases] == ["abc123", "def456"]
+        assert client.execute.call_count == 2
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_no_releases_skip_default_branch_lookup(self, mock_client_class):
+        """Test the default branch is only looked up when there are releases."""
+        client = GitHubGraphQLClient("token")
+        client.execute = MagicMock(
+            return_value={
+                "repository": {
+                    "releases": {
+                        "nodes": [],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    }
+                }
+            }
+        )
+
+        assert client.get_repository_releases("owner/repo") == []
+        assert client.execute.call_count == 1
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_untagged_drafts_target_default_branch(self, mock_client_class):
+        """Test drafts without a tag commit target the default branch."""
+        client = GitHubGraphQLClient("token")
+        client.execute = MagicMock(
+            side_effect=[
+                {
+                    "repository": {
+                        "releases": {
+                            "nodes": [_release("v2.0", None, [])],
+                            "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        }
+                    }
+                },
+                {"repository": {"defaultBranchRef": {"name": "main"}}},
+            ]
+        )
+
+        releases = client.get_repository_releases("owner/repo")
+
+        assert releases[0]["target_commitish"] == "main"
+        assert releases[0]["tag_commit_sha"] is None
+        assert releases[0]["draft"] is True
@@ -0,0 +1,102 @@
+"""Tests for the shared keep-alive connection pool."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from unittest.mock import patch
+
+from github_data.github.graphql_client import GitHubGraphQLClient
+from github_data.github.http_pool import PooledRequestsHTTPTransport, SharedHTTPPool
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"data": {}}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    """Serve keep-alive HTTP on localhost."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+class TestSharedHTTPPool:
+    """Test connection reuse across transport sessions and threads."""
+
+    def test_rejects_empty_pool(self):
+        """Test a pool must hold at least one connection."""
+        with pytest.raises(ValueError, match="at least 1"):
+            SharedHTTPPool(0)
+
+    def test_connection_survives_transport_close(self, server_url):
+        """Test reconnecting a transport reuses the pooled connection."""
+        pool = SharedHTTPPool(2)
+        transport = PooledRequestsHTTPTransport(pool, url=server_url)
+
+        for _ in range(3):
+            transport.connect()
+            transport.session.get(server_url).raise_for_status()
+            transport.close()
+
+        assert pool.stats() == {
+            "hosts": 1,
+            "connections_opened": 1,
+            "requests": 3,
+        }
+
+    def test_threads_share_connections(self, server_url):
+        """Test transports on different threads draw from one pool."""
+        pool = SharedHTTPPool(1)
+
+        def fetch():
+            transport = PooledRequestsHTTPTransport(pool, url=server_url)
+            transport.connect()
+            transport.session.get(server_url).raise_for_status()
+            transport.close()
+
+        workers = [threading.Thread(target=fetch) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        stats = pool.stats()
+        assert stats["requests"] == 4
+        assert stats["connections_opened"] == 1
+
+
+class TestGraphQLClientHTTPPool:
+    """Test the GraphQL client sends every thread through one pool."""
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_per_thread_transports_share_pool(self, mock_client_class):
+        """Test each thread's transport uses the client's shared pool."""
+        pool = SharedHTTPPool()
+        client = GitHubGraphQLClient("token", http_pool=pool)
+
+        worker = threading.Thread(target=lambda: client._gql_client)
+        worker.start()
+        worker.join()
+
+        transports = [c.kwargs["transport"] for c in mock_client_class.call_args_list]
+        assert len(transports) == 2
+        assert all(t._http_pool is pool for t in transports)
+        assert client.get_http_pool_stats()["requests"] == 0
@@ -0,0 +1,160 @@
+"""Tests for alias-batched GraphQL mutations."""
+
+import pytest
+from unittest.mock import Mock, patch
+from gql.transport.exceptions import TransportQueryError
+
+from github_data.github.graphql_client import GitHubGraphQLClient
+from github_data.github.utils.mutation_batcher import (
+    AliasedMutation,
+    MutationBatcher,
+    MutationError,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast, pytest.mark.github_api]
+
+ADD_COMMENT = AliasedMutation(
+    field="addComment", input_type="AddCommentInput!", selection="subject { id }"
+)
+
+
+class TestMutationBatcher:
+    """Test packing mutations into aliased documents."""
+
+    def test_rejects_non_positive_batch_size(self):
+        """Test batch_size must be at least 1."""
+        with pytest.raises(ValueError, match="batch_size"):
+            MutationBatcher(Mock(), batch_size=0)
+
+    def test_splits_inputs_into_batches_in_order(self):
+        """Test each request carries at most batch_size aliased mutations."""
+        client = Mock()
+        client.execute.side_effect = [
+            {"item0": {"n": 1}, "item1": {"n": 2}},
+            {"item0": {"n": 3}},
+        ]
+        inputs = [{"body": str(n)} for n in (1, 2, 3)]
+
+        results = MutationBatcher(client, batch_size=2).execute(ADD_COMMENT, inputs)
+
+        assert results == [{"n": 1}, {"n": 2}, {"n": 3}]
+        assert client.execute.call_count == 2
+        document = client.execute.call_args_list[0][0][0]
+        source = document.document.loc.source.body
+        assert source.startswith("mutation batchedAddComment(")
+        assert "item1: addComment(input: $input1)" in source
+        assert client.execute.call_args_list[1][1]["variable_values"] == {
+            "input0": {"body": "3"}
+        }
+
+    def test_failed_alias_does_not_fail_the_batch(self):
+        """Test per-alias errors become results while the rest succeed."""
+        client = Mock()
+        client.execute.side_effect = TransportQueryError(
+            "partial",
+            errors=[{"message": "Could not resolve", "path": ["item1"]}],
+            data={"item0": {"n": 1}, "item1": None},
+        )
+
+        results = MutationBatcher(client).execute(
+            ADD_COMMENT, [{"body": "a"}, {"body": "b"}]
+        )
+
+        assert results[0] == {"n": 1}
+        assert isinstance(results[1], MutationError)
+        assert "Could not resolve" in str(results[1])
+        assert results[1].input_data == {"body": "b"}
+
+    def test_errors_without_alias_fail_the_request(self):
+        """Test document-wide errors are raised."""
+        client = Mock()
+        client.execute.side_effect = TransportQueryError(
+            "denied", errors=[{"message": "Bad credentials"}], data=None
+        )
+
+        with pytest.raises(TransportQueryError):
+            MutationBatcher(client).execute(ADD_COMMENT, [{"body": "a"}])
+
+
+class TestGraphQLClientBatchedMutations:
+    """Test client write methods built on batched mutations."""
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_add_sub_issues_batch_resolves_numbers_once(self, mock_client_class):
+        """Test issue numbers resolve in one lookup and links in one mutation."""
+        gql_client = Mock()
+        mock_client_class.return_value = gql_client
+        gql_client.execute.side_effect = [
+            {
+                "repository": {
+                    "item0": {"id": "I_1"},
+                    "item1": {"id": "I_2"},
+                    "item2": {"id": "I_3"},
+                    "item3": None,
+                }
+            },
+            {
+                "item0": {"issue": {"number": 1}, "subIssue": {"number": 2}},
+                "item1": {"issue": {"number": 1}, "subIssue": {"number": 3}},
+            },
+        ]
+        client = GitHubGraphQLClient("token")
+
+        results = client.add_sub_issues_batch("owner/repo", [(1, 2), (1, 3), (1, 99)])
+
+        assert gql_client.execute.call_count == 2
+        variables = gql_client.execute.call_args_list[1][1]["variable_values"]
+        assert variables == {
+            "input0": {"issueId": "I_1", "subIssueId": "I_2"},
+            "input1": {"issueId": "I_1", "subIssueId": "I_3"},
+        }
+        assert results[:2] == [
+            {"parent_issue_number": 1, "sub_issue_number": 2},
+            {"parent_issue_number": 1, "sub_issue_number": 3},
+        ]
+        assert isinstance(results[2], MutationError)
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_unresolved_number_fails_only_its_own_comment(self, mock_client_class):
+        """Test a number GitHub cannot resolve fails only the comments on it."""
+        gql_client = Mock()
+        mock_client_class.return_value = gql_client
+        gql_client.execute.side_effect = [
+            TransportQueryError(
+                "partial",
+                errors=[
+                    {
+                        "type": "NOT_FOUND",
+                        "message": "Could not resolve to an issue or pull request",
+                        "path": ["repository", "item1"],
+                    }
+                ],
+                data={"repository": {"item0": {"id": "I_1"}, "item1": None}},
+            ),
+            {
+                "item0": {
+                    "commentEdge": {
+                        "node": {
+                            "id": "IC_1",
+                            "databaseId": 11,
+                            "body": "hello",
+                            "url": "https://github.com/owner/repo/issues/1#c",
+                            "createdAt": "2026-01-01T00:00:00Z",
+                            "updatedAt": "2026-01-01T00:00:00Z",
+                            "author": None,
+                        }
+                    }
+                }
+            },
+        ]
+        client = GitHubGraphQLClient("token")
+
+        results = client.create_issue_comments_batch(
+            "owner/repo", [(1, "hello"), (99, "lost")]
+        )
+
+        variables = gql_client.execute.call_args_list[1][1]["variable_values"]
+        assert variables == {"input0": {"subjectId": "I_1", "body": "hello"}}
+        assert results[0]["body"] == "hello"
+        assert isinstance(results[1], MutationError)
+        assert "not found" in str(results[1])
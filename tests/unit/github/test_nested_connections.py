@@ -0,0 +1,149 @@
+"""Tests for follow-up pagination of nested GraphQL connections."""
+
+import pytest
+from unittest.mock import Mock
+
+from github_data.github.utils.nested_connections import (
+    NestedConnection,
+    NestedConnectionResolver,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast, pytest.mark.github_api]
+
+COMMENTS = NestedConnection(
+    field="comments", parent_type="Issue", node_fields="id body"
+)
+
+
+def _connection(ids, end_cursor=None):
+    """Build a connection payload; a cursor means more pages follow."""
+    return {
+        "nodes": [{"id": i} for i in ids],
+        "pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor},
+    }
+
+
+class TestNestedConnectionResolver:
+    """Test completion of truncated inner connections."""
+
+    def test_complete_connections_are_left_alone(self):
+        """Test no follow-up query is made when nothing was truncated."""
+        client = Mock()
+        nodes = [{"id": "I1", "comments": _connection(["c1"])}]
+
+        NestedConnectionResolver(client).resolve(nodes, [COMMENTS])
+
+        client.execute.assert_not_called()
+        assert nodes[0]["comments"]["nodes"] == [{"id": "c1"}]
+
+    def test_truncated_parents_are_batched_into_one_query(self):
+        """Test several truncated parents are completed by a single request."""
+        client = Mock()
+        client.execute.return_value = {
+            "node0": {"comments": _connection(["a2"])},
+            "node1": {"comments": _connection(["b2"])},
+        }
+        nodes = [
+            {"id": "I1", "comments": _connection(["a1"], "ca")},
+            {"id": "I2", "comments": _connection(["x1"])},
+            {"id": "I3", "comments": _connection(["b1"], "cb")},
+        ]
+
+        NestedConnectionResolver(client).resolve(nodes, [COMMENTS])
+
+        assert client.execute.call_count == 1
+        variables = client.execute.call_args[1]["variable_values"]
+        assert variables["id0"] == "I1" and variables["after0"] == "ca"
+        assert variables["id1"] == "I3" and variables["after1"] == "cb"
+        assert [c["id"] for c in nodes[0]["comments"]["nodes"]] == ["a1", "a2"]
+        assert [c["id"] for c in nodes[2]["comments"]["nodes"]] == ["b1", "b2"]
+
+    def test_follows_pages_until_exhausted_and_respects_batch_size(self):
+        """Test parents are re-queued while pages remain, batch_size at a time."""
+        client = Mock()
+        client.execute.side_effect = [
+            {"node0": {"comments": _connection(["a2"], "ca2")}},
+            {"node0": {"comments": _connection(["b2"])}},
+            {"node0": {"comments": _connection(["a3"])}},
+        ]
+        nodes = [
+            {"id": "I1", "comments": _connection(["a1"], "ca")},
+            {"id": "I2", "comments": _connection(["b1"], "cb")},
+        ]
+
+        NestedConnectionResolver(client, batch_size=1).resolve(nodes, [COMMENTS])
+
+        assert client.execute.call_count == 3
+        assert [c["id"] for c in nodes[0]["comments"]["nodes"]] == ["a1", "a2", "a3"]
+        assert [c["id"] for c in nodes[1]["comments"]["nodes"]] == ["b1", "b2"]
+
+    def test_child_connections_are_completed_after_parents(self):
+        """Test nested children of fetched items are completed too."""
+        review_comments = NestedConnection(
+            field="comments", parent_type="PullRequestReview", node_fields="id"
+        )
+        reviews = NestedConnection(
+            field="reviews",
+            parent_type="PullRequest",
+            node_fields="id",
+            children=(review_comments,),
+        )
+        client = Mock()
+        client.execute.side_effect = [
+            {
+                "node0": {
+                    "reviews": {
+                        "nodes": [{"id": "R2", "comments": _connection(["x"], "cx")}],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    }
+                }
+            },
+            {"node0": {"comments": _connection(["y"])}},
+        ]
+        nodes = [
+            {
+                "id": "PR1",
+                "reviews": {
+                    "nodes": [{"id": "R1", "comments": _connection(["w"])}],
+                    "pageInfo": {"hasNextPage": True, "endCursor": "cr"},
+                },
+            }
+        ]
+
+        NestedConnectionResolver(client).resolve(nodes, [reviews])
+
+        second_review = nodes[0]["reviews"]["nodes"][1]
+        assert [c["id"] for c in second_review["comments"]["nodes"]] == ["x", "y"]
+        assert client.execute.call_args[1]["variable_values"]["id0"] == "R2"
+
+    def test_missing_parent_stops_following(self):
+        """Test a parent that no longer resolves keeps its existing items."""
+        client = Mock()
+        client.execute.return_value = {"node0": None}
+        nodes = [{"id": "I1", "comments": _connection(["a1"], "ca")}]
+
+        NestedConnectionResolver(client).resolve(nodes, [COMMENTS])
+
+        assert client.execute.call_count == 1
+        assert nodes[0]["comments"]["nodes"] == [{"id": "a1"}]
+
+    def test_connection_arguments_with_braces_are_kept(self):
+        """Test input-object arguments such as orderBy reach the follow-up query."""
+        ordered = NestedConnection(
+            field="comments",
+            parent_type="Issue",
+            node_fields="id",
+            arguments="orderBy: {field: UPDATED_AT, direction: ASC}",
+        )
+        client = Mock()
+        client.execute.return_value = {"node0": {"comments": _connection(["a2"])}}
+        nodes = [{"id": "I1", "comments": _connection(["a1"], "ca")}]
+
+        NestedConnectionResolver(client).resolve(nodes, [ordered])
+
+        source = client.execute.call_args[0][0].document.loc.source.body
+        assert (
+            "comments(first: $first, after: $after0, "
+            "orderBy: {field: UPDATED_AT, direction: ASC})" in source
+        )
+        assert [c["id"] for c in nodes[0]["comments"]["nodes"]] == ["a1", "a2"]
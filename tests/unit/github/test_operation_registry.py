@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import Mock, patch
+from github_data.github.cache import CacheTag
 from github_data.github.operation_registry import (
     ValidationError,
     Operation,
@@ -257,3 +258,27 @@ def test_write_operations_auto_detected():
 
         # Read operation should cache
         assert registry.get_operation("get_repository_releases").should_cache() is True
+
+
+def test_operation_cache_tag_from_template():
+    """A cache_key_template names the data type the operation touches."""
+    spec = {
+        "boundary_method": "get_all_issue_comments",
+        "cache_key_template": "all_comments:{repo_name}",
+    }
+    operation = Operation("get_all_issue_comments", "comments", spec)
+
+    tag = operation.get_cache_tag(repo_name="owner/repo")
+
+    assert tag == CacheTag(repo_name="owner/repo", data_type="all_comments")
+
+
+def test_operation_cache_tag_defaults_to_entity():
+    """Without a template, the entity name is the data type."""
+    spec = {"boundary_method": "create_release"}
+    operation = Operation("create_release", "releases", spec)
+
+    assert operation.get_cache_tag(repo_name="owner/repo", tag_name="v1") == (
+        CacheTag(repo_name="owner/repo", data_type="releases")
+    )
+    assert operation.get_cache_tag(tag_name="v1") is None
@@ -0,0 +1,133 @@
+"""Tests for the bundled schema and the validated query cache."""
+
+import pytest
+from gql import gql
+from graphql import GraphQLError
+from unittest.mock import Mock, patch
+
+from github_data.github import graphql_client
+from github_data.github.graphql_client import GitHubGraphQLClient
+from github_data.github.queries import milestones, pr_reviews, pull_requests
+from github_data.github.queries import comments, issues, sub_issues
+from github_data.github.utils import query_cache
+from github_data.github.utils.alias_batcher import _build_aliased_query
+from github_data.github.utils.nested_connections import _build_follow_up_query
+from github_data.github.utils.query_cache import (
+    compile_query,
+    schema_version,
+    validate_query,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast, pytest.mark.github_api]
+
+SENT_QUERIES = [
+    graphql_client.REPOSITORY_LABELS_QUERY,
+    graphql_client.REPOSITORY_ISSUES_QUERY,
+    graphql_client.REPOSITORY_COMMENTS_QUERY,
+    graphql_client.REPOSITORY_PULL_REQUESTS_QUERY,
+    graphql_client.REPOSITORY_PR_COMMENTS_QUERY,
+    graphql_client.REPOSITORY_SUB_ISSUES_QUERY,
+    graphql_client.RATE_LIMIT_QUERY,
+    graphql_client.REPOSITORY_PR_REVIEWS_QUERY,
+    graphql_client.REPOSITORY_REVIEW_COMMENTS_QUERY,
+    compile_query(milestones.REPOSITORY_MILESTONES_QUERY),
+]
+
+LOOKUPS = [
+    pull_requests.PULL_REQUEST_COMMENTS_LOOKUP,
+    pr_reviews.PULL_REQUEST_REVIEWS_LOOKUP,
+    sub_issues.ISSUE_SUB_ISSUES_LOOKUP,
+]
+
+CONNECTIONS = [
+    comments.ISSUE_COMMENTS_CONNECTION,
+    issues.ISSUE_LABELS_CONNECTION,
+    pull_requests.PULL_REQUEST_ASSIGNEES_CONNECTION,
+    pull_requests.PULL_REQUEST_COMMENTS_CONNECTION,
+    pull_requests.PULL_REQUEST_LABELS_CONNECTION,
+    pr_reviews.REVIEW_COMMENTS_CONNECTION,
+    pr_reviews.PULL_REQUEST_REVIEWS_CONNECTION,
+    pr_reviews.PULL_REQUEST_REVIEW_IDS_CONNECTION,
+    sub_issues.SUB_ISSUES_CONNECTION,
+    sub_issues.ISSUE_SUB_ISSUE_DETAILS_CONNECTION,
+]
+
+
+class TestBundledSchema:
+    """Test the shipped schema covers every query the client sends."""
+
+    def test_schema_is_versioned(self):
+        """Test the snapshot records the version it was taken at."""
+        assert schema_version() != "unknown"
+
+    @pytest.mark.parametrize("query", SENT_QUERIES)
+    def test_repository_queries_validate(self, query):
+        """Test paginated repository queries match the schema."""
+        validate_query(query)
+
+    @pytest.mark.parametrize("lookup", LOOKUPS)
+    def test_batched_lookups_validate(self, lookup):
+        """Test aliased per-item lookups match the schema."""
+        validate_query(_build_aliased_query(lookup, 2))
+
+    @pytest.mark.parametrize("connection", CONNECTIONS)
+    def test_nested_follow_ups_validate(self, connection):
+        """Test nested-connection follow-up queries match the schema."""
+        validate_query(_build_follow_up_query(connection, 2))
+
+
+class TestQueryCache:
+    """Test queries are parsed and validated once."""
+
+    def test_compile_query_parses_once(self):
+        """Test the same source returns the same parsed request."""
+        source = "query cached { rateLimit { cost } }"
+        assert compile_query(source) is compile_query(source)
+
+    def test_invalid_query_raises(self):
+        """Test a query selecting an unknown field is rejected."""
+        with pytest.raises(GraphQLError, match="Cannot query field 'nope'"):
+            validate_query(gql("{ rateLimit { nope } }"))
+
+    def test_validates_each_document_once(self):
+        """Test a validated document is not checked again."""
+        query = gql("query once { rateLimit { cost } }")
+
+        with patch.object(query_cache, "validate", return_value=[]) as validate:
+            validate_query(query)
+            validate_query(query)
+
+        assert validate.call_count == 1
+
+
+class TestGraphQLClientSchema:
+    """Test the client uses the bundled schema instead of downloading it."""
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_does_not_fetch_schema(self, mock_client_class):
+        """Test clients are created without schema introspection."""
+        GitHubGraphQLClient("token")
+
+        assert "fetch_schema_from_transport" not in mock_client_class.call_args[1]
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_rejects_invalid_query_before_sending(self, mock_client_class):
+        """Test an invalid query never reaches the transport."""
+        gql_client = mock_client_class.return_value = Mock()
+        client = GitHubGraphQLClient("token")
+
+        with pytest.raises(GraphQLError):
+            client.execute(gql("{ viewer { login } }"))
+
+        gql_client.execute.assert_not_called()
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_validation_can_be_disabled(self, mock_client_class):
+        """Test validate_queries=False sends queries unchecked."""
+        gql_client = mock_client_class.return_value = Mock()
+        gql_client.execute.return_value = {}
+        client = GitHubGraphQLClient("token", validate_queries=False)
+
+        client.execute(gql("{ viewer { login } }"))
+
+        gql_client.execute.assert_called_once()
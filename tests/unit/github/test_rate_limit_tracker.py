@@ -0,0 +1,67 @@
+"""Tests for passive rate-limit tracking."""
+
+import pytest
+from unittest.mock import Mock
+
+from github_data.github.rate_limit_tracker import RateLimitTracker
+from github_data.github.utils.graphql_budget import GraphQLBudgetTracker
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast, pytest.mark.rate_limiting]
+
+
+def _github_client(rate_limiting, resettime=0):
+    client = Mock()
+    client.requester.rate_limiting = rate_limiting
+    client.requester.rate_limiting_resettime = resettime
+    return client
+
+
+class TestRateLimitTracker:
+    """Test rate-limit state recorded from responses."""
+
+    def test_records_rest_headers_without_requests(self):
+        """Test the last response's headers are read, not the API."""
+        client = _github_client((4321, 5000), resettime=1704070800)
+        tracker = RateLimitTracker()
+
+        tracker.record_rest_headers(client)
+
+        state = tracker.get("core")
+        assert (state.remaining, state.limit, state.reset_at) == (
+            4321,
+            5000,
+            1704070800.0,
+        )
+        client.get_rate_limit.assert_not_called()
+
+    def test_no_response_seen_yet_records_nothing(self):
+        """Test PyGithub's placeholder before any response is ignored."""
+        tracker = RateLimitTracker()
+
+        tracker.record_rest_headers(_github_client((-1, -1)))
+        tracker.record_rest_headers(Mock())
+
+        assert tracker.get("core") is None
+
+    def test_update_keeps_known_limit(self):
+        """Test a response without a limit keeps the one seen before."""
+        tracker = RateLimitTracker()
+
+        tracker.update("graphql", 4000, limit=5000)
+        tracker.update("graphql", 3990)
+
+        assert tracker.snapshot()["graphql"].limit == 5000
+
+    def test_graphql_budget_feeds_shared_tracker(self):
+        """Test in-query GraphQL rateLimit data reaches the shared tracker."""
+        tracker = RateLimitTracker()
+        budget = GraphQLBudgetTracker(rate_limits=tracker)
+
+        budget.record(
+            {"cost": 1, "remaining": 4200, "resetAt": "2024-01-01T01:00:00Z"},
+            "getRepositoryIssues",
+        )
+
+        state = tracker.get("graphql")
+        assert state.remaining == 4200
+        assert state.reset_at == 1704070800.0
@@ -0,0 +1,172 @@
+"""Tests for coalescing single-item lookups into batch lookups."""
+
+import threading
+from concurrent.futures import Future
+from unittest.mock import Mock
+
+import pytest
+
+from gql.transport.exceptions import TransportQueryError, TransportServerError
+
+from github_data.github.service import GitHubService
+from github_data.github.utils.alias_batcher import is_item_error
+from github_data.github.utils.request_coalescer import RequestCoalescer
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+class TestRequestCoalescer:
+    """Test single-item loads share batch fetches."""
+
+    def test_rejects_non_positive_batch_size(self):
+        """Test max_batch_size must be at least 1."""
+        with pytest.raises(ValueError, match="max_batch_size"):
+            RequestCoalescer(Mock(), max_batch_size=0)
+
+    def test_lone_load_is_fetched_immediately(self):
+        """Test a single caller gets its own batch without waiting."""
+        fetch_batch = Mock(side_effect=lambda keys: {key: key * 10 for key in keys})
+        coalescer = RequestCoalescer(fetch_batch, max_batch_size=100)
+
+        assert coalescer.load(1) == 10
+        assert coalescer.load(2) == 20
+        assert [call.args[0] for call in fetch_batch.call_args_list] == [[1], [2]]
+
+    def test_loads_waiting_on_a_batch_share_the_next_one(self):
+        """Test keys requested while a batch is in flight are fetched together."""
+        in_flight = threading.Event()
+        release = threading.Event()
+        batches = []
+
+        def fetch_batch(keys):
+            batches.append(keys)
+            if len(batches) == 1:
+                in_flight.set()
+                release.wait(5)
+            return {key: key * 10 for key in keys}
+
+        coalescer = RequestCoalescer(fetch_batch, max_batch_size=100)
+        results = {}
+
+        def load(key):
+            results[key] = coalescer.load(key)
+
+        first = threading.Thread(target=load, args=(0,))
+        first.start()
+        in_flight.wait(5)
+        waiting = [threading.Thread(target=load, args=(key,)) for key in (1, 2, 3)]
+        for thread in waiting:
+            thread.start()
+        while len(coalescer._pending) < 3:
+            threading.Event().wait(0.001)
+        release.set()
+        for thread in [first, *waiting]:
+            thread.join(5)
+
+        assert batches[0] == [0]
+        assert sorted(batches[1]) == [1, 2, 3]
+        assert len(batches) == 2
+        assert results == {0: 0, 1: 10, 2: 20, 3: 30}
+
+    def test_batch_errors_reach_every_caller(self):
+        """Test a failed fetch is raised to the callers of its keys."""
+        coalescer = RequestCoalescer(
+            Mock(side_effect=RuntimeError("boom")), max_batch_size=100
+        )
+
+        with pytest.raises(RuntimeError, match="boom"):
+            coalescer.load(1)
+
+    def test_failing_key_fails_only_its_own_load(self):
+        """Test a batch failing because of one key is split to serve the rest."""
+
+        def fetch_batch(keys):
+            if 3 in keys:
+                raise RuntimeError("bad key")
+            return {key: key * 10 for key in keys}
+
+        coalescer = RequestCoalescer(
+            fetch_batch,
+            max_batch_size=100,
+            is_item_error=lambda e: str(e) == "bad key",
+        )
+        futures = {}
+        for key in (1, 2, 3, 4, 5):
+            futures[key] = coalescer._pending[key] = Future()
+
+        coalescer._dispatch(coalescer._take_batch())
+
+        assert {key: futures[key].result() for key in (1, 2, 4, 5)} == {
+            1: 10,
+            2: 20,
+            4: 40,
+            5: 50,
+        }
+        with pytest.raises(RuntimeError, match="bad key"):
+            futures[3].result()
+
+    def test_request_failure_fails_every_load_without_splitting(self):
+        """Test an error not caused by a key is not retried in halves."""
+        error = ConnectionError("unreachable")
+        fetch_batch = Mock(side_effect=error)
+        coalescer = RequestCoalescer(
+            fetch_batch, max_batch_size=100, is_item_error=lambda e: False
+        )
+        futures = {}
+        for key in range(100):
+            futures[key] = coalescer._pending[key] = Future()
+
+        coalescer._dispatch(coalescer._take_batch())
+
+        assert fetch_batch.call_count == 1
+        assert all(future.exception() is error for future in futures.values())
+
+    def test_item_graphql_errors_are_split_and_transport_errors_are_not(self):
+        """Test only GraphQL errors naming item aliases split a batch."""
+        assert is_item_error(
+            TransportQueryError("bad", errors=[{"path": ["repository", "item3"]}])
+        )
+        assert not is_item_error(
+            TransportQueryError("bad", errors=[{"message": "Something went wrong"}])
+        )
+        assert not is_item_error(TransportServerError("bad gateway", 502))
+
+    def test_missing_key_raises_key_error(self):
+        """Test a batch result lacking a key fails that key's load."""
+        coalescer = RequestCoalescer(Mock(return_value={}), max_batch_size=100)
+
+        with pytest.raises(KeyError):
+            coalescer.load(1)
+
+
+class TestGitHubServiceCoalescedLookups:
+    """Test single-item service lookups are served by batch lookups."""
+
+    def setup_method(self):
+        """Set up service over a mock boundary."""
+        self.boundary = Mock()
+        rate_limiter = Mock()
+        rate_limiter.execute_with_retry.side_effect = lambda op, _: op()
+        self.service = GitHubService(
+            boundary=self.boundary, rate_limiter=rate_limiter, caching_enabled=False
+        )
+
+    def test_get_issue_parent_uses_graphql_batch(self):
+        """Test parent lookups go through the batched GraphQL lookup."""
+        parent = {"number": 1}
+        self.boundary.get_issue_parents_graphql_batch.return_value = {2: parent}
+
+        assert self.service.get_issue_parent("owner/repo", 2) == parent
+        self.boundary.get_issue_parents_graphql_batch.assert_called_once_with(
+            "owner/repo", [2]
+        )
+        self.boundary.get_issue_parent.assert_not_called()
+
+    def test_get_issue_sub_issues_uses_graphql_batch(self):
+        """Test sub-issue lookups go through the batched GraphQL lookup."""
+        self.boundary.get_issue_sub_issues_graphql_batch.return_value = {5: []}
+
+        assert self.service.get_issue_sub_issues("owner/repo", 5) == []
+        self.boundary.get_issue_sub_issues_graphql_batch.assert_called_once_with(
+            "owner/repo", [5]
+        )
@@ -0,0 +1,133 @@
+"""Tests for GitHub REST API client write operations."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests_cache
+from github import Auth, Github
+from unittest.mock import Mock
+
+from github_data.github.cache import CacheConfig, setup_global_cache
+from github_data.github.restapi_client import GitHubRestApiClient
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast, pytest.mark.github_api]
+
+
+class TestGitHubRestApiClientWrites:
+    """Writes go straight to their endpoint without fetching the object."""
+
+    def setup_method(self):
+        """Set up client over a mock Github instance."""
+        self.github = Mock()
+        self.requester = self.github.requester
+        self.requester.requestJsonAndCheck.return_value = ({}, {"id": 1})
+        self.client = GitHubRestApiClient("token", github_instance=self.github)
+
+    def test_create_issue_comment_posts_directly(self):
+        """Test an issue comment is a single POST."""
+        result = self.client.create_issue_comment("owner/repo", 7, "hello")
+
+        assert result == {"id": 1}
+        self.requester.requestJsonAndCheck.assert_called_once_with(
+            "POST", "/repos/owner/repo/issues/7/comments", input={"body": "hello"}
+        )
+        self.github.get_repo.assert_not_called()
+
+    def test_close_issue_sends_state_reason(self):
+        """Test closing an issue is a single PATCH."""
+        self.client.close_issue("owner/repo", 7, "not_planned")
+
+        self.requester.requestJsonAndCheck.assert_called_once_with(
+            "PATCH",
+            "/repos/owner/repo/issues/7",
+            input={"state": "closed", "state_reason": "not_planned"},
+        )
+
+    def test_create_issue_passes_milestone_number(self):
+        """Test the milestone is not looked up before creating the issue."""
+        self.client.create_issue("owner/repo", "Bug", "text", ["bug"], milestone=3)
+
+        self.requester.requestJsonAndCheck.assert_called_once_with(
+            "POST",
+            "/repos/owner/repo/issues",
+            input={"title": "Bug", "body": "text", "labels": ["bug"], "milestone": 3},
+        )
+        self.github.get_repo.assert_not_called()
+
+    def test_label_writes_quote_the_label_name(self):
+        """Test label names are escaped in the label URL."""
+        self.client.update_label("owner/repo", "needs info", "triage", "ff0000", "")
+        self.client.delete_label("owner/repo", "area/api")
+
+        calls = self.requester.requestJsonAndCheck.call_args_list
+        assert calls[0].args == ("PATCH", "/repos/owner/repo/labels/needs%20info")
+        assert calls[0].kwargs["input"] == {
+            "new_name": "triage",
+            "color": "ff0000",
+            "description": "",
+        }
+        assert calls[1].args == ("DELETE", "/repos/owner/repo/labels/area%2Fapi")
+
+    def test_create_pull_request_review_posts_event(self):
+        """Test a review is created without fetching the pull request."""
+        self.client.create_pull_request_review("owner/repo", 4, "LGTM", "APPROVE")
+
+        self.requester.requestJsonAndCheck.assert_called_once_with(
+            "POST",
+            "/repos/owner/repo/pulls/4/reviews",
+            input={"body": "LGTM", "event": "APPROVE"},
+        )
+
+
+class TestIssueImportStatusPolls:
+    """Import status polls always reach GitHub."""
+
+    def test_polls_bypass_global_http_cache(self):
+        """Test each poll sees the current status with the cache installed."""
+        statuses = iter(["pending", "pending", "imported", "imported"])
+
+        class StatusHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status = next(statuses)
+                single = self.path.startswith("/repos/owner/repo/import/issues/7")
+                body = {"id": 7, "status": status}
+                encoded = json.dumps(body if single else [body]).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        setup_global_cache(CacheConfig(backend="memory"))
+        github = Github(
+            auth=Auth.Token("token"),
+            base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            seconds_between_requests=None,
+        )
+        client = GitHubRestApiClient("token", github_instance=github)
+
+        try:
+            polls = [
+                client.get_issue_import("owner/repo", 7)["status"],
+                client.get_issue_imports("owner/repo", "2026-01-01T00:00:00Z")[0][
+                    "status"
+                ],
+                client.get_issue_import("owner/repo", 7)["status"],
+                client.get_issue_imports("owner/repo", "2026-01-01T00:00:00Z")[0][
+                    "status"
+                ],
+            ]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert polls == ["pending", "pending", "imported", "imported"]
+        assert len(requests_cache.get_cache().responses) == 0
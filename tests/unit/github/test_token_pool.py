@@ -0,0 +1,210 @@
+"""Tests for budget-aware rotation over several GitHub tokens."""
+
+import os
+import threading
+import time
+
+import pytest
+from gql import gql
+from unittest.mock import Mock, patch
+
+from github_data.github.graphql_client import GitHubGraphQLClient
+from github_data.github.token_pool import PooledTokenAuth, TokenPool
+from github_data.github.utils.graphql_budget import GraphQLBudgetTracker
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast, pytest.mark.rate_limiting]
+
+
+class TestTokenPool:
+    """Test token selection by remaining budget."""
+
+    def test_requires_a_token(self):
+        """Test an empty pool is rejected."""
+        with pytest.raises(ValueError, match="at least one token"):
+            TokenPool(["", ""])
+
+    def test_unknown_budgets_rotate(self):
+        """Test tokens without known state are used in turn."""
+        pool = TokenPool(["a", "b", "c", "a"])
+
+        assert [pool.acquire() for _ in range(4)] == ["a", "b", "c", "a"]
+
+    def test_picks_token_with_most_headroom(self):
+        """Test the token with the largest remaining budget wins."""
+        pool = TokenPool(["a", "b"])
+        reset_at = time.time() + 600
+        pool.tracker_for("a").update("core", 100, reset_at=reset_at)
+        pool.tracker_for("b").update("core", 4000, reset_at=reset_at)
+        pool.tracker_for("b").update("graphql", 10, reset_at=reset_at)
+        pool.tracker_for("a").update("graphql", 900, reset_at=reset_at)
+
+        assert pool.acquire("core") == "b"
+        assert pool.acquire("graphql") == "a"
+
+    def test_reset_window_counts_as_full_budget(self):
+        """Test a token whose window has passed is treated as refilled."""
+        pool = TokenPool(["a", "b"])
+        pool.tracker_for("a").update("core", 0, reset_at=time.time() - 1)
+        pool.tracker_for("b").update("core", 4000, reset_at=time.time() + 600)
+
+        assert pool.acquire() == "a"
+
+    def test_writing_pins_the_primary_token(self):
+        """Test writes on a thread use the first token whatever the budgets."""
+        pool = TokenPool(["a", "b"])
+        reset_at = time.time() + 600
+        pool.tracker_for("a").update("core", 10, reset_at=reset_at)
+        pool.tracker_for("b").update("core", 4000, reset_at=reset_at)
+
+        with pool.writing():
+            pinned = [pool.acquire() for _ in range(3)]
+            other_thread = []
+            thread = threading.Thread(
+                target=lambda: other_thread.append(pool.acquire())
+            )
+            thread.start()
+            thread.join()
+
+        assert pinned == ["a", "a", "a"]
+        assert other_thread == ["b"]
+        assert pool.acquire() == "b"
+
+    def test_from_environment_combines_sources(self, tmp_path):
+        """Test GITHUB_TOKEN, GITHUB_TOKENS and a token file are pooled."""
+        token_file = tmp_path / "tokens"
+        token_file.write_text("# backup tokens\nt3\n\nt4\n")
+        env = {
+            "GITHUB_TOKEN": "t1",
+            "GITHUB_TOKENS": "t2, t3",
+            "GITHUB_TOKENS_FILE": str(token_file),
+        }
+
+        with patch.dict(os.environ, env, clear=True):
+            pool = TokenPool.from_environment()
+
+        assert pool.tokens == ["t1", "t2", "t3", "t4"]
+
+    def test_from_environment_without_pool_settings(self):
+        """Test no pool is built when only GITHUB_TOKEN is set."""
+        with patch.dict(os.environ, {"GITHUB_TOKEN": "t1"}, clear=True):
+            assert TokenPool.from_environment() is None
+
+
+class TestPooledTokenAuth:
+    """Test PyGithub authentication drawing from the pool."""
+
+    def test_records_previous_response_for_its_token(self):
+        """Test headers of a response are credited to the token that sent it."""
+        pool = TokenPool(["a", "b"])
+        auth = PooledTokenAuth(pool)
+        requester = Mock(rate_limiting=(4000, 5000), rate_limiting_resettime=0)
+        auth._WithRequester__requester = requester  # set by Github() normally
+
+        first_headers, second_headers = {}, {}
+        auth.authentication(first_headers)
+        auth.authentication(second_headers)
+
+        assert first_headers["Authorization"] == "token a"
+        assert second_headers["Authorization"] == "token b"
+        assert pool.tracker_for("a").get("core").remaining == 4000
+        assert pool.tracker_for("b").get("core") is None
+
+    def test_overlapping_requests_are_not_credited(self):
+        """Test headers are dropped when another thread's request overlapped."""
+        pool = TokenPool(["a", "b"])
+        auth = PooledTokenAuth(pool)
+        requester = Mock(rate_limiting=(4000, 5000), rate_limiting_resettime=0)
+        auth._WithRequester__requester = requester
+        other_sent = threading.Event()
+        finish_other = threading.Event()
+
+        def other_thread_requests():
+            auth.authentication({})
+            other_sent.set()
+            finish_other.wait()
+
+        thread = threading.Thread(target=other_thread_requests)
+        thread.start()
+        other_sent.wait()
+        # Sent while the other thread's request may still be in flight
+        auth.authentication({})
+        auth.authentication({})
+        finish_other.set()
+        thread.join()
+
+        assert pool.tracker_for("a").get("core") is None
+        assert pool.tracker_for("b").get("core") is None
+
+        # Once the other thread has exited, requests no longer overlap
+        headers = {}
+        auth.authentication(headers)
+        auth.authentication({})
+
+        sent_with = headers["Authorization"].split()[-1]
+        assert pool.tracker_for(sent_with).get("core").remaining == 4000
+
+
+class TestPooledGraphQLClient:
+    """Test GraphQL queries spread over pooled tokens."""
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_queries_go_to_token_with_most_points(self, mock_client_class):
+        """Test each token gets its own client and its reported budget."""
+        clients = {}
+
+        def create_client(transport, **kwargs):
+            token = transport.headers["Authorization"].split()[-1]
+            client = clients[token] = Mock()
+            client.execute.return_value = {
+                "rateLimit": {
+                    "cost": 1,
+                    "remaining": 4000 if token == "a" else 100,
+                    "resetAt": "2999-01-01T00:00:00Z",
+                }
+            }
+            return client
+
+        mock_client_class.side_effect = create_client
+        pool = TokenPool(["a", "b"])
+        client = GitHubGraphQLClient(
+            "a", budget=GraphQLBudgetTracker(token_pool=pool), token_pool=pool
+        )
+
+        for _ in range(4):
+            client.execute("query")
+
+        # Both are tried once, then "a" keeps the most points
+        assert clients["a"].execute.call_count == 3
+        assert clients["b"].execute.call_count == 1
+        assert pool.tracker_for("b").get("graphql").remaining == 100
+
+    @patch("github_data.github.graphql_client.Client")
+    def test_mutations_go_to_primary_token(self, mock_client_class):
+        """Test mutations skip budget rotation and use the first token."""
+        clients = {}
+
+        def create_client(transport, **kwargs):
+            token = transport.headers["Authorization"].split()[-1]
+            client = clients[token] = Mock()
+            client.execute.return_value = {}
+            return client
+
+        mock_client_class.side_effect = create_client
+        pool = TokenPool(["a", "b"])
+        pool.tracker_for("a").update("graphql", 10, reset_at=time.time() + 600)
+        client = GitHubGraphQLClient(
+            "a",
+            budget=GraphQLBudgetTracker(token_pool=pool),
+            token_pool=pool,
+            validate_queries=False,
+        )
+        mutation = gql(
+            'mutation { addComment(input: {subjectId: "I_1", body: "x"}) '
+            "{ clientMutationId } }"
+        )
+
+        for _ in range(3):
+            client.execute(mutation)
+
+        assert list(clients) == ["a"]
+        assert clients["a"].execute.call_count == 3
@@ -0,0 +1,270 @@
+"""Tests for pacing of mutating GitHub API calls."""
+
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+from github.GithubException import GithubException, RateLimitExceededException
+from gql.transport.exceptions import TransportQueryError, TransportServerError
+
+from github_data.github.service import GitHubService
+from github_data.github.token_pool import TokenPool
+from github_data.github.write_scheduler import (
+    DEFAULT_PENALTY_SECONDS,
+    RECOVERY_WRITES,
+    WriteScheduler,
+    is_secondary_rate_limit,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast, pytest.mark.rate_limiting]
+
+
+def _secondary_limit(status=403, headers=None):
+    return RateLimitExceededException(
+        status,
+        {"message": "You have exceeded a secondary rate limit"},
+        headers if headers is not None else {"Retry-After": "30"},
+    )
+
+
+@pytest.fixture
+def mock_time():
+    """Freeze the scheduler's clock; sleeping advances it."""
+    with patch("github_data.github.write_scheduler.time") as mock_time:
+        now = [1000.0]
+        mock_time.monotonic.side_effect = lambda: now[0]
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        mock_time.sleep.side_effect = sleep
+        yield mock_time
+
+
+class TestSecondaryRateLimitDetection:
+    """Test telling secondary limits from other errors."""
+
+    def test_secondary_limit_responses(self):
+        """Test 429s and 403s with Retry-After count as secondary limits."""
+        assert is_secondary_rate_limit(GithubException(429, {}, {}))
+        assert is_secondary_rate_limit(_secondary_limit())
+        assert is_secondary_rate_limit(_secondary_limit(headers={}))
+
+    def test_primary_limit_and_other_errors(self):
+        """Test exhausted hourly budgets and plain failures are not."""
+        primary = RateLimitExceededException(
+            403, {"message": "API rate limit exceeded"}, {"X-RateLimit-Remaining": "0"}
+        )
+        assert not is_secondary_rate_limit(primary)
+        assert not is_secondary_rate_limit(GithubException(422, {}, {}))
+        assert not is_secondary_rate_limit(GithubException(403, {}, {}))
+
+    def test_graphql_rate_limit_responses(self):
+        """Test GraphQL rejections by status or RATE_LIMITED error count."""
+        rate_limited = TransportQueryError(
+            "limited", errors=[{"type": "RATE_LIMITED", "message": "slow down"}]
+        )
+        not_found = TransportQueryError(
+            "missing", errors=[{"type": "NOT_FOUND", "message": "no issue"}]
+        )
+
+        assert is_secondary_rate_limit(TransportServerError("forbidden", 403))
+        assert is_secondary_rate_limit(TransportServerError("too many", 429))
+        assert is_secondary_rate_limit(rate_limited)
+        assert not is_secondary_rate_limit(TransportServerError("down", 502))
+        assert not is_secondary_rate_limit(not_found)
+
+
+class TestWriteScheduler:
+    """Test write budgets, Retry-After and adaptive pacing."""
+
+    def test_rejects_non_positive_budgets(self):
+        """Test budgets must allow at least one write."""
+        with pytest.raises(ValueError, match="at least 1"):
+            WriteScheduler(per_minute=0)
+
+    def test_writes_are_spaced_by_per_minute_budget(self, mock_time):
+        """Test consecutive writes start 60/per_minute seconds apart."""
+        scheduler = WriteScheduler(per_minute=60)
+
+        for _ in range(3):
+            scheduler.execute(lambda: None)
+
+        assert [c.args[0] for c in mock_time.sleep.call_args_list] == [1.0, 1.0]
+
+    def test_per_hour_budget_holds_writes_for_the_rest_of_the_hour(self, mock_time):
+        """Test writes beyond the hourly budget wait until the window rolls."""
+        scheduler = WriteScheduler(per_minute=60, per_hour=2)
+
+        for _ in range(3):
+            scheduler.execute(lambda: None)
+
+        assert mock_time.sleep.call_args_list[-1].args[0] == pytest.approx(3599.0)
+
+    def test_batched_writes_are_charged_per_mutation(self, mock_time):
+        """Test a request making several writes uses up that many slots."""
+        scheduler = WriteScheduler(per_minute=60, per_hour=4)
+
+        scheduler.execute(lambda: None, writes=3)
+        scheduler.execute(lambda: None, writes=1)
+        scheduler.execute(lambda: None, writes=2)
+
+        assert [c.args[0] for c in mock_time.sleep.call_args_list] == [
+            3.0,
+            pytest.approx(3597.0),
+        ]
+
+    def test_secondary_limit_honors_retry_after_and_slows_down(self, mock_time):
+        """Test a rejected write waits Retry-After, then the pace is halved."""
+        scheduler = WriteScheduler(per_minute=60)
+        operation = Mock(side_effect=[_secondary_limit(), "created"])
+
+        assert scheduler.execute(operation) == "created"
+
+        assert operation.call_count == 2
+        mock_time.sleep.assert_called_once_with(pytest.approx(30.0))
+        assert scheduler.per_minute == 30
+
+    def test_missing_retry_after_uses_default_penalty(self, mock_time):
+        """Test a 429 without Retry-After pauses writes for the default time."""
+        scheduler = WriteScheduler(per_minute=60)
+        operation = Mock(side_effect=[GithubException(429, {}, {}), "created"])
+
+        scheduler.execute(operation)
+
+        mock_time.sleep.assert_called_once_with(pytest.approx(DEFAULT_PENALTY_SECONDS))
+
+    def test_rate_limited_graphql_write_is_retried(self, mock_time):
+        """Test a GraphQL write rejected as RATE_LIMITED waits and is retried."""
+        scheduler = WriteScheduler(per_minute=60)
+        rate_limited = TransportQueryError(
+            "limited", errors=[{"type": "RATE_LIMITED", "message": "slow down"}]
+        )
+        operation = Mock(side_effect=[rate_limited, "created"])
+
+        assert scheduler.execute(operation) == "created"
+
+        mock_time.sleep.assert_called_once_with(pytest.approx(DEFAULT_PENALTY_SECONDS))
+        assert scheduler.per_minute == 30
+
+    def test_gives_up_after_max_retries(self, mock_time):
+        """Test persistent secondary limits are raised to the caller."""
+        scheduler = WriteScheduler(max_retries=1)
+        operation = Mock(side_effect=_secondary_limit())
+
+        with pytest.raises(RateLimitExceededException):
+            scheduler.execute(operation)
+
+        assert operation.call_count == 2
+
+    def test_other_errors_are_not_retried(self, mock_time):
+        """Test unrelated failures are raised immediately."""
+        scheduler = WriteScheduler()
+        operation = Mock(side_effect=GithubException(422, {}, {}))
+
+        with pytest.raises(GithubException):
+            scheduler.execute(operation)
+
+        operation.assert_called_once()
+
+    def test_pace_recovers_after_successful_writes(self, mock_time):
+        """Test a reduced pace is raised again after a run of successes."""
+        scheduler = WriteScheduler(per_minute=60)
+        scheduler.execute(Mock(side_effect=[_secondary_limit(), None]))
+
+        for _ in range(RECOVERY_WRITES):
+            scheduler.execute(lambda: None)
+
+        assert scheduler.per_minute == pytest.approx(37.5)
+
+
+class TestServiceWriteScheduling:
+    """Test the service routes mutating calls through the scheduler."""
+
+    def test_writes_go_through_scheduler_and_reads_do_not(self):
+        """Test create calls are paced while reads are not."""
+        boundary = Mock()
+        boundary.create_label.return_value = {"name": "bug"}
+        boundary.get_repository_labels.return_value = []
+        scheduler = Mock()
+        scheduler.execute.side_effect = lambda operation, writes=1: operation()
+        service = GitHubService(
+            boundary, caching_enabled=False, write_scheduler=scheduler
+        )
+
+        assert service.create_label("o/r", "bug", "red", "") == {"name": "bug"}
+        service.get_repository_labels("o/r")
+
+        scheduler.execute.assert_called_once()
+
+    def test_batched_writes_reserve_a_slot_per_mutation(self):
+        """Test each batched request is charged one write per item."""
+        boundary = Mock()
+        boundary.create_labels_batch.side_effect = lambda repo, batch: list(batch)
+        scheduler = Mock()
+        scheduler.execute.side_effect = lambda operation, writes=1: operation()
+        service = GitHubService(
+            boundary, caching_enabled=False, write_scheduler=scheduler
+        )
+        labels = [{"name": str(n), "color": "red"} for n in range(60)]
+
+        assert service.create_labels_batch("o/r", labels) == labels
+        assert [c.args[1] for c in scheduler.execute.call_args_list] == [50, 10]
+
+    def test_failed_batch_keeps_results_of_earlier_batches(self):
+        """Test a batch failing for good fails only its items and later ones."""
+        boundary = Mock()
+        error = ConnectionError("connection lost")
+        boundary.create_labels_batch.side_effect = [
+            [{"name": str(n)} for n in range(50)],
+            error,
+        ]
+        rate_limiter = Mock()
+        rate_limiter.execute_with_retry.side_effect = lambda op, _: op()
+        service = GitHubService(
+            boundary, rate_limiter=rate_limiter, caching_enabled=False
+        )
+        labels = [{"name": str(n), "color": "red"} for n in range(120)]
+
+        results = service.create_labels_batch("o/r", labels)
+
+        assert results[:50] == [{"name": str(n)} for n in range(50)]
+        assert results[50:] == [error] * 70
+        assert boundary.create_labels_batch.call_count == 2
+
+    def test_batch_results_are_reported_as_each_request_returns(self):
+        """Test on_result gets a batch's results before the next is sent."""
+        boundary = Mock()
+        boundary.create_labels_batch.side_effect = lambda repo, batch: list(batch)
+        rate_limiter = Mock()
+        rate_limiter.execute_with_retry.side_effect = lambda op, _: op()
+        service = GitHubService(
+            boundary, rate_limiter=rate_limiter, caching_enabled=False
+        )
+        labels = [{"name": str(n), "color": "red"} for n in range(60)]
+        reported = []
+
+        service.create_labels_batch(
+            "o/r",
+            labels,
+            on_result=lambda index, result: reported.append(
+                (index, boundary.create_labels_batch.call_count)
+            ),
+        )
+
+        assert reported == [(n, 1) for n in range(50)] + [(n, 2) for n in range(50, 60)]
+
+    def test_writes_are_sent_with_the_primary_token(self):
+        """Test pooled tokens serve reads while writes use the first one."""
+        pool = TokenPool(["primary", "spare"])
+        pool.tracker_for("primary").update("core", 10, reset_at=time.time() + 600)
+        boundary = Mock()
+        boundary.create_label.side_effect = lambda *args: {"token": pool.acquire()}
+        boundary.get_repository_labels.side_effect = lambda repo: [
+            {"token": pool.acquire()}
+        ]
+        service = GitHubService(boundary, caching_enabled=False, token_pool=pool)
+
+        assert service.create_label("o/r", "bug", "red", "") == {"token": "primary"}
+        assert service.get_repository_labels("o/r") == [{"token": "spare"}]
@@ -0,0 +1,146 @@
+"""Tests for item-level pipelining of dependent restore strategies."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from github_data.entities.registry import EntityRegistry
+from github_data.operations.restore.orchestrator import StrategyBasedRestoreOrchestrator
+from github_data.operations.restore.pipeline import ItemPipeline
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+def _parent_keys(item):
+    return [("issue_number_mapping", key) for key in item[1:]]
+
+
+class TestItemPipeline:
+    """Items are released as their context entries land, in parent order."""
+
+    def test_releases_items_as_parents_are_mapped(self):
+        """Test each parent's items are released in order once it is mapped."""
+        context = {}
+        pipeline = ItemPipeline(context)
+        items = [("a1", 1), ("b1", 2), ("a2", 1), ("link", 1, 2), ("free",)]
+        stage = pipeline.add_stage(items, _parent_keys, {"issues"})
+        written = []
+
+        def write(ready):
+            written.append(ready)
+            return len(ready), []
+
+        context["issue_number_mapping"][1] = 10
+        context["issue_number_mapping"][2] = 20
+        pipeline.finished("issues")
+
+        assert stage.run(write) == (5, [])
+        assert written == [[("free",), ("a1", 1), ("a2", 1), ("b1", 2), ("link", 1, 2)]]
+
+    def test_releases_unmapped_items_when_parents_finish(self):
+        """Test items whose parent never appears are released at the end."""
+        context = {"issue_number_mapping": {1: 10}}
+        pipeline = ItemPipeline(context)
+        stage = pipeline.add_stage([("b", 2), ("a", 1)], _parent_keys, {"issues"})
+
+        pipeline.finished("issues")
+
+        written = []
+        stage.run(lambda ready: (written.extend(ready), (len(ready), []))[1])
+        assert written == [("a", 1), ("b", 2)]
+
+    def test_cancel_drops_waiting_items(self):
+        """Test a cancelled stage stops without writing waiting items."""
+        pipeline = ItemPipeline({})
+        stage = pipeline.add_stage([("a", 1)], _parent_keys, {"issues"})
+
+        pipeline.cancel()
+
+        write = Mock()
+        assert stage.run(write) == (0, [])
+        write.assert_not_called()
+
+
+class _Strategy:
+    """Minimal restore strategy recording the items it writes."""
+
+    def __init__(self, name, events):
+        self._name = name
+        self.events = events
+
+    def get_entity_name(self):
+        return self._name
+
+    def read(self, input_path, storage_service):
+        return []
+
+    def transform(self, entity, context):
+        return {"item": entity}
+
+    def write(self, github_service, repo_name, entity_data):
+        self.events.append((self._name, entity_data["item"]))
+        return entity_data
+
+    def post_create_actions(self, github_service, repo_name, entity, created, context):
+        pass
+
+
+class _IssuesStrategy(_Strategy):
+    def __init__(self, events, comment_written):
+        super().__init__("issues", events)
+        self._comment_written = comment_written
+
+    def read(self, input_path, storage_service):
+        return [1, 2]
+
+    def write(self, github_service, repo_name, entity_data):
+        if entity_data["item"] == 2:
+            # Issue 1's comment is posted while later issues are created
+            assert self._comment_written.wait(timeout=5)
+        return super().write(github_service, repo_name, entity_data)
+
+    def post_create_actions(self, github_service, repo_name, entity, created, context):
+        context.setdefault("issue_number_mapping", {})[entity] = entity * 10
+
+
+class _CommentsStrategy(_Strategy):
+    def __init__(self, events, comment_written):
+        super().__init__("comments", events)
+        self._comment_written = comment_written
+
+    def read(self, input_path, storage_service):
+        return [(1, "first"), (2, "other"), (1, "second")]
+
+    def get_parent_keys(self, comment):
+        return [("issue_number_mapping", comment[0])]
+
+    def post_create_actions(self, github_service, repo_name, entity, created, context):
+        self._comment_written.set()
+
+
+def test_pipelined_restore_overlaps_comments_with_issue_creation():
+    """Test comments are posted as soon as their issue exists, in order."""
+    orchestrator = StrategyBasedRestoreOrchestrator(
+        registry=EntityRegistry(),
+        github_service=Mock(),
+        storage_service=Mock(),
+        git_service=Mock(),
+        pipeline_dependents=True,
+    )
+    events = []
+    comment_written = threading.Event()
+    orchestrator._strategies = [
+        _IssuesStrategy(events, comment_written),
+        _CommentsStrategy(events, comment_written),
+    ]
+
+    results = orchestrator.execute("owner/repo", "/data")
+
+    assert [result["entity_name"] for result in results] == ["issues", "comments"]
+    assert all(result["success"] for result in results)
+    assert events.index(("comments", (1, "first"))) < events.index(("issues", 2))
+    assert events.index(("comments", (1, "first"))) < events.index(
+        ("comments", (1, "second"))
+    )
+    assert ("comments", (2, "other")) in events
@@ -0,0 +1,195 @@
+"""Tests for the restore journal and resuming interrupted restores."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from github_data.entities.registry import EntityRegistry
+from github_data.entities.sub_issues.models import SubIssue
+from github_data.operations.restore.journal import (
+    JOURNAL_FILENAME,
+    RestoreJournal,
+    item_key,
+)
+from github_data.operations.restore.orchestrator import StrategyBasedRestoreOrchestrator
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+class _Item:
+    def __init__(self, id, number):
+        self.id = id
+        self.number = number
+
+
+def _record(journal, context, entity_name, item, new_number):
+    sizes = RestoreJournal.mapping_sizes(context)
+    context.setdefault("issue_number_mapping", {})[item.number] = new_number
+    journal.record(entity_name, item, context, sizes)
+
+
+class TestRestoreJournal:
+    """Journaled items and their mappings survive an interrupted restore."""
+
+    def test_resume_replays_mappings_and_skips_recorded_items(self, tmp_path):
+        """Test a resumed journal knows the items and mappings recorded before."""
+        journal = RestoreJournal.open(str(tmp_path), "owner/repo")
+        context = {"issue_number_mapping": {}}
+        _record(journal, context, "issues", _Item(101, 1), 7)
+        _record(journal, context, "issues", _Item(102, 2), 8)
+        journal.close()
+
+        resumed = RestoreJournal.open(str(tmp_path), "owner/repo", resume=True)
+        context = {}
+        resumed.replay(context)
+
+        assert context == {"issue_number_mapping": {1: 7, 2: 8}}
+        assert resumed.skip("issues", _Item(101, 1))
+        assert not resumed.skip("issues", _Item(103, 3))
+        assert not resumed.skip("comments", _Item(101, 1))
+        assert resumed.skipped("issues") == 1
+
+    def test_resume_drops_entry_cut_off_by_interruption(self, tmp_path):
+        """Test a partly written last entry is discarded before appending."""
+        journal = RestoreJournal.open(str(tmp_path), "owner/repo")
+        _record(journal, {}, "issues", _Item(101, 1), 7)
+        journal.close()
+        with open(tmp_path / JOURNAL_FILENAME, "a", encoding="utf-8") as f:
+            f.write('{"entity": "issues", "ke')
+
+        resumed = RestoreJournal.open(str(tmp_path), "owner/repo", resume=True)
+        _record(resumed, {}, "issues", _Item(102, 2), 8)
+        resumed.close()
+
+        resumed = RestoreJournal.open(str(tmp_path), "owner/repo", resume=True)
+        context = {}
+        resumed.replay(context)
+        assert context == {"issue_number_mapping": {1: 7, 2: 8}}
+
+    def test_ignores_journal_of_other_repository(self, tmp_path):
+        """Test resuming starts over if the journal is for another repository."""
+        journal = RestoreJournal.open(str(tmp_path), "owner/other")
+        _record(journal, {}, "issues", _Item(101, 1), 7)
+        journal.close()
+
+        resumed = RestoreJournal.open(str(tmp_path), "owner/repo", resume=True)
+
+        assert not resumed.skip("issues", _Item(101, 1))
+        lines = (tmp_path / JOURNAL_FILENAME).read_text().splitlines()
+        assert len(lines) == 1
+        assert "owner/repo" in lines[0]
+
+    def test_item_key_of_items_without_id(self):
+        """Test items without an id are identified by their content."""
+        link = SubIssue(
+            sub_issue_id=2,
+            sub_issue_number=2,
+            parent_issue_id=1,
+            parent_issue_number=1,
+            position=0,
+        )
+
+        assert item_key(link) == item_key(link.model_copy())
+        assert item_key(link) != item_key(link.model_copy(update={"position": 1}))
+
+
+class _IssuesStrategy:
+    """Restore strategy creating issues, optionally failing at one."""
+
+    def __init__(self, fail_at=None):
+        self.fail_at = fail_at
+        self.written = []
+
+    def get_entity_name(self):
+        return "issues"
+
+    def read(self, input_path, storage_service):
+        return [_Item(100 + number, number) for number in (1, 2, 3)]
+
+    def transform(self, entity, context):
+        return {"original_number": entity.number}
+
+    def write(self, github_service, repo_name, entity_data):
+        if entity_data["original_number"] == self.fail_at:
+            raise ConnectionError("connection lost")
+        self.written.append(entity_data["original_number"])
+        return {**entity_data, "number": entity_data["original_number"] + 10}
+
+    def post_create_actions(self, github_service, repo_name, entity, created, context):
+        context.setdefault("issue_number_mapping", {})[created["original_number"]] = (
+            created["number"]
+        )
+
+
+class _BatchedIssuesStrategy(_IssuesStrategy):
+    """Restore strategy creating issues two per request, like write_batch does."""
+
+    def write_batch(self, github_service, repo_name, entities_data, on_result=None):
+        results = []
+        for start in range(0, len(entities_data), 2):
+            batch = [
+                self.write(github_service, repo_name, data)
+                for data in entities_data[start : start + 2]
+            ]
+            for offset, created in enumerate(batch):
+                if on_result is not None:
+                    on_result(start + offset, created)
+            results.extend(batch)
+        return results
+
+
+def _orchestrator(strategy, **kwargs):
+    orchestrator = StrategyBasedRestoreOrchestrator(
+        registry=EntityRegistry(),
+        github_service=Mock(),
+        storage_service=Mock(),
+        git_service=Mock(),
+        **kwargs,
+    )
+    orchestrator._strategies = [strategy]
+    return orchestrator
+
+
+def test_resumed_restore_creates_only_remaining_items(tmp_path):
+    """Test a resumed restore skips journaled items and keeps their mapping."""
+    interrupted = _IssuesStrategy(fail_at=3)
+    results = _orchestrator(interrupted, journal=True).execute(
+        "owner/repo", str(tmp_path)
+    )
+    assert not results[0]["success"]
+    assert interrupted.written == [1, 2]
+
+    resumed = _IssuesStrategy()
+    orchestrator = _orchestrator(resumed, resume=True)
+    results = orchestrator.execute("owner/repo", str(tmp_path))
+
+    assert results[0]["success"]
+    assert results[0]["entities_created"] == 1
+    assert resumed.written == [3]
+    assert orchestrator._context["issue_number_mapping"] == {1: 11, 2: 12, 3: 13}
+
+
+def test_restore_interrupted_mid_batch_resumes_after_last_request(tmp_path):
+    """Test items of requests that returned are journaled before the call ends."""
+    interrupted = _BatchedIssuesStrategy(fail_at=3)
+    results = _orchestrator(interrupted, journal=True).execute(
+        "owner/repo", str(tmp_path)
+    )
+    assert not results[0]["success"]
+    assert interrupted.written == [1, 2]
+
+    resumed = _BatchedIssuesStrategy()
+    orchestrator = _orchestrator(resumed, resume=True)
+    results = orchestrator.execute("owner/repo", str(tmp_path))
+
+    assert results[0]["success"]
+    assert results[0]["entities_created"] == 1
+    assert resumed.written == [3]
+    assert orchestrator._context["issue_number_mapping"] == {1: 11, 2: 12, 3: 13}
+
+
+def test_restore_without_journal_writes_no_file(tmp_path):
+    """Test journaling is off unless requested."""
+    _orchestrator(_IssuesStrategy()).execute("owner/repo", str(tmp_path))
+
+    assert not (tmp_path / JOURNAL_FILENAME).exists()
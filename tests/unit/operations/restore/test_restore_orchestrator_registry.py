@@ -22,3 +22,103 @@ def test_restore_orchestrator_accepts_registry():
     )
 
     assert orchestrator._registry == registry
+
+
+@pytest.mark.unit
+def test_restore_orchestrator_writes_batching_strategies_in_one_call():
+    """Test write_batch strategies get all entities and continue past failures."""
+    orchestrator = StrategyBasedRestoreOrchestrator(
+        registry=EntityRegistry(),
+        github_service=Mock(),
+        storage_service=Mock(),
+        git_service=Mock(),
+    )
+    strategy = Mock(spec=["get_entity_name", "read", "transform", "write_batch"])
+    strategy.get_entity_name.return_value = "comments"
+    strategy.read.return_value = ["a", "b", "c"]
+    strategy.transform.side_effect = lambda entity, context: {"body": entity}
+    strategy.write_batch.return_value = [{"id": 1}, RuntimeError("gone"), {"id": 3}]
+    strategy.post_create_actions = Mock()
+
+    result = orchestrator._execute_strategy(strategy, "owner/repo", "/data")
+
+    strategy.write_batch.assert_called_once()
+    assert strategy.write_batch.call_args.args[2] == [
+        {"body": "a"},
+        {"body": "b"},
+        {"body": "c"},
+    ]
+    assert strategy.post_create_actions.call_count == 2
+    assert result["success"] is False
+    assert result["entities_created"] == 2
+    assert "gone" in result["error"]
+
+
+class _RecordingStrategy:
+    """Restore strategy writing one item and recording it in the context."""
+
+    def __init__(self, name, write=None):
+        self._name = name
+        self._write = write
+
+    def get_entity_name(self):
+        return self._name
+
+    def read(self, input_path, storage_service):
+        return [self._name]
+
+    def transform(self, entity, context):
+        return {"seen": sorted(context)}
+
+    def write(self, github_service, repo_name, entity_data):
+        if self._write is not None:
+            self._write()
+        return entity_data
+
+    def post_create_actions(self, github_service, repo_name, entity, created, context):
+        context[self._name] = created["seen"]
+
+
+@pytest.mark.unit
+def test_restore_orchestrator_rejects_invalid_max_workers():
+    """Test orchestrator requires at least one worker."""
+    with pytest.raises(ValueError, match="max_workers"):
+        StrategyBasedRestoreOrchestrator(
+            registry=EntityRegistry(),
+            github_service=Mock(),
+            storage_service=Mock(),
+            git_service=Mock(),
+            max_workers=0,
+        )
+
+
+@pytest.mark.unit
+def test_parallel_restore_overlaps_independent_entities():
+    """Test independent entities in one level are restored concurrently."""
+    import threading
+
+    # Deadlocks (and times out) unless all three writes are in flight at once
+    barrier = threading.Barrier(3, timeout=5)
+    orchestrator = StrategyBasedRestoreOrchestrator(
+        registry=EntityRegistry(),
+        github_service=Mock(),
+        storage_service=Mock(),
+        git_service=Mock(),
+        max_workers=3,
+    )
+    orchestrator._strategies = [
+        _RecordingStrategy(name, barrier.wait)
+        for name in ("labels", "milestones", "releases")
+    ] + [_RecordingStrategy("issues")]
+
+    results = orchestrator.execute("owner/repo", "/data")
+
+    assert [r["entity_name"] for r in results] == [
+        "labels",
+        "milestones",
+        "releases",
+        "issues",
+    ]
+    assert all(r["success"] for r in results)
+    # Issues run in a later level, after their dependencies' context exists
+    assert orchestrator._context["issues"] == ["labels", "milestones", "releases"]
@@ -0,0 +1,191 @@
+"""Tests for incremental saves driven by the save manifest."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import Mock
+
+from github_data.entities.issues.models import Issue
+from github_data.entities.registry import EntityRegistry
+from github_data.operations.save.manifest import (
+    CLOCK_SKEW_MARGIN,
+    MANIFEST_FILENAME,
+    SaveManifest,
+    merge_by_id,
+    selection_fingerprint,
+)
+from github_data.operations.save.orchestrator import StrategyBasedSaveOrchestrator
+from github_data.storage import create_storage_service
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+NOW = datetime(2026, 1, 2, 12, 0, tzinfo=timezone.utc)
+
+
+def _item(item_id, updated_at, created_at=NOW):
+    return SimpleNamespace(id=item_id, updated_at=updated_at, created_at=created_at)
+
+
+def _raw_issue(number, title, updated_at):
+    return {
+        "id": f"I_{number}",
+        "number": number,
+        "title": title,
+        "state": "open",
+        "user": {"login": "octocat", "id": "U_1"},
+        "created_at": f"2026-01-01T00:0{number}:00Z",
+        "updated_at": updated_at,
+        "html_url": f"https://github.com/owner/repo/issues/{number}",
+    }
+
+
+class TestSaveManifest:
+    """Test watermark bookkeeping and persistence."""
+
+    def test_round_trip(self, tmp_path):
+        """Test saved watermarks are loaded back for the same repository."""
+        manifest = SaveManifest("owner/repo")
+        manifest.advance("issues", [_item(1, NOW)], read_started=NOW + timedelta(1))
+        manifest.save(str(tmp_path))
+
+        loaded = SaveManifest.load(str(tmp_path), "owner/repo")
+
+        assert loaded.watermark("issues") == NOW
+        assert loaded.watermark("comments") is None
+
+    def test_other_repository_starts_empty(self, tmp_path):
+        """Test a manifest written for another repository is ignored."""
+        manifest = SaveManifest("owner/repo", {"issues": NOW})
+        manifest.save(str(tmp_path))
+
+        assert (
+            SaveManifest.load(str(tmp_path), "owner/other").watermark("issues") is None
+        )
+
+    def test_unreadable_manifest_starts_empty(self, tmp_path):
+        """Test a corrupt manifest falls back to a full save."""
+        (tmp_path / MANIFEST_FILENAME).write_text("{not json")
+
+        assert (
+            SaveManifest.load(str(tmp_path), "owner/repo").watermark("issues") is None
+        )
+
+    def test_watermark_stays_behind_read_start(self):
+        """Test items updated during the read are read again next time."""
+        manifest = SaveManifest("owner/repo")
+
+        manifest.advance("issues", [_item(1, NOW)], read_started=NOW)
+
+        assert manifest.watermark("issues") == NOW - CLOCK_SKEW_MARGIN
+
+    def test_watermark_never_moves_back(self):
+        """Test older items do not lower an entity's watermark."""
+        manifest = SaveManifest("owner/repo", {"issues": NOW})
+
+        manifest.advance(
+            "issues", [_item(1, NOW - timedelta(days=1))], read_started=NOW
+        )
+        manifest.advance("issues", [], read_started=NOW)
+
+        assert manifest.watermark("issues") == NOW
+
+
+class TestMergeById:
+    """Test merging changed items into saved ones."""
+
+    def test_replaces_changed_and_appends_new_by_creation(self):
+        """Test changed items replace saved ones in place; new ones are appended."""
+        saved = [_item(1, NOW), _item(2, NOW)]
+        changed = [
+            _item(4, NOW, created_at=NOW + timedelta(2)),
+            _item(2, NOW + timedelta(1)),
+            _item(3, NOW, created_at=NOW + timedelta(1)),
+        ]
+
+        merged = merge_by_id(saved, changed)
+
+        assert [item.id for item in merged] == [1, 2, 3, 4]
+        assert merged[1].updated_at == NOW + timedelta(1)
+
+
+class TestIncrementalSave:
+    """Test the orchestrator reads only changed issues once a manifest exists."""
+
+    @pytest.fixture
+    def registry(self):
+        registry = EntityRegistry()
+        for entity in registry.get_all_entity_names():
+            registry.get_entity(entity).enabled = entity == "issues"
+        return registry
+
+    def _save(self, registry, github_service, output_path):
+        return StrategyBasedSaveOrchestrator(
+            registry=registry,
+            github_service=github_service,
+            storage_service=create_storage_service("json"),
+            incremental=True,
+        ).execute("owner/repo", output_path)
+
+    def test_second_save_merges_changes(self, registry, tmp_path):
+        """Test only issues updated since the watermark are read and merged."""
+        github_service = Mock()
+        github_service.get_repository_issues.return_value = [
+            _raw_issue(1, "First", "2026-01-01T10:00:00Z"),
+            _raw_issue(2, "Second", "2026-01-01T11:00:00Z"),
+        ]
+        self._save(registry, github_service, str(tmp_path))
+
+        manifest = json.loads((tmp_path / MANIFEST_FILENAME).read_text())
+        assert manifest["watermarks"]["issues"] == "2026-01-01T11:00:00+00:00"
+
+        github_service.iter_repository_issues.return_value = iter(
+            [
+                _raw_issue(2, "Second, edited", "2026-01-02T09:00:00Z"),
+                _raw_issue(3, "Third", "2026-01-02T10:00:00Z"),
+            ]
+        )
+        results = self._save(registry, github_service, str(tmp_path))
+
+        assert results[0]["success"]
+        github_service.iter_repository_issues.assert_called_once_with(
+            "owner/repo", since=datetime(2026, 1, 1, 11, tzinfo=timezone.utc)
+        )
+        issues = create_storage_service("json").read(tmp_path / "issues.json", Issue)
+        assert [issue.title for issue in issues] == [
+            "First",
+            "Second, edited",
+            "Third",
+        ]
+
+    def test_missing_entity_file_reads_everything(self, registry, tmp_path):
+        """Test a watermark without a saved file falls back to a full read."""
+        SaveManifest(
+            "owner/repo", {"issues": NOW}, selection_fingerprint(registry)
+        ).save(str(tmp_path))
+        github_service = Mock()
+        github_service.get_repository_issues.return_value = []
+
+        self._save(registry, github_service, str(tmp_path))
+
+        github_service.iter_repository_issues.assert_not_called()
+        github_service.get_repository_issues.assert_called_once_with("owner/repo")
+
+    def test_widened_selection_reads_everything(self, registry, tmp_path):
+        """Test newly selected issues are read even if older than the watermark."""
+        registry.get_entity("issues").enabled = {1}
+        github_service = Mock()
+        github_service.get_repository_issues.return_value = [
+            _raw_issue(1, "First", "2026-01-01T10:00:00Z"),
+            _raw_issue(2, "Second", "2026-01-01T11:00:00Z"),
+        ]
+        self._save(registry, github_service, str(tmp_path))
+
+        registry.get_entity("issues").enabled = {1, 2}
+        self._save(registry, github_service, str(tmp_path))
+
+        github_service.iter_repository_issues.assert_not_called()
+        assert github_service.get_repository_issues.call_count == 2
+        issues = create_storage_service("json").read(tmp_path / "issues.json", Issue)
+        assert [issue.number for issue in issues] == [1, 2]
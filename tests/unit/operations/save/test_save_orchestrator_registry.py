@@ -88,3 +88,87 @@ def test_save_orchestrator_returns_failure_status_on_error():
     assert results[0]["entity_name"] == "milestones"
     assert results[0]["success"] is False
     assert "API Error: 401 Unauthorized" in results[0]["error"]
+
+
+def _enable_only(registry, *names):
+    for entity_name in registry.get_all_entity_names():
+        registry.get_entity(entity_name).enabled = entity_name in names
+
+
+@pytest.mark.unit
+def test_save_orchestrator_rejects_invalid_max_workers():
+    """Test orchestrator requires at least one worker."""
+    with pytest.raises(ValueError, match="max_workers"):
+        StrategyBasedSaveOrchestrator(
+            registry=EntityRegistry(),
+            github_service=Mock(),
+            storage_service=Mock(),
+            max_workers=0,
+        )
+
+
+@pytest.mark.unit
+def test_parallel_save_overlaps_independent_entities():
+    """Test independent entities in one level run concurrently."""
+    import threading
+
+    registry = EntityRegistry()
+    _enable_only(registry, "labels", "milestones", "releases")
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait_for_peers(repo_name):
+        # Deadlocks (and times out) unless all three reads are in flight at once
+        barrier.wait()
+        return []
+
+    github_service = Mock()
+    github_service.get_repository_labels.side_effect = wait_for_peers
+    github_service.get_repository_milestones.side_effect = wait_for_peers
+    github_service.get_repository_releases.side_effect = wait_for_peers
+
+    orchestrator = StrategyBasedSaveOrchestrator(
+        registry=registry,
+        github_service=github_service,
+        storage_service=Mock(),
+        max_workers=3,
+    )
+
+    results = orchestrator.execute("owner/repo", "/tmp/test")
+
+    assert [r["entity_name"] for r in results] == ["labels", "milestones", "releases"]
+    assert all(r["success"] for r in results)
+
+
+@pytest.mark.unit
+def test_parallel_save_runs_dependents_after_dependencies():
+    """Test later levels see context produced by earlier levels."""
+    registry = EntityRegistry()
+    _enable_only(registry, "milestones", "issues", "comments")
+
+    calls = []
+
+    def record(name):
+        def side_effect(repo_name):
+            calls.append(name)
+            return []
+
+        return side_effect
+
+    github_service = Mock()
+    github_service.get_repository_milestones.side_effect = record("milestones")
+    github_service.get_repository_issues.side_effect = record("issues")
+    github_service.get_all_issue_comments.side_effect = record("comments")
+
+    orchestrator = StrategyBasedSaveOrchestrator(
+        registry=registry,
+        github_service=github_service,
+        storage_service=Mock(),
+        max_workers=4,
+    )
+
+    results = orchestrator.execute("owner/repo", "/tmp/test")
+
+    assert calls == ["milestones", "issues", "comments"]
+    assert [r["entity_name"] for r in results] == ["milestones", "issues", "comments"]
+    assert "issues" in orchestrator._context
@@ -0,0 +1,49 @@
+"""Tests for SaveEntityStrategy read behavior."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from github_data.entities.comments.save_strategy import CommentsSaveStrategy
+
+pytestmark = [pytest.mark.unit, pytest.mark.fast]
+
+
+class StreamingService:
+    """Service exposing both list and streaming read methods."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_all_issue_comments(self, repo_name):
+        self.calls.append("get")
+        return [{"id": 1}]
+
+    def iter_all_issue_comments(self, repo_name):
+        self.calls.append("iter")
+        yield {"id": 1}
+        yield {"id": 2}
+
+
+@patch("github_data.github.converter_registry.get_converter")
+def test_read_prefers_streaming_service_method(mock_get_converter):
+    """Test read converts items from the iter_ variant when available."""
+    mock_get_converter.return_value = lambda item: item["id"]
+    service = StreamingService()
+
+    result = CommentsSaveStrategy().read(service, "owner/repo")
+
+    assert result == [1, 2]
+    assert service.calls == ["iter"]
+
+
+@patch("github_data.github.converter_registry.get_converter")
+def test_read_falls_back_to_list_method(mock_get_converter):
+    """Test read uses the get_ method when no streaming variant is defined."""
+    mock_get_converter.return_value = lambda item: item["id"]
+    service = Mock()
+    service.get_all_issue_comments.return_value = [{"id": 7}]
+
+    result = CommentsSaveStrategy().read(service, "owner/repo")
+
+    assert result == [7]
+    service.get_all_issue_comments.assert_called_once_with("owner/repo")
@@ -1,8 +1,10 @@
 import pytest
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock
 from gql import Client
-from gql.transport.exceptions import TransportError
+from gql.transport.exceptions import TransportError, TransportServerError
 
 from github_data.github.utils.graphql_paginator import GraphQLPaginator
 
@@ -390,6 +392,229 @@ class TestGraphQLPaginatorErrorHandling:
             )
 
 
+def _issues_page(ids, end_cursor=None):
+    """Build an issues page result; a cursor means more pages follow."""
+    return {
+        "repository": {
+            "issues": {
+                "nodes": [{"id": i} for i in ids],
+                "pageInfo": {
+                    "hasNextPage": end_cursor is not None,
+                    "endCursor": end_cursor,
+                },
+            }
+        }
+    }
+
+
+class TestGraphQLPaginatorStreaming:
+    """Test page-by-page iteration with paginate_iter."""
+
+    def test_yields_pages_lazily(self):
+        """Test each page is fetched only when the caller asks for it."""
+        mock_client = Mock(spec=Client)
+        mock_client.execute.side_effect = [
+            _issues_page(["1", "2"], "c1"),
+            _issues_page(["3"]),
+        ]
+        paginator = GraphQLPaginator(mock_client)
+
+        pages = paginator.paginate_iter(
+            query=Mock(),
+            variable_values={"owner": "test", "name": "repo"},
+            data_path="repository.issues",
+            post_processor=lambda nodes: [n["id"] for n in nodes],
+        )
+
+        assert next(pages) == ["1", "2"]
+        assert mock_client.execute.call_count == 1
+        assert list(pages) == [["3"]]
+        assert mock_client.execute.call_count == 2
+
+    def test_prefetches_next_page_while_caller_processes(self):
+        """Test the next page is requested before the current one is consumed."""
+        mock_client = Mock(spec=Client)
+        mock_client.execute.side_effect = [
+            _issues_page(["1"], "c1"),
+            _issues_page(["2"]),
+        ]
+        second_page_requested = threading.Event()
+
+        def post_processor(nodes):
+            if nodes[0]["id"] == "1":
+                assert second_page_requested.wait(timeout=5)
+            return nodes
+
+        def execute(*args, **kwargs):
+            result = mock_client.execute(*args, **kwargs)
+            if kwargs["variable_values"]["after"] == "c1":
+                second_page_requested.set()
+            return result
+
+        executor = Mock()
+        executor.execute.side_effect = execute
+        with ThreadPoolExecutor(max_workers=1) as prefetch_executor:
+            paginator = GraphQLPaginator(executor, prefetch_executor=prefetch_executor)
+            results = paginator.paginate_all(
+                query=Mock(),
+                variable_values={"owner": "test", "name": "repo"},
+                data_path="repository.issues",
+                post_processor=post_processor,
+            )
+
+        assert results == [{"id": "1"}, {"id": "2"}]
+
+    def test_prefetch_error_raised_when_page_is_reached(self):
+        """Test a failed prefetch surfaces when its page is consumed."""
+        mock_client = Mock(spec=Client)
+        mock_client.execute.side_effect = [
+            _issues_page(["1"], "c1"),
+            TransportError("boom"),
+        ]
+        with ThreadPoolExecutor(max_workers=1) as prefetch_executor:
+            paginator = GraphQLPaginator(
+                mock_client, prefetch_executor=prefetch_executor
+            )
+            pages = paginator.paginate_iter(
+                query=Mock(),
+                variable_values={"owner": "test", "name": "repo"},
+                data_path="repository.issues",
+            )
+
+            assert next(pages) == [{"id": "1"}]
+            with pytest.raises(TransportError, match="boom"):
+                next(pages)
+
+
+class TestGraphQLPaginatorAdaptivePageSize:
+    """Test page size adapting to failures, latency and cost."""
+
+    @staticmethod
+    def _page_sizes(mock_client):
+        return [
+            call[1]["variable_values"]["first"]
+            for call in mock_client.execute.call_args_list
+        ]
+
+    def test_gateway_error_retries_same_cursor_with_smaller_page(self):
+        """Test a 502 halves the page and retries from the same cursor."""
+        mock_client = Mock(spec=Client)
+        mock_client.execute.side_effect = [
+            _issues_page(["1"], "c1"),
+            TransportServerError("502 Bad Gateway", 502),
+            _issues_page(["2"]),
+        ]
+        paginator = GraphQLPaginator(mock_client, page_size=40)
+
+        results = paginator.paginate_all(
+            query=Mock(),
+            variable_values={"owner": "test", "name": "repo"},
+            data_path="repository.issues",
+        )
+
+        assert results == [{"id": "1"}, {"id": "2"}]
+        assert self._page_sizes(mock_client) == [40, 40, 20]
+        cursors = [
+            call[1]["variable_values"]["after"]
+            for call in mock_client.execute.call_args_list
+        ]
+        assert cursors == [None, "c1", "c1"]
+
+    def test_gives_up_at_minimum_page_size(self):
+        """Test the error is raised once the page cannot shrink further."""
+        mock_client = Mock(spec=Client)
+        mock_client.execute.side_effect = TransportServerError("504", 504)
+        paginator = GraphQLPaginator(
+            mock_client, page_size=40, min_page_size=10, max_retries=0
+        )
+
+        with pytest.raises(TransportServerError):
+            paginator.paginate_all(
+                query=Mock(),
+                variable_values={"owner": "test", "name": "repo"},
+                data_path="repository.issues",
+            )
+
+        assert self._page_sizes(mock_client) == [40, 20, 10]
+
+    def test_non_size_related_errors_are_not_retried(self):
+        """Test errors unrelated to page size propagate immediately."""
+        mock_client = Mock(spec=Client)
+        mock_client.execute.side_effect = TransportServerError("401", 401)
+        paginator = GraphQLPaginator(mock_client)
+
+        with pytest.raises(TransportServerError):
+            paginator.paginate_all(
+                query=Mock(),
+                variable_values={"owner": "test", "name": "repo"},
+                data_path="repository.issues",
+            )
+
+        assert mock_client.execute.call_count == 1
+
+    def test_transient_error_mid_pagination_retries_same_cursor(self):
+        """Test a server error on a later page is retried, not fatal."""
+        mock_client = Mock(spec=Client)
+        mock_client.execute.side_effect = [
+            _issues_page(["1"], "c1"),
+            TransportServerError("500 Internal Server Error", 500),
+            TransportServerError("429 Too Many Requests", 429),
+            _issues_page(["2"]),
+        ]
+        paginator = GraphQLPaginator(mock_client, retry_delay=0)
+
+        results = paginator.paginate_all(
+            query=Mock(),
+            variable_values={"owner": "test", "name": "repo"},
+            data_path="repository.issues",
+        )
+
+        assert results == [{"id": "1"}, {"id": "2"}]
+        cursors = [
+            call[1]["variable_values"]["after"]
+            for call in mock_client.execute.call_args_list
+        ]
+        assert cursors == [None, "c1", "c1", "c1"]
+
+    def test_transient_errors_give_up_after_max_retries(self):
+        """Test a page still failing after max_retries raises its error."""
+        mock_client = Mock(spec=Client)
+        mock_client.execute.side_effect = TransportServerError("500", 500)
+        paginator = GraphQLPaginator(mock_client, max_retries=2, retry_delay=0)
+
+        with pytest.raises(TransportServerError):
+            paginator.paginate_all(
+                query=Mock(),
+                variable_values={"owner": "test", "name": "repo"},
+                data_path="repository.issues",
+            )
+
+        assert mock_client.execute.call_count == 3
+
+    def test_expensive_page_shrinks_then_cheap_pages_grow_back(self):
+        """Test query cost drives the next page size within its bounds."""
+        expensive = _issues_page(["1"], "c1")
+        expensive["rateLimit"] = {"cost": 80}
+        cheap = _issues_page(["2"], "c2")
+        cheap["rateLimit"] = {"cost": 5}
+        mock_client = Mock(spec=Client)
+        mock_client.execute.side_effect = [
+            expensive,
+            cheap,
+            _issues_page(["3"], "c3"),
+            _issues_page(["4"]),
+        ]
+        paginator = GraphQLPaginator(mock_client, page_size=100)
+
+        paginator.paginate_all(
+            query=Mock(),
+            variable_values={"owner": "test", "name": "repo"},
+            data_path="repository.issues",
+        )
+
+        assert self._page_sizes(mock_client) == [100, 50, 100, 100]
+
+
 @pytest.mark.github_api
 @pytest.mark.performance
 class TestGraphQLPaginatorPerformance:
@@ -252,6 +252,46 @@ def test_load_repository_visibility_skipped_for_save():
         assert main._repository_visibility == "public"
 
 
+@pytest.mark.unit
+def test_load_max_workers_default():
+    """Test MAX_WORKERS defaults to sequential execution."""
+    from unittest.mock import patch
+    from github_data.main import Main
+
+    with patch.dict(os.environ, {}, clear=True):
+        main = Main()
+        main._load_max_workers_from_environment()
+
+        assert main._max_workers == 1
+
+
+@pytest.mark.unit
+def test_load_max_workers_valid_value():
+    """Test MAX_WORKERS accepts positive integers."""
+    from unittest.mock import patch
+    from github_data.main import Main
+
+    with patch.dict(os.environ, {"MAX_WORKERS": "4"}):
+        main = Main()
+        main._load_max_workers_from_environment()
+
+        assert main._max_workers == 4
+
+
+@pytest.mark.unit
+def test_load_max_workers_invalid_value_exits():
+    """Test MAX_WORKERS exits on non-positive or non-numeric values."""
+    from unittest.mock import patch
+    from github_data.main import Main
+
+    for value in ["0", "-2", "many"]:
+        with patch.dict(os.environ, {"MAX_WORKERS": value}):
+            main = Main()
+
+            with pytest.raises(SystemExit):
+                main._load_max_workers_from_environment()
+
+
 # Repository Existence Check Tests
 
 
@@ -569,3 +609,102 @@ def test_main_execution_order():
             "execute",
         ]
         assert calls == expected
+
+
+@pytest.mark.unit
+def test_load_write_budgets_for_restore():
+    """Test WRITES_PER_MINUTE and WRITES_PER_HOUR configure restore pacing."""
+    from unittest.mock import patch
+    from github_data.main import Main
+
+    env = {"WRITES_PER_MINUTE": "30", "WRITES_PER_HOUR": "300"}
+    with patch.dict(os.environ, env):
+        main = Main()
+        main._operation = "restore"
+        main._load_write_budgets_from_environment()
+
+        assert (main._writes_per_minute, main._writes_per_hour) == (30, 300)
+
+
+@pytest.mark.unit
+def test_load_write_budgets_invalid_value_exits():
+    """Test write budgets exit on non-positive or non-numeric values."""
+    from unittest.mock import patch
+    from github_data.main import Main
+
+    for value in ["0", "fast"]:
+        with patch.dict(os.environ, {"WRITES_PER_MINUTE": value}):
+            main = Main()
+            main._operation = "restore"
+
+            with pytest.raises(SystemExit):
+                main._load_write_budgets_from_environment()
+
+
+@pytest.mark.unit
+def test_load_github_tokens_pool_without_github_token():
+    """Test GITHUB_TOKENS alone is enough and its first token is primary."""
+    from unittest.mock import patch
+    from github_data.main import Main
+
+    with patch.dict(os.environ, {"GITHUB_TOKENS": "t1,t2"}, clear=True):
+        main = Main()
+        main._load_github_token_from_environment()
+
+        assert main._github_token == "t1"
+        assert main._token_pool.tokens == ["t1", "t2"]
+
+
+@pytest.mark.unit
+def test_load_graphql_concurrency():
+    """Test GRAPHQL_CONCURRENCY selects the asyncio client only when set."""
+    from unittest.mock import patch
+    from github_data.main import Main
+
+    with patch.dict(os.environ, {}, clear=True):
+        main = Main()
+        main._load_graphql_concurrency_from_environment()
+        assert main._graphql_concurrency is None
+
+    with patch.dict(os.environ, {"GRAPHQL_CONCURRENCY": "8"}):
+        main._load_graphql_concurrency_from_environment()
+        assert main._graphql_concurrency == 8
+
+
+@pytest.mark.unit
+def test_load_graphql_validation():
+    """Test GRAPHQL_VALIDATE_QUERIES can turn schema validation off."""
+    from unittest.mock import patch
+    from github_data.main import Main
+
+    with patch.dict(os.environ, {"GRAPHQL_VALIDATE_QUERIES": "false"}):
+        main = Main()
+        main._load_graphql_validation_from_environment()
+
+        assert main._validate_graphql_queries is False
+
+    with patch.dict(os.environ, {"GRAPHQL_VALIDATE_QUERIES": "maybe"}):
+        with pytest.raises(SystemExit):
+            main._load_graphql_validation_from_environment()
+
+
+@pytest.mark.unit
+def test_load_incremental_save():
+    """Test INCREMENTAL_SAVE turns on incremental saves only for save."""
+    from unittest.mock import patch
+    from github_data.main import Main
+
+    with patch.dict(os.environ, {"INCREMENTAL_SAVE": "true"}):
+        main = Main()
+        main._operation = "save"
+        main._load_incremental_save_from_environment()
+        assert main._incremental_save is True
+
+        restore = Main()
+        restore._operation = "restore"
+        restore._load_incremental_save_from_environment()
+        assert restore._incremental_save is False
+
+    with patch.dict(os.environ, {"INCREMENTAL_SAVE": "maybe"}):
+        with pytest.raises(SystemExit):
+            main._load_incremental_save_from_environment()
@@ -36,17 +36,16 @@ class TestRateLimitHandler:
         """Test successful operation logs warning when rate limit is low."""
         mock_operation = Mock(return_value="success")
 
-        # Mock rate limit check to show low remaining
-        mock_rate_limit = Mock()
-        mock_rate_limit.core.remaining = 50  # Below threshold of 100
-        mock_rate_limit.core.reset = None
-
-        mock_github_client.get_rate_limit.return_value = mock_rate_limit
+        # Headers of the last response show low remaining
+        mock_github_client.requester.rate_limiting = (50, 5000)  # Below 100
+        mock_github_client.requester.rate_limiting_resettime = 0
 
         result = rate_limiter.execute_with_retry(mock_operation, mock_github_client)
 
         assert result == "success"
         mock_operation.assert_called_once()
+        mock_github_client.get_rate_limit.assert_not_called()
+        assert rate_limiter.tracker.get("core").remaining == 50
 
         # Check warning was logged
         assert "GitHub API rate limit low: 50 requests remaining" in caplog.text